@@ -5,15 +5,18 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from django.db.models import Prefetch
+from phoneinone_server.db_router import replica_reads
 from .models import InternetCarrier, InternetPlan
 from .serializers import *
 
 
+@replica_reads
 class InternetCarrierViewSet(ReadOnlyModelViewSet):
     queryset = InternetCarrier.objects.all()
     serializer_class = InternetCarrierSerializer
 
 
+@replica_reads
 class InternetPlanView(APIView):
     queryset = InternetPlan.objects.all().order_by("internet_price_per_month")
 
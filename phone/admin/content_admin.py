@@ -14,14 +14,7 @@ from django import forms
 
 from phone.constants import CardSlotChoices, CarrierChoices
 from phone.models import *
-from phone.inventory.kt_first.excel_kt_first import (
-    read_inventory_excel as read_kt_first_inventory_excel,
-    update_inventory as update_kt_first_inventory,
-)
-from phone.inventory.lg_hunet.image_lg_hunet import (
-    extract_json_from_image as extract_json_from_image_lg_hunet,
-    update_inventory as update_inventory_lg_hunet,
-)
+from phoneinone_server.db_router import read_replica
 from .base import commonAdmin, format_price
 
 logger = logging.getLogger(__name__)
@@ -330,6 +323,11 @@ class InventoryAdmin(commonAdmin):
             .select_related("dealership", "device_variant__device")
         )
 
+    def delete_queryset(self, request, queryset):
+        # queryset soft delete 는 post_save 가 발생하지 않으므로 별칭을 직접 정리
+        InventoryAlias.objects.filter(inventory__in=queryset).delete()
+        super().delete_queryset(request, queryset)
+
     def get_urls(self):
         urls = super().get_urls()
         custom_urls = [
@@ -378,6 +376,12 @@ class InventoryAdmin(commonAdmin):
             import tempfile
             import os
 
+            # openpyxl 은 업로드 시에만 로드 (웹 워커 기동 시간/메모리 절감)
+            from phone.inventory.kt_first.excel_kt_first import (
+                read_inventory_excel as read_kt_first_inventory_excel,
+                update_inventory as update_kt_first_inventory,
+            )
+
             excel_file = request.FILES["excel_file"]
 
             with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmp:
@@ -420,6 +424,12 @@ class InventoryAdmin(commonAdmin):
             import tempfile
             import os
 
+            # Gemini 추출기도 업로드 시에만 로드
+            from phone.inventory.lg_hunet.image_lg_hunet import (
+                extract_json_from_image as extract_json_from_image_lg_hunet,
+                update_inventory as update_inventory_lg_hunet,
+            )
+
             image_file = request.FILES["image_file"]
 
             with tempfile.NamedTemporaryFile(delete=False, suffix=".png") as tmp:
@@ -485,12 +495,15 @@ class InventorySummaryAdmin(commonAdmin):
             dealership__deleted_at__isnull=True,
         )
 
+        # 아래 두 집계는 replica 에서 읽는다 (DB_REPLICA_HOST 미설정 시 default)
         # 대리점 컬럼 목록 (이름순)
         dealer_rows = (
             base.values("dealership_id", "dealership__name")
             .distinct()
             .order_by("dealership__name")
         )
+        with read_replica():
+            dealer_rows = list(dealer_rows)
         dealerships = [
             {"id": d["dealership_id"], "name": d["dealership__name"]}
             for d in dealer_rows
@@ -514,6 +527,8 @@ class InventorySummaryAdmin(commonAdmin):
                 "device_variant_id",
             )
         )
+        with read_replica():
+            agg_rows = list(agg_rows)
 
         devices = OrderedDict()
         for r in agg_rows:
@@ -36,7 +36,7 @@ _ADMIN_GROUPS = {
     ],
     "재고": [Inventory, InventorySummary],
     "오픈마켓": [OpenMarket, OpenMarketProduct, OpenMarketProductOption],
-    "기타": [Dealership, OfficialContractLink],
+    "기타": [Dealership, OfficialContractLink, RequestMetric],
     "진단": [DiagnosisLog, CalculatorSession, CustomerIdentity],
 }
 
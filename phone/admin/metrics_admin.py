@@ -0,0 +1,41 @@
+# pyright: reportAttributeAccessIssue=false
+from django.contrib import admin
+from django.shortcuts import render
+
+from phone.models import RequestMetric
+from phone.request_metrics import endpoint_percentiles
+
+PERIOD_HOURS = (1, 24, 24 * 7)
+
+
+@admin.register(RequestMetric)
+class RequestMetricAdmin(admin.ModelAdmin):
+    """view 별 응답시간 / SQL 백분위 리포트 (RequestMetricsMiddleware 샘플 기준)."""
+
+    change_list_template = "admin/request_metrics.html"
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def changelist_view(self, request, extra_context=None):
+        try:
+            hours = int(request.GET.get("hours", 24))
+        except ValueError:
+            hours = 24
+        if hours not in PERIOD_HOURS:
+            hours = 24
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "엔드포인트 성능",
+            "opts": self.model._meta,
+            "rows": endpoint_percentiles(hours),
+            "hours": hours,
+            "period_hours": PERIOD_HOURS,
+        }
+        if extra_context:
+            context.update(extra_context)
+        return render(request, self.change_list_template, context)
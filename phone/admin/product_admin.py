@@ -1,14 +1,12 @@
 # pyright: reportAttributeAccessIssue=false
 import traceback
 from io import BytesIO
-import pandas as pd
 
-from django.db.models import Prefetch, F
+from django.db.models import Prefetch
 from django.contrib import admin, messages
 from django.urls import path
 from django.http import HttpResponse, HttpResponseRedirect
 from django.shortcuts import render
-from django.utils import timezone
 
 import nested_admin
 
@@ -175,6 +173,33 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
             return self.readonly_fields + ["device"]
         return self.readonly_fields  # 생성하는 경우는 기본 설정 사용
 
+    # 목록 구성(노출/정렬/시리즈)이 바뀌는 필드 - 바뀌면 전역 제품 태그까지 무효화
+    STRUCTURAL_FIELDS = {"is_active", "is_featured", "sort_order", "product_series"}
+
+    @staticmethod
+    def _formset_changed(formset):
+        return any(
+            getattr(formset, attr, None)
+            for attr in ("new_objects", "changed_objects", "deleted_objects")
+        )
+
+    def _revalidate_saved_product(self, form, formsets, change):
+        """제품 폼 + inline(옵션/상세 이미지) 저장 결과로 revalidate 태그를 정한다."""
+        from phone.revalidate import revalidate_products
+
+        if not change or self.STRUCTURAL_FIELDS & set(form.changed_data):
+            revalidate_products()
+        elif form.changed_data or any(
+            self._formset_changed(formset) for formset in formsets
+        ):
+            revalidate_products(product_ids=[form.instance.id])
+
+    def delete_model(self, request, obj):
+        from phone.revalidate import revalidate_products
+
+        super().delete_model(request, obj)
+        revalidate_products()
+
     # admin의 URL 패턴 확장
     def get_urls(self):
         urls = super().get_urls()
@@ -221,7 +246,9 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
 
         success = revalidate_products()
         if success:
-            messages.success(request, "✅ 모든 제품 캐시가 성공적으로 갱신되었습니다.")
+            messages.success(
+                request, "✅ 모든 제품 캐시 갱신을 요청했습니다. 수 초 내 반영됩니다."
+            )
         else:
             messages.error(request, "❌ 캐시 갱신에 실패했습니다. 로그를 확인해주세요.")
 
@@ -231,10 +258,11 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
         """단일 제품 캐시 revalidate"""
         from phone.revalidate import revalidate_products
 
-        success = revalidate_products()
+        success = revalidate_products(product_ids=[object_id])
         if success:
             messages.success(
-                request, f"✅ 제품 ID {object_id} 캐시가 성공적으로 갱신되었습니다."
+                request,
+                f"✅ 제품 ID {object_id} 캐시 갱신을 요청했습니다. 수 초 내 반영됩니다.",
             )
         else:
             messages.error(request, "❌ 캐시 갱신에 실패했습니다. 로그를 확인해주세요.")
@@ -246,112 +274,30 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
         """선택된 제품들의 캐시 revalidate (Admin Action)"""
         from phone.revalidate import revalidate_products
 
-        success = revalidate_products()
+        success = revalidate_products(
+            product_ids=list(queryset.values_list("id", flat=True))
+        )
         if success:
             messages.success(
                 request,
-                f"✅ {queryset.count()}개 제품의 캐시가 성공적으로 갱신되었습니다.",
+                f"✅ {queryset.count()}개 제품의 캐시 갱신을 요청했습니다. "
+                "수 초 내 반영됩니다.",
             )
         else:
             messages.error(request, "❌ 캐시 갱신에 실패했습니다. 로그를 확인해주세요.")
 
     def save_current_prices(self, request):
         """
-        모든 활성 상품의 현재 최저가를 PriceHistory에 저장
+        모든 활성 상품의 현재 최저가를 PriceHistory에 저장 (beat 스냅샷과 같은 로직을 즉시 실행)
         - (product, carrier) 조합별로 6개월 총액 기준 가장 저렴한 공시지원금 옵션의 final_price 저장
-        - 같은 날짜의 같은 (product, carrier) 레코드가 이미 있으면 update, 없으면 create
-        - 이전 가격과 동일하면 스킵
+        - 같은 날짜의 같은 (product, carrier) 레코드가 이미 있으면 가격이 달라졌을 때만 update
         """
-        today = timezone.now().date()
-        created_count = 0
-        updated_count = 0
-        skipped_count = 0
-
-        # 1. 활성 상품 목록 조회 (1 쿼리)
-        products = list(
-            Product.objects.filter(deleted_at__isnull=True, is_active=True).only("id")
-        )
-
-        if not products:
-            messages.info(request, "활성 상품이 없습니다.")
-            return HttpResponseRedirect("../")
-
-        product_ids = [p.id for p in products]
-
-        # 2. 모든 공시지원금 옵션을 한 번에 조회 (1 쿼리)
-        # 6개월 총액 계산하여 정렬 - (product_id, carrier)별로 최저가 선택
-        all_options = list(
-            ProductOption.objects.filter(
-                product_id__in=product_ids,
-                discount_type=DiscountTypeChoices.SUBSIDY,
-                deleted_at__isnull=True,
-                plan__deleted_at__isnull=True,
-            )
-            .select_related("plan")
-            .annotate(six_month_total=F("final_price") + F("plan__price") * 6)
-            .order_by("six_month_total")
-        )
-
-        # (product_id, carrier) -> best_option 매핑 (six_month_total 기준 최저가)
-        best_options_map = {}
-        for opt in all_options:
-            key = (opt.product_id, opt.plan.carrier)
-            if key not in best_options_map:
-                best_options_map[key] = opt
-
-        # 3. 오늘 날짜의 기존 PriceHistory 조회 (1 쿼리)
-        # DB unique_together = (product, price_at, carrier) 와 동일한 키로 조회
-        carriers = [code for code, _ in CarrierChoices.CHOICES]
-
-        existing_histories = list(
-            PriceHistory.objects.filter(
-                product_id__in=product_ids,
-                carrier__in=carriers,
-                price_at=today,
-            )
-        )
-
-        # (product_id, carrier) -> history 인스턴스 매핑
-        history_map = {(h.product_id, h.carrier): h for h in existing_histories}
-
-        # 4. CREATE / UPDATE / SKIP 분기
-        to_create = []
-        to_update = []
-
-        for (product_id, carrier), best_option in best_options_map.items():
-            existing = history_map.get((product_id, carrier))
-
-            if existing is None:
-                # 오늘 날짜 레코드가 없으면 새로 생성
-                to_create.append(
-                    PriceHistory(
-                        product_id=product_id,
-                        carrier=carrier,
-                        final_price=best_option.final_price,
-                        plan_id=best_option.plan_id,
-                        price_at=today,
-                    )
-                )
-                created_count += 1
-            elif existing.final_price == best_option.final_price:
-                # 가격이 동일하면 스킵 (plan_id가 달라도 가격 기준)
-                skipped_count += 1
-            else:
-                # 가격이 달라졌으면 기존 레코드 업데이트
-                existing.final_price = best_option.final_price
-                existing.plan_id = best_option.plan_id
-                to_update.append(existing)
-                updated_count += 1
-
-        # 5. bulk 저장
-        if to_create:
-            PriceHistory.objects.bulk_create(to_create)
-        if to_update:
-            PriceHistory.objects.bulk_update(to_update, ["final_price", "plan_id"])
+        from phone.price_snapshot import snapshot_price_history
 
+        counts = snapshot_price_history()
         messages.success(
             request,
-            f"✅ 가격 기록 저장 완료: {created_count}개 생성, {updated_count}개 업데이트, {skipped_count}개 스킵",
+            f"✅ 가격 기록 저장 완료: {counts['created']}개 생성, {counts['updated']}개 업데이트",
         )
 
         return HttpResponseRedirect("../")
@@ -449,6 +395,9 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
             )
         )
 
+        # pandas 는 CSV 내보내기/업로드에서만 로드 (웹 워커 기동 시간/메모리 절감)
+        import pandas as pd
+
         df = pd.DataFrame(data)
 
         output = BytesIO()
@@ -465,6 +414,8 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
 
     def upload_excel(self, request):
         if request.method == "POST" and request.FILES.get("excel_file"):
+            import pandas as pd
+
             excel_file = request.FILES["excel_file"]
 
             try:
@@ -669,6 +620,8 @@ class ProductAdmin(nested_admin.NestedModelAdmin):
                 formset.deleted_objects = []
             else:
                 self.save_formset(request, form, formset, change=change)
+        # 태그는 inline 까지 저장된 뒤 한 번에 계산한다.
+        self._revalidate_saved_product(form, formsets, change)
 
 
 @admin.register(ProductOption)
@@ -0,0 +1,339 @@
+"""
+공개 API end-to-end 벤치마크
+
+실제 트래픽과 비슷한 비율(TRAFFIC_MIX)로 요청을 섞어 보내고 엔드포인트별
+p50/p95/p99 지연시간, 요청당 쿼리 수, 전체 처리량(req/s)을 잰다.
+
+    - in-process (기본): Django 테스트 Client 로 같은 프로세스에서 호출한다.
+      요청마다 CaptureQueriesContext 로 쿼리 수를 센다.
+    - HTTP: base_url 로 떠 있는 서버(gunicorn 등)에 concurrency 개 스레드로 보낸다.
+      서버가 DEBUG 면 Server-Timing 헤더(RequestMetricsMiddleware)에서 쿼리 수를 읽는다.
+
+결과는 JSON 으로 저장해 baseline 으로 쓰고, 다음 실행 결과와 비교해 p95 가
+threshold 비율 이상 느려지거나 쿼리 수가 늘어난 엔드포인트를 회귀로 표시한다.
+
+사용법:
+    from phone.api_benchmark import InProcessTransport, BenchmarkTargets, run_benchmark
+
+    targets = BenchmarkTargets.from_db()
+    result = run_benchmark(InProcessTransport(), targets, requests=500)
+    regressions = compare_to_baseline(result, load_baseline(path), threshold=0.2)
+"""
+
+import json
+import random
+import re
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from internet.models import InternetCarrier
+from phone.constants import CardSlotChoices, CarrierChoices, ContactChannelChoices
+from phone.models import PartnerCard, Product
+
+CARRIERS = (CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG)
+
+# 엔드포인트 이름 -> 가중치 (대략적인 운영 트래픽 비율)
+TRAFFIC_MIX = {
+    "product_list_carrier": 20,
+    "product_list_brand": 10,
+    "product_detail": 25,
+    "price_chart": 15,
+    "calculator_post": 10,
+    "calculator_patch": 5,
+    "partner_cards": 10,
+    "internet_plans": 5,
+}
+
+# 연결 실패(서버가 응답 없이 끊음 / 타임아웃)를 집계할 때 쓰는 상태 코드
+CONNECTION_ERROR_STATUS = 599
+
+_SERVER_TIMING_QUERIES = re.compile(r'db;[^,]*desc="(\d+) queries"')
+
+
+@dataclass
+class BenchmarkTargets:
+    """요청 경로를 만들 때 쓰는 id 목록."""
+
+    product_ids: list
+    brands: list
+    card_ids: list
+    internet_carrier_ids: list
+    session_ids: list = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @classmethod
+    def from_db(cls):
+        products = Product.objects.filter(
+            is_active=True, best_price_option__isnull=False
+        )
+        return cls(
+            product_ids=list(products.order_by("id").values_list("id", flat=True)),
+            brands=sorted(set(products.values_list("device__brand", flat=True))),
+            card_ids=list(
+                PartnerCard.objects.filter(is_active=True)
+                .order_by("sort_order", "id")
+                .values_list("id", flat=True)[:2]
+            ),
+            internet_carrier_ids=list(
+                InternetCarrier.objects.order_by("id").values_list("id", flat=True)
+            ),
+        )
+
+
+def _calculator_payload(targets, rng):
+    slots = CardSlotChoices.VALUES
+    return {
+        "answers": {
+            "carrier": rng.choice(CARRIERS),
+            "internet": targets.internet_carrier_ids[:1],
+        },
+        "auto_selected": {
+            "partner_card_slots": [
+                {
+                    "slot": slots[i % len(slots)],
+                    "card_id": card_id,
+                    "card_name": f"bench-{card_id}",
+                    "spend_allocated": 300000,
+                    "amount_monthly": 10000,
+                }
+                for i, card_id in enumerate(targets.card_ids)
+            ]
+        },
+        "result": {"winner": None},
+    }
+
+
+def build_request(name, targets, rng):
+    """엔드포인트 이름 -> (method, path, JSON body). 만들 수 없으면 None."""
+    if name == "product_list_carrier":
+        return "GET", f"/phone/products?carrier={rng.choice(CARRIERS)}", None
+    if name == "product_list_brand" and targets.brands:
+        return "GET", f"/phone/products?brand={rng.choice(targets.brands)}", None
+    if name == "product_detail" and targets.product_ids:
+        product_id = rng.choice(targets.product_ids)
+        return (
+            "GET",
+            f"/phone/products/{product_id}?carrier={rng.choice(CARRIERS)}",
+            None,
+        )
+    if name == "price_chart" and targets.product_ids:
+        product_id = rng.choice(targets.product_ids)
+        period = rng.choice(("1week", "1month", "3months"))
+        return (
+            "GET",
+            f"/phone/price-history-chart?product_id={product_id}&period={period}",
+            None,
+        )
+    if name == "calculator_post":
+        return "POST", "/phone/calculator-sessions", _calculator_payload(targets, rng)
+    if name == "calculator_patch":
+        with targets.lock:
+            if not targets.session_ids:
+                return None
+            session_id = targets.session_ids.pop()
+        return (
+            "PATCH",
+            f"/phone/calculator-sessions/{session_id}",
+            {"contact_channel": ContactChannelChoices.KAKAO},
+        )
+    if name == "partner_cards":
+        return "GET", "/phone/partner-cards", None
+    if name == "internet_plans":
+        return "GET", "/internet/plans", None
+    return None
+
+
+class InProcessTransport:
+    """Django 테스트 Client 로 같은 프로세스/DB 연결에서 호출한다 (동시성 1)."""
+
+    concurrency = 1
+
+    def __init__(self):
+        self.client = Client()
+
+    def send(self, method, path, body, remote_addr):
+        kwargs = {"secure": True, "REMOTE_ADDR": remote_addr}
+        if body is not None:
+            kwargs.update(data=json.dumps(body), content_type="application/json")
+        with CaptureQueriesContext(connection) as ctx:
+            start = time.perf_counter()
+            response = getattr(self.client, method.lower())(path, **kwargs)
+            elapsed = time.perf_counter() - start
+        return response.status_code, elapsed, len(ctx.captured_queries), response
+
+
+class HttpTransport:
+    """떠 있는 서버(gunicorn 등)로 HTTP 요청을 보낸다."""
+
+    def __init__(self, base_url, concurrency=4, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.timeout = timeout
+
+    def send(self, method, path, body, remote_addr):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(
+            self.base_url + path,
+            data=data,
+            method=method,
+            headers={
+                "Content-Type": "application/json",
+                "X-Forwarded-For": remote_addr,
+            },
+        )
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read()
+                status, headers = response.status, response.headers
+        except urllib.error.HTTPError as e:
+            payload, status, headers = e.read(), e.code, e.headers
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            # 과부하로 서버가 연결을 끊은 경우 - 에러 응답으로 집계한다
+            payload, status, headers = b"", CONNECTION_ERROR_STATUS, {}
+        elapsed = time.perf_counter() - start
+        match = _SERVER_TIMING_QUERIES.search(headers.get("Server-Timing", ""))
+        return status, elapsed, int(match[1]) if match else None, payload
+
+
+def _session_id(response):
+    if hasattr(response, "json"):
+        return response.json().get("id")
+    return json.loads(response).get("id")
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(
+        len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def run_benchmark(transport, targets, requests=500, mix=None, seed=0, warmup=1):
+    """mix 비율로 requests 번 요청하고 엔드포인트별 통계 dict 를 반환.
+
+    warmup: 엔드포인트별 처음 N번은 통계에서 뺀다 (캐시 / 커넥션 준비).
+    """
+    mix = {name: weight for name, weight in (mix or TRAFFIC_MIX).items() if weight > 0}
+    unknown = set(mix) - set(TRAFFIC_MIX)
+    if unknown:
+        raise ValueError(f"알 수 없는 엔드포인트: {sorted(unknown)}")
+    rng = random.Random(seed)
+    names = rng.choices(list(mix), weights=list(mix.values()), k=requests)
+    # 익명 사용자마다 다른 IP - AnonRateThrottle 에 걸리지 않게
+    plan = [
+        (name, f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}")
+        for i, name in enumerate(names)
+    ]
+
+    samples = {name: [] for name in mix}
+    warmed = {name: 0 for name in mix}
+    sample_lock = threading.Lock()
+
+    def run_one(name, remote_addr, request_rng):
+        request = build_request(name, targets, request_rng)
+        if request is None:
+            # PATCH 할 세션이 아직 없으면 POST 로 대신한다
+            name = "calculator_post" if name == "calculator_patch" else name
+            request = build_request(name, targets, request_rng)
+            if request is None:
+                return
+        status, elapsed, queries, response = transport.send(*request, remote_addr)
+        if name == "calculator_post" and status < 400:
+            session_id = _session_id(response)
+            if session_id:
+                with targets.lock:
+                    targets.session_ids.append(session_id)
+        with sample_lock:
+            bucket = samples.setdefault(name, [])
+            if warmed.get(name, 0) < warmup:
+                warmed[name] = warmed.get(name, 0) + 1
+                return
+            bucket.append((status, elapsed * 1000, queries))
+
+    request_rngs = [random.Random(rng.getrandbits(64)) for _ in plan]
+    started = time.perf_counter()
+    if transport.concurrency > 1:
+        with ThreadPoolExecutor(max_workers=transport.concurrency) as pool:
+            for future in [
+                pool.submit(run_one, name, addr, request_rng)
+                for (name, addr), request_rng in zip(plan, request_rngs)
+            ]:
+                future.result()
+    else:
+        for (name, addr), request_rng in zip(plan, request_rngs):
+            run_one(name, addr, request_rng)
+    wall = time.perf_counter() - started
+
+    endpoints = {}
+    for name, rows in samples.items():
+        if not rows:
+            continue
+        timings = sorted(ms for _, ms, _ in rows)
+        queries = [q for _, _, q in rows if q is not None]
+        endpoints[name] = {
+            "count": len(rows),
+            "errors": sum(1 for status, _, _ in rows if status >= 400),
+            "p50_ms": round(_percentile(timings, 50), 2),
+            "p95_ms": round(_percentile(timings, 95), 2),
+            "p99_ms": round(_percentile(timings, 99), 2),
+            "mean_ms": round(statistics.fmean(timings), 2),
+            "queries": round(statistics.fmean(queries), 1) if queries else None,
+        }
+    return {
+        "meta": {
+            "requests": requests,
+            "seed": seed,
+            "concurrency": transport.concurrency,
+            "measured_at": timezone.now().isoformat(timespec="seconds"),
+        },
+        "throughput_rps": round(requests / wall, 1) if wall else None,
+        "endpoints": endpoints,
+    }
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(result, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def compare_to_baseline(result, baseline, threshold=0.2):
+    """baseline 대비 회귀 목록 [(엔드포인트, 설명)]. p95 는 threshold 비율, 쿼리 수는 1개라도."""
+    regressions = []
+    for name, current in result["endpoints"].items():
+        base = baseline.get("endpoints", {}).get(name)
+        if not base:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                (
+                    name,
+                    f"p95 {base['p95_ms']:.1f}ms → {current['p95_ms']:.1f}ms "
+                    f"(+{current['p95_ms'] / base['p95_ms'] - 1:.0%})",
+                )
+            )
+        if (
+            current["queries"] is not None
+            and base.get("queries") is not None
+            and current["queries"] > base["queries"]
+        ):
+            regressions.append((name, f"쿼리 {base['queries']} → {current['queries']}"))
+    return regressions
@@ -0,0 +1,168 @@
+"""
+sync(WSGI) vs async(ASGI) 배포의 동시 처리 용량 비교
+
+같은 DB / 같은 워커 수로 두 배포를 띄우고, 읽기 API(상품 목록/상세, 가격 차트) 믹스를
+동시성 단계별로 보내 처리량과 p95 를 잰다. 엔드포인트 p95 가 모두 예산 안이고 에러가
+없는 가장 높은 동시성을 그 배포의 '용량'으로 본다.
+
+    - sync: gunicorn phoneinone_server.wsgi:application (sync 워커, Procfile 과 같음)
+    - async: gunicorn phoneinone_server.asgi:application -k uvicorn_worker.UvicornWorker
+      (ASYNC_READ_API=True → phone.views.async_views)
+
+요청 생성 / 통계는 phone.api_benchmark(HttpTransport, run_benchmark)를 그대로 쓴다.
+서버는 현재 DB 데이터를 읽으므로 카탈로그를 미리 만들어 두어야 한다
+(generate_synthetic_catalog).
+
+사용법:
+    from phone.async_benchmark import DEPLOYMENTS, compare_deployments, serve
+
+    with serve("sync", workers=2) as sync_url, serve("async", workers=2) as async_url:
+        rows = compare_deployments(
+            {"sync": sync_url, "async": async_url}, targets, concurrencies=(1, 16, 64)
+        )
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from contextlib import contextmanager
+
+from django.conf import settings
+
+from phone.api_benchmark import HttpTransport, run_benchmark
+
+# 읽기 API 만 (async view 로 바뀐 경로). 비율은 api_benchmark.TRAFFIC_MIX 와 같다.
+READ_MIX = {
+    "product_list_carrier": 20,
+    "product_list_brand": 10,
+    "product_detail": 25,
+    "price_chart": 15,
+}
+
+DEPLOYMENTS = {
+    "sync": {
+        "args": ["phoneinone_server.wsgi:application"],
+        "env": {"ASYNC_READ_API": "False"},
+    },
+    "async": {
+        "args": [
+            "phoneinone_server.asgi:application",
+            "-k",
+            "uvicorn_worker.UvicornWorker",
+        ],
+        "env": {"ASYNC_READ_API": "True"},
+    },
+}
+
+DEFAULT_CONCURRENCIES = (1, 8, 32, 64)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_ready(url, process, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"서버가 기동 중 종료됨 (exit {process.returncode})")
+        try:
+            with urllib.request.urlopen(f"{url}/phone/ping", timeout=2):
+                return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}초 안에 응답하지 않음: {url}")
+
+
+@contextmanager
+def serve(deployment, workers=1, settings_module=None, timeout=60):
+    """deployment 를 gunicorn 으로 띄우고 base URL 을 돌려준다. 블록을 나가면 종료."""
+    if deployment not in DEPLOYMENTS:
+        raise ValueError(
+            f"알 수 없는 배포: {deployment} (가능: {', '.join(DEPLOYMENTS)})"
+        )
+    config = DEPLOYMENTS[deployment]
+    port = _free_port()
+    url = f"http://localhost:{port}"
+    env = {
+        **os.environ,
+        **config["env"],
+        "PROCESS_ROLE": "web",
+        "DJANGO_SETTINGS_MODULE": settings_module or settings.SETTINGS_MODULE,
+    }
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "gunicorn",
+            *config["args"],
+            "--workers",
+            str(workers),
+            "--bind",
+            f"127.0.0.1:{port}",
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+        cwd=settings.BASE_DIR,
+    )
+    try:
+        _wait_ready(url, process, timeout)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def capacity(rows, p95_budget_ms):
+    """p95 예산 안이고 에러가 없는 가장 높은 동시성 (없으면 0)."""
+    passing = [
+        row["concurrency"]
+        for row in rows
+        if row["errors"] == 0 and row["worst_p95_ms"] <= p95_budget_ms
+    ]
+    return max(passing, default=0)
+
+
+def compare_deployments(
+    base_urls,
+    targets,
+    concurrencies=DEFAULT_CONCURRENCIES,
+    requests=300,
+    mix=None,
+    seed=0,
+    warmup=1,
+):
+    """base_urls({배포 이름: URL})마다 동시성 단계별로 run_benchmark 결과를 요약한다."""
+    rows = []
+    for deployment, url in base_urls.items():
+        for concurrency in concurrencies:
+            result = run_benchmark(
+                HttpTransport(url, concurrency=concurrency),
+                targets,
+                requests=requests,
+                mix=mix or READ_MIX,
+                seed=seed,
+                warmup=warmup,
+            )
+            endpoints = result["endpoints"]
+            rows.append(
+                {
+                    "deployment": deployment,
+                    "concurrency": concurrency,
+                    "throughput_rps": result["throughput_rps"],
+                    "worst_p95_ms": max(e["p95_ms"] for e in endpoints.values()),
+                    "errors": sum(e["errors"] for e in endpoints.values()),
+                    "endpoints": endpoints,
+                }
+            )
+    return rows
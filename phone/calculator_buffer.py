@@ -0,0 +1,338 @@
+"""
+CalculatorSession write-behind 버퍼
+
+광고 집행 중에는 result_view POST(CalculatorSession INSERT)가 가장 무거운 쓰기 경로가
+된다. CALCULATOR_WRITE_BEHIND=True 이면 view 는 검증 + UUID 발급 후 row 를 버퍼에
+넣고 바로 201 을 반환하고, 워커(task_flush_calculator_sessions)가 모아서
+bulk_create 한다.
+
+버퍼 구조 (Redis):
+    - {prefix}:pending:<session_id>  row payload(JSON), TTL 보관
+    - {prefix}:stream                session_id 만 담긴 stream (consumer group 으로 소비)
+
+아직 버퍼에 있는 세션에 PATCH/GET 이 오면 `ensure_session_persisted` 가 해당 row 를
+먼저 INSERT 한 뒤 기존 DB 경로를 그대로 탄다. INSERT 는 세션 id 별 advisory lock 아래
+이미 있는 id 를 건너뛰므로 워커와 요청이 같은 row 를 동시에 넣어도 먼저 들어간 row 가
+유지되고, PATCH 의 first-write-wins(contact_channel IS NULL 조건부 UPDATE)도 그대로
+보존된다.
+created_at 은 INSERT(flush/승격) 시점 기준이라 응답 시점보다 수 초 늦을 수 있다.
+
+배치 INSERT 가 FK / 데이터 오류로 실패하면 row 단위로 다시 넣고, 그래도 실패하는 row 는
+dead-letter({prefix}:dead)로 옮긴 뒤 배치 전체를 ack 한다. 오류 row 하나 때문에 같은
+배치가 계속 재전달되다 정상 세션까지 TTL 로 사라지는 것을 막는다.
+
+사용법:
+    from phone.calculator_buffer import buffer_session, flush_session_buffer
+
+    session_id = buffer_session(flat, internet_ids)
+    flush_session_buffer()  # 워커에서 주기 실행
+"""
+
+import json
+import logging
+import os
+import socket
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, connection, transaction
+from django.utils.module_loading import import_string
+
+from internet.models import InternetCarrier
+from phone.models import CalculatorSession
+
+logger = logging.getLogger(__name__)
+
+# 재시도해도 같은 결과가 나오는 row 단위 오류 (DB 장애 등은 ack 하지 않고 재전달에 맡긴다)
+POISON_ERRORS = (IntegrityError, DataError, TypeError, ValueError)
+
+
+class RedisSessionBuffer:
+    """Redis stream + pending key 기반 버퍼 (운영 기본값)."""
+
+    group = "calculator_session_writers"
+    # 워커가 읽고 ack 하지 못한 채 죽은 경우, 이 시간(ms) 이후 다른 워커가 회수한다.
+    claim_idle_ms = 60 * 1000
+
+    def __init__(self, url: str | None = None, prefix: str | None = None):
+        import redis
+
+        self.client = redis.Redis.from_url(
+            url or settings.CALCULATOR_BUFFER_REDIS_URL, decode_responses=True
+        )
+        self.prefix = prefix or settings.CALCULATOR_BUFFER_KEY_PREFIX
+        self.stream = f"{self.prefix}:stream"
+        self.dead_key = f"{self.prefix}:dead"
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self._group_ready = False
+
+    def _pending_key(self, session_id: str) -> str:
+        return f"{self.prefix}:pending:{session_id}"
+
+    def _ensure_group(self):
+        if self._group_ready:
+            return
+        import redis
+
+        try:
+            self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    def push(self, session_id: str, payload: dict):
+        pipe = self.client.pipeline()
+        pipe.set(
+            self._pending_key(session_id),
+            json.dumps(payload, ensure_ascii=False),
+            ex=settings.CALCULATOR_BUFFER_TTL,
+        )
+        pipe.xadd(self.stream, {"id": session_id})
+        pipe.execute()
+
+    def get(self, session_id: str) -> dict | None:
+        raw = self.client.get(self._pending_key(session_id))
+        return json.loads(raw) if raw else None
+
+    def read_batch(self, count: int) -> list[tuple[str, dict | None]]:
+        """(entry_id, payload) 목록. 죽은 워커가 잡고 있던 entry 를 먼저 회수한다."""
+        self._ensure_group()
+        _, claimed, _ = self.client.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer,
+            min_idle_time=self.claim_idle_ms,
+            count=count,
+        )
+        entries = list(claimed)
+        if len(entries) < count:
+            response = self.client.xreadgroup(
+                self.group,
+                self.consumer,
+                {self.stream: ">"},
+                count=count - len(entries),
+            )
+            for _, messages in response or []:
+                entries.extend(messages)
+
+        if not entries:
+            return []
+        session_ids = [fields["id"] for _, fields in entries]
+        raws = self.client.mget([self._pending_key(sid) for sid in session_ids])
+        return [
+            (entry_id, json.loads(raw) if raw else None)
+            for (entry_id, _), raw in zip(entries, raws)
+        ]
+
+    def ack(self, entries: list[tuple[str, dict | None]]):
+        entry_ids = [entry_id for entry_id, _ in entries]
+        pending_keys = [
+            self._pending_key(payload["id"]) for _, payload in entries if payload
+        ]
+        pipe = self.client.pipeline()
+        pipe.xack(self.stream, self.group, *entry_ids)
+        pipe.xdel(self.stream, *entry_ids)
+        if pending_keys:
+            pipe.delete(*pending_keys)
+        pipe.execute()
+
+    def discard(self, session_id: str):
+        """pending payload 만 지운다. stream entry 는 flush 때 만료로 ack 된다."""
+        self.client.delete(self._pending_key(session_id))
+
+    def dead_letter(self, failures: list[tuple[dict, str]]):
+        """INSERT 할 수 없는 payload 를 오류 메시지와 함께 {prefix}:dead 리스트에 보관."""
+        self.client.rpush(
+            self.dead_key,
+            *[
+                json.dumps({"payload": payload, "error": error}, ensure_ascii=False)
+                for payload, error in failures
+            ],
+        )
+
+
+class InMemorySessionBuffer:
+    """테스트/로컬용 프로세스 내 버퍼 - RedisSessionBuffer 와 같은 인터페이스."""
+
+    def __init__(self):
+        self.pending = OrderedDict()
+        self.stream = []
+        self.dead = []
+        self._seq = 0
+
+    def push(self, session_id: str, payload: dict):
+        # Redis 경로와 동일하게 JSON 직렬화 가능한 payload 만 허용
+        self.pending[session_id] = json.loads(json.dumps(payload))
+        self._seq += 1
+        self.stream.append((str(self._seq), session_id))
+
+    def get(self, session_id: str) -> dict | None:
+        return self.pending.get(session_id)
+
+    def read_batch(self, count: int) -> list[tuple[str, dict | None]]:
+        return [
+            (entry_id, self.pending.get(session_id))
+            for entry_id, session_id in self.stream[:count]
+        ]
+
+    def ack(self, entries: list[tuple[str, dict | None]]):
+        done = {entry_id for entry_id, _ in entries}
+        for entry_id, session_id in self.stream:
+            if entry_id in done:
+                self.pending.pop(session_id, None)
+        self.stream = [entry for entry in self.stream if entry[0] not in done]
+
+    def discard(self, session_id: str):
+        self.pending.pop(session_id, None)
+
+    def dead_letter(self, failures: list[tuple[dict, str]]):
+        self.dead.extend(
+            {"payload": payload, "error": error} for payload, error in failures
+        )
+
+
+@lru_cache(maxsize=None)
+def get_session_buffer():
+    return import_string(settings.CALCULATOR_SESSION_BUFFER)()
+
+
+def buffer_session(flat: dict, internet_ids: list[int]) -> uuid.UUID:
+    """세션 row 를 버퍼에 넣고 발급한 UUID 를 반환한다 (DB 접근 없음)."""
+    session_id = uuid.uuid4()
+    get_session_buffer().push(
+        str(session_id),
+        {"id": str(session_id), "fields": flat, "internet_ids": internet_ids},
+    )
+    return session_id
+
+
+def persist_sessions(payloads: list[dict]) -> int:
+    """버퍼 payload 를 CalculatorSession / internet_carriers 로 bulk INSERT.
+
+    이미 존재하는 id 는 건너뛴다 (먼저 들어간 row 유지). 반환값은 시도한 row 수.
+    calculator_session 은 created_at 파티션 테이블이라 PK 가 (id, created_at) 이고
+    id 만으로는 충돌이 나지 않는다 → id 별 advisory lock 을 잡고 존재 여부를 확인한다.
+    """
+    if not payloads:
+        return 0
+
+    carrier_ids = {cid for p in payloads for cid in p.get("internet_ids") or []}
+    valid_carrier_ids = (
+        set(
+            InternetCarrier.objects.filter(id__in=carrier_ids).values_list(
+                "id", flat=True
+            )
+        )
+        if carrier_ids
+        else set()
+    )
+
+    Through = CalculatorSession.internet_carriers.through
+    sessions = []
+    links = []
+    for payload in payloads:
+        session_id = uuid.UUID(payload["id"])
+        sessions.append(CalculatorSession(id=session_id, **payload["fields"]))
+        links.extend(
+            Through(calculatorsession_id=session_id, internetcarrier_id=cid)
+            for cid in payload.get("internet_ids") or []
+            if cid in valid_carrier_ids
+        )
+
+    with transaction.atomic():
+        _lock_session_ids([s.id for s in sessions])
+        existing = set(
+            CalculatorSession.objects.filter(
+                id__in=[s.id for s in sessions]
+            ).values_list("id", flat=True)
+        )
+        CalculatorSession.objects.bulk_create(
+            [s for s in sessions if s.id not in existing], ignore_conflicts=True
+        )
+        links = [link for link in links if link.calculatorsession_id not in existing]
+        if links:
+            Through.objects.bulk_create(links, ignore_conflicts=True)
+        # FK 는 DEFERRABLE 이라 COMMIT 때 검사된다 → 이 블록 안에서 검사해 오류를 여기서 낸다.
+        connection.check_constraints()
+    return len(sessions)
+
+
+def _lock_session_ids(session_ids):
+    """트랜잭션 끝까지 세션 id 별 advisory lock (정렬 순서로 잡아 교착 방지)."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(hashtext(k)) "
+            "FROM unnest(%s::text[]) AS k ORDER BY k",
+            [sorted(str(session_id) for session_id in session_ids)],
+        )
+
+
+def ensure_session_persisted(session_id) -> bool:
+    """버퍼에만 있는 세션이면 즉시 INSERT 한다. write-behind 비활성 시 no-op.
+
+    INSERT 할 수 없는 payload 는 dead-letter 로 옮기고 False 를 반환한다 (view 는 404).
+    """
+    if not settings.CALCULATOR_WRITE_BEHIND:
+        return False
+    buffer = get_session_buffer()
+    payload = buffer.get(str(session_id))
+    if payload is None:
+        return False
+    failures = _persist_one_by_one([payload])
+    if failures:
+        buffer.dead_letter(failures)
+        buffer.discard(str(session_id))
+        return False
+    logger.info("calculator_buffer.promoted session_id=%s", session_id)
+    return True
+
+
+def _persist_one_by_one(payloads: list[dict]) -> list[tuple[dict, str]]:
+    """배치 INSERT 가 실패했을 때 row 별로 다시 넣는다. 실패한 (payload, 오류) 목록을 반환."""
+    failures = []
+    for payload in payloads:
+        try:
+            persist_sessions([payload])
+        except POISON_ERRORS as e:
+            logger.error(
+                "calculator_buffer.dead_letter session_id=%s error=%r",
+                payload.get("id"),
+                e,
+            )
+            failures.append((payload, repr(e)))
+    return failures
+
+
+def flush_session_buffer(batch_size: int | None = None, max_batches: int = 20) -> int:
+    """버퍼를 batch_size 단위로 bulk_create 한다. 반환값은 처리한 entry 수."""
+    batch_size = batch_size or settings.CALCULATOR_BUFFER_BATCH_SIZE
+    buffer = get_session_buffer()
+    flushed = 0
+
+    for _ in range(max_batches):
+        entries = buffer.read_batch(batch_size)
+        if not entries:
+            break
+        payloads = [payload for _, payload in entries if payload]
+        expired = len(entries) - len(payloads)
+        if expired:
+            logger.warning("calculator_buffer.expired count=%s", expired)
+        try:
+            persist_sessions(payloads)
+        except POISON_ERRORS as e:
+            logger.warning("calculator_buffer.batch_failed error=%r", e)
+            failures = _persist_one_by_one(payloads)
+            if failures:
+                buffer.dead_letter(failures)
+        buffer.ack(entries)
+        flushed += len(entries)
+        logger.info(
+            "calculator_buffer.flushed batch=%s total=%s", len(entries), flushed
+        )
+        if len(entries) < batch_size:
+            break
+
+    return flushed
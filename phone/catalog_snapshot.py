@@ -0,0 +1,295 @@
+"""
+카탈로그 정적 스냅샷 (S3 / CloudFront)
+
+카탈로그는 가격 엑셀 업로드 / 재고 반영 / admin 상품 수정 때만 바뀌는데 사이트의 페이지
+뷰는 매번 Django API 를 거친다. 상품 목록(전체 + 통신사별), 상품 상세(전체 + 통신사별),
+시리즈 목록 응답을 미리 렌더링해 S3 에 올리고 프론트가 CloudFront 에서 읽는다.
+응답 본문은 API 와 같은 코드(쿼리 / serializer 또는 phone.product_payloads /
+ORJSONRenderer)로 만들어 바이트 단위로 같다.
+
+오브젝트 ({CATALOG_SNAPSHOT_PREFIX}/ 아래):
+    - objects/<내용 sha256>.json   응답 본문. 내용 주소라 같은 내용이면 같은 키 (immutable)
+    - manifests/<version>.json     발행 시점의 manifest (immutable, 롤백 / 추적용)
+    - manifest.json                현재 manifest (max-age=CATALOG_SNAPSHOT_MANIFEST_MAX_AGE)
+
+manifest:
+    {"version": "...", "generated_at": "...",
+     "objects": {"products": "objects/….json", "products?carrier=SK": "…",
+                 "products/12": "…", "products/12?carrier=SK": "…", "product-series": "…"}}
+
+objects 의 키는 /phone/ 뒤의 API 경로(+쿼리)다. 프론트는 manifest 에 키가 있으면
+CloudFront 에서 읽고, 키가 없거나 manifest 를 못 읽으면 기존 API 를 부른다 (fallback).
+API 가 404 인 응답(판매 상품이 없는 목록 등)은 키를 넣지 않는다.
+
+발행:
+    - revalidate_products(가격 / 재고 / 상품 변경)가 schedule_catalog_snapshot() 을 부르면
+      CATALOG_SNAPSHOT_COALESCE_WINDOW 초 동안의 변경을 모아 task_publish_catalog_snapshot
+      을 한 번 실행한다. beat 도 매시간 안전망으로 돈다.
+    - 이전 manifest 가 가리키는 오브젝트는 다시 올리지 않고, version(오브젝트 목록의 해시)이
+      같으면 manifest 도 쓰지 않는다.
+    - 발행은 Postgres advisory lock 으로 한 번에 하나만 돈다. 겹친 발행은 앞 발행이 끝난
+      뒤 렌더링부터 시작하므로 오래된 manifest 가 나중에 쓰이지 않는다.
+
+사용법:
+    from phone.catalog_snapshot import publish_catalog_snapshot, schedule_catalog_snapshot
+
+    schedule_catalog_snapshot()    # commit 후 발행 예약 (CATALOG_SNAPSHOT_ENABLED 일 때만)
+    publish_catalog_snapshot()     # {"version", "objects", "uploaded", "changed"}
+"""
+
+import hashlib
+import json
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from phone.constants import CarrierChoices
+from phone.product_payloads import product_detail_payload, product_list_payload
+from phone.renderers import ORJSONRenderer
+from phone.serializers import (
+    ProductDetailSerializer,
+    ProductListSerializer,
+    ProductSeriesSerializer,
+)
+from phone.views.product_views import (
+    ProductSeriesViewSet,
+    ProductViewSet,
+    detail_inventories,
+    group_in_stock_by_device,
+    in_stock_inventories,
+    product_detail_queryset,
+    product_list_querysets,
+    related_products_queryset,
+)
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "manifest.json"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+PUBLISH_SCHEDULED_KEY = "catalog_snapshot:publish_scheduled"
+PUBLISH_LOCK_KEY = "catalog_snapshot:publish"
+
+
+class S3SnapshotStore:
+    """CATALOG_SNAPSHOT_PREFIX 아래 S3 오브젝트 (운영 기본값)."""
+
+    def __init__(self):
+        import boto3  # 발행 시에만 로드 - 웹 워커가 boto3 를 import 하지 않게
+
+        self.client = boto3.client("s3", region_name=settings.AWS_S3_REGION_NAME)
+        self.bucket = settings.AWS_STORAGE_BUCKET_NAME
+
+    def _key(self, name):
+        return f"{settings.CATALOG_SNAPSHOT_PREFIX}/{name}"
+
+    def get(self, name: str) -> bytes | None:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._key(name))
+        except self.client.exceptions.NoSuchKey:
+            return None
+        return response["Body"].read()
+
+    def put(self, name: str, body: bytes, cache_control: str):
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(name),
+            Body=body,
+            ContentType="application/json",
+            CacheControl=cache_control,
+        )
+
+
+class InMemorySnapshotStore:
+    """테스트/로컬용 - S3SnapshotStore 와 같은 인터페이스."""
+
+    def __init__(self):
+        self.objects = {}
+
+    def get(self, name: str) -> bytes | None:
+        entry = self.objects.get(name)
+        return entry and entry[0]
+
+    def put(self, name: str, body: bytes, cache_control: str):
+        self.objects[name] = (body, cache_control)
+
+
+@lru_cache(maxsize=None)
+def get_snapshot_store():
+    return import_string(settings.CATALOG_SNAPSHOT_STORE)()
+
+
+def _render(data) -> bytes:
+    return ORJSONRenderer().render(data)
+
+
+def render_product_list(carrier: str | None = None) -> bytes | None:
+    """GET /phone/products[?carrier=] 응답 본문 (API 가 404 면 None)."""
+    base_queryset, queryset = product_list_querysets(
+        ProductViewSet.queryset.all(), {"carrier": carrier} if carrier else {}
+    )
+    if not base_queryset.exists():
+        return None
+    if settings.FAST_PRODUCT_SERIALIZATION:
+        return _render(product_list_payload(queryset, carrier))
+    in_stock_by_device = group_in_stock_by_device(in_stock_inventories(queryset))
+    serializer = ProductListSerializer(
+        queryset, many=True, context={"in_stock_by_device": in_stock_by_device}
+    )
+    return _render(serializer.data)
+
+
+def render_product_detail(product_id: int, carrier: str | None = None) -> bytes | None:
+    """GET /phone/products/<id>[?carrier=] 응답 본문 (조회수는 올리지 않는다)."""
+    base_queryset = ProductViewSet.queryset.filter(id=product_id)
+    if settings.FAST_PRODUCT_SERIALIZATION:
+        data = product_detail_payload(base_queryset, carrier)
+        return None if data is None else _render(data)
+    instance = product_detail_queryset(base_queryset, carrier).first()
+    if instance is None:
+        return None
+    related_products = []
+    if instance.product_series_id:
+        related_products = related_products_queryset(instance)
+    serializer = ProductDetailSerializer(
+        instance,
+        context={
+            "inventories": detail_inventories(instance),
+            "related_products": related_products,
+        },
+    )
+    return _render(serializer.data)
+
+
+def render_product_series() -> bytes:
+    """GET /phone/product-series 응답 본문."""
+    queryset = ProductSeriesViewSet.queryset.all().order_by("name")
+    return _render(ProductSeriesSerializer(queryset, many=True).data)
+
+
+def build_snapshot() -> dict[str, bytes]:
+    """{API 경로(+쿼리): 응답 본문}. 404 인 경로는 빠진다."""
+    carriers = [None, *CarrierChoices.VALUES]
+    bodies = {}
+    for carrier in carriers:
+        bodies[_path("products", carrier)] = render_product_list(carrier)
+    product_ids = ProductViewSet.queryset.order_by("id").values_list("id", flat=True)
+    for product_id in product_ids:
+        for carrier in carriers:
+            bodies[_path(f"products/{product_id}", carrier)] = render_product_detail(
+                product_id, carrier
+            )
+    bodies["product-series"] = render_product_series()
+    return {path: body for path, body in bodies.items() if body is not None}
+
+
+def _path(path, carrier):
+    return f"{path}?carrier={carrier}" if carrier else path
+
+
+def _object_name(body: bytes) -> str:
+    return f"objects/{hashlib.sha256(body).hexdigest()}.json"
+
+
+@contextmanager
+def _publish_lock():
+    """발행 전체(렌더링 ~ manifest 쓰기)를 감싸는 세션 advisory lock."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [PUBLISH_LOCK_KEY])
+    try:
+        yield
+    finally:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_advisory_unlock(hashtext(%s))", [PUBLISH_LOCK_KEY]
+            )
+
+
+def publish_catalog_snapshot(store=None) -> dict:
+    """스냅샷을 렌더링해 바뀐 오브젝트와 manifest 를 올린다."""
+    # 발행 중에 들어온 변경은 새 예약으로 이어지도록 lock 전에 지운다.
+    cache.delete(PUBLISH_SCHEDULED_KEY)
+    store = store or get_snapshot_store()
+    with _publish_lock():
+        return _publish(store)
+
+
+def _publish(store) -> dict:
+    bodies = build_snapshot()
+
+    current = store.get(MANIFEST)
+    current = json.loads(current) if current else {"version": None, "objects": {}}
+    published = set(current["objects"].values())
+
+    objects = {}
+    uploaded = 0
+    for path, body in bodies.items():
+        name = _object_name(body)
+        if name not in published:
+            store.put(name, body, IMMUTABLE)
+            published.add(name)
+            uploaded += 1
+        objects[path] = name
+
+    digest = hashlib.sha256(json.dumps(objects, sort_keys=True).encode())
+    version = digest.hexdigest()[:16]
+    stats = {
+        "version": version,
+        "objects": len(objects),
+        "uploaded": uploaded,
+        "changed": version != current["version"],
+    }
+    if stats["changed"]:
+        manifest = json.dumps(
+            {
+                "version": version,
+                "generated_at": timezone.now().isoformat(),
+                "objects": objects,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        ).encode()
+        store.put(f"manifests/{version}.json", manifest, IMMUTABLE)
+        store.put(
+            MANIFEST,
+            manifest,
+            f"public, max-age={settings.CATALOG_SNAPSHOT_MANIFEST_MAX_AGE}",
+        )
+
+    logger.info(
+        "catalog_snapshot.published version=%s objects=%s uploaded=%s changed=%s",
+        stats["version"],
+        stats["objects"],
+        stats["uploaded"],
+        stats["changed"],
+    )
+    return stats
+
+
+def _schedule_publish():
+    # 윈도우당 발행 예약은 한 번만 (revalidate._schedule_flush 와 같은 방식)
+    window = settings.CATALOG_SNAPSHOT_COALESCE_WINDOW
+    if not cache.add(PUBLISH_SCHEDULED_KEY, 1, timeout=window * 5):
+        return
+    from phone.tasks import task_publish_catalog_snapshot
+
+    try:
+        task_publish_catalog_snapshot.apply_async(countdown=window)
+    except Exception:
+        # broker 장애 시에는 beat 의 매시간 발행이 처리한다
+        cache.delete(PUBLISH_SCHEDULED_KEY)
+        logger.exception("catalog_snapshot.schedule_failed")
+
+
+def schedule_catalog_snapshot() -> bool:
+    """현재 트랜잭션이 commit 되면 스냅샷 발행을 예약한다. 꺼져 있으면 False."""
+    if not settings.CATALOG_SNAPSHOT_ENABLED:
+        return False
+    transaction.on_commit(_schedule_publish)
+    return True
@@ -113,3 +113,15 @@ class OpenMarketChoices(object):
     ]
 
     VALUES = [ST11, GMK, SSG, LTON]
+
+
+class OutboxStatusChoices(object):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    CHOICES = [
+        (PENDING, "대기"),
+        (SENT, "발송"),
+        (FAILED, "실패"),
+    ]
+    VALUES = [PENDING, SENT, FAILED]
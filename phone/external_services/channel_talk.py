@@ -1,4 +1,5 @@
 import requests
+from django.conf import settings
 from phoneinone_server.settings import (
     CHANENLTALK_ACCESS_KEY,
     CHANENLTALK_ACCESS_SECRET,
@@ -15,22 +16,26 @@ class ChannelTalkAPI:
     ORDER_ALERT_GROUP_ID = "501418" if DEBUG else "501406"
     OPEN_MARKET_ERROR_ALERT_GROUP_ID = "545526"
     OPEN_MARKET_ORDER_GROUP_ID = "545602"
+    # 채널톡 응답이 늦어져도 호출 측(워커/요청)이 무한정 묶이지 않도록 (connect, read) 초
+    TIMEOUT = (3, 10)
 
     @staticmethod
     def post(path: str, json: dict) -> dict[str, str]:
         response = requests.post(
-            url="https://api.channel.io" + path,
+            url=settings.CHANNELTALK_API_HOST + path,
             json=json,
             headers=ChannelTalkAPI.CHANNELTALK_HEADERS,
+            timeout=ChannelTalkAPI.TIMEOUT,
         )
         return response.json()
 
     @staticmethod
     def get(path: str, params: dict = {}) -> dict:
         response = requests.get(
-            url="https://api.channel.io" + path,
+            url=settings.CHANNELTALK_API_HOST + path,
             params=params,
             headers=ChannelTalkAPI.CHANNELTALK_HEADERS,
+            timeout=ChannelTalkAPI.TIMEOUT,
         )
         if response.status_code != 200:
             raise Exception(f"Failed to get data: {response.text}")
@@ -39,58 +44,44 @@ class ChannelTalkAPI:
     @staticmethod
     def put(path: str, json: dict) -> dict:
         response = requests.put(
-            url="https://api.channel.io" + path,
+            url=settings.CHANNELTALK_API_HOST + path,
             json=json,
             headers=ChannelTalkAPI.CHANNELTALK_HEADERS,
+            timeout=ChannelTalkAPI.TIMEOUT,
         )
         if response.status_code != 200:
             raise Exception(f"Failed to put data: {response.text}")
         return response.json()
 
 
-def send_order_alert(
-    order_id: str, customer_name: str, customer_phone: str
-) -> dict[str, str]:
-    """Send a message to the team via Channel Talk."""
-    # Implementation for sending message via Channel Talk
-    response = ChannelTalkAPI.post(
-        path=f"/open/v5/groups/{ChannelTalkAPI.ORDER_ALERT_GROUP_ID}/messages",
-        json={
-            "blocks": [
-                {
-                    "type": "text",
-                    "value": f"주문 알림: {order_id}, {customer_name}, {customer_phone}",
-                },
-            ]
-        },
-    )
-    return response
+def group_message_path(group_id: str) -> str:
+    return f"/open/v5/groups/{group_id}/messages"
+
+
+def text_message_body(text: str) -> dict:
+    return {"blocks": [{"type": "text", "value": text}]}
 
 
-def send_inquiry_alert(
+def user_event_path(user_id: str) -> str:
+    return f"/open/v5/users/{user_id}/events"
+
+
+def order_alert_text(order_id: str, customer_name: str, customer_phone: str) -> str:
+    return f"주문 알림: {order_id}, {customer_name}, {customer_phone}"
+
+
+def inquiry_alert_text(
     customer_name: str,
     customer_phone: str,
     device_name: str,
     internet_new: bool,
     card: bool,
     gift: bool,
-) -> dict[str, str]:
-    """Send a message to the team via Channel Talk."""
-    response = ChannelTalkAPI.post(
-        path=f"/open/v5/groups/{ChannelTalkAPI.ORDER_ALERT_GROUP_ID}/messages",
-        json={
-            "blocks": [
-                {
-                    "type": "text",
-                    "value": f"가격문의: {customer_name}, {customer_phone}, {device_name}, 인터넷가입: {internet_new}, 카드: {card}, 워치: {gift}",
-                },
-            ]
-        },
-    )
-    return response
+) -> str:
+    return f"가격문의: {customer_name}, {customer_phone}, {device_name}, 인터넷가입: {internet_new}, 카드: {card}, 워치: {gift}"
 
 
-def send_calculator_lead_alert(
+def calculator_lead_alert_text(
     *,
     session_id: str,
     contact_channel: str,
@@ -100,8 +91,8 @@ def send_calculator_lead_alert(
     pio_total: int,
     total_saving: int,
     funnel_variant: str,
-) -> dict[str, str]:
-    """Calculator 세션 lead 결정 (PATCH 첫 적용) 시 운영팀 채널 알림."""
+) -> str:
+    """Calculator 세션 lead 결정 (PATCH 첫 적용) 시 운영팀 채널 알림 문구."""
     if contact_channel == "phone":
         header = f"📞 전화요청 (calculator): {customer_name or '-'} / {customer_phone or '-'}"
     elif contact_channel == "kakao":
@@ -115,16 +106,7 @@ def send_calculator_lead_alert(
         f"funnel: {funnel_variant}\n"
         f"session: {session_id}"
     )
-
-    response = ChannelTalkAPI.post(
-        path=f"/open/v5/groups/{ChannelTalkAPI.ORDER_ALERT_GROUP_ID}/messages",
-        json={
-            "blocks": [
-                {"type": "text", "value": f"{header}\n{body}"},
-            ]
-        },
-    )
-    return response
+    return f"{header}\n{body}"
 
 
 def send_open_market_order_alert(source: str, orders: list[dict[str, str]]):
@@ -298,6 +280,15 @@ def send_shipping_noti_to_customer(
     return response
 
 
+# 가격 알림톡 자동화를 트리거하는 유저 커스텀 이벤트 이름
+PRICE_ALERT_EVENT_NAME = "price_alert"
+
+
+def price_alert_digest_text(lines: list[str]) -> str:
+    """채널톡 유저 ID 가 없는 가격 알림 대상을 운영 그룹에 한 번에 알리는 메시지."""
+    return f"가격 알림 대상 {len(lines)}건 (채널톡 유저 없음)\n" + "\n".join(lines)
+
+
 def send_open_market_update_failure_alert(
     task_name: str, om_product_id: int, detail: str, market: str = "11번가"
 ):
@@ -320,6 +311,21 @@ def send_open_market_update_failure_alert(
     )
 
 
+def send_ops_failure_alert(task_name: str, detail: str):
+    """오픈마켓과 무관한 운영 배치(가격 기록, 파티션, 데이터 정리 등) 실패 알림."""
+    ChannelTalkAPI.post(
+        path=f"/open/v5/groups/{ChannelTalkAPI.OPEN_MARKET_ERROR_ALERT_GROUP_ID}/messages",
+        json={
+            "blocks": [
+                {
+                    "type": "text",
+                    "value": f"[운영 작업 {task_name} 실패]\n상세: {detail}",
+                }
+            ]
+        },
+    )
+
+
 def send_marketplace_sync_failure_alert(stage: str, carrier: str, reason: str):
     """정책 엑셀 업로드 후처리(마켓플레이스 동기화) 단계 실패 알림."""
     ChannelTalkAPI.post(
@@ -0,0 +1,265 @@
+"""
+채널톡 알림 outbox
+
+고객 요청(주문 생성, 가격문의, calculator lead PATCH)이나 가격 알림 매칭 안에서 채널톡
+API 를 직접 호출하지 않고, 비즈니스 row 와 같은 트랜잭션에서 ChannelTalkOutbox 에 적재만
+한다. user_id 가 있는 row 는 유저 이벤트(알림톡 자동화 트리거), 나머지는 그룹 메시지다.
+요청은 DB commit 직후 바로 응답하고, 발송은 task_deliver_channel_talk_outbox 가
+배치로 처리한다.
+
+발송 규칙:
+    - 대상 row 는 select_for_update(skip_locked) 로 잡고 next_attempt_at 을 lease 만큼
+      미뤄 둔다 → 워커가 겹쳐 돌아도 중복 발송하지 않고, 워커가 죽으면 lease 후 재시도.
+      lease 는 배치 전체가 최악의 경우(건마다 간격 대기 + 타임아웃) 걸리는 시간보다 길다.
+    - 같은 그룹(유저)으로는 CHANNEL_TALK_GROUP_MIN_INTERVAL 초 간격으로 보낸다. 발송은
+      advisory lock 으로 한 번에 한 워커만 하고(겹친 실행은 건너뜀), 간격은 DB 의 마지막
+      sent_at 부터 이어서 재므로 실행이 바뀌어도 지켜진다.
+    - 실패 시 지수 백오프로 재시도, 한 그룹이 실패하면 그 그룹의 남은 row 는 이번 배치에서
+      보내지 않는다. CHANNEL_TALK_OUTBOX_MAX_ATTEMPTS 회 실패하면 FAILED 로 남긴다.
+
+사용법:
+    from phone.external_services.channel_talk_outbox import queue_order_alert
+
+    with transaction.atomic():
+        order = Order.objects.create(...)
+        queue_order_alert(order.id, order.customer_name, order.customer_phone)
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Max
+from django.utils import timezone
+
+from phone.constants import OutboxStatusChoices
+from phone.external_services.channel_talk import (
+    PRICE_ALERT_EVENT_NAME,
+    ChannelTalkAPI,
+    calculator_lead_alert_text,
+    group_message_path,
+    inquiry_alert_text,
+    order_alert_text,
+    text_message_body,
+    user_event_path,
+)
+from phone.models import ChannelTalkOutbox
+
+logger = logging.getLogger(__name__)
+
+LEASE_MARGIN = timedelta(seconds=60)
+DELIVER_LOCK_KEY = "channel_talk_outbox:deliver"
+BACKOFF_BASE_SECONDS = 30
+BACKOFF_MAX_SECONDS = 60 * 60
+
+
+def enqueue_group_message(kind: str, group_id: str, text: str) -> ChannelTalkOutbox:
+    """채널톡 그룹 텍스트 메시지를 outbox 에 적재 (호출 측 트랜잭션에 포함된다)."""
+    return ChannelTalkOutbox.objects.create(
+        kind=kind,
+        group_id=group_id,
+        body=text_message_body(text),
+        next_attempt_at=timezone.now(),
+    )
+
+
+def enqueue_user_event(
+    kind: str, user_id: str, name: str, property: dict
+) -> ChannelTalkOutbox:
+    """채널톡 유저 커스텀 이벤트를 outbox 에 적재 (호출 측 트랜잭션에 포함된다)."""
+    return ChannelTalkOutbox.objects.create(
+        kind=kind,
+        user_id=user_id,
+        body={"name": name, "property": property},
+        next_attempt_at=timezone.now(),
+    )
+
+
+def queue_price_alert_event(user_id: str, property: dict):
+    return enqueue_user_event(
+        "price_alert_event", user_id, PRICE_ALERT_EVENT_NAME, property
+    )
+
+
+def queue_order_alert(order_id, customer_name: str, customer_phone: str):
+    return enqueue_group_message(
+        "order",
+        ChannelTalkAPI.ORDER_ALERT_GROUP_ID,
+        order_alert_text(order_id, customer_name, customer_phone),
+    )
+
+
+def queue_inquiry_alert(**kwargs):
+    return enqueue_group_message(
+        "inquiry", ChannelTalkAPI.ORDER_ALERT_GROUP_ID, inquiry_alert_text(**kwargs)
+    )
+
+
+def queue_calculator_lead_alert(**kwargs):
+    return enqueue_group_message(
+        "calculator_lead",
+        ChannelTalkAPI.ORDER_ALERT_GROUP_ID,
+        calculator_lead_alert_text(**kwargs),
+    )
+
+
+def _target(row: ChannelTalkOutbox) -> tuple[str, str, str]:
+    """(rate limit 키, API path, 성공 응답 키)"""
+    if row.user_id:
+        return f"user:{row.user_id}", user_event_path(row.user_id), "event"
+    return row.group_id, group_message_path(row.group_id), "message"
+
+
+def batch_lease(batch_size: int) -> timedelta:
+    """batch_size 건을 모두 간격 대기 + connect/read 타임아웃으로 보내도 끝나는 시간."""
+    per_row = settings.CHANNEL_TALK_GROUP_MIN_INTERVAL + sum(ChannelTalkAPI.TIMEOUT)
+    return timedelta(seconds=batch_size * per_row) + LEASE_MARGIN
+
+
+def _claim_batch(batch_size: int) -> list[ChannelTalkOutbox]:
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            ChannelTalkOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboxStatusChoices.PENDING, next_attempt_at__lte=now)
+            .order_by("id")[:batch_size]
+        )
+        if rows:
+            ChannelTalkOutbox.objects.filter(id__in=[r.id for r in rows]).update(
+                next_attempt_at=now + batch_lease(len(rows))
+            )
+    return rows
+
+
+def _mark_failed(row: ChannelTalkOutbox, error: Exception):
+    attempts = row.attempts + 1
+    fields = {"attempts": attempts, "last_error": str(error)[:2000]}
+    if attempts >= settings.CHANNEL_TALK_OUTBOX_MAX_ATTEMPTS:
+        fields["status"] = OutboxStatusChoices.FAILED
+        logger.error(
+            "channel_talk_outbox.gave_up id=%s kind=%s attempts=%s error=%s",
+            row.id,
+            row.kind,
+            attempts,
+            error,
+        )
+    else:
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+        fields["next_attempt_at"] = timezone.now() + timedelta(seconds=delay)
+        logger.warning(
+            "channel_talk_outbox.retry id=%s kind=%s attempts=%s delay=%s error=%s",
+            row.id,
+            row.kind,
+            attempts,
+            delay,
+            error,
+        )
+    ChannelTalkOutbox.objects.filter(id=row.id).update(**fields)
+
+
+def _last_sent_at(rows: list[ChannelTalkOutbox]) -> dict[str, float]:
+    """배치에 있는 그룹/유저별 마지막 발송 시각(epoch 초) - 이전 실행의 발송까지 포함."""
+    sent = ChannelTalkOutbox.objects.filter(status=OutboxStatusChoices.SENT)
+    groups = {row.group_id for row in rows if not row.user_id}
+    users = {row.user_id for row in rows if row.user_id}
+    last = {}
+    for group_id, sent_at in (
+        sent.filter(user_id="", group_id__in=groups)
+        .values("group_id")
+        .annotate(last=Max("sent_at"))
+        .values_list("group_id", "last")
+    ):
+        last[group_id] = sent_at.timestamp()
+    for user_id, sent_at in (
+        sent.filter(user_id__in=users)
+        .values("user_id")
+        .annotate(last=Max("sent_at"))
+        .values_list("user_id", "last")
+    ):
+        last[f"user:{user_id}"] = sent_at.timestamp()
+    return last
+
+
+def _try_deliver_lock() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_try_advisory_lock(hashtext(%s))", [DELIVER_LOCK_KEY])
+        return cursor.fetchone()[0]
+
+
+def _release_deliver_lock():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", [DELIVER_LOCK_KEY])
+
+
+def deliver_outbox(batch_size: int | None = None, sleep=time.sleep) -> dict[str, int]:
+    """대기 중인 outbox row 를 한 배치 발송한다. 반환값은 결과별 건수.
+
+    다른 워커가 발송 중이면 그룹 간격이 깨지지 않도록 이번 실행은 건너뛴다.
+    """
+    if not _try_deliver_lock():
+        logger.info("channel_talk_outbox.skipped reason=already_running")
+        return {"sent": 0, "failed": 0, "deferred": 0}
+    try:
+        return _deliver(batch_size, sleep)
+    finally:
+        _release_deliver_lock()
+
+
+def _deliver(batch_size, sleep) -> dict[str, int]:
+    rows = _claim_batch(batch_size or settings.CHANNEL_TALK_OUTBOX_BATCH_SIZE)
+    counts = {"sent": 0, "failed": 0, "deferred": 0}
+    if not rows:
+        return counts
+
+    min_interval = settings.CHANNEL_TALK_GROUP_MIN_INTERVAL
+    last_sent_at = _last_sent_at(rows)
+    failed_groups: set[str] = set()
+    sent_ids = []
+    deferred_ids = []
+
+    for row in rows:
+        key, path, expected = _target(row)
+        if key in failed_groups:
+            deferred_ids.append(row.id)
+            continue
+
+        if key in last_sent_at:
+            wait = min_interval - (time.time() - last_sent_at[key])
+            if wait > 0:
+                sleep(wait)
+
+        try:
+            response = ChannelTalkAPI.post(path=path, json=row.body)
+            last_sent_at[key] = time.time()
+            if expected not in response:
+                raise Exception(f"채널톡 메시지 발송 실패: {response}")
+        except Exception as e:
+            failed_groups.add(key)
+            _mark_failed(row, e)
+            counts["failed"] += 1
+            continue
+        sent_ids.append(row.id)
+
+    if sent_ids:
+        ChannelTalkOutbox.objects.filter(id__in=sent_ids).update(
+            status=OutboxStatusChoices.SENT,
+            sent_at=timezone.now(),
+            attempts=F("attempts") + 1,
+        )
+    if deferred_ids:
+        # 시도 횟수는 늘리지 않고 lease 만 풀어서 다음 배치에서 다시 잡히게 한다.
+        ChannelTalkOutbox.objects.filter(id__in=deferred_ids).update(
+            next_attempt_at=timezone.now()
+        )
+
+    counts["sent"] = len(sent_ids)
+    counts["deferred"] = len(deferred_ids)
+    logger.info(
+        "channel_talk_outbox.delivered sent=%s failed=%s deferred=%s",
+        counts["sent"],
+        counts["failed"],
+        counts["deferred"],
+    )
+    return counts
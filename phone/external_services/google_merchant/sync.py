@@ -14,6 +14,7 @@ from phone.models import (
     Inventory,
     DeviceColor,
 )
+from phoneinone_server.db_router import read_replica
 from . import product_builder as builder
 from .client import product_inputs_client, account_name, datasource_name
 
@@ -52,9 +53,12 @@ def _inventories_for(product):
     )
 
 
+@read_replica()
 def push(dry_run: bool = False, limit: int | None = None, stdout=None):
     """활성 상품을 Merchant에 등록/갱신한다.
 
+    DB 는 읽기만 하므로 replica 를 쓴다 (DB_REPLICA_HOST 미설정 시 default).
+
     dry_run=True 이면 API를 호출하지 않고 페이로드만 집계/출력한다
     (google 라이브러리·크리덴셜 없이도 실행 가능).
 
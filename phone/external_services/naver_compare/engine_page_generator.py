@@ -1,4 +1,3 @@
-import boto3
 from django.conf import settings
 from phone.models import *
 from phone.constants import OpenMarketChoices
@@ -6,6 +5,7 @@ from urllib.parse import urlencode
 from django.utils import timezone
 from phone.constants import *
 from django.db.models import QuerySet
+from phoneinone_server.db_router import read_replica
 
 
 # .txt 파일, 컬럼은 탭으로 구분하기, 헤더는 총 74개
@@ -249,6 +249,8 @@ class NaverCompareEnginePageGenerator:
             fields=["registered_price", "updated_at", "last_price_updated_at"],
         )
 
+    # 상품/재고 읽기는 replica, 마지막 bulk_update 는 default
+    @read_replica()
     def generate(self):
         if len(self.HEADERS) != 74:
             raise ValueError("헤더의 개수가 74개가 아닙니다.")
@@ -285,6 +287,8 @@ class NaverCompareEnginePageGenerator:
         return content
 
     def _upload_to_s3(self, content: str):
+        import boto3  # 업로드 시에만 로드 - beat 가 tasks 를 import 할 때 끌려오지 않게
+
         s3 = boto3.client(
             "s3",
             region_name=settings.AWS_S3_REGION_NAME,
@@ -1,17 +1,14 @@
 import requests
-
-from phoneinone_server.settings import SSG_API_KEY
-
-HOST_SSG = "https://eapi.ssgadm.com"
+from django.conf import settings
 
 # 등록/수정 API 연속 호출 시 최소 3초 간격 필요 (문서 명시)
 SSG_CALL_INTERVAL_SEC = 3
 
 
 def _headers() -> dict:
-    if not SSG_API_KEY:
+    if not settings.SSG_API_KEY:
         raise Exception("SSG_API_KEY 환경변수가 설정되지 않았습니다.")
-    return {"Authorization": SSG_API_KEY, "Accept": "application/json"}
+    return {"Authorization": settings.SSG_API_KEY, "Accept": "application/json"}
 
 
 def _check_result(response: requests.Response, action: str) -> dict:
@@ -32,13 +29,19 @@ def _check_result(response: requests.Response, action: str) -> dict:
 
 def ssg_get(path: str, params: dict | None = None, action: str = "조회") -> dict:
     response = requests.get(
-        f"{HOST_SSG}{path}", params=params, headers=_headers(), timeout=30
+        f"{settings.SSG_API_HOST}{path}",
+        params=params,
+        headers=_headers(),
+        timeout=30,
     )
     return _check_result(response, action)
 
 
 def ssg_post(path: str, json_body: dict, action: str = "요청") -> dict:
     response = requests.post(
-        f"{HOST_SSG}{path}", json=json_body, headers=_headers(), timeout=60
+        f"{settings.SSG_API_HOST}{path}",
+        json=json_body,
+        headers=_headers(),
+        timeout=60,
     )
     return _check_result(response, action)
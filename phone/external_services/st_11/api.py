@@ -1,6 +1,12 @@
+from django.conf import settings
+
 from phone.constants import CarrierChoices
 
-HOST_11st = "https://api.11st.co.kr/rest"
+
+def host_11st() -> str:
+    """11번가 API base URL. 호출 시점에 읽으므로 벤치마크에서 가짜 서버로 교체된다."""
+    return settings.API_HOST_11st
+
 
 # 기본 옵션(0원) = 상품 등록 기준이 되는 각 통신사 최상위 요금제.
 # 옵션명은 DB Plan.name(현행 요금제명)과 표기를 맞춘다.
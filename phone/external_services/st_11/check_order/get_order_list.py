@@ -1,7 +1,7 @@
 import requests
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 from lxml import etree
 from datetime import datetime, timezone, timedelta
 
@@ -129,7 +129,7 @@ def get_unhandled_order_list_today():
         datetime(today.year, today.month, today.day, 23, 59, 59, tzinfo=KST)
     )
 
-    url = f"{HOST_11st}/ordservices/complete/{yesterday_00_00}/{today_23_59}"
+    url = f"{host_11st()}/ordservices/complete/{yesterday_00_00}/{today_23_59}"
     headers = {"openapikey": API_KEY_11st}
 
     response = requests.request(
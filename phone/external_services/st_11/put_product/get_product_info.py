@@ -2,7 +2,7 @@ import requests
 from lxml import etree
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 
 
 def get_product_listed_price(om_product_id: str) -> int:
@@ -10,7 +10,7 @@ def get_product_listed_price(om_product_id: str) -> int:
 
     옵션이 있는 상품의 경우 selPrc는 "옵션 0원"에 해당하는 기본 판매가이다.
     """
-    url = f"{HOST_11st}/prodmarketservice/prodmarket/{om_product_id}"
+    url = f"{host_11st()}/prodmarketservice/prodmarket/{om_product_id}"
     headers = {"openapikey": API_KEY_11st}
 
     response = requests.get(url, headers=headers)
@@ -36,7 +36,7 @@ def get_display_status_code(om_product_id: str) -> str:
     주요 코드: 103=판매중, 104=품절, 105=전시중지중, 106/107=판매종료.
     전시중지 처리(stopdisplay) 상태가 105이다.
     """
-    url = f"{HOST_11st}/prodmarketservice/prodmarket/{om_product_id}"
+    url = f"{host_11st()}/prodmarketservice/prodmarket/{om_product_id}"
     headers = {"openapikey": API_KEY_11st}
 
     response = requests.get(url, headers=headers)
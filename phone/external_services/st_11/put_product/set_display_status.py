@@ -12,7 +12,7 @@ import requests
 from lxml import etree
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 
 
 def _put_display_status(action: str, om_product_id: str) -> str:
@@ -21,7 +21,7 @@ def _put_display_status(action: str, om_product_id: str) -> str:
     action: "stopdisplay" | "restartdisplay"
     실패(HTTP 오류 또는 resultCode != 200) 시 예외를 발생시킨다.
     """
-    url = f"{HOST_11st}/prodstatservice/stat/{action}/{om_product_id}"
+    url = f"{host_11st()}/prodstatservice/stat/{action}/{om_product_id}"
     headers = {"openapikey": API_KEY_11st}
 
     response = requests.put(url, headers=headers)
@@ -1,7 +1,7 @@
 import requests
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 from lxml import etree
 from math import ceil
 
@@ -11,7 +11,7 @@ def _set_product_price(open_market_product_id: str, price: int):
     if price < 1000:
         price = 1000
 
-    url = f"{HOST_11st}/prodservices/product/priceCoupon/{open_market_product_id}"
+    url = f"{host_11st()}/prodservices/product/priceCoupon/{open_market_product_id}"
     headers = {"openapikey": API_KEY_11st}
     payload = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <Product>
@@ -4,13 +4,13 @@ import requests
 from lxml import etree
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 
 T = TypeVar("T")
 
 
 def get_product_detail_html(om_product_id: str) -> str:
-    url = f"{HOST_11st}/prodservices/getProductDetailCont/{om_product_id}"
+    url = f"{host_11st()}/prodservices/getProductDetailCont/{om_product_id}"
     headers = {"openapikey": API_KEY_11st}
 
     response = requests.get(url, headers=headers)
@@ -32,7 +32,7 @@ def get_product_detail_html(om_product_id: str) -> str:
 
 
 def update_product_detail_html(om_product_id: str, html_content: str) -> None:
-    url = f"{HOST_11st}/prodservices/updateProductDetailCont/{om_product_id}"
+    url = f"{host_11st()}/prodservices/updateProductDetailCont/{om_product_id}"
     headers = {"openapikey": API_KEY_11st}
 
     payload = (
@@ -1,7 +1,7 @@
 import requests
 
 from phoneinone_server.settings import API_KEY_11st
-from ..api import HOST_11st
+from ..api import host_11st
 from lxml import etree
 from datetime import datetime, timezone, timedelta
 
@@ -99,7 +99,7 @@ class _NoDataResponse(Exception):
 def get_settlement_list(start: datetime, end: datetime) -> list[dict]:
     """기간별 정산내역 조회. 날짜포맷 YYYYMMDD, 조회기간 최대 31일."""
     url = (
-        f"{HOST_11st}/settlement/settlementList"
+        f"{host_11st()}/settlement/settlementList"
         f"/{format_date_11st_style(start)}/{format_date_11st_style(end)}"
     )
     headers = {"openapikey": API_KEY_11st}
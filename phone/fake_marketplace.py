@@ -0,0 +1,424 @@
+"""
+로컬 가짜 마켓플레이스 API 서버 (11번가 / SSG / 채널톡)
+
+실제 외부 API 대신 127.0.0.1 의 빈 포트에 HTTP 서버를 띄워 마켓플레이스 동기화
+코드를 네트워크 왕복까지 포함해 측정/재현한다. 응답 형식은 클라이언트 코드가
+파싱하는 필드만 맞춘다.
+
+    - 11번가 (XML, EUC-KR): 가격(priceCoupon), 옵션(updateProductOption),
+      전시상태(prodstatservice), 상품조회(prodmarket), 주문(ordservices/complete)
+    - SSG (JSON, resultCode "00"): 옵션(/option), 판매상태(/sales-status),
+      주문(listShppDirection)
+    - 채널톡: 그룹 메시지(/open/v5/groups/{id}/messages) - 받은 메시지를 기록
+
+서비스마다 FaultConfig 로 지연(latency/jitter), 에러 주입(HTTP 500 비율),
+초당 요청 한도(초과 시 HTTP 429)를 설정한다. 상품별 가격/옵션/전시상태는 서버
+메모리에 저장되며, 11번가 가격 인하는 실제처럼 한 번에 80% 넘게 내리면 실패한다.
+
+사용법:
+    from phone.fake_marketplace import FakeMarketplace, FaultConfig
+
+    with FakeMarketplace(st11=FaultConfig(latency_ms=80, rate_limit=10)) as fake:
+        with fake.settings():  # API_HOST_11st / SSG_API_HOST / CHANNELTALK_API_HOST
+            sync_11st_display_status()
+        print(fake.st11.calls, fake.channel_talk.messages)
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from django.test.utils import override_settings
+from lxml import etree
+
+ST11_ORDER_NS = "http://skt.tmall.business.openapi.spring.service.client.domain/"
+
+# 11번가 판매상태 코드 (103=판매중, 105=전시중지)
+ST11_ON_SALE = "103"
+ST11_DISPLAY_STOPPED = "105"
+# 11번가는 한 번에 현재가의 80% 를 넘게 내리는 가격 수정을 거부한다
+ST11_MAX_PRICE_DROP = 0.8
+
+
+@dataclass
+class FaultConfig:
+    """서비스별 장애 주입 설정."""
+
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    error_rate: float = 0.0  # 0~1, 이 비율로 HTTP 500
+    rate_limit: int = 0  # 초당 허용 요청 수, 0 이면 무제한 (초과 시 HTTP 429)
+
+
+class _FakeService:
+    """라우트 테이블 + 장애 주입 + 호출 기록을 가진 가짜 API 하나."""
+
+    name = ""
+    base_path = ""
+    routes = ()  # (method, regex, handler 메서드 이름)
+
+    def __init__(self, fault, seed):
+        self.fault = fault or FaultConfig()
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = Counter()
+        self.errors = 0
+        self.throttled = 0
+        self._window = deque()
+        self._routes = [
+            (method, re.compile(self.base_path + pattern + "$"), handler)
+            for method, pattern, handler in self.routes
+        ]
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def reset_stats(self):
+        with self.lock:
+            self.calls.clear()
+            self.errors = 0
+            self.throttled = 0
+
+    def stats(self):
+        with self.lock:
+            return {
+                "calls": dict(sorted(self.calls.items())),
+                "errors": self.errors,
+                "throttled": self.throttled,
+            }
+
+    def start(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                service.handle(self, "GET")
+
+            def do_POST(self):
+                service.handle(self, "POST")
+
+            def do_PUT(self):
+                service.handle(self, "PUT")
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, name=f"fake-{self.name}", daemon=True
+        )
+        self.thread.start()
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def _fault(self):
+        """주입할 장애 상태 코드 (없으면 None). 지연은 여기서 잔다."""
+        with self.lock:
+            delay = self.fault.latency_ms + self.rng.uniform(0, self.fault.jitter_ms)
+            fail = self.rng.random() < self.fault.error_rate
+            throttled = False
+            if self.fault.rate_limit:
+                now = time.monotonic()
+                while self._window and now - self._window[0] >= 1:
+                    self._window.popleft()
+                throttled = len(self._window) >= self.fault.rate_limit
+                if not throttled:
+                    self._window.append(now)
+        if delay:
+            time.sleep(delay / 1000)
+        if throttled:
+            with self.lock:
+                self.throttled += 1
+            return 429
+        if fail:
+            with self.lock:
+                self.errors += 1
+            return 500
+        return None
+
+    def handle(self, request, method):
+        length = int(request.headers.get("Content-Length") or 0)
+        body = request.rfile.read(length) if length else b""
+        path = unquote(urlsplit(request.path).path)
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                break
+        else:
+            self._send(request, 404, b"not found", "text/plain")
+            return
+
+        with self.lock:
+            self.calls[handler] += 1
+        status = self._fault()
+        if status:
+            self._send(request, status, self.error_body(status), self.content_type)
+            return
+        payload = getattr(self, handler)(body, *match.groups())
+        self._send(request, 200, payload, self.content_type)
+
+    def _send(self, request, status, payload, content_type):
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(payload)))
+        request.end_headers()
+        request.wfile.write(payload)
+
+    content_type = "application/json"
+
+    def error_body(self, status):
+        return json.dumps({"message": f"fake {self.name} error {status}"}).encode()
+
+
+class Fake11st(_FakeService):
+    name = "11st"
+    base_path = "/rest"
+    content_type = "text/xml; charset=EUC-KR"
+    routes = (
+        ("POST", r"/prodservices/product/priceCoupon/([^/]+)", "set_price"),
+        ("POST", r"/prodservices/updateProductOption/([^/]+)", "set_options"),
+        (
+            "PUT",
+            r"/prodstatservice/stat/(stopdisplay|restartdisplay)/([^/]+)",
+            "display",
+        ),
+        ("GET", r"/prodmarketservice/prodmarket/([^/]+)", "product"),
+        ("GET", r"/ordservices/complete/(\d{12})/(\d{12})", "orders"),
+    )
+
+    def __init__(self, fault, seed, orders=0):
+        super().__init__(fault, seed)
+        self.prices = {}
+        self.options = {}
+        self.display_status = {}
+        self.order_count = orders
+
+    @staticmethod
+    def _xml(root):
+        return etree.tostring(
+            root, xml_declaration=True, encoding="EUC-KR", standalone=True
+        )
+
+    def _client_message(self, message, result_code="200", **extra):
+        root = etree.Element("ClientMessage")
+        etree.SubElement(root, "message").text = message
+        etree.SubElement(root, "resultCode").text = result_code
+        for tag, value in extra.items():
+            etree.SubElement(root, tag).text = str(value)
+        return self._xml(root)
+
+    def error_body(self, status):
+        return self._client_message(f"fake 11번가 오류 {status}", str(status))
+
+    def set_price(self, body, product_id):
+        price = int(etree.fromstring(body).findtext("selPrc"))
+        with self.lock:
+            current = self.prices.get(product_id)
+            if current and price < current * (1 - ST11_MAX_PRICE_DROP):
+                return self._client_message(
+                    "가격 수정 실패 - 인하 한도 초과", preSelPrc=current
+                )
+            self.prices[product_id] = price
+        return self._client_message("가격 수정 성공", preSelPrc=current or price)
+
+    def set_options(self, body, product_id):
+        root = etree.fromstring(body)
+        names = [o.findtext("colValue0") for o in root.iter("ProductOption")]
+        with self.lock:
+            self.options[product_id] = names
+        return self._client_message(f"옵션 {len(names)}개 수정 성공")
+
+    def display(self, body, action, product_id):
+        status = ST11_DISPLAY_STOPPED if action == "stopdisplay" else ST11_ON_SALE
+        with self.lock:
+            self.display_status[product_id] = status
+        return self._client_message("전시상태 변경 성공")
+
+    def product(self, body, product_id):
+        root = etree.Element("Product")
+        with self.lock:
+            etree.SubElement(root, "prdNo").text = product_id
+            etree.SubElement(root, "selPrc").text = str(
+                self.prices.get(product_id, 1000)
+            )
+            etree.SubElement(root, "selStatCd").text = self.display_status.get(
+                product_id, ST11_ON_SALE
+            )
+        return self._xml(root)
+
+    def orders(self, body, start, end):
+        ns2 = f"{{{ST11_ORDER_NS}}}"
+        root = etree.Element(ns2 + "orders", nsmap={"ns2": ST11_ORDER_NS})
+        for i in range(self.order_count):
+            order = etree.SubElement(root, ns2 + "order")
+            for tag, value in (
+                ("ordNo", f"FAKE{start}{i:05d}"),
+                ("ordNm", f"테스트{i}"),
+                ("ordPrtblTel", "010-0000-0000"),
+                ("prdNm", "가짜 상품"),
+                ("prdNo", str(9000000000 + i)),
+                ("slctPrdOptNm", "요금제:가짜 요금제-1개"),
+                ("selPrc", "1000"),
+            ):
+                etree.SubElement(order, tag).text = value
+        return self._xml(root)
+
+
+class FakeSsg(_FakeService):
+    name = "ssg"
+    routes = (
+        ("GET", r"/item/0\.1/online/([^/]+)/option", "get_option"),
+        ("POST", r"/item/0\.1/online/([^/]+)/option", "set_option"),
+        ("GET", r"/item/0\.1/online/([^/]+)/sales-status", "get_sales_status"),
+        ("POST", r"/item/0\.1/online/([^/]+)/sales-status", "set_sales_status"),
+        ("POST", r"/api/pd/1/listShppDirection\.ssg", "orders"),
+    )
+
+    def __init__(self, fault, seed, orders=0):
+        super().__init__(fault, seed)
+        self.options = {}
+        self.sales_status = {}
+        self.order_count = orders
+        self._next_uitem_id = 1
+
+    @staticmethod
+    def _ok(**result):
+        return json.dumps(
+            {"result": {"resultCode": "00", "resultMessage": "SUCCESS", **result}},
+            ensure_ascii=False,
+        ).encode()
+
+    def get_option(self, body, item_id):
+        with self.lock:
+            option = self.options.get(item_id) or {
+                "sellStatCd": 20,
+                "invMngYn": "Y",
+                "invQtyMarkgYn": "N",
+                "optionNms": [],
+            }
+        return self._ok(option=option)
+
+    def set_option(self, body, item_id):
+        option = json.loads(body)["online_updateOption"]["option"]
+        with self.lock:
+            for row in option["optionNms"]:
+                if not row.get("uitemId"):
+                    row["uitemId"] = f"{self._next_uitem_id:05d}"
+                    self._next_uitem_id += 1
+            self.options[item_id] = option
+        return self._ok()
+
+    def get_sales_status(self, body, item_id):
+        with self.lock:
+            status = self.sales_status.get(item_id) or {
+                "sellStatCd": 20,
+                "sellFrmCd": 10,
+                "invMngYn": "Y",
+                "invQtyMarkgYn": "N",
+                "dispStrtDt": "20240101000000",
+                "dispEndDt": "99991231235959",
+            }
+        return self._ok(salesStatus=status)
+
+    def set_sales_status(self, body, item_id):
+        status = json.loads(body)["online_updateSalesStatus"]["salesStatus"]
+        with self.lock:
+            self.sales_status[item_id] = status
+        return self._ok()
+
+    def orders(self, body):
+        directions = [
+            {
+                "shppDirection": {
+                    "ordNo": f"FAKESSG{i:05d}",
+                    "ordpeNm": f"테스트{i}",
+                    "ordpeHpno": "010-0000-0000",
+                    "itemNm": "가짜 상품",
+                    "itemId": str(1000000000 + i),
+                    "uitemNm": "가짜 요금제",
+                    "sellprc": 1000,
+                }
+            }
+            for i in range(self.order_count)
+        ]
+        return self._ok(shppDirections=directions or [""])
+
+
+class FakeChannelTalk(_FakeService):
+    name = "channel_talk"
+    routes = (("POST", r"/open/v5/groups/([^/]+)/messages", "group_message"),)
+
+    def __init__(self, fault, seed):
+        super().__init__(fault, seed)
+        self.messages = []
+
+    def group_message(self, body, group_id):
+        blocks = json.loads(body).get("blocks") or [{}]
+        with self.lock:
+            self.messages.append((group_id, blocks[0].get("value", "")))
+        return json.dumps({"message": {"chatId": group_id}}).encode()
+
+
+class FakeMarketplace:
+    """11번가/SSG/채널톡 가짜 서버 묶음. with 블록 동안 서버가 떠 있다."""
+
+    def __init__(
+        self,
+        st11=None,
+        ssg=None,
+        channel_talk=None,
+        seed=0,
+        st11_orders=0,
+        ssg_orders=0,
+    ):
+        self.st11 = Fake11st(st11, seed, orders=st11_orders)
+        self.ssg = FakeSsg(ssg, seed + 1, orders=ssg_orders)
+        self.channel_talk = FakeChannelTalk(channel_talk, seed + 2)
+        self.services = (self.st11, self.ssg, self.channel_talk)
+
+    def __enter__(self):
+        for service in self.services:
+            service.start()
+        return self
+
+    def __exit__(self, *exc):
+        for service in self.services:
+            service.stop()
+
+    def settings(self):
+        """클라이언트 코드가 가짜 서버를 바라보게 하는 override_settings."""
+        return override_settings(**self.env())
+
+    def env(self):
+        return {
+            "API_HOST_11st": self.st11.url,
+            "SSG_API_HOST": self.ssg.url,
+            "CHANNELTALK_API_HOST": self.channel_talk.url,
+            "SSG_API_KEY": "fake-ssg-key",
+        }
+
+    def reset_stats(self):
+        for service in self.services:
+            service.reset_stats()
+        with self.channel_talk.lock:
+            self.channel_talk.messages.clear()
+
+    def stats(self):
+        return {service.name: service.stats() for service in self.services}
@@ -0,0 +1,160 @@
+"""재고표 별칭(InventoryAlias) 정규화/동기화/매칭 헬퍼.
+
+Inventory.name_in_sheet / color_in_sheet 에는 쉼표로 구분된 별칭이 들어갈 수 있다.
+importer마다 공백 제거 규칙이 달라 매칭 결과가 어긋나던 문제를 없애기 위해,
+별칭을 한 번만 정규화해 InventoryAlias 테이블에 전개해 두고 모든 importer가
+`match_feed_rows` 한 번의 조회로 Inventory를 찾는다.
+
+매칭 결과(매칭률, 미매칭 row)는 `inventory_match.*` 로그로 남긴다.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+
+from phone.models import Dealership, Inventory, InventoryAlias
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_alias(text: str | None) -> str:
+    """공백을 모두 제거하고 대문자로 통일한다. ex) 'uipa 512(아이폰 에어)' -> 'UIPA512(아이폰에어)'"""
+    if not text:
+        return ""
+    return _WHITESPACE.sub("", str(text)).upper()
+
+
+def _split_aliases(text: str | None) -> list[str]:
+    keys = [normalize_alias(part) for part in (text or "").split(",")]
+    return [key for key in keys if key]
+
+
+def build_alias_rows(inventory: Inventory) -> list[InventoryAlias]:
+    """Inventory 한 건의 (모델명 x 색상명) 별칭 조합을 InventoryAlias 객체로 전개."""
+    return [
+        InventoryAlias(
+            dealership_id=inventory.dealership_id,
+            model_key=model_key,
+            color_key=color_key,
+            inventory_id=inventory.id,
+        )
+        for model_key in _split_aliases(inventory.name_in_sheet)
+        for color_key in _split_aliases(inventory.color_in_sheet)
+    ]
+
+
+def sync_inventory_aliases(inventory: Inventory) -> None:
+    """Inventory 한 건의 별칭을 현재 name_in_sheet / color_in_sheet 기준으로 재생성.
+
+    soft delete 된 Inventory는 별칭을 모두 제거한다. 같은 대리점의 다른 Inventory가
+    이미 같은 별칭을 갖고 있으면 기존 매핑을 유지하고 경고 로그만 남긴다.
+    """
+    InventoryAlias.objects.filter(inventory_id=inventory.id).delete()
+    if inventory.deleted_at is not None:
+        return
+
+    rows = build_alias_rows(inventory)
+    taken = set(
+        InventoryAlias.objects.filter(
+            dealership_id=inventory.dealership_id,
+            model_key__in={r.model_key for r in rows},
+            color_key__in={r.color_key for r in rows},
+        ).values_list("model_key", "color_key")
+    )
+    if taken:
+        logger.warning(
+            "inventory_alias.conflict inventory_id=%s dealership_id=%s aliases=%s",
+            inventory.id,
+            inventory.dealership_id,
+            sorted(taken),
+        )
+    InventoryAlias.objects.bulk_create(
+        [r for r in rows if (r.model_key, r.color_key) not in taken],
+        ignore_conflicts=True,
+    )
+
+
+def rebuild_inventory_aliases(dealership: Dealership | None = None) -> int:
+    """대리점(또는 전체)의 별칭 테이블을 Inventory 기준으로 다시 만든다."""
+    inventories = Inventory.objects.all()
+    aliases = InventoryAlias.objects.all()
+    if dealership is not None:
+        inventories = inventories.filter(dealership=dealership)
+        aliases = aliases.filter(dealership=dealership)
+
+    aliases.delete()
+    rows = []
+    for inventory in inventories.order_by("id"):
+        rows.extend(build_alias_rows(inventory))
+    InventoryAlias.objects.bulk_create(rows, ignore_conflicts=True)
+    return len(rows)
+
+
+@dataclass
+class FeedMatchResult:
+    """재고 피드 매칭 결과 - new_counts 는 write_inventory_counts 에 그대로 넘긴다."""
+
+    new_counts: dict[int, int] = field(default_factory=dict)
+    unmatched: list[tuple[str, str, int]] = field(default_factory=list)
+    total_rows: int = 0
+
+    @property
+    def matched_rows(self) -> int:
+        return self.total_rows - len(self.unmatched)
+
+    @property
+    def match_rate(self) -> float:
+        if self.total_rows == 0:
+            return 1.0
+        return self.matched_rows / self.total_rows
+
+
+def match_feed_rows(
+    dealership: Dealership, rows: list[tuple[str, str, int]]
+) -> FeedMatchResult:
+    """(재고표 모델명, 색상명, 수량) row 목록을 InventoryAlias 한 번의 조회로 매칭한다.
+
+    같은 Inventory로 매칭되는 row는 수량을 누적한다
+    (ex. 같은 갤럭시S26이어도 SM-S942NSO / SM-S942N 처럼 나뉘는 경우).
+    """
+    result = FeedMatchResult(total_rows=len(rows))
+    keyed_rows = [
+        (normalize_alias(name), normalize_alias(color), name, color, count)
+        for name, color, count in rows
+    ]
+
+    alias_map = {
+        (model_key, color_key): inventory_id
+        for model_key, color_key, inventory_id in InventoryAlias.objects.filter(
+            dealership=dealership,
+            model_key__in={r[0] for r in keyed_rows},
+            color_key__in={r[1] for r in keyed_rows},
+        ).values_list("model_key", "color_key", "inventory_id")
+    }
+
+    for model_key, color_key, name, color, count in keyed_rows:
+        inventory_id = alias_map.get((model_key, color_key))
+        if inventory_id is None:
+            result.unmatched.append((name, color, count))
+            continue
+        result.new_counts[inventory_id] = result.new_counts.get(inventory_id, 0) + count
+
+    logger.info(
+        "inventory_match.summary dealership=%s total=%s matched=%s unmatched=%s rate=%.3f",
+        dealership.name,
+        result.total_rows,
+        result.matched_rows,
+        len(result.unmatched),
+        result.match_rate,
+    )
+    for name, color, count in result.unmatched:
+        logger.info(
+            "inventory_match.unmatched dealership=%s name=%r color=%r count=%s",
+            dealership.name,
+            name,
+            color,
+            count,
+        )
+    return result
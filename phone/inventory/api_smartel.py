@@ -1,6 +1,8 @@
 import requests
 from phoneinone_server.settings import SMARTEL_INVENTORY_API_KEY
 from phone.models import Inventory, Dealership
+from phone.inventory.aliases import match_feed_rows
+from phone.inventory.writer import write_inventory_counts
 
 REQUEST_URL = "https://api2.smartel.kr/inventory/list"
 
@@ -43,34 +45,20 @@ def fetch_smartel_inventory():
 
 def update_inventory_counts(api_items):
     smartel_dealer = Dealership.objects.get(name="디아이")
-    Inventory_objects = Inventory.objects.filter(dealership=smartel_dealer)
-    update_counts = 0
-    not_updated_datas = []
-    db_dict = {}
+    Inventory_objects = list(Inventory.objects.filter(dealership=smartel_dealer))
 
-    for db_item in Inventory_objects:
-        db_dict[
-            (
-                db_item.name_in_sheet.replace(" ", ""),
-                db_item.color_in_sheet.replace(" ", ""),
-            )
-        ] = db_item
-        db_item.count = 0
-
-    for api_item in api_items:
-        api_key = (api_item.phone_name.replace(" ", ""), api_item.color)
-        db_item = db_dict.get(api_key)
-        if db_item:
-            if db_item.count == 0:
-                update_counts += 1
-            db_item.count += (
-                api_item.count
-            )  # 누적하여 더하기 - 같은 갤럭시S26이어도 SM-S942NSO / SM-S942N 처럼 나뉘는 경우 있음
-        else:
-            not_updated_datas.append(api_item)
+    # 누적하여 더하기 - 같은 갤럭시S26이어도 SM-S942NSO / SM-S942N 처럼 나뉘는 경우 있음
+    match = match_feed_rows(
+        smartel_dealer,
+        [(item.phone_name, item.color, item.count) for item in api_items],
+    )
+    unmatched_keys = {(name, color) for name, color, _ in match.unmatched}
+    not_updated_datas = [
+        item for item in api_items if (item.phone_name, item.color) in unmatched_keys
+    ]
 
-    Inventory.objects.bulk_update(Inventory_objects, ["count"])
-    return (not_updated_datas, update_counts)
+    changes = write_inventory_counts(Inventory_objects, match.new_counts)
+    return (not_updated_datas, len(changes))
 
 
 def sync_smartel_inventory():
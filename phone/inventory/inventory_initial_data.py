@@ -1,7 +1,9 @@
 import openpyxl
+from django.db import transaction
 
 
 from phone.models import Inventory, Dealership, DeviceVariant, DeviceColor
+from phone.inventory.aliases import rebuild_inventory_aliases
 
 """
 각 대리점에서 받는 재고표와 DB에 있는 device_varaint, device_color 정보를 매칭하기 위한 DB 초기 데이터 로드
@@ -80,20 +82,24 @@ def load_initial_inventory_data(file_path: str):
                     )
 
         # 3. 한 번에 DB로 쏘기 (Bulk Upsert)
+        # 별칭 재생성(전체 삭제 후 생성)까지 한 트랜잭션 - 중간 상태를 importer 가 보지 않도록
         if inventory_objects:
-            Inventory.objects.bulk_create(
-                inventory_objects,
-                update_conflicts=True,
-                unique_fields=[
-                    "device_variant",
-                    "device_color",
-                    "dealership",
-                ],  # 중복 기준 필드
-                update_fields=[
-                    "color_in_sheet",
-                    "name_in_sheet",
-                ],  # 이미 있을 때 업데이트할 필드
-            )
+            with transaction.atomic():
+                Inventory.objects.bulk_create(
+                    inventory_objects,
+                    update_conflicts=True,
+                    unique_fields=[
+                        "device_variant",
+                        "device_color",
+                        "dealership",
+                    ],  # 중복 기준 필드
+                    update_fields=[
+                        "color_in_sheet",
+                        "name_in_sheet",
+                    ],  # 이미 있을 때 업데이트할 필드
+                )
+                # bulk_create 는 post_save 를 타지 않으므로 별칭 테이블을 직접 다시 만든다
+                rebuild_inventory_aliases()
 
     except Exception as e:
         print(f"Error occurred: {e}")
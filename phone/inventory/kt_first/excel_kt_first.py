@@ -1,6 +1,8 @@
 import openpyxl
 from phone.models import Inventory, Dealership
 from phone.constants import CarrierChoices
+from phone.inventory.aliases import match_feed_rows
+from phone.inventory.writer import write_inventory_counts
 
 
 """엑셀 양식
@@ -57,31 +59,19 @@ def read_inventory_excel(file_path):
 
 def update_inventory(inventory_data):
     DEALER = Dealership.objects.get(name="퍼스트", carrier=CarrierChoices.KT)
-    old_datas = Inventory.objects.filter(dealership=DEALER)
-    inventory_name_color_to_object = dict()
-    for data in old_datas:
-        names = data.name_in_sheet.split(",")
-        colors = data.color_in_sheet.split(",")
-        for name in names:
-            for color in colors:
-                key = name + "_" + color.replace(" ", "")
-                inventory_name_color_to_object[key] = data
-
-        data.count = 0
-
-    not_matched = []
-
-    for item in inventory_data:
-        key = item["name_in_sheet"] + "_" + item["color_in_sheet"].replace(" ", "")
-        if key in inventory_name_color_to_object:
-            inventory_obj = inventory_name_color_to_object[key]
-            inventory_obj.count += item["count"]
-
-        else:
-            not_matched.append(
-                f"{item['name_in_sheet']} - {item['color_in_sheet']} : {item['count']}"
-            )
-
-    Inventory.objects.bulk_update(old_datas, ["count"])
+    old_datas = list(Inventory.objects.filter(dealership=DEALER))
+
+    match = match_feed_rows(
+        DEALER,
+        [
+            (item["name_in_sheet"], item["color_in_sheet"], item["count"])
+            for item in inventory_data
+        ],
+    )
+    not_matched = [
+        f"{name} - {color} : {count}" for name, color, count in match.unmatched
+    ]
+
+    write_inventory_counts(old_datas, match.new_counts)
 
     return not_matched
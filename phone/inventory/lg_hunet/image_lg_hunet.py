@@ -1,9 +1,19 @@
+import hashlib
 import json
-from google import genai
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
 
 from phoneinone_server.settings import GEMINI_API_KEY
 from phone.models import Inventory, Dealership
 from phone.constants import CarrierChoices
+from phone.inventory.aliases import match_feed_rows
+from phone.inventory.writer import write_inventory_counts
+
+logger = logging.getLogger(__name__)
 
 
 """엑셀 양식
@@ -27,14 +37,7 @@ NSO같이 유통향 말고 직구모델이 있는데, 퍼스트는 직구모델
 """
 
 
-def extract_json_from_image(file_path: str):
-    client = genai.Client(api_key=GEMINI_API_KEY)
-    image = client.files.upload(file=file_path)
-    response = client.models.generate_content(
-        model="gemini-3-flash-preview",
-        contents=[
-            image,
-            """
+EXTRACT_PROMPT = """
 [역할]: 엑셀 이미지 내 텍스트 추출 전문가
 [규칙]:
 1. 서론/결론 생략 (인사말, "도움이 되길 바랍니다" 등 금지).
@@ -45,46 +48,93 @@ def extract_json_from_image(file_path: str):
 ---
 [입력내용]: 주어진 이미지에서 텍스트를 추출해. 엑셀 캡쳐본이라 줄로 나뉘어 있어. 단, 규칙과 출력형식을 반드시 준수해야 하고, 다른 형식으로 답변하면 안돼.
 만약 이전에 주어진 이미지가 있더라도, 오직 지금 주어진 이미지에서만 텍스트를 추출해야 해.
-""",
-        ],
-    )
-    json_data = json.loads(response.text.replace("```", "").replace("json\n", ""))
-    # 단말기명에서 모든 공백 제거 필요
-    # ex) "UIPA 512(아이폰 에어 512G)" -> "UIPA_512(아이폰에어512G)"
-    # KEY = 단말기명_색상, VALUE = 수량
+"""
+
+CACHE_KEY_PREFIX = "lg_hunet_image"
+
+
+class GeminiStockImageProvider:
+    """재고표 캡쳐 이미지를 Gemini로 읽어 {단말기명: [[색상, 수량], ...]} 으로 반환."""
+
+    model = "gemini-3-flash-preview"
+
+    def extract(self, file_path: str) -> dict[str, list]:
+        from google import genai
+
+        client = genai.Client(api_key=GEMINI_API_KEY)
+        image = client.files.upload(file=file_path)
+        response = client.models.generate_content(
+            model=self.model,
+            contents=[image, EXTRACT_PROMPT],
+        )
+        return json.loads(response.text.replace("```", "").replace("json\n", ""))
+
+
+class StubStockImageProvider:
+    """테스트/벤치마크용 오프라인 추출기 - 고정 결과를 (선택적 지연 후) 반환."""
+
+    def __init__(self, result: dict[str, list] | None = None, latency: float = 0.0):
+        self.result = result or {}
+        self.latency = latency
+        self.calls = 0
+
+    def extract(self, file_path: str) -> dict[str, list]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return self.result
+
+
+def get_stock_image_provider():
+    return import_string(settings.LG_HUNET_IMAGE_PROVIDER)()
+
+
+def _content_hash(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def extract_json_from_image(file_path: str, provider=None):
+    """이미지 내용 해시 기준으로 캐시된 추출 결과를 재사용하고, 없을 때만 provider 호출.
+
+    캐시에는 provider 원본 결과({단말기명: [[색상, 수량]]})를 저장하고
+    LG_HUNET_IMAGE_CACHE_TTL 동안 유지한다.
+    """
+    cache_key = f"{CACHE_KEY_PREFIX}:{_content_hash(file_path)}"
+    json_data = cache.get(cache_key)
+    if json_data is None:
+        provider = provider or get_stock_image_provider()
+        json_data = provider.extract(file_path)
+        cache.set(cache_key, json_data, settings.LG_HUNET_IMAGE_CACHE_TTL)
+    else:
+        logger.info("lg_hunet_image.cache_hit key=%s", cache_key)
+
+    # 단말기명/색상명 공백 정규화는 InventoryAlias 매칭(normalize_alias)에서 처리
+    # KEY = (단말기명, 색상), VALUE = 수량
     cleaned_data = dict()
     for device_name, color_list in json_data.items():
-        cleaned_device_name = device_name.replace(" ", "")
         for color_name, count in color_list:
-            key = f"{cleaned_device_name}_{color_name.replace(' ', '')}"
-            cleaned_data[key] = count
+            key = (device_name, color_name)
+            cleaned_data[key] = cleaned_data.get(key, 0) + count
 
     return cleaned_data
 
 
-def update_inventory(inventory_data: dict[str, int]):
+def update_inventory(inventory_data: dict[tuple[str, str], int]):
     DEALER = Dealership.objects.get(name="엘비휴넷", carrier=CarrierChoices.LG)
-    old_datas = Inventory.objects.filter(dealership=DEALER)
-    inventory_name_color_to_object = dict()
-    for data in old_datas:
-        names = data.name_in_sheet.split(",")
-        colors = data.color_in_sheet.split(",")
-        for name in names:
-            for color in colors:
-                key = f"{name}_{color.replace(' ', '')}"
-                inventory_name_color_to_object[key] = data
-
-        data.count = 0
-
-    not_matched = []
-
-    for key, count in inventory_data.items():
-        if key in inventory_name_color_to_object:
-            inventory_obj = inventory_name_color_to_object[key]
-            inventory_obj.count += count
-        else:
-            not_matched.append(f"{key} : {count}")
-
-    Inventory.objects.bulk_update(old_datas, ["count"])
+    old_datas = list(Inventory.objects.filter(dealership=DEALER))
+
+    match = match_feed_rows(
+        DEALER,
+        [(name, color, count) for (name, color), count in inventory_data.items()],
+    )
+    not_matched = [
+        f"{name}_{color} : {count}" for name, color, count in match.unmatched
+    ]
+
+    write_inventory_counts(old_datas, match.new_counts)
 
     return not_matched
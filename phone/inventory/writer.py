@@ -0,0 +1,65 @@
+"""대리점 재고 동기화 공용 writer.
+
+스마텔(디아이) API / KT 퍼스트 엑셀 / LG 엘비휴넷 이미지 importer가 모두 같은
+방식으로 재고를 반영하도록 하는 헬퍼.
+
+- 피드에 없는 row는 0으로 간주한다 (기존 "전부 0으로 초기화 후 누적" 동작과 동일).
+- count가 실제로 바뀐 row만 bulk_update 한다.
+- 바뀐 row마다 InventoryChangeLog를 1건씩 append 해서 다운스트림이 Inventory
+  전체를 다시 훑지 않고 변경분만 읽을 수 있게 한다.
+- 재고가 바뀐 단말의 제품 상세 캐시(product-detail-<id>)만 revalidate 예약한다.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+from phone.models import Inventory, InventoryChangeLog
+from phone.revalidate import revalidate_products
+
+
+def write_inventory_counts(
+    inventories: list[Inventory], new_counts: dict[int, int]
+) -> list[InventoryChangeLog]:
+    """대리점 재고 row 목록에 새 수량을 반영하고 변경 이력을 남긴다.
+
+    Args:
+        inventories: 해당 대리점의 Inventory 전체 (DB에 저장된 현재 count 포함)
+        new_counts: Inventory.id -> 피드에서 누적한 수량. 없는 id는 0으로 본다.
+
+    Returns:
+        생성된 InventoryChangeLog 목록 (변경이 없으면 빈 리스트)
+    """
+    now = timezone.now()
+    changed = []
+    logs = []
+
+    for inventory in inventories:
+        new_count = new_counts.get(inventory.id, 0)
+        if inventory.count == new_count:
+            continue
+
+        logs.append(
+            InventoryChangeLog(
+                device_variant_id=inventory.device_variant_id,
+                device_color_id=inventory.device_color_id,
+                dealership_id=inventory.dealership_id,
+                old_count=inventory.count,
+                new_count=new_count,
+            )
+        )
+        inventory.count = new_count
+        inventory.updated_at = now
+        changed.append(inventory)
+
+    if not changed:
+        return []
+
+    with transaction.atomic():
+        Inventory.objects.bulk_update(changed, ["count", "updated_at"])
+        InventoryChangeLog.objects.bulk_create(logs)
+        revalidate_products(
+            device_variant_ids={log.device_variant_id for log in logs},
+            include_lists=False,
+        )
+
+    return logs
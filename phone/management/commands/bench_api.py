@@ -0,0 +1,207 @@
+"""공개 API end-to-end 벤치마크 (phone.api_benchmark).
+
+상품 목록(통신사/제조사), 상세, 가격 차트, calculator POST/PATCH, 제휴카드, 인터넷
+요금제를 TRAFFIC_MIX 비율로 섞어 보내고 엔드포인트별 p50/p95/p99, 요청당 쿼리 수,
+처리량을 출력한다. baseline JSON 과 비교해 p95 가 --threshold 이상 느려지거나 쿼리 수가
+늘어난 엔드포인트를 회귀로 표시한다.
+
+in-process (기본): 합성 카탈로그(phone.synthetic_catalog)를 만들고 테스트 Client 로
+호출한 뒤 전체를 롤백한다. DB 에 아무것도 남지 않는다.
+--base-url: 떠 있는 서버(gunicorn 등)로 보낸다. 카탈로그는 미리
+generate_synthetic_catalog 로 같은 DB 에 만들어 두어야 한다.
+
+사용 예:
+  python manage.py bench_api                                   # 상품 50개, 500요청
+  python manage.py bench_api --products 500 --requests 2000
+  python manage.py bench_api --save-baseline                   # baseline 갱신
+  python manage.py bench_api --fail-on-regression              # 회귀 시 exit 1
+  python manage.py bench_api --mix mix.json                    # {"product_detail": 50, ...}
+
+  # gunicorn 대상 (DEBUG=True 면 Server-Timing 헤더로 쿼리 수도 집계)
+  gunicorn phoneinone_server.wsgi:application -w 4 -b 127.0.0.1:8001 &
+  python manage.py bench_api --base-url http://127.0.0.1:8001 --concurrency 8 \\
+      --baseline benchmarks/api_baseline_gunicorn.json
+"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from phone.api_benchmark import (
+    TRAFFIC_MIX,
+    BenchmarkTargets,
+    HttpTransport,
+    InProcessTransport,
+    compare_to_baseline,
+    load_baseline,
+    run_benchmark,
+    save_baseline,
+)
+from phone.partner_card_cache import invalidate_partner_card_index
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / "benchmarks" / "api_baseline.json"
+
+
+class Command(BaseCommand):
+    help = (
+        "공개 API 트래픽 믹스를 재생해 엔드포인트별 p50/p95/p99, 쿼리 수, 처리량을 "
+        "측정하고 baseline 과 비교한다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=500, help="총 요청 수 (기본: 500)"
+        )
+        parser.add_argument(
+            "--products",
+            type=int,
+            default=50,
+            help="in-process 합성 카탈로그 상품 수 (기본: 50)",
+        )
+        parser.add_argument(
+            "--use-existing",
+            action="store_true",
+            help="in-process 에서 합성 카탈로그를 만들지 않고 현재 DB 데이터 사용",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본: 0)")
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=1,
+            help="엔드포인트별 통계에서 제외할 처음 요청 수 (기본: 1)",
+        )
+        parser.add_argument(
+            "--mix",
+            default=None,
+            help=f"엔드포인트별 가중치 JSON 파일 (키: {', '.join(TRAFFIC_MIX)})",
+        )
+        parser.add_argument(
+            "--base-url",
+            default=None,
+            help="이 서버로 HTTP 요청 (미지정 시 in-process)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=4,
+            help="--base-url 사용 시 동시 요청 수 (기본: 4)",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=str(DEFAULT_BASELINE),
+            help="baseline JSON 경로 (기본: benchmarks/api_baseline.json)",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="이번 결과를 baseline 으로 저장",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="p95 회귀 판정 비율 (기본: 0.2 = 20%%)",
+        )
+        parser.add_argument(
+            "--fail-on-regression",
+            action="store_true",
+            help="회귀가 있으면 에러로 종료",
+        )
+
+    def handle(self, *args, **opts):
+        mix = TRAFFIC_MIX
+        if opts["mix"]:
+            with open(opts["mix"], encoding="utf-8") as f:
+                mix = json.load(f)
+            unknown = set(mix) - set(TRAFFIC_MIX)
+            if unknown:
+                raise CommandError(f"알 수 없는 엔드포인트: {sorted(unknown)}")
+        bench = {
+            "requests": opts["requests"],
+            "mix": mix,
+            "seed": opts["seed"],
+            "warmup": opts["warmup"],
+        }
+
+        if opts["base_url"]:
+            transport = HttpTransport(opts["base_url"], opts["concurrency"])
+            result = run_benchmark(transport, BenchmarkTargets.from_db(), **bench)
+            result["meta"]["mode"] = f"http {opts['base_url']}"
+        else:
+            result = self._run_in_process(opts, bench)
+
+        self._report(result)
+        baseline_path = Path(opts["baseline"])
+        if baseline_path.exists():
+            self._compare(result, load_baseline(baseline_path), opts)
+        else:
+            self.stdout.write(f"baseline 없음: {baseline_path}")
+        if opts["save_baseline"]:
+            baseline_path.parent.mkdir(parents=True, exist_ok=True)
+            save_baseline(result, baseline_path)
+            self.stdout.write(self.style.SUCCESS(f"baseline 저장: {baseline_path}"))
+
+    def _run_in_process(self, opts, bench):
+        # calculator 쓰기가 DEBUG 분기로 건너뛰지 않도록 DEBUG=False, 측정 미들웨어 적재 제외
+        with override_settings(
+            DEBUG=False,
+            ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            REQUEST_METRICS_ENABLED=False,
+            EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
+        ), transaction.atomic():
+            if not opts["use_existing"]:
+                build_catalog(
+                    CatalogScale(
+                        products=opts["products"],
+                        variants_per_device=2,
+                        plans_per_carrier=3,
+                        price_history_days=90,
+                    ),
+                    seed=opts["seed"],
+                )
+            invalidate_partner_card_index()
+            result = run_benchmark(
+                InProcessTransport(), BenchmarkTargets.from_db(), **bench
+            )
+            transaction.set_rollback(True)
+        invalidate_partner_card_index()
+        result["meta"]["mode"] = "in-process"
+        result["meta"]["products"] = None if opts["use_existing"] else opts["products"]
+        return result
+
+    def _report(self, result):
+        self.stdout.write(
+            f"{'endpoint':<22}{'n':>6}{'err':>5}{'p50':>9}{'p95':>9}{'p99':>9}"
+            f"{'queries':>9}"
+        )
+        for name, stats in sorted(result["endpoints"].items()):
+            queries = "-" if stats["queries"] is None else f"{stats['queries']:.1f}"
+            self.stdout.write(
+                f"{name:<22}{stats['count']:>6}{stats['errors']:>5}"
+                f"{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+                f"{queries:>9}"
+            )
+        self.stdout.write(f"처리량: {result['throughput_rps']} req/s")
+
+    def _compare(self, result, baseline, opts):
+        keys = ("mode", "products", "requests", "concurrency")
+        if any(result["meta"].get(k) != baseline["meta"].get(k) for k in keys):
+            self.stdout.write(
+                self.style.WARNING(
+                    "baseline 과 측정 조건이 다릅니다: "
+                    + ", ".join(f"{k}={baseline['meta'].get(k)}" for k in keys)
+                )
+            )
+        regressions = compare_to_baseline(result, baseline, opts["threshold"])
+        if not regressions:
+            self.stdout.write(self.style.SUCCESS("baseline 대비 회귀 없음"))
+            return
+        for name, reason in regressions:
+            self.stdout.write(self.style.ERROR(f"회귀 {name}: {reason}"))
+        if opts["fail_on_regression"]:
+            raise CommandError(f"회귀 {len(regressions)}건")
@@ -0,0 +1,131 @@
+"""sync(WSGI) / async(ASGI) 배포의 동시 처리 용량 비교 (phone.async_benchmark).
+
+두 배포를 같은 워커 수의 gunicorn 으로 띄우고 읽기 API(상품 목록/상세, 가격 차트) 믹스를
+--concurrency 단계별로 보내 처리량(req/s), 엔드포인트 중 가장 나쁜 p95, 에러 수를
+출력한다. p95 가 --p95-budget-ms 안이고 에러가 없는 가장 높은 동시성을 용량으로 표시한다.
+
+서버는 현재 DB 를 읽는다. 카탈로그는 미리 generate_synthetic_catalog 로 만들어 둔다.
+--sync-url / --async-url 을 주면 서버를 띄우지 않고 떠 있는 서버로 보낸다.
+
+사용 예:
+  python manage.py generate_synthetic_catalog --products 200
+  python manage.py bench_async
+  python manage.py bench_async --workers 2 --concurrency 4 --concurrency 64 --requests 1000
+  python manage.py bench_async --sync-url http://10.0.0.5:8000 --async-url http://10.0.0.6:8000
+  python manage.py bench_async --json async_capacity.json
+"""
+
+import json
+from contextlib import ExitStack
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phone.api_benchmark import BenchmarkTargets
+from phone.async_benchmark import (
+    DEFAULT_CONCURRENCIES,
+    DEPLOYMENTS,
+    capacity,
+    compare_deployments,
+    serve,
+)
+
+
+class Command(BaseCommand):
+    help = "sync(WSGI) / async(ASGI) 배포의 읽기 API 동시 처리 용량(처리량, p95) 비교"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--deployment",
+            action="append",
+            choices=list(DEPLOYMENTS),
+            help="측정할 배포 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1, help="배포별 gunicorn 워커 수 (기본: 1)"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            action="append",
+            help=f"동시 요청 수 단계 (여러 번 지정, 기본: {DEFAULT_CONCURRENCIES})",
+        )
+        parser.add_argument(
+            "--requests", type=int, default=300, help="단계별 요청 수 (기본: 300)"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본: 0)")
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=1,
+            help="엔드포인트별 통계에서 제외할 처음 요청 수 (기본: 1)",
+        )
+        parser.add_argument(
+            "--p95-budget-ms",
+            type=float,
+            default=500,
+            help="용량 판정 p95 예산(ms) (기본: 500)",
+        )
+        parser.add_argument("--sync-url", default=None, help="떠 있는 sync 서버 URL")
+        parser.add_argument("--async-url", default=None, help="떠 있는 async 서버 URL")
+        parser.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+
+    def handle(self, *args, **opts):
+        targets = BenchmarkTargets.from_db()
+        if not targets.product_ids:
+            raise CommandError(
+                "판매 중인 상품이 없습니다. generate_synthetic_catalog 로 먼저 만드세요."
+            )
+        deployments = opts["deployment"] or list(DEPLOYMENTS)
+        given = {"sync": opts["sync_url"], "async": opts["async_url"]}
+
+        with ExitStack() as stack:
+            base_urls = {}
+            for deployment in deployments:
+                url = given[deployment]
+                if url is None:
+                    self.stdout.write(
+                        f"{deployment} 서버 기동 (workers={opts['workers']})..."
+                    )
+                    url = stack.enter_context(
+                        serve(deployment, workers=opts["workers"])
+                    )
+                base_urls[deployment] = url.rstrip("/")
+            rows = compare_deployments(
+                base_urls,
+                targets,
+                concurrencies=opts["concurrency"] or DEFAULT_CONCURRENCIES,
+                requests=opts["requests"],
+                seed=opts["seed"],
+                warmup=opts["warmup"],
+            )
+
+        self.stdout.write(
+            f"{'deployment':<12}{'conc':>6}{'req/s':>9}{'worst p95':>11}{'errors':>8}"
+        )
+        for row in rows:
+            self.stdout.write(
+                f"{row['deployment']:<12}{row['concurrency']:>6}"
+                f"{row['throughput_rps']:>9.1f}{row['worst_p95_ms']:>9.1f}ms"
+                f"{row['errors']:>8}"
+            )
+        summary = {}
+        for deployment in base_urls:
+            summary[deployment] = capacity(
+                [r for r in rows if r["deployment"] == deployment],
+                opts["p95_budget_ms"],
+            )
+            self.stdout.write(
+                f"{deployment} 용량: 동시 {summary[deployment]} "
+                f"(p95 <= {opts['p95_budget_ms']:.0f}ms, 에러 0)"
+            )
+
+        if opts["json"]:
+            with open(opts["json"], "w", encoding="utf-8") as f:
+                json.dump(
+                    {"workers": opts["workers"], "capacity": summary, "rows": rows},
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+                f.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {opts['json']}"))
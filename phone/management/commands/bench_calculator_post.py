@@ -0,0 +1,115 @@
+"""calculator POST(CalculatorSession 생성) 지연시간을 PartnerCard 캐시 사용/미사용으로 비교한다.
+
+요청마다 CalculatorSessionViewSet.create 를 직접 호출하고(throttle 제외), 전체를
+하나의 트랜잭션으로 묶어 마지막에 롤백하므로 DB에 세션이 남지 않는다.
+PartnerCard 가 없으면 벤치마크용 카드를 만들었다가 함께 롤백한다.
+
+사용 예:
+    python manage.py bench_calculator_post                  # 기본 200회 x 2모드
+    python manage.py bench_calculator_post --iterations 1000
+    python manage.py bench_calculator_post --slots 3        # partner_card_slots 3개
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from phone.constants import CardSlotChoices, CarrierChoices
+from phone.models import PartnerCard
+from phone.partner_card_cache import invalidate_partner_card_index
+from phone.views import CalculatorSessionViewSet
+
+
+def _payload(card_ids: list[int]) -> dict:
+    slots = CardSlotChoices.VALUES
+    return {
+        "answers": {"carrier": CarrierChoices.SK, "internet": []},
+        "auto_selected": {
+            "partner_card_slots": [
+                {
+                    "slot": slots[i % len(slots)],
+                    "card_id": card_id,
+                    "card_name": f"bench-{card_id}",
+                    "spend_allocated": 300000,
+                    "amount_monthly": 10000,
+                }
+                for i, card_id in enumerate(card_ids)
+            ]
+        },
+        "result": {"winner": None},
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "calculator POST 지연시간(p50/p95/평균)과 요청당 쿼리 수를 PartnerCard "
+        "프로세스 캐시 사용/미사용으로 비교한다. 모든 쓰기는 롤백된다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="모드별 요청 횟수 (기본: 200)",
+        )
+        parser.add_argument(
+            "--slots",
+            type=int,
+            default=2,
+            help="요청당 partner_card_slots 개수 (기본: 2)",
+        )
+
+    def handle(self, *args, **opts):
+        iterations = opts["iterations"]
+        view = CalculatorSessionViewSet.as_view({"post": "create"}, throttle_classes=[])
+        factory = APIRequestFactory()
+
+        with transaction.atomic():
+            card_ids = list(
+                PartnerCard.objects.order_by("id").values_list("id", flat=True)[
+                    : opts["slots"]
+                ]
+            )
+            while len(card_ids) < opts["slots"]:
+                card_ids.append(
+                    PartnerCard.objects.create(
+                        name=f"bench-{len(card_ids)}", carriers=[CarrierChoices.SK]
+                    ).id
+                )
+            payload = _payload(card_ids)
+
+            for label, ttl in (("캐시 미사용", 0), ("캐시 사용", 300)):
+                with override_settings(PARTNER_CARD_CACHE_TTL=ttl):
+                    invalidate_partner_card_index()
+                    view(factory.post("/", payload, format="json"))  # warm-up
+                    timings, queries = self._run(view, factory, payload, iterations)
+                self._report(label, timings, queries)
+
+            transaction.set_rollback(True)
+        invalidate_partner_card_index()
+
+    def _run(self, view, factory, payload, iterations):
+        timings = []
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(iterations):
+                request = factory.post("/", payload, format="json")
+                started = time.perf_counter()
+                response = view(request)
+                timings.append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 400:
+                    raise RuntimeError(f"POST 실패: {response.data}")
+        return timings, len(ctx.captured_queries) / iterations
+
+    def _report(self, label, timings, queries):
+        timings.sort()
+        p95 = timings[max(0, int(len(timings) * 0.95) - 1)]
+        self.stdout.write(
+            f"[{label}] n={len(timings)} "
+            f"p50={statistics.median(timings):.2f}ms p95={p95:.2f}ms "
+            f"avg={statistics.fmean(timings):.2f}ms 쿼리/요청={queries:.1f}"
+        )
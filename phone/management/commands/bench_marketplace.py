@@ -0,0 +1,149 @@
+"""가짜 11번가/SSG/채널톡 서버를 상대로 마켓플레이스 동기화를 측정한다.
+
+phone.fake_marketplace 서버를 띄우고 phone.marketplace_benchmark 단계
+(trigger_marketplace_sync, sync_11st_display_status, update_ssg_prices,
+sync_ssg_sales_status)별 소요 시간, API 호출 수, 주입된 에러/429, 실패 알림 수를
+출력한다. 지연/에러율/초당 한도는 서비스 공통 옵션으로 주고, 합성 카탈로그
+(오픈마켓 3곳: 11번가/G마켓/SSG)를 만든 뒤 전체를 롤백한다. 운영 DB 보호를 위해
+DEBUG 가 아니면 --force 없이는 실행되지 않는다.
+
+--serve: 측정 없이 서버만 띄우고 환경변수를 출력한다. 그 값으로 runserver /
+celery worker 를 띄우면 운영 흐름 전체를 가짜 서버로 돌려볼 수 있다.
+
+사용 예:
+  python manage.py bench_marketplace                              # 지연 50ms
+  python manage.py bench_marketplace --products 50 --latency-ms 120 --jitter-ms 80
+  python manage.py bench_marketplace --error-rate 0.05 --rate-limit 20
+  python manage.py bench_marketplace --stage sync_11st_display_status --json out.json
+  python manage.py bench_marketplace --serve --st11-orders 3     # Ctrl-C 로 종료
+"""
+
+import json
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from phone.fake_marketplace import FakeMarketplace, FaultConfig
+from phone.marketplace_benchmark import STAGES, run_marketplace_benchmark
+from phone.synthetic_catalog import OPEN_MARKETS, CatalogScale, build_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "가짜 마켓플레이스 서버(지연/에러/429 주입)를 띄우고 마켓 동기화 단계별 "
+        "소요 시간과 API 호출 수를 측정한다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--products", type=int, default=20, help="합성 카탈로그 상품 수 (기본: 20)"
+        )
+        parser.add_argument(
+            "--use-existing",
+            action="store_true",
+            help="합성 카탈로그를 만들지 않고 현재 DB 의 오픈마켓 상품 사용",
+        )
+        parser.add_argument(
+            "--stage",
+            action="append",
+            choices=STAGES,
+            help="측정할 단계 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument(
+            "--latency-ms", type=float, default=50, help="응답 지연 (기본: 50)"
+        )
+        parser.add_argument(
+            "--jitter-ms", type=float, default=0, help="추가 무작위 지연 최대값"
+        )
+        parser.add_argument(
+            "--error-rate", type=float, default=0.0, help="HTTP 500 비율 (0~1)"
+        )
+        parser.add_argument(
+            "--rate-limit",
+            type=int,
+            default=0,
+            help="서비스별 초당 허용 요청 수, 초과 시 429 (기본: 0 = 무제한)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본: 0)")
+        parser.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+        parser.add_argument(
+            "--serve", action="store_true", help="측정 없이 가짜 서버만 띄운다"
+        )
+        parser.add_argument(
+            "--st11-orders", type=int, default=0, help="11번가 주문 조회 응답 주문 수"
+        )
+        parser.add_argument(
+            "--ssg-orders", type=int, default=0, help="SSG 주문 조회 응답 주문 수"
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="DEBUG=False 환경에서도 실행",
+        )
+
+    def handle(self, *args, **opts):
+        if not settings.DEBUG and not opts["force"]:
+            raise CommandError(
+                "DEBUG=False 환경입니다. 정말 실행하려면 --force 를 붙이세요."
+            )
+        fault = FaultConfig(
+            latency_ms=opts["latency_ms"],
+            jitter_ms=opts["jitter_ms"],
+            error_rate=opts["error_rate"],
+            rate_limit=opts["rate_limit"],
+        )
+        fake = FakeMarketplace(
+            st11=fault,
+            ssg=fault,
+            channel_talk=FaultConfig(),
+            seed=opts["seed"],
+            st11_orders=opts["st11_orders"],
+            ssg_orders=opts["ssg_orders"],
+        )
+        with fake:
+            if opts["serve"]:
+                self._serve(fake)
+                return
+            with transaction.atomic():
+                if not opts["use_existing"]:
+                    build_catalog(
+                        CatalogScale(
+                            products=opts["products"], open_markets=len(OPEN_MARKETS)
+                        ),
+                        seed=opts["seed"],
+                    )
+                result = run_marketplace_benchmark(fake, stages=opts["stage"] or STAGES)
+                transaction.set_rollback(True)
+
+        self._report(result)
+        if opts["json"]:
+            with open(opts["json"], "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {opts['json']}"))
+
+    def _serve(self, fake):
+        for key, value in fake.env().items():
+            self.stdout.write(f"export {key}={value}")
+        self.stdout.write("가짜 서버 실행 중 - Ctrl-C 로 종료")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(json.dumps(fake.stats(), ensure_ascii=False, indent=2))
+
+    def _report(self, result):
+        self.stdout.write(
+            f"{'stage':<26}{'sec':>8}{'calls':>7}{'ms/call':>9}"
+            f"{'err':>5}{'429':>5}{'alerts':>8}"
+        )
+        for stage, stats in result["stages"].items():
+            per_call = "-" if stats["ms_per_call"] is None else stats["ms_per_call"]
+            self.stdout.write(
+                f"{stage:<26}{stats['seconds']:>8.2f}{stats['api_calls']:>7}"
+                f"{per_call:>9}{stats['errors']:>5}{stats['throttled']:>5}"
+                f"{stats['alerts']:>8}"
+            )
@@ -0,0 +1,97 @@
+"""상품 목록 / 상세 응답 직렬화의 요청당 CPU 시간 비교 (phone.serialization_benchmark).
+
+serializer + JSONRenderer 경로와 values() 기반 phone.product_payloads + ORJSONRenderer
+경로로 같은 응답을 만들어 CPU / wall 중앙값, 쿼리 수, CPU 절감 비율을 출력한다. 두 경로의
+응답 바이트가 다르면 mismatch 로 표시한다.
+
+in-process (기본): 합성 카탈로그(phone.synthetic_catalog)를 만들고 측정한 뒤 롤백한다.
+
+사용 예:
+  python manage.py bench_serialization                         # 상품 50개, 20회
+  python manage.py bench_serialization --products 300 --iterations 50
+  python manage.py bench_serialization --use-existing --json serialization.json
+  python manage.py bench_serialization --fail-on-mismatch      # 바이트가 다르면 exit 1
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from phone.serialization_benchmark import TARGETS, run_serialization_benchmark
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "상품 목록/상세 응답을 serializer 경로와 values()+orjson 경로로 만들어 "
+        "요청당 CPU 시간을 비교한다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--products", type=int, default=50, help="합성 카탈로그 상품 수 (기본: 50)"
+        )
+        parser.add_argument(
+            "--use-existing",
+            action="store_true",
+            help="합성 카탈로그를 만들지 않고 현재 DB 데이터 사용",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=20, help="대상별 반복 횟수 (기본: 20)"
+        )
+        parser.add_argument(
+            "--target",
+            action="append",
+            choices=list(TARGETS),
+            help="측정할 대상 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본: 0)")
+        parser.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+        parser.add_argument(
+            "--fail-on-mismatch",
+            action="store_true",
+            help="두 경로의 응답 바이트가 다르면 에러로 종료",
+        )
+
+    def handle(self, *args, **opts):
+        bench = {"iterations": opts["iterations"], "targets": opts["target"]}
+        if opts["use_existing"]:
+            result = run_serialization_benchmark(**bench)
+        else:
+            with transaction.atomic():
+                build_catalog(
+                    CatalogScale(products=opts["products"]), seed=opts["seed"]
+                )
+                result = run_serialization_benchmark(**bench)
+                transaction.set_rollback(True)
+
+        self.stdout.write(
+            f"{'target':<24}{'cpu_ms':>9}{'fast':>9}{'saving':>8}"
+            f"{'wall_ms':>9}{'fast':>9}{'queries':>9}{'bytes':>9}"
+        )
+        for name, stats in result["targets"].items():
+            serializer, fast = stats["serializer"], stats["fast"]
+            saving = (
+                "-" if stats["cpu_saving"] is None else f"{stats['cpu_saving']:.0%}"
+            )
+            line = (
+                f"{name:<24}{serializer['cpu_ms']:>9.2f}{fast['cpu_ms']:>9.2f}"
+                f"{saving:>8}{serializer['wall_ms']:>9.2f}{fast['wall_ms']:>9.2f}"
+                f"{serializer['queries']:>5}/{fast['queries']:<3}{stats['bytes']:>9}"
+            )
+            if not stats["identical"]:
+                line += "  " + self.style.ERROR("mismatch")
+            self.stdout.write(line)
+
+        if opts["json"]:
+            with open(opts["json"], "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {opts['json']}"))
+
+        mismatched = [
+            name for name, stats in result["targets"].items() if not stats["identical"]
+        ]
+        if opts["fail_on_mismatch"] and mismatched:
+            raise CommandError(f"응답 바이트가 다릅니다: {', '.join(mismatched)}")
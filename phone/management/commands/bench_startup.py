@@ -0,0 +1,78 @@
+"""프로세스 역할(web / worker / beat)별 기동 시간과 상주 메모리를 측정한다.
+
+역할마다 새 프로세스를 --repeat 번 띄워 기동 import 시간, 전체 wall 시간(인터프리터
+포함), RSS 중앙값과 로드된 무거운 라이브러리(pandas, openpyxl, google.genai, boto3,
+lxml, Google Merchant 등)를 출력한다 (phone.startup_benchmark). --instance-memory-mb 를
+주면 인스턴스 메모리에 들어가는 프로세스 수도 계산한다.
+
+사용 예:
+  python manage.py bench_startup
+  python manage.py bench_startup --role web --repeat 5
+  python manage.py bench_startup --instance-memory-mb 2048 --json startup.json
+  python manage.py bench_startup --fail-on-heavy        # web 이 무거운 모듈을 로드하면 exit 1
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phone.startup_benchmark import ROLES, measure_role
+
+
+class Command(BaseCommand):
+    help = "web/worker/beat 역할별 기동 import 시간, RSS, 로드된 무거운 라이브러리 측정"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--role",
+            action="append",
+            choices=ROLES,
+            help="측정할 역할 (여러 번 지정 가능, 기본: 전체)",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="역할별 반복 횟수 (기본: 3)"
+        )
+        parser.add_argument(
+            "--instance-memory-mb",
+            type=int,
+            default=None,
+            help="인스턴스 메모리(MB) - 역할별로 들어가는 프로세스 수를 함께 출력",
+        )
+        parser.add_argument("--json", default=None, help="결과를 저장할 JSON 경로")
+        parser.add_argument(
+            "--fail-on-heavy",
+            action="store_true",
+            help="web 역할이 무거운 라이브러리를 로드하면 에러로 종료",
+        )
+
+    def handle(self, *args, **opts):
+        results = [
+            measure_role(role, repeat=opts["repeat"]) for role in opts["role"] or ROLES
+        ]
+
+        self.stdout.write(
+            f"{'role':<8}{'import_s':>10}{'wall_s':>9}{'rss_mb':>9}"
+            + (f"{'fit':>6}" if opts["instance_memory_mb"] else "")
+            + "  heavy modules"
+        )
+        for result in results:
+            fit = ""
+            if opts["instance_memory_mb"]:
+                fit = f"{int(opts['instance_memory_mb'] // result['rss_mb']):>6}"
+            self.stdout.write(
+                f"{result['role']:<8}{result['import_s']:>10.3f}"
+                f"{result['wall_s']:>9.3f}{result['rss_mb']:>9.1f}{fit}  "
+                + (", ".join(result["heavy_modules"]) or "-")
+            )
+
+        if opts["json"]:
+            with open(opts["json"], "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+                f.write("\n")
+            self.stdout.write(self.style.SUCCESS(f"결과 저장: {opts['json']}"))
+
+        web = next((r for r in results if r["role"] == "web"), None)
+        if opts["fail_on_heavy"] and web and web["heavy_modules"]:
+            raise CommandError(
+                f"web 역할이 무거운 모듈을 로드합니다: {', '.join(web['heavy_modules'])}"
+            )
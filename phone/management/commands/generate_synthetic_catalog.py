@@ -0,0 +1,91 @@
+"""성능 측정용 합성 카탈로그를 scale 에 맞춰 생성한다 (phone.synthetic_catalog).
+
+같은 옵션 + --seed 면 항상 같은 데이터가 만들어진다. 기존 데이터는 지우지 않고 추가만
+하므로 빈 로컬 DB 에서 실행하는 것을 전제로 한다. 운영 DB 보호를 위해 DEBUG 가 아니면
+--force 없이는 실행되지 않는다. 전체가 한 트랜잭션이라 중간에 실패하면 남는 row 가 없다.
+
+사용 예:
+  # 기본 (상품 10개)
+  python manage.py generate_synthetic_catalog
+
+  # 상품 500 x 통신사 3 x 요금제 20 x 계약/할인 4조합 (용량 1개 → 옵션 120,000개)
+  python manage.py generate_synthetic_catalog --products 500 --plans-per-carrier 20 \\
+      --variants-per-device 1
+
+  # 오픈마켓 상품, 90일 가격 이력, 계산기 세션 10만 건까지
+  python manage.py generate_synthetic_catalog --products 200 --open-markets 3 \\
+      --price-history-days 90 --calculator-sessions 100000
+"""
+
+import dataclasses
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from phone.synthetic_catalog import CARRIERS, OPEN_MARKETS, CatalogScale, build_catalog
+
+HELP_TEXTS = {
+    "products": "상품 수 (= 단말기 수)",
+    "carriers": f"통신사 수 (최대 {len(CARRIERS)}, SK/KT/LG 순)",
+    "variants_per_device": "단말기당 용량 수",
+    "colors_per_device": "단말기당 색상 수",
+    "plans_per_carrier": "통신사당 요금제 수",
+    "series": "제품 시리즈 수",
+    "tags": "상품 태그 수",
+    "detail_images_per_product": "상품당 상세 이미지 수",
+    "partner_cards": "제휴카드 수",
+    "internet_plans_per_carrier": "인터넷 통신사당 인터넷 요금제 수",
+    "open_markets": f"오픈마켓 수 (최대 {len(OPEN_MARKETS)})",
+    "price_history_days": "PriceHistory 를 만들 기간 (일, 오늘까지)",
+    "calculator_sessions": "CalculatorSession 수",
+}
+
+
+class Command(BaseCommand):
+    help = "성능 측정용 합성 카탈로그(상품/옵션/재고/오픈마켓/가격이력/세션) 생성"
+
+    def add_arguments(self, parser):
+        for field in dataclasses.fields(CatalogScale):
+            parser.add_argument(
+                f"--{field.name.replace('_', '-')}",
+                type=int,
+                default=field.default,
+                help=f"{HELP_TEXTS[field.name]} (기본: {field.default})",
+            )
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (기본: 0)")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="DEBUG=False 환경에서도 실행",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError(
+                "DEBUG=False 환경입니다. 정말 실행하려면 --force 를 붙이세요."
+            )
+        scale = CatalogScale(
+            **{
+                field.name: options[field.name]
+                for field in dataclasses.fields(CatalogScale)
+            }
+        )
+        if not 1 <= scale.carriers <= len(CARRIERS):
+            raise CommandError(f"--carriers 는 1~{len(CARRIERS)} 사이여야 합니다.")
+        if not 0 <= scale.open_markets <= len(OPEN_MARKETS):
+            raise CommandError(
+                f"--open-markets 는 0~{len(OPEN_MARKETS)} 사이여야 합니다."
+            )
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            counts = build_catalog(scale, seed=options["seed"])
+        elapsed = time.perf_counter() - started
+
+        for name, count in counts.items():
+            self.stdout.write(f"  {name}: {count:,}")
+        self.stdout.write(
+            self.style.SUCCESS(f"완료: {sum(counts.values()):,} rows, {elapsed:.1f}초")
+        )
@@ -0,0 +1,70 @@
+"""월별 파티션 테이블(PriceHistory / PriceHistoryDaily / calculator_session) 관리.
+
+기본 동작은 이번 달 ~ N개월 뒤 파티션 생성뿐이다. --retain-months 를 주면 그보다
+오래된 파티션을 떼어내며(detach), 떼어낸 파티션은 같은 이름의 독립 테이블로 남는다
+(pg_dump 로 보관 후 --drop 으로 지우거나 직접 DROP).
+
+사용 예:
+  # 앞으로 3개월 파티션 생성 (beat 에서도 매일 실행)
+  python manage.py manage_partitions
+
+  # 24개월보다 오래된 파티션 분리 (테이블은 남김)
+  python manage.py manage_partitions --retain-months 24
+
+  # 분리 후 삭제까지
+  python manage.py manage_partitions --retain-months 24 --drop
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from phone.partitioning import (
+    PARTITIONED_TABLES,
+    detach_old_partitions,
+    ensure_partitions,
+    list_partitions,
+)
+
+
+class Command(BaseCommand):
+    help = "월별 파티션 생성 / 오래된 파티션 분리(archive)·삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=3,
+            help="이번 달부터 몇 개월 뒤까지 파티션을 만들지 (기본: 3)",
+        )
+        parser.add_argument(
+            "--retain-months",
+            type=int,
+            default=None,
+            help="이 개월 수보다 오래된 파티션을 분리. 미지정 시 분리하지 않음",
+        )
+        parser.add_argument(
+            "--drop",
+            action="store_true",
+            help="분리한 파티션을 삭제 (--retain-months 필요)",
+        )
+
+    def handle(self, *args, **options):
+        if options["drop"] and options["retain_months"] is None:
+            raise CommandError("--drop 은 --retain-months 와 함께 사용해야 합니다.")
+
+        created = ensure_partitions(months_ahead=options["months_ahead"])
+        self.stdout.write(f"생성 {len(created)}개: {', '.join(created) or '-'}")
+
+        if options["retain_months"] is not None:
+            detached = detach_old_partitions(
+                options["retain_months"], drop=options["drop"]
+            )
+            action = "삭제" if options["drop"] else "분리"
+            self.stdout.write(
+                f"{action} {len(detached)}개: {', '.join(detached) or '-'}"
+            )
+
+        for table in PARTITIONED_TABLES:
+            months = sorted(list_partitions(table))
+            span = f"{months[0]:%Y-%m} ~ {months[-1]:%Y-%m}" if months else "-"
+            self.stdout.write(f"  {table}: {len(months)}개 ({span})")
+        self.stdout.write(self.style.SUCCESS("완료"))
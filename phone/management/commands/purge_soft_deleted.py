@@ -0,0 +1,91 @@
+"""보관 기간이 지난 soft delete row 를 archive(ArchivedRow 로 이동) 하거나 삭제한다.
+
+beat 의 task_purge_soft_deleted 와 같은 로직이다. 기본값은 settings 의
+SOFT_DELETE_* 값을 따르고, 옵션으로 덮어쓸 수 있다.
+
+사용 예:
+  # 대상 모델과 정리될 row 수만 확인
+  python manage.py purge_soft_deleted --dry-run
+
+  # 기본 설정으로 실행
+  python manage.py purge_soft_deleted
+
+  # ProductOption 만 180일 기준으로 보관 없이 삭제
+  python manage.py purge_soft_deleted --model phone.ProductOption --retention-days 180 --mode delete
+"""
+
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from phone.soft_delete_purge import MODES, purge_soft_deleted, purge_targets
+
+
+class Command(BaseCommand):
+    help = "보관 기간이 지난 soft delete row archive / 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="대상 모델 label (예: phone.ProductOption). 여러 번 지정 가능, 미지정 시 전체",
+        )
+        parser.add_argument("--mode", choices=MODES, default=None)
+        parser.add_argument("--retention-days", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--sleep", type=float, default=None, help="배치 사이 쉬는 시간(초)"
+        )
+        parser.add_argument(
+            "--max-seconds", type=float, default=None, help="실행 시간 제한(초)"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="지우지 않고 모델별 대상 row 수만 출력 (FK 로 참조 중인 row 포함)",
+        )
+
+    def handle(self, *args, **options):
+        targets = purge_targets()
+        if options["models"]:
+            try:
+                selected = {apps.get_model(label) for label in options["models"]}
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            unknown = selected - set(targets)
+            if unknown:
+                raise CommandError(
+                    f"정리 대상이 아닌 모델: {', '.join(m._meta.label for m in unknown)}"
+                )
+            targets = [model for model in targets if model in selected]
+
+        if options["dry_run"]:
+            retention_days = options["retention_days"]
+            if retention_days is None:
+                retention_days = settings.SOFT_DELETE_RETENTION_DAYS
+            cutoff = timezone.now() - timedelta(days=retention_days)
+            for model in targets:
+                # 기본 매니저는 deleted_at IS NULL 만 보므로 QuerySet 을 직접 만든다
+                count = QuerySet(model).filter(deleted_at__lt=cutoff).count()
+                self.stdout.write(f"  {model._meta.label}: {count}")
+            return
+
+        results = purge_soft_deleted(
+            targets,
+            mode=options["mode"],
+            retention_days=options["retention_days"],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+            max_seconds=options["max_seconds"],
+            on_progress=lambda label, total: self.stdout.write(
+                f"  {label}: {total}건 처리"
+            ),
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"완료 — 총 {sum(results.values())}건 정리")
+        )
@@ -0,0 +1,42 @@
+"""InventoryAlias 테이블을 Inventory.name_in_sheet / color_in_sheet 기준으로 다시 만든다.
+
+Inventory 를 bulk_create / update / raw SQL 로 바꾸면 별칭을 유지하는 post_save 가
+돌지 않는다. 그런 변경 뒤에 별칭 테이블을 맞출 때 쓴다.
+
+사용 예:
+  # 전체 대리점
+  python manage.py rebuild_inventory_aliases
+
+  # 한 대리점만 (이름 또는 id)
+  python manage.py rebuild_inventory_aliases --dealership 디아이
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from phone.inventory.aliases import rebuild_inventory_aliases
+from phone.models import Dealership
+
+
+class Command(BaseCommand):
+    help = "InventoryAlias 테이블 재생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dealership", help="대리점 이름 또는 id (미지정 시 전체 대리점)"
+        )
+
+    def handle(self, *args, **options):
+        dealership = None
+        if options["dealership"]:
+            value = options["dealership"]
+            lookup = {"id": int(value)} if value.isdigit() else {"name": value}
+            try:
+                dealership = Dealership.objects.get(**lookup)
+            except Dealership.DoesNotExist:
+                raise CommandError(f"대리점을 찾을 수 없습니다: {value}")
+
+        with transaction.atomic():
+            count = rebuild_inventory_aliases(dealership)
+        target = dealership.name if dealership else "전체 대리점"
+        self.stdout.write(self.style.SUCCESS(f"{target} 별칭 {count}건 재생성"))
@@ -0,0 +1,45 @@
+"""활성 상품의 (product, carrier) 최저가를 오늘 날짜 PriceHistory 로 기록한다.
+
+beat 의 task_snapshot_price_history 와 같은 로직이다. 스냅샷이 며칠 빠졌으면
+--backfill-days 로 그 기간의 빈 날을 직전 기록 가격으로 먼저 채운다
+(옵션은 현재 가격만 있으므로 지난 날짜 가격을 다시 계산할 수는 없다).
+
+사용 예:
+  # 오늘 스냅샷
+  python manage.py snapshot_price_history
+
+  # 최근 7일 중 빠진 날을 채우고 오늘 스냅샷
+  python manage.py snapshot_price_history --backfill-days 7
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from phone.price_snapshot import backfill_price_history, snapshot_price_history
+
+
+class Command(BaseCommand):
+    help = "PriceHistory 스냅샷 (옵션: 빠진 날 backfill)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backfill-days",
+            type=int,
+            default=0,
+            help="최근 N일 중 기록이 없는 날을 직전 기록 가격으로 채운다 (기본: 0)",
+        )
+
+    def handle(self, *args, **options):
+        if options["backfill_days"] > 0:
+            start = timezone.now().date() - timedelta(days=options["backfill_days"])
+            filled = backfill_price_history(start)
+            self.stdout.write(f"backfill 완료 — {start} 부터 {filled}건 채움")
+
+        counts = snapshot_price_history()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"스냅샷 완료 — 생성 {counts['created']} / 업데이트 {counts['updated']}"
+            )
+        )
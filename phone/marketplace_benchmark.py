@@ -0,0 +1,159 @@
+"""
+마켓플레이스 동기화 벤치마크 (phone.fake_marketplace 대상)
+
+가짜 11번가/SSG/채널톡 서버를 띄운 상태에서 운영 코드 그대로 단계별 소요 시간과
+API 호출 수, 주입된 에러/429, 실패 알림(채널톡 메시지) 수를 잰다.
+
+    - trigger_marketplace_sync: 통신사별로 호출. Celery 를 eager 로 돌려 11번가
+      Task A→B→C(옵션 정리, 가격 인하, 옵션 추가)와 SSG 가격 갱신이 그 자리에서
+      실행된다. 외부 마켓 API 가 아닌 네이버 EP(S3 업로드)/가격 알림 큐잉은 건너뛴다.
+    - sync_11st_display_status: 저장된 전시상태를 모두 뒤집어 전 상품이 API 를 타게 한다.
+    - update_ssg_prices: SSG 상품마다 task_update_ssg_prices.
+    - sync_ssg_sales_status: 판매상태를 모두 뒤집고 enable_resume=True 로 동기화.
+
+사용법:
+    from phone.fake_marketplace import FakeMarketplace, FaultConfig
+    from phone.marketplace_benchmark import run_marketplace_benchmark
+
+    with FakeMarketplace(st11=FaultConfig(latency_ms=50)) as fake:
+        result = run_marketplace_benchmark(fake)
+"""
+
+import contextlib
+import dataclasses
+import time
+from unittest import mock
+
+from django.db.models import Case, Value, When
+from django.utils import timezone
+
+from phone.constants import CarrierChoices, OpenMarketChoices
+from phone.models import OpenMarketProduct
+
+STAGES = (
+    "trigger_marketplace_sync",
+    "sync_11st_display_status",
+    "update_ssg_prices",
+    "sync_ssg_sales_status",
+)
+CARRIERS = (CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG)
+
+
+@contextlib.contextmanager
+def _eager_celery():
+    from phoneinone_server.celery import app
+
+    previous = app.conf.task_always_eager
+    app.conf.task_always_eager = True
+    try:
+        yield
+    finally:
+        app.conf.task_always_eager = previous
+
+
+def _flip_display_flags(source):
+    """저장된 전시상태를 모두 뒤집는다 - 동기화가 전 상품에 API 를 호출하게."""
+    return OpenMarketProduct.objects.filter(open_market__source=source).update(
+        is_display_stopped=Case(
+            When(is_display_stopped=True, then=Value(False)), default=Value(True)
+        )
+    )
+
+
+def _run_trigger(carriers):
+    from phone.product_option_update import marketplace_sync
+
+    skipped = {}
+    with _eager_celery(), mock.patch.object(
+        marketplace_sync.task_generate_naver_compare_ep, "delay"
+    ) as naver_ep, mock.patch.object(
+        marketplace_sync.task_match_price_alerts, "delay"
+    ) as price_alerts:
+        for carrier in carriers:
+            marketplace_sync.trigger_marketplace_sync(carrier, margin=0, om_margin=0)
+        skipped["naver_ep"] = naver_ep.call_count
+        skipped["price_alerts"] = price_alerts.call_count
+    return {"carriers": list(carriers), "skipped_tasks": skipped}
+
+
+def _run_11st_display():
+    from phone.external_services.st_11.put_product.sync_display_status import (
+        sync_11st_display_status,
+    )
+
+    _flip_display_flags(OpenMarketChoices.ST11)
+    return sync_11st_display_status()
+
+
+def _run_ssg_prices():
+    from phone.tasks import task_update_ssg_prices
+
+    ids = OpenMarketProduct.objects.filter(
+        open_market__source=OpenMarketChoices.SSG, deleted_at__isnull=True
+    ).values_list("id", flat=True)
+    done = failed = 0
+    for om_product_id in ids:
+        try:
+            task_update_ssg_prices(om_product_id)
+            done += 1
+        except Exception:  # noqa: BLE001 - 실패는 채널톡 알림 수로도 집계된다
+            failed += 1
+    return {"updated": done, "failed": failed}
+
+
+def _run_ssg_sales():
+    from phone.external_services.ssg.put_product.sync_sales_status import (
+        sync_ssg_sales_status,
+    )
+
+    _flip_display_flags(OpenMarketChoices.SSG)
+    return sync_ssg_sales_status(enable_resume=True)
+
+
+def run_marketplace_benchmark(fake, stages=STAGES, carriers=CARRIERS):
+    """fake(FakeMarketplace, 실행 중) 를 대상으로 stages 를 순서대로 재고 결과 dict 반환."""
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise ValueError(f"알 수 없는 단계: {sorted(unknown)}")
+    runners = {
+        "trigger_marketplace_sync": lambda: _run_trigger(carriers),
+        "sync_11st_display_status": _run_11st_display,
+        "update_ssg_prices": _run_ssg_prices,
+        "sync_ssg_sales_status": _run_ssg_sales,
+    }
+
+    results = {}
+    with fake.settings():
+        for stage in stages:
+            fake.reset_stats()
+            started = time.perf_counter()
+            outcome = runners[stage]()
+            elapsed = time.perf_counter() - started
+            stats = fake.stats()
+            calls = sum(
+                sum(s["calls"].values())
+                for name, s in stats.items()
+                if name != "channel_talk"
+            )
+            results[stage] = {
+                "seconds": round(elapsed, 3),
+                "api_calls": calls,
+                "ms_per_call": round(elapsed * 1000 / calls, 2) if calls else None,
+                "errors": sum(s["errors"] for s in stats.values()),
+                "throttled": sum(s["throttled"] for s in stats.values()),
+                "alerts": len(fake.channel_talk.messages),
+                "alert_samples": [text for _, text in fake.channel_talk.messages[:3]],
+                "services": stats,
+                "result": outcome,
+            }
+    return {
+        "meta": {
+            "stages": list(stages),
+            "faults": {
+                service.name: dataclasses.asdict(service.fault)
+                for service in fake.services
+            },
+            "measured_at": timezone.now().isoformat(timespec="seconds"),
+        },
+        "stages": results,
+    }
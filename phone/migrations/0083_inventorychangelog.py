@@ -0,0 +1,54 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0082_merge_0080_devicevariant_gtin_0081_seed_device_specs"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryChangeLog",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("old_count", models.IntegerField()),
+                ("new_count", models.IntegerField()),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "dealership",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory_changes",
+                        to="phone.dealership",
+                    ),
+                ),
+                (
+                    "device_color",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory_changes",
+                        to="phone.devicecolor",
+                    ),
+                ),
+                (
+                    "device_variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory_changes",
+                        to="phone.devicevariant",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["created_at"], name="phone_inven_created_15d25a_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:12
+
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _normalize(text):
+    return re.sub(r"\s+", "", text or "").upper()
+
+
+def backfill_inventory_aliases(apps, schema_editor):
+    Inventory = apps.get_model("phone", "Inventory")
+    InventoryAlias = apps.get_model("phone", "InventoryAlias")
+
+    rows = []
+    for inventory in Inventory.objects.filter(deleted_at__isnull=True).order_by("id"):
+        model_keys = [
+            k for k in map(_normalize, inventory.name_in_sheet.split(",")) if k
+        ]
+        color_keys = [
+            k for k in map(_normalize, inventory.color_in_sheet.split(",")) if k
+        ]
+        for model_key in model_keys:
+            for color_key in color_keys:
+                rows.append(
+                    InventoryAlias(
+                        dealership_id=inventory.dealership_id,
+                        model_key=model_key,
+                        color_key=color_key,
+                        inventory_id=inventory.id,
+                    )
+                )
+    InventoryAlias.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0083_inventorychangelog"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InventoryAlias",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("model_key", models.CharField(max_length=100)),
+                ("color_key", models.CharField(max_length=50)),
+                (
+                    "dealership",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="inventory_aliases",
+                        to="phone.dealership",
+                    ),
+                ),
+                (
+                    "inventory",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aliases",
+                        to="phone.inventory",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("dealership", "model_key", "color_key"),
+                        name="unique_inventory_alias",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_inventory_aliases, migrations.RunPython.noop),
+    ]
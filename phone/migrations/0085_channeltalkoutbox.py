@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0084_inventoryalias"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChannelTalkOutbox",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("kind", models.CharField(max_length=30, verbose_name="알림 종류")),
+                (
+                    "group_id",
+                    models.CharField(max_length=20, verbose_name="채널톡 그룹 ID"),
+                ),
+                ("body", models.JSONField(verbose_name="요청 본문")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "대기"),
+                            ("sent", "발송"),
+                            ("failed", "실패"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.IntegerField(default=0)),
+                ("next_attempt_at", models.DateTimeField()),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "pending")),
+                        fields=["next_attempt_at"],
+                        name="ct_outbox_pending",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:23
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0085_channeltalkoutbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RevalidationRequest",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "tags",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.CharField(max_length=100), size=None
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
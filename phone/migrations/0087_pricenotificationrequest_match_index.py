@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0086_revalidationrequest"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pricenotificationrequest",
+            index=models.Index(
+                fields=["product", "notified_at", "target_price"],
+                name="price_noti_match_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 기존 PriceHistory 로 일별 시리즈를 처음 기록일부터 오늘까지 채운다.
+BACKFILL_SQL = """
+INSERT INTO phone_pricehistorydaily (product_id, carrier, day, final_price, plan_id)
+SELECT k.product_id, k.carrier, g.day::date, ph.final_price, ph.plan_id
+FROM (
+    SELECT product_id, carrier, MIN(price_at) AS first_day
+    FROM phone_pricehistory
+    WHERE deleted_at IS NULL
+    GROUP BY product_id, carrier
+) k
+CROSS JOIN LATERAL generate_series(
+    k.first_day, CURRENT_DATE, interval '1 day'
+) AS g(day)
+JOIN LATERAL (
+    SELECT h.final_price, h.plan_id
+    FROM phone_pricehistory h
+    WHERE h.product_id = k.product_id
+      AND h.carrier = k.carrier
+      AND h.price_at <= g.day::date
+      AND h.deleted_at IS NULL
+    ORDER BY h.price_at DESC
+    LIMIT 1
+) ph ON TRUE
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0087_pricenotificationrequest_match_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PriceHistoryDaily",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "carrier",
+                    models.CharField(
+                        choices=[
+                            ("SK", "SK"),
+                            ("KT", "KT"),
+                            ("LG", "LG"),
+                            ("알뜰폰", "알뜰폰"),
+                        ],
+                        max_length=100,
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("final_price", models.IntegerField(blank=True, null=True)),
+                (
+                    "plan",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_prices",
+                        to="phone.plan",
+                    ),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_prices",
+                        to="phone.product",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("product", "day", "carrier"), name="unique_price_daily"
+                    )
+                ],
+            },
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
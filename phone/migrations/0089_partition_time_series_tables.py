@@ -0,0 +1,157 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:35
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+# 시계열 테이블을 월별 RANGE 파티션 테이블로 전환한다.
+# 이후 파티션 생성/분리는 phone.partitioning / manage_partitions 커맨드가 맡는다.
+PARTITIONED_TABLES = [
+    ("phone_pricehistory", "price_at"),
+    ("phone_pricehistorydaily", "day"),
+    ("calculator_session", "created_at"),
+]
+MONTHS_AHEAD = 3
+
+
+def _add_months(month, n):
+    index = month.year * 12 + month.month - 1 + n
+    return month.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def _partition_table(cursor, table, column):
+    old = f"{table}_unpartitioned"
+
+    # 인덱스/제약 이름은 스키마 전역이라, 정의를 보관한 뒤 옛 테이블 쪽 이름을 비운다
+    cursor.execute(
+        """
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = current_schema() AND i.tablename = %s
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c
+              WHERE c.conindid = (quote_ident(i.indexname))::regclass
+          )
+        """,
+        [table],
+    )
+    indexes = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT conname, contype, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = %s::regclass AND contype IN ('u', 'f', 'c')
+        """,
+        [table],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        """
+        SELECT attidentity, pg_get_serial_sequence(%s, 'id')
+        FROM pg_attribute
+        WHERE attrelid = %s::regclass AND attname = 'id'
+        """,
+        [table, table],
+    )
+    identity, sequence = cursor.fetchone()
+
+    cursor.execute(f'ALTER TABLE "{table}" RENAME TO "{old}"')
+    for name, _ in indexes:
+        cursor.execute(f'ALTER INDEX "{name}" RENAME TO "{name[:50]}_old"')
+    for name, _, _ in constraints:
+        cursor.execute(
+            f'ALTER TABLE "{old}" RENAME CONSTRAINT "{name}" TO "{name[:50]}_old"'
+        )
+
+    cursor.execute(
+        f'CREATE TABLE "{table}" (LIKE "{old}" INCLUDING DEFAULTS INCLUDING IDENTITY) '
+        f'PARTITION BY RANGE ("{column}")'
+    )
+    # 파티션 테이블의 PK/UNIQUE 는 파티션 키를 포함해야 한다
+    cursor.execute(f'ALTER TABLE "{table}" ADD PRIMARY KEY ("id", "{column}")')
+    for name, contype, definition in constraints:
+        if contype == "u" and column not in definition:
+            raise RuntimeError(f"{table}.{name} 에 파티션 키 {column} 가 없습니다.")
+        cursor.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" {definition}')
+    for _, definition in indexes:
+        cursor.execute(definition)
+
+    # 기존 데이터 범위 ~ 현재+MONTHS_AHEAD 월 파티션, 범위 밖 row 는 default 로
+    cursor.execute(f'SELECT MIN("{column}")::date, CURRENT_DATE FROM "{old}"')
+    first, today = cursor.fetchone()
+    month = (first or today).replace(day=1)
+    last = _add_months(today.replace(day=1), MONTHS_AHEAD)
+    while month <= last:
+        cursor.execute(
+            f'CREATE TABLE "{table}_p{month:%Y%m}" PARTITION OF "{table}" '
+            f"FOR VALUES FROM ('{month}') TO ('{_add_months(month, 1)}')"
+        )
+        month = _add_months(month, 1)
+    cursor.execute(f'CREATE TABLE "{table}_default" PARTITION OF "{table}" DEFAULT')
+
+    cursor.execute(f'INSERT INTO "{table}" SELECT * FROM "{old}"')
+    if identity:
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+            f'COALESCE((SELECT MAX(id) FROM "{table}"), 0) + 1, false)',
+            [table],
+        )
+    elif sequence:
+        cursor.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{table}"."id"')
+    cursor.execute(f'DROP TABLE "{old}"')
+
+
+def partition_tables(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        for table, column in PARTITIONED_TABLES:
+            _partition_table(cursor, table, column)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internet", "0013_inquiry"),
+        ("phone", "0088_pricehistorydaily"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="calculatorsession",
+            name="internet_carriers",
+            field=models.ManyToManyField(
+                blank=True,
+                db_constraint=False,
+                related_name="calculator_sessions",
+                to="internet.internetcarrier",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="customeridentity",
+            name="session",
+            field=models.OneToOneField(
+                db_constraint=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="identity",
+                to="phone.calculatorsession",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="calculatorsession",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="cs_created_brin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pricehistory",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["price_at"], name="pricehistory_price_at_brin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pricehistorydaily",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["day"], name="price_daily_day_brin"
+            ),
+        ),
+        migrations.RunPython(partition_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0089_partition_time_series_tables"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedRow",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                (
+                    "table_name",
+                    models.CharField(max_length=100, verbose_name="원본 테이블"),
+                ),
+                ("row_id", models.CharField(max_length=64, verbose_name="원본 PK")),
+                (
+                    "deleted_at",
+                    models.DateTimeField(null=True, verbose_name="soft delete 시각"),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="보관 시각"),
+                ),
+                ("data", models.JSONField(verbose_name="원본 row")),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["table_name", "row_id"], name="archived_row_lookup"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:42
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # 운영 중인 hot 테이블이므로 쓰기를 막지 않도록 CONCURRENTLY 로 만든다
+    atomic = False
+
+    dependencies = [
+        ("phone", "0090_archivedrow"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="inventory",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["device_variant", "dealership"],
+                include=("count",),
+                name="inv_alive_variant",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="openmarketproduct",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["open_market", "device_variant"],
+                name="omp_alive_market",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="productoption",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["product", "contract_type", "plan"],
+                name="po_alive_product",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="productoption",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=["device_variant", "discount_type"],
+                name="po_alive_variant",
+            ),
+        ),
+    ]
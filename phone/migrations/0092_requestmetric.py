@@ -0,0 +1,48 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0091_alive_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RequestMetric",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("view_name", models.CharField(max_length=150)),
+                ("method", models.CharField(max_length=10)),
+                ("status", models.PositiveSmallIntegerField()),
+                ("query_count", models.PositiveIntegerField(default=0)),
+                ("db_ms", models.FloatField(default=0, verbose_name="SQL 합계(ms)")),
+                (
+                    "slowest_sql_ms",
+                    models.FloatField(default=0, verbose_name="가장 느린 SQL(ms)"),
+                ),
+                ("slowest_sql", models.TextField(blank=True, default="")),
+                (
+                    "app_ms",
+                    models.FloatField(
+                        default=0, verbose_name="view 처리(SQL 제외, ms)"
+                    ),
+                ),
+                (
+                    "render_ms",
+                    models.FloatField(default=0, verbose_name="응답 렌더링(ms)"),
+                ),
+                ("total_ms", models.FloatField(default=0, verbose_name="전체(ms)")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "verbose_name": "엔드포인트 성능",
+                "verbose_name_plural": "엔드포인트 성능",
+                "indexes": [
+                    models.Index(fields=["created_at"], name="request_metric_created")
+                ],
+            },
+        ),
+    ]
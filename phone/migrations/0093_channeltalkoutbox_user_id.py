@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("phone", "0092_requestmetric"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="channeltalkoutbox",
+            name="user_id",
+            field=models.CharField(
+                blank=True, default="", max_length=100, verbose_name="채널톡 유저 ID"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="channeltalkoutbox",
+            name="group_id",
+            field=models.CharField(
+                blank=True, max_length=20, verbose_name="채널톡 그룹 ID"
+            ),
+        ),
+    ]
@@ -28,8 +28,15 @@ from .content import (
     Event,
     CustomImage,
 )
-from .price import PriceHistory, PriceNotificationRequest
-from .inventory import Dealership, OfficialContractLink, Inventory, InventorySummary
+from .price import PriceHistory, PriceHistoryDaily, PriceNotificationRequest
+from .inventory import (
+    Dealership,
+    OfficialContractLink,
+    Inventory,
+    InventorySummary,
+    InventoryChangeLog,
+    InventoryAlias,
+)
 from .open_market import (
     OpenMarket,
     OpenMarketProduct,
@@ -39,6 +46,9 @@ from .open_market import (
 )
 from .diagnosis import DiagnosisLog, DiagnosisInquiry
 from .calculator import CalculatorSession, CustomerIdentity
+from .notification import ChannelTalkOutbox, RevalidationRequest
+from .archive import ArchivedRow
+from .metrics import RequestMetric
 
 __all__ = [
     "SoftDeleteModel",
@@ -70,11 +80,14 @@ __all__ = [
     "Event",
     "CustomImage",
     "PriceHistory",
+    "PriceHistoryDaily",
     "PriceNotificationRequest",
     "Dealership",
     "OfficialContractLink",
     "Inventory",
     "InventorySummary",
+    "InventoryChangeLog",
+    "InventoryAlias",
     "OpenMarket",
     "OpenMarketProduct",
     "OpenMarketProductOption",
@@ -84,4 +97,8 @@ __all__ = [
     "DiagnosisInquiry",
     "CalculatorSession",
     "CustomerIdentity",
+    "ChannelTalkOutbox",
+    "RevalidationRequest",
+    "ArchivedRow",
+    "RequestMetric",
 ]
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class ArchivedRow(models.Model):
+    """soft delete 후 보관 기간이 지난 row 의 보관본.
+
+    원본 테이블에서 지운 row 를 to_jsonb 그대로 담는다 (task_purge_soft_deleted).
+    원본 스키마가 바뀌어도 보관본 적재가 깨지지 않도록 컬럼 대신 JSON 으로 둔다.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    table_name = models.CharField("원본 테이블", max_length=100)
+    row_id = models.CharField("원본 PK", max_length=64)
+    deleted_at = models.DateTimeField("soft delete 시각", null=True)
+    archived_at = models.DateTimeField("보관 시각", auto_now_add=True)
+    data = models.JSONField("원본 row")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["table_name", "row_id"], name="archived_row_lookup"),
+        ]
+
+    def __str__(self):
+        return f"ArchivedRow({self.table_name} / {self.row_id})"
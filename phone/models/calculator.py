@@ -1,6 +1,7 @@
 import uuid
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 from phone.constants import (
@@ -24,6 +25,8 @@ class CalculatorSession(SoftDeleteModel):
         (2) volume 대비 storage cost
         (3) PATCH 가 단 1회 (first-write-wins) 라 변경 추적 가치 낮음
         추적 수단: applied 응답 + first_write_wins.ignored WARN 로그.
+    - created_at 기준 월별 파티션 테이블 (phone.partitioning). PK 는 DB 상 (id, created_at)
+      이라 이 테이블을 가리키는 FK 는 db_constraint=False 로 둔다.
     """
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -57,6 +60,7 @@ class CalculatorSession(SoftDeleteModel):
         "internet.InternetCarrier",
         blank=True,
         related_name="calculator_sessions",
+        db_constraint=False,
     )
 
     device = models.ForeignKey(
@@ -123,6 +127,7 @@ class CalculatorSession(SoftDeleteModel):
     class Meta:
         db_table = "calculator_session"
         indexes = [
+            BrinIndex(fields=["created_at"], name="cs_created_brin"),
             models.Index(fields=["funnel_variant", "contact_channel"]),
             models.Index(fields=["ga4_client_id"]),
             models.Index(
@@ -146,6 +151,7 @@ class CustomerIdentity(SoftDeleteModel):
         CalculatorSession,
         on_delete=models.CASCADE,
         related_name="identity",
+        db_constraint=False,
     )
     source = models.CharField(
         max_length=20,
@@ -78,6 +78,14 @@ class Inventory(SoftDeleteModel):
         indexes = [
             models.Index(fields=["created_at"]),
             models.Index(fields=["device_variant", "device_color", "dealership"]),
+            # device_variant 별 대리점(통신사) 재고 - 11번가 전시상태 동기화 재고 합계,
+            # 상품 목록/상세의 재고 있는 (통신사, 용량) 조회. count 는 INCLUDE 로 heap 안 봄
+            models.Index(
+                fields=["device_variant", "dealership"],
+                include=["count"],
+                name="inv_alive_variant",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -99,3 +107,76 @@ class InventorySummary(Inventory):
         proxy = True
         verbose_name = "제품별 재고"
         verbose_name_plural = "제품별 재고"
+
+
+class InventoryChangeLog(models.Model):
+    """재고 수량 변경 이력 - 재고 동기화 시 count가 실제로 바뀐 row만 1건씩 append.
+
+    다운스트림(11번가/SSG 전시상태 동기화 등)이 Inventory 전체를 다시 훑지 않고
+    id/created_at 이후의 변경분만 읽어갈 수 있도록 하는 compact change feed.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    device_variant = models.ForeignKey(
+        DeviceVariant,
+        on_delete=models.CASCADE,
+        related_name="inventory_changes",
+    )
+    device_color = models.ForeignKey(
+        DeviceColor,
+        on_delete=models.CASCADE,
+        related_name="inventory_changes",
+    )
+    dealership = models.ForeignKey(
+        Dealership,
+        on_delete=models.CASCADE,
+        related_name="inventory_changes",
+    )
+    old_count = models.IntegerField()
+    new_count = models.IntegerField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self):
+        return (
+            f"{self.device_variant_id}/{self.device_color_id}@{self.dealership_id}"
+            f" ({self.old_count} -> {self.new_count})"
+        )
+
+
+class InventoryAlias(models.Model):
+    """재고표 별칭 정규화 인덱스 - (대리점, 정규화 모델명, 정규화 색상명) -> Inventory.
+
+    Inventory.name_in_sheet / color_in_sheet 의 쉼표 구분 별칭을 전개해 1 row씩
+    저장한다. Inventory 저장 시 signal로 동기화되며, 재고 importer는 이 테이블을
+    한 번의 조회로 매칭한다.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    dealership = models.ForeignKey(
+        Dealership,
+        on_delete=models.CASCADE,
+        related_name="inventory_aliases",
+    )
+    model_key = models.CharField(max_length=100)
+    color_key = models.CharField(max_length=50)
+    inventory = models.ForeignKey(
+        Inventory,
+        on_delete=models.CASCADE,
+        related_name="aliases",
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dealership", "model_key", "color_key"],
+                name="unique_inventory_alias",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.model_key}_{self.color_key} -> {self.inventory_id}"
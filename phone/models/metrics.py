@@ -0,0 +1,32 @@
+from django.db import models
+
+
+class RequestMetric(models.Model):
+    """샘플링된 API 요청 1건의 SQL / 구간별 시간 측정값 (phone.request_metrics).
+
+    admin '엔드포인트 성능' 페이지가 view 별 p50/p95/p99 를 계산하는 원천 데이터다.
+    보관 기간(REQUEST_METRICS_RETENTION_DAYS)이 지난 row 는 beat 가 지운다.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    view_name = models.CharField(max_length=150)
+    method = models.CharField(max_length=10)
+    status = models.PositiveSmallIntegerField()
+    query_count = models.PositiveIntegerField(default=0)
+    db_ms = models.FloatField("SQL 합계(ms)", default=0)
+    slowest_sql_ms = models.FloatField("가장 느린 SQL(ms)", default=0)
+    slowest_sql = models.TextField(blank=True, default="")
+    app_ms = models.FloatField("view 처리(SQL 제외, ms)", default=0)
+    render_ms = models.FloatField("응답 렌더링(ms)", default=0)
+    total_ms = models.FloatField("전체(ms)", default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "엔드포인트 성능"
+        verbose_name_plural = "엔드포인트 성능"
+        indexes = [
+            models.Index(fields=["created_at"], name="request_metric_created"),
+        ]
+
+    def __str__(self):
+        return f"RequestMetric({self.view_name} / {self.total_ms:.0f}ms)"
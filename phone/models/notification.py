@@ -0,0 +1,57 @@
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+
+from phone.constants import OutboxStatusChoices
+
+
+class ChannelTalkOutbox(models.Model):
+    """채널톡 그룹 메시지 / 유저 이벤트 outbox.
+
+    주문/문의/calculator lead/가격 알림을 요청 안에서 바로 보내지 않고 비즈니스 row 와 같은
+    트랜잭션으로 여기에 적재한다. user_id 가 있으면 유저 이벤트, 없으면 group_id 그룹 메시지. 발송은 task_deliver_channel_talk_outbox 가 배치로
+    처리하며 실패 시 next_attempt_at 을 늘려 재시도한다.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    kind = models.CharField("알림 종류", max_length=30)
+    group_id = models.CharField("채널톡 그룹 ID", max_length=20, blank=True)
+    user_id = models.CharField("채널톡 유저 ID", max_length=100, blank=True, default="")
+    body = models.JSONField("요청 본문")
+    status = models.CharField(
+        max_length=10,
+        choices=OutboxStatusChoices.CHOICES,
+        default=OutboxStatusChoices.PENDING,
+    )
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                name="ct_outbox_pending",
+                condition=models.Q(status=OutboxStatusChoices.PENDING),
+            ),
+        ]
+
+    def __str__(self):
+        return f"ChannelTalkOutbox({self.id} / {self.kind} / {self.status})"
+
+
+class RevalidationRequest(models.Model):
+    """Next.js ISR revalidation 대기열.
+
+    admin 저장/엑셀 업로드가 몰려도 revalidate 요청을 바로 보내지 않고 여기에 쌓아 두면
+    task_flush_revalidation 이 짧은 윈도우 동안 모인 태그를 중복 제거해 한 번에 보낸다.
+    row 1개 = enqueue 호출 1회 (coalesce 지표 계산용).
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    tags = ArrayField(models.CharField(max_length=100))
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"RevalidationRequest({self.id} / {', '.join(self.tags)})"
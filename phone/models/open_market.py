@@ -54,6 +54,17 @@ class OpenMarketProduct(SoftDeleteModel):
         help_text="재고 소진 시 11번가 전시중지(True), 재고 확보 시 전시재개(False). 재고 동기화 시 자동 갱신됨.",
     )
 
+    class Meta(SoftDeleteModel.Meta):
+        indexes = [
+            models.Index(fields=["created_at"]),
+            # 마켓별 alive 상품 조회 (11번가/SSG 동기화, 전시상태 동기화, 네이버 EP)
+            models.Index(
+                fields=["open_market", "device_variant"],
+                name="omp_alive_market",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 from phone.constants import CarrierChoices
@@ -20,7 +21,45 @@ class PriceHistory(SoftDeleteModel):
         return f"{self.product.name} - {self.price_at}"
 
     class Meta:
+        # price_at 기준 월별 파티션 테이블 (phone.partitioning)
         unique_together = ("product", "price_at", "carrier")
+        indexes = [
+            BrinIndex(fields=["price_at"], name="pricehistory_price_at_brin"),
+        ]
+
+
+class PriceHistoryDaily(models.Model):
+    """(product, carrier) 일별 가격 시리즈 (PriceHistory 의 forward-fill 결과).
+
+    PriceHistory 는 가격이 바뀐 날만 기록되므로 차트를 그리려면 빈 날을 직전 가격으로
+    채워야 한다. 그 작업을 쓰기 시점에 해 두고, 차트 조회는 (product, day) 범위 한 번으로
+    끝낸다. phone.price_series 에서만 갱신한다.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="daily_prices"
+    )
+    carrier = models.CharField(max_length=100, choices=CarrierChoices.CHOICES)
+    day = models.DateField()
+    final_price = models.IntegerField(null=True, blank=True)
+    plan = models.ForeignKey(
+        Plan, on_delete=models.CASCADE, related_name="daily_prices"
+    )
+
+    class Meta:
+        # day 기준 월별 파티션 테이블 (phone.partitioning)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["product", "day", "carrier"], name="unique_price_daily"
+            ),
+        ]
+        indexes = [
+            BrinIndex(fields=["day"], name="price_daily_day_brin"),
+        ]
+
+    def __str__(self):
+        return f"PriceHistoryDaily({self.product_id} / {self.carrier} / {self.day})"
 
 
 class PriceNotificationRequest(SoftDeleteModel):
@@ -45,3 +84,13 @@ class PriceNotificationRequest(SoftDeleteModel):
         help_text="Channel Talk User ID for notification",
         default="",
     )
+
+    class Meta(SoftDeleteModel.Meta):
+        indexes = [
+            models.Index(fields=["created_at"]),
+            # 가격 알림 매칭: (product, 미발송, target_price >= 현재가) 범위 조회용
+            models.Index(
+                fields=["product", "notified_at", "target_price"],
+                name="price_noti_match_idx",
+            ),
+        ]
@@ -81,6 +81,24 @@ class ProductOption(SoftDeleteModel):
         default=None,
     )
 
+    class Meta(SoftDeleteModel.Meta):
+        indexes = [
+            models.Index(fields=["created_at"]),
+            # alive row 전용 partial index (SoftDeleteManager 가 항상 deleted_at IS NULL)
+            # 상품 목록/상세 options prefetch: product_id IN (...) + contract_type + plan 조인
+            models.Index(
+                fields=["product", "contract_type", "plan"],
+                name="po_alive_product",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+            # 마켓플레이스 동기화 / 네이버 EP: device_variant_id IN (...) + 공시지원금
+            models.Index(
+                fields=["device_variant", "discount_type"],
+                name="po_alive_variant",
+                condition=models.Q(deleted_at__isnull=True),
+            ),
+        ]
+
     def __str__(self):
         return f"{self.id}"
 
@@ -145,18 +163,19 @@ class ProductOption(SoftDeleteModel):
         # 처리 완료 후 초기화
         _thread_locals.pending_products.clear()
 
-    @property
-    def monthly_payment(self):
+    @classmethod
+    def calculate_monthly_payment(cls, final_price, discount_type, plan_price):
         result = 0
-        if self.final_price:
-            result += self.final_price * (1.0625 / 24)
+        if final_price:
+            result += final_price * (1.0625 / 24)
         return int(
-            result
-            + (
-                self.plan.price * 0.75
-                if self.discount_type == "선택약정"
-                else self.plan.price
-            )
+            result + (plan_price * 0.75 if discount_type == "선택약정" else plan_price)
+        )
+
+    @property
+    def monthly_payment(self):
+        return self.calculate_monthly_payment(
+            self.final_price, self.discount_type, self.plan.price
         )
 
     @property
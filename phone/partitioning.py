@@ -0,0 +1,114 @@
+"""
+월별 RANGE 파티션 관리
+
+시간 범위로만 조회되는 테이블은 0089 마이그레이션에서 파티션 테이블로 전환됐다.
+파티션 이름은 `<table>_pYYYYMM`, 범위 밖 row 는 `<table>_default` 로 들어간다.
+
+    - ensure_partitions(): 이번 달 ~ N개월 뒤 파티션을 미리 만든다 (없는 것만).
+      default 파티션에 해당 범위 row 가 있으면 생성이 실패하므로 넉넉히 앞서 만든다.
+    - detach_old_partitions(): 보관 기간이 지난 파티션을 떼어낸다. 떼어낸 파티션은 같은
+      이름의 독립 테이블로 남아 pg_dump 로 보관(archive)할 수 있고, drop=True 면 삭제한다.
+
+사용법:
+    from phone.partitioning import ensure_partitions, detach_old_partitions
+
+    ensure_partitions(months_ahead=3)
+    detach_old_partitions(retain_months=24, drop=False)
+"""
+
+import logging
+import re
+from datetime import date
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from phone.models import CalculatorSession, PriceHistory, PriceHistoryDaily
+
+logger = logging.getLogger(__name__)
+
+# 파티션 테이블 -> 파티션 키 컬럼
+PARTITIONED_TABLES = {
+    PriceHistory._meta.db_table: "price_at",
+    PriceHistoryDaily._meta.db_table: "day",
+    CalculatorSession._meta.db_table: "created_at",
+}
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})(\d{2})$")
+
+
+def add_months(month: date, n: int) -> date:
+    index = month.year * 12 + month.month - 1 + n
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def list_partitions(table: str) -> dict[date, str]:
+    """table 에 붙어 있는 월 파티션 (월 1일 -> 파티션 이름). default 는 제외."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            """,
+            [table],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = _PARTITION_SUFFIX.search(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def ensure_partitions(months_ahead: int = 3, today: date | None = None) -> list[str]:
+    """모든 파티션 테이블에 이번 달 ~ months_ahead 개월 뒤 파티션을 만든다."""
+    this_month = (today or timezone.now().date()).replace(day=1)
+    created = []
+    for table in PARTITIONED_TABLES:
+        existing = list_partitions(table)
+        for n in range(months_ahead + 1):
+            month = add_months(this_month, n)
+            if month in existing:
+                continue
+            name = partition_name(table, month)
+            with transaction.atomic(), connection.cursor() as cursor:
+                # DDL 은 바인드 파라미터를 못 쓰므로 직접 만든 날짜 리터럴을 넣는다
+                cursor.execute(
+                    f'CREATE TABLE "{name}" PARTITION OF "{table}" '
+                    f"FOR VALUES FROM ('{month}') TO ('{add_months(month, 1)}')"
+                )
+            created.append(name)
+            logger.info("partitioning.created table=%s partition=%s", table, name)
+    return created
+
+
+def detach_old_partitions(
+    retain_months: int, drop: bool = False, today: date | None = None
+) -> list[str]:
+    """retain_months 개월보다 오래된 파티션을 떼어낸다 (drop=True 면 삭제까지)."""
+    cutoff = add_months((today or timezone.now().date()).replace(day=1), -retain_months)
+    detached = []
+    for table in PARTITIONED_TABLES:
+        for month, name in sorted(list_partitions(table).items()):
+            if month >= cutoff:
+                continue
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"')
+                if drop:
+                    cursor.execute(f'DROP TABLE "{name}"')
+            detached.append(name)
+            logger.info(
+                "partitioning.detached table=%s partition=%s dropped=%s",
+                table,
+                name,
+                drop,
+            )
+    return detached
@@ -0,0 +1,73 @@
+"""
+유효 PartnerCard 프로세스 내 캐시
+
+calculator POST 검증(validate_auto_selected)이 매 요청마다 PartnerCard id 존재 여부를
+DB에 묻지 않도록, 삭제되지 않은 카드의 id -> (carriers, discount_types) 를 프로세스
+메모리에 들고 있는다.
+
+무효화:
+    - 같은 프로세스: PartnerCard post_save / post_delete signal 에서 즉시 비움
+      (soft delete 도 save(update_fields=["deleted_at"]) 라 post_save 로 잡힌다)
+    - 다른 워커 프로세스 / queryset.update 등 signal 이 없는 경로:
+      PARTNER_CARD_CACHE_TTL(초) 경과 후 다음 조회에서 다시 적재
+    PARTNER_CARD_CACHE_TTL <= 0 이면 캐시를 쓰지 않고 매번 조회한다.
+
+사용법:
+    from phone.partner_card_cache import get_partner_card_index
+
+    index = get_partner_card_index()
+    index[card_id].carriers
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+
+from phone.models import PartnerCard
+
+
+@dataclass(frozen=True)
+class PartnerCardInfo:
+    carriers: tuple[str, ...]
+    discount_types: tuple[str, ...]
+
+
+_lock = threading.Lock()
+_index: dict[int, PartnerCardInfo] | None = None
+_loaded_at = 0.0
+
+
+def _load_index() -> dict[int, PartnerCardInfo]:
+    return {
+        card_id: PartnerCardInfo(tuple(carriers or ()), tuple(discount_types or ()))
+        for card_id, carriers, discount_types in PartnerCard.objects.values_list(
+            "id", "carriers", "discount_types"
+        )
+    }
+
+
+def get_partner_card_index() -> dict[int, PartnerCardInfo]:
+    """삭제되지 않은 PartnerCard id -> PartnerCardInfo. TTL 내에는 DB 조회 없음."""
+    global _index, _loaded_at
+
+    ttl = settings.PARTNER_CARD_CACHE_TTL
+    if ttl <= 0:
+        return _load_index()
+
+    index = _index
+    if index is not None and time.monotonic() - _loaded_at < ttl:
+        return index
+
+    with _lock:
+        if _index is None or time.monotonic() - _loaded_at >= ttl:
+            _index = _load_index()
+            _loaded_at = time.monotonic()
+        return _index
+
+
+def invalidate_partner_card_index():
+    global _index
+    with _lock:
+        _index = None
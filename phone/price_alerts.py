@@ -0,0 +1,188 @@
+"""
+가격 알림(PriceNotificationRequest) 매칭
+
+미발송 알림 요청을 현재 최저가와 한 번의 쿼리로 조인해 target_price 이하로 내려온
+요청만 골라낸다. 요청 row 마다 가격을 따로 조회하지 않는다.
+
+현재가 기준 (prev_carrier = 고객의 현재 통신사):
+    - 같은 통신사 옵션은 기기변경 가격
+    - 다른 통신사 옵션은 번호이동 가격 (알뜰폰 고객은 SK/KT/LG 모두 번호이동)
+    위 옵션 중 최저 final_price 가 target_price 이하이면 매칭.
+
+발송 (모두 ChannelTalkOutbox 적재, 실제 발송/재시도는 outbox 워커):
+    - channel_talk_user_id 가 있으면 유저 이벤트(price_alert)로 알림톡 자동화를 트리거
+    - 없으면 배치 단위로 모아 운영 그룹 메시지 1건으로 적재
+    - 배치의 요청을 `UPDATE ... SET notified_at WHERE notified_at IS NULL RETURNING id`
+      로 선점하고, 선점한 요청만 같은 트랜잭션에서 outbox 에 적재한다. 동시에 도는 다른
+      실행은 같은 row 를 선점하지 못하므로 중복 발송되지 않는다.
+
+사용법:
+    from phone.price_alerts import match_price_alerts
+
+    match_price_alerts()                      # 전체
+    match_price_alerts(product_ids=[1, 2])    # 가격이 바뀐 제품만
+"""
+
+import logging
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from phone.constants import ContractTypeChoices
+from phone.external_services.channel_talk import (
+    ChannelTalkAPI,
+    price_alert_digest_text,
+)
+from phone.external_services.channel_talk_outbox import (
+    enqueue_group_message,
+    queue_price_alert_event,
+)
+from phone.models import Plan, PriceNotificationRequest, Product, ProductOption
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PriceAlertMatch:
+    request_id: int
+    product_name: str
+    customer_phone: str
+    channel_talk_user_id: str
+    target_price: int
+    carrier: str
+    contract_type: str
+    price: int
+
+
+def _match_sql(with_product_filter: bool) -> str:
+    product_filter = (
+        "AND po.product_id = ANY(%(product_ids)s)" if with_product_filter else ""
+    )
+    return f"""
+        WITH best AS (
+            SELECT po.product_id, pl.carrier, po.contract_type,
+                   MIN(po.final_price) AS price
+            FROM {ProductOption._meta.db_table} po
+            JOIN {Plan._meta.db_table} pl ON pl.id = po.plan_id
+            JOIN {Product._meta.db_table} p ON p.id = po.product_id
+            WHERE po.deleted_at IS NULL
+              AND pl.deleted_at IS NULL
+              AND p.deleted_at IS NULL
+              AND p.is_active
+              AND po.final_price IS NOT NULL
+              AND po.contract_type IN (%(change)s, %(mnp)s)
+              {product_filter}
+            GROUP BY po.product_id, pl.carrier, po.contract_type
+        )
+        SELECT DISTINCT ON (r.id)
+               r.id, p.name, r.customer_phone, COALESCE(r.channel_talk_user_id, ''),
+               r.target_price, b.carrier, b.contract_type, b.price
+        FROM best b
+        JOIN {PriceNotificationRequest._meta.db_table} r
+          ON r.product_id = b.product_id
+         AND r.notified_at IS NULL
+         AND r.target_price >= b.price
+        JOIN {Product._meta.db_table} p ON p.id = r.product_id
+        WHERE r.deleted_at IS NULL
+          AND r.id > %(after_id)s
+          AND (
+                (b.carrier = r.prev_carrier AND b.contract_type = %(change)s)
+             OR (b.carrier <> r.prev_carrier AND b.contract_type = %(mnp)s)
+          )
+        ORDER BY r.id, b.price
+        LIMIT %(limit)s
+    """
+
+
+def find_matches(
+    after_id: int = 0, limit: int | None = None, product_ids=None
+) -> list[PriceAlertMatch]:
+    """id > after_id 인 미발송 요청 중 현재가가 target_price 이하인 것 (id 순)."""
+    params = {
+        "change": ContractTypeChoices.CHANGE,
+        "mnp": ContractTypeChoices.MNP,
+        "after_id": after_id,
+        "limit": limit or settings.PRICE_ALERT_BATCH_SIZE,
+    }
+    if product_ids is not None:
+        params["product_ids"] = list(product_ids)
+    with connection.cursor() as cursor:
+        cursor.execute(_match_sql(product_ids is not None), params)
+        return [PriceAlertMatch(*row) for row in cursor.fetchall()]
+
+
+def _claim(request_ids: list[int], now) -> set[int]:
+    """아직 발송되지 않은 요청에 notified_at 을 찍어 선점하고 선점한 id 를 반환한다."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {PriceNotificationRequest._meta.db_table} "
+            "SET notified_at = %s "
+            "WHERE id = ANY(%s) AND notified_at IS NULL "
+            "RETURNING id",
+            [now, request_ids],
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+def _queue_events(matches: list[PriceAlertMatch]):
+    for match in matches:
+        queue_price_alert_event(
+            match.channel_talk_user_id,
+            {
+                "productName": match.product_name,
+                "targetPrice": match.target_price,
+                "currentPrice": match.price,
+                "carrier": match.carrier,
+                "contractType": match.contract_type,
+            },
+        )
+
+
+def _queue_digest(matches: list[PriceAlertMatch]):
+    enqueue_group_message(
+        "price_alert",
+        ChannelTalkAPI.ORDER_ALERT_GROUP_ID,
+        price_alert_digest_text(
+            [
+                f"{m.customer_phone} / {m.product_name} / "
+                f"{m.carrier} {m.contract_type} {m.price:,}원 "
+                f"(목표 {m.target_price:,}원)"
+                for m in matches
+            ]
+        ),
+    )
+
+
+def match_price_alerts(product_ids=None, batch_size: int | None = None) -> dict:
+    """미발송 가격 알림을 배치 단위로 선점(notified_at)하고 outbox 에 적재한다.
+
+    동시에 여러 번 돌아도 요청마다 선점에 성공한 한 실행만 적재한다.
+    """
+    counts = {"matched": 0, "notified": 0}
+    after_id = 0
+    while True:
+        matches = find_matches(after_id, batch_size, product_ids)
+        if not matches:
+            break
+        after_id = matches[-1].request_id
+
+        # 선점과 outbox 적재를 한 트랜잭션으로 - 적재된 요청만 notified_at 이 남는다.
+        with transaction.atomic():
+            claimed = _claim([m.request_id for m in matches], timezone.now())
+            claimed_matches = [m for m in matches if m.request_id in claimed]
+            _queue_events([m for m in claimed_matches if m.channel_talk_user_id])
+            without_user = [m for m in claimed_matches if not m.channel_talk_user_id]
+            if without_user:
+                _queue_digest(without_user)
+
+        counts["matched"] += len(matches)
+        counts["notified"] += len(claimed_matches)
+
+    logger.info(
+        "price_alerts.matched matched=%s notified=%s",
+        counts["matched"],
+        counts["notified"],
+    )
+    return counts
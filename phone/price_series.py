@@ -0,0 +1,275 @@
+"""
+일별 가격 시리즈 (PriceHistoryDaily)
+
+PriceHistory 는 가격이 바뀐 날에만 row 가 생긴다. 차트는 매일 값이 필요하므로 직전
+가격으로 빈 날을 채운(forward-fill) 결과를 쓰기 시점에 PriceHistoryDaily 로 저장해 두고,
+조회는 (product, day) 인덱스 범위 읽기 한 번으로 끝낸다.
+
+갱신 경로:
+    - PriceHistory 를 쓰면 refresh_daily_prices() 로 (product, carrier) 의 해당 날짜부터
+      오늘까지를 다시 채운다 (단건 저장은 signal, bulk 저장은 호출 측에서 직접).
+    - 가격 변동이 없는 날에도 시리즈가 오늘까지 이어지도록 task_extend_daily_prices 가
+      각 시리즈의 마지막 값을 오늘까지 연장한다.
+
+사용법:
+    from phone.price_series import build_price_charts
+
+    charts = build_price_charts([1, 2], ["1month", "1year"])
+    charts[(1, "1year")]["chart_data"]
+
+    charts = await abuild_price_charts([1, 2], ["1month"])  # async view
+"""
+
+from datetime import date, timedelta
+from typing import Iterable
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from phone.constants import CarrierChoices
+from phone.models import DeviceVariant, PriceHistory, PriceHistoryDaily, Product
+
+PERIOD_DAYS = {
+    "1week": 7,
+    "1month": 30,
+    "3months": 90,
+    "6months": 180,
+    "1year": 365,
+}
+CHART_CARRIERS = [CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG]
+# extend 시 마지막 값을 찾는 범위(일). 이보다 오래 끊긴 시리즈는 refresh 로 복구한다.
+EXTEND_LOOKBACK_DAYS = 30
+
+_REFRESH_SQL = f"""
+    INSERT INTO {PriceHistoryDaily._meta.db_table}
+        (product_id, carrier, day, final_price, plan_id)
+    SELECT k.product_id, k.carrier, g.day::date, ph.final_price, ph.plan_id
+    FROM unnest(%(product_ids)s::integer[], %(carriers)s::varchar[])
+        AS k(product_id, carrier)
+    CROSS JOIN generate_series(
+        %(start)s::date, %(end)s::date, interval '1 day'
+    ) AS g(day)
+    JOIN LATERAL (
+        SELECT h.final_price, h.plan_id
+        FROM {PriceHistory._meta.db_table} h
+        WHERE h.product_id = k.product_id
+          AND h.carrier = k.carrier
+          AND h.price_at <= g.day::date
+          AND h.deleted_at IS NULL
+        ORDER BY h.price_at DESC
+        LIMIT 1
+    ) ph ON TRUE
+"""
+
+_EXTEND_SQL = f"""
+    INSERT INTO {PriceHistoryDaily._meta.db_table}
+        (product_id, carrier, day, final_price, plan_id)
+    SELECT l.product_id, l.carrier, g.day::date, l.final_price, l.plan_id
+    FROM (
+        SELECT DISTINCT ON (product_id, carrier)
+               product_id, carrier, day, final_price, plan_id
+        FROM {PriceHistoryDaily._meta.db_table}
+        WHERE day >= %(since)s AND day < %(end)s
+        ORDER BY product_id, carrier, day DESC
+    ) l
+    CROSS JOIN LATERAL generate_series(
+        l.day + 1, %(end)s::date, interval '1 day'
+    ) AS g(day)
+    ON CONFLICT (product_id, day, carrier) DO NOTHING
+"""
+
+
+def refresh_daily_prices(
+    keys: Iterable[tuple[int, str]], start: date, end: date | None = None
+) -> int:
+    """(product_id, carrier) 들의 start~end 일별 가격을 PriceHistory 기준으로 다시 채운다.
+
+    기존 row 를 지우고 다시 넣으므로 PriceHistory 수정/soft delete 도 반영된다.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return 0
+    end = end or timezone.now().date()
+    product_ids = [product_id for product_id, _ in keys]
+    carriers = [carrier for _, carrier in keys]
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM {PriceHistoryDaily._meta.db_table} d
+            USING unnest(%(product_ids)s::integer[], %(carriers)s::varchar[])
+                AS k(product_id, carrier)
+            WHERE d.product_id = k.product_id
+              AND d.carrier = k.carrier
+              AND d.day >= %(start)s
+            """,
+            {"product_ids": product_ids, "carriers": carriers, "start": start},
+        )
+        cursor.execute(
+            _REFRESH_SQL,
+            {
+                "product_ids": product_ids,
+                "carriers": carriers,
+                "start": start,
+                "end": end,
+            },
+        )
+        return cursor.rowcount
+
+
+def refresh_daily_prices_for(histories: Iterable[PriceHistory]) -> int:
+    """저장한 PriceHistory 들의 (product, carrier) 시리즈를 가장 이른 price_at 부터 갱신."""
+    histories = list(histories)
+    if not histories:
+        return 0
+    return refresh_daily_prices(
+        {(h.product_id, h.carrier) for h in histories},
+        min(h.price_at for h in histories),
+    )
+
+
+def extend_daily_prices(end: date | None = None) -> int:
+    """모든 시리즈의 마지막 값을 end(기본 오늘)까지 연장한다. 이미 있는 날은 건드리지 않는다."""
+    end = end or timezone.now().date()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _EXTEND_SQL,
+            {"since": end - timedelta(days=EXTEND_LOOKBACK_DAYS), "end": end},
+        )
+        return cursor.rowcount
+
+
+def _storage_rows(device_ids):
+    """(device_id, storage_capacity) - 단말기별 출고가 오름차순."""
+    return (
+        DeviceVariant.objects.filter(device_id__in=device_ids)
+        .order_by("device_id", "device_price")
+        .values_list("device_id", "storage_capacity")
+    )
+
+
+def _smallest_storage_by_device(rows) -> dict[int, str]:
+    storage = {}
+    for device_id, capacity in rows:
+        storage.setdefault(device_id, capacity)
+    return storage
+
+
+def _build_chart(days: dict, start: date, end: date) -> tuple[list, dict]:
+    """day -> {carrier: (price, plan_name, plan_price)} 를 start~end 차트로 펼친다.
+
+    materialize 가 늦어 마지막 며칠이 비어 있으면 직전 값을 이어서 쓴다.
+    """
+    last = {carrier: None for carrier in CHART_CARRIERS}
+    chart_data = []
+    current = start
+    while current <= end:
+        last.update(days.get(current, {}))
+        chart_data.append(
+            {
+                "date": current.strftime("%Y-%m-%d"),
+                **{
+                    carrier: last[carrier][0] if last[carrier] else None
+                    for carrier in CHART_CARRIERS
+                },
+            }
+        )
+        current += timedelta(days=1)
+
+    latest_prices = {}
+    for carrier in CHART_CARRIERS:
+        value = last[carrier]
+        if value is not None and value[0] is not None and value[1] is not None:
+            latest_prices[carrier] = {
+                "price": value[0],
+                "plan_name": value[1],
+                "plan_price": value[2],
+            }
+        else:
+            latest_prices[carrier] = None
+    return chart_data, latest_prices
+
+
+def _chart_products(product_ids):
+    return Product.objects.filter(id__in=product_ids).only("id", "name", "device")
+
+
+def _daily_rows(product_ids, start: date, end: date):
+    return (
+        PriceHistoryDaily.objects.filter(
+            product_id__in=product_ids,
+            day__gte=start,
+            day__lte=end,
+            carrier__in=CHART_CARRIERS,
+        )
+        .order_by("product_id", "day")
+        .values_list(
+            "product_id", "day", "carrier", "final_price", "plan__name", "plan__price"
+        )
+    )
+
+
+def _chart_window(product_ids, periods, end):
+    product_ids = list(dict.fromkeys(product_ids))
+    periods = list(dict.fromkeys(periods))
+    end = end or timezone.now().date()
+    earliest = end - timedelta(days=max(PERIOD_DAYS[p] for p in periods))
+    return product_ids, periods, end, earliest
+
+
+def _assemble_charts(products, storage, daily_rows, periods, end):
+    series: dict[int, dict[date, dict]] = {product_id: {} for product_id in products}
+    for product_id, day, carrier, price, plan_name, plan_price in daily_rows:
+        series[product_id].setdefault(day, {})[carrier] = (
+            price,
+            plan_name,
+            plan_price,
+        )
+
+    charts = {}
+    for product_id, product in products.items():
+        for period in periods:
+            chart_data, latest_prices = _build_chart(
+                series[product_id], end - timedelta(days=PERIOD_DAYS[period]), end
+            )
+            charts[(product_id, period)] = {
+                "product_name": product.name,
+                "storage": storage.get(product.device_id, "N/A"),
+                "period": period,
+                "chart_data": chart_data,
+                "latest_prices": latest_prices,
+            }
+    return charts
+
+
+def build_price_charts(
+    product_ids: Iterable[int], periods: Iterable[str], end: date | None = None
+) -> dict[tuple[int, str], dict]:
+    """(product_id, period) -> 차트 응답. 없는(삭제된) 상품은 결과에서 빠진다.
+
+    상품 / 용량 / 일별 시리즈를 각각 한 번씩, 총 3 쿼리로 모든 차트를 만든다.
+    """
+    product_ids, periods, end, earliest = _chart_window(product_ids, periods, end)
+    products = {product.id: product for product in _chart_products(product_ids)}
+    if not products:
+        return {}
+    storage = _smallest_storage_by_device(
+        _storage_rows({p.device_id for p in products.values()})
+    )
+    daily_rows = _daily_rows(list(products), earliest, end)
+    return _assemble_charts(products, storage, daily_rows, periods, end)
+
+
+async def abuild_price_charts(
+    product_ids: Iterable[int], periods: Iterable[str], end: date | None = None
+) -> dict[tuple[int, str], dict]:
+    """build_price_charts 의 async ORM 버전 (phone.views.async_views)."""
+    product_ids, periods, end, earliest = _chart_window(product_ids, periods, end)
+    products = {product.id: product async for product in _chart_products(product_ids)}
+    if not products:
+        return {}
+    storage = _smallest_storage_by_device(
+        [row async for row in _storage_rows({p.device_id for p in products.values()})]
+    )
+    daily_rows = [row async for row in _daily_rows(list(products), earliest, end)]
+    return _assemble_charts(products, storage, daily_rows, periods, end)
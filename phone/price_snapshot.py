@@ -0,0 +1,134 @@
+"""
+PriceHistory 스냅샷
+
+활성 상품의 (product, carrier) 별 최저가 공시지원금 옵션(6개월 총액 = final_price +
+요금제 * 6 기준)을 하루 1건씩 PriceHistory 에 기록한다. 옵션을 파이썬으로 읽지 않고
+INSERT ... SELECT DISTINCT ON ... ON CONFLICT DO UPDATE 한 문장으로 처리하므로
+카탈로그 크기와 관계없이 쿼리 1번이다.
+
+    - 오늘 row 가 없으면 생성, 있으면 가격이 달라졌을 때만 갱신 (plan 만 다르면 스킵)
+    - 기록/갱신된 (product, carrier) 는 일별 가격 시리즈(PriceHistoryDaily)도 갱신
+
+backfill:
+    ProductOption 은 현재 가격만 들고 있어 지난 날짜의 옵션 가격은 알 수 없다. 스냅샷이
+    돌지 않은 날은 그 전날까지의 마지막 기록 가격으로 채운다 (이미 있는 날은 유지).
+
+사용법:
+    from phone.price_snapshot import snapshot_price_history, backfill_price_history
+
+    snapshot_price_history()                      # 오늘
+    backfill_price_history(date(2026, 10, 1))     # 10/1 ~ 어제 빈 날 채우기
+"""
+
+import logging
+from datetime import date
+
+from django.db import connection
+from django.utils import timezone
+
+from phone.constants import DiscountTypeChoices
+from phone.models import Plan, PriceHistory, Product, ProductOption
+from phone.price_series import refresh_daily_prices
+
+logger = logging.getLogger(__name__)
+
+_SNAPSHOT_SQL = f"""
+    INSERT INTO {PriceHistory._meta.db_table} AS ph
+        (product_id, carrier, final_price, plan_id, price_at, created_at, updated_at)
+    SELECT DISTINCT ON (po.product_id, pl.carrier)
+           po.product_id, pl.carrier, po.final_price, po.plan_id,
+           %(day)s, %(now)s, %(now)s
+    FROM {ProductOption._meta.db_table} po
+    JOIN {Plan._meta.db_table} pl ON pl.id = po.plan_id
+    JOIN {Product._meta.db_table} p ON p.id = po.product_id
+    WHERE po.deleted_at IS NULL
+      AND pl.deleted_at IS NULL
+      AND p.deleted_at IS NULL
+      AND p.is_active
+      AND po.discount_type = %(discount_type)s
+    ORDER BY po.product_id, pl.carrier,
+             po.final_price + pl.price * 6 ASC NULLS LAST, po.id
+    ON CONFLICT (product_id, price_at, carrier) DO UPDATE
+        SET final_price = EXCLUDED.final_price,
+            plan_id = EXCLUDED.plan_id,
+            updated_at = EXCLUDED.updated_at,
+            deleted_at = NULL
+        WHERE ph.final_price IS DISTINCT FROM EXCLUDED.final_price
+           OR ph.deleted_at IS NOT NULL
+    -- 파티션 테이블은 RETURNING 에서 xmax 를 못 읽으므로, 갱신된 row 는 created_at 이
+    -- 이전 값으로 남는 점으로 신규 여부를 구분한다
+    RETURNING ph.product_id, ph.carrier, (ph.created_at = ph.updated_at) AS inserted
+"""
+
+_BACKFILL_SQL = f"""
+    INSERT INTO {PriceHistory._meta.db_table}
+        (product_id, carrier, final_price, plan_id, price_at, created_at, updated_at)
+    SELECT k.product_id, k.carrier, last.final_price, last.plan_id,
+           g.day::date, %(now)s, %(now)s
+    FROM (
+        SELECT DISTINCT product_id, carrier
+        FROM {PriceHistory._meta.db_table}
+        WHERE deleted_at IS NULL AND price_at < %(end)s
+    ) k
+    CROSS JOIN generate_series(
+        %(start)s::date, %(end)s::date - 1, interval '1 day'
+    ) AS g(day)
+    JOIN LATERAL (
+        SELECT h.final_price, h.plan_id
+        FROM {PriceHistory._meta.db_table} h
+        WHERE h.product_id = k.product_id
+          AND h.carrier = k.carrier
+          AND h.price_at < g.day::date
+          AND h.deleted_at IS NULL
+        ORDER BY h.price_at DESC
+        LIMIT 1
+    ) last ON TRUE
+    ON CONFLICT (product_id, price_at, carrier) DO NOTHING
+    RETURNING product_id, carrier
+"""
+
+
+def snapshot_price_history(day: date | None = None) -> dict[str, int]:
+    """day(기본 오늘)의 (product, carrier) 최저가를 PriceHistory 에 upsert 한다."""
+    day = day or timezone.now().date()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _SNAPSHOT_SQL,
+            {
+                "day": day,
+                "now": timezone.now(),
+                "discount_type": DiscountTypeChoices.SUBSIDY,
+            },
+        )
+        rows = cursor.fetchall()
+
+    refresh_daily_prices(
+        {(product_id, carrier) for product_id, carrier, _ in rows}, day
+    )
+    created = sum(1 for *_, inserted in rows if inserted)
+    counts = {"created": created, "updated": len(rows) - created}
+    logger.info(
+        "price_snapshot.done day=%s created=%s updated=%s",
+        day,
+        counts["created"],
+        counts["updated"],
+    )
+    return counts
+
+
+def backfill_price_history(start: date, end: date | None = None) -> int:
+    """start ~ end 전날 중 기록이 없는 날을 직전 기록 가격으로 채우고 채운 row 수를 반환."""
+    end = end or timezone.now().date()
+    if start >= end:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(
+            _BACKFILL_SQL, {"start": start, "end": end, "now": timezone.now()}
+        )
+        rows = cursor.fetchall()
+
+    refresh_daily_prices(set(rows), start)
+    logger.info(
+        "price_snapshot.backfilled start=%s end=%s rows=%s", start, end, len(rows)
+    )
+    return len(rows)
@@ -1,6 +1,7 @@
 import openpyxl
 import io
 from ..models import Product, ProductOption
+from ..revalidate import revalidate_products
 from django.db.models import OuterRef, Subquery
 from django.utils import timezone
 
@@ -62,6 +63,7 @@ def update_product_option_SK_subsidy_addtional(file: bytes, margin=0) -> str:
     db_option_dict = {}
     updates = []
     update_device_variants = set()
+    changed_product_ids = set()
 
     for option in db_options:
         # name_sk가 일치하는 경우가 있음 (ex. 아이폰16같은 경우에는 용량별로 정책이 동일해서 name_sk가 같음)
@@ -82,12 +84,15 @@ def update_product_option_SK_subsidy_addtional(file: bytes, margin=0) -> str:
             if key in db_option_dict:
                 options = db_option_dict[key]
                 for option in options:
+                    old_final_price = option.final_price
                     option.additional_discount = jungchaek
                     option.updated_at = now
                     option.final_price = option._get_final_price()
                     if option.final_price < 0:
                         option.additional_discount += option.final_price
                         option.final_price = 0
+                    if option.final_price != old_final_price:
+                        changed_product_ids.add(option.product_id)
                     updates.append(option)
                     update_device_variants.add(
                         option.device_variant.device.model_name
@@ -118,6 +123,10 @@ def update_product_option_SK_subsidy_addtional(file: bytes, margin=0) -> str:
             p.best_price_option_id = p._new_best_option_id
         Product.objects.bulk_update(products_to_update, ["best_price_option"])
 
+    # 가격이 실제로 바뀐 제품의 상세/브랜드 목록 캐시만 무효화
+    if changed_product_ids:
+        revalidate_products(product_ids=changed_product_ids)
+
     update_device_variants = sorted(list(update_device_variants))
 
     return f"{ws.title} 시트의 {update_device_variants}의 SK 추가지원금 {len(updates)}건 업데이트 완료"
@@ -1,17 +1,21 @@
 # pyright: reportAttributeAccessIssue=false
-"""정책 엑셀 업로드 후처리 - 11번가/네이버/Next.js 캐시 동기화 헬퍼.
+"""정책 엑셀 업로드 후처리 - 11번가/SSG/네이버 마켓플레이스 동기화 헬퍼.
 
 엑셀 import로 ProductOption.final_price가 갱신된 직후 호출되어:
   1) 11번가 가격 업데이트 Task 큐잉 (해당 통신사 OMP만)
   2) 네이버 가격비교 EP 재생성 Task 큐잉
-  3) Next.js ISR 캐시 무효화 (제품 태그)
-4단계 모두 단계별 try/except로 격리되어 한 단계 실패가 다음 단계를 막지 않는다.
+  3) 가격 알림 매칭 Task 큐잉 (목표가에 도달한 PriceNotificationRequest 발송)
+  4) Next.js ISR 캐시 무효화 (전역 제품 태그, REVALIDATE_PRODUCT_TAGS_ONLY=False 일 때)
+단계별 try/except로 격리되어 한 단계 실패가 다음 단계를 막지 않는다.
+가격이 바뀐 제품 단위 태그는 엑셀 importer가 직접 적재한다.
 실패는 채널톡으로 알림 후 그 단계만 포기.
 """
 
 import logging
 from collections import defaultdict
 
+from django.conf import settings
+
 from phone.constants import (
     CarrierChoices,
     ContractTypeChoices,
@@ -23,7 +27,11 @@ from phone.external_services.channel_talk import (
 )
 from phone.models import OpenMarketProduct, ProductOption
 from phone.revalidate import revalidate_products
-from phone.tasks import task_a_remove_options, task_generate_naver_compare_ep
+from phone.tasks import (
+    task_a_remove_options,
+    task_generate_naver_compare_ep,
+    task_match_price_alerts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -120,8 +128,15 @@ def trigger_marketplace_sync(carrier: str, margin: int, om_margin: int) -> None:
     except Exception as e:
         send_marketplace_sync_failure_alert("네이버 EP 큐잉", carrier, str(e))
 
-    # 단계 3 — Next.js ISR 캐시 무효화
+    # 단계 3 — 가격 알림 매칭 큐잉
     try:
-        revalidate_products()
+        task_match_price_alerts.delay()
     except Exception as e:
-        send_marketplace_sync_failure_alert("ISR revalidate", carrier, str(e))
+        send_marketplace_sync_failure_alert("가격 알림 큐잉", carrier, str(e))
+
+    # 단계 4 — Next.js ISR 캐시 무효화 (대기열 적재, 워커가 모아서 전송)
+    if not settings.REVALIDATE_PRODUCT_TAGS_ONLY:
+        try:
+            revalidate_products()
+        except Exception as e:
+            send_marketplace_sync_failure_alert("ISR revalidate", carrier, str(e))
@@ -0,0 +1,519 @@
+"""
+상품 목록 / 상세 응답의 빠른 직렬화 경로
+
+ProductListSerializer / ProductDetailSerializer 는 옵션 수백 개를 모델 인스턴스
+(select_related plan, device_variant)로 만든 뒤 필드마다 DRF Field 를 거친다. 여기서는
+같은 데이터를 values() 로 읽어 dict / list 를 바로 만든다. ORJSONRenderer 로 렌더링한
+응답은 serializer + JSONRenderer 경로와 바이트 단위로 같다
+(phone/tests/test_product_payloads.py 가 golden 비교).
+
+    - 하위 목록(옵션 / 이미지 / 태그 / 색상 / 재고 등)은 관계별로 쿼리 1번씩.
+      옵션 조건과 정렬은 이 모듈의 *_options_queryset 을 두 경로가 같이 쓴다
+    - 하위 목록 정렬은 두 경로 모두 id 로 고정한다 (dict 키 순서까지 같아야 함)
+    - 최저가 / 재고 규칙은 serializer 와 같다. 한쪽을 바꾸면 다른 쪽도 바꿔야 한다
+
+settings.FAST_PRODUCT_SERIALIZATION 이 False 면 view 는 serializer 경로를 쓴다.
+
+사용법:
+    from phone.product_payloads import product_detail_payload, product_list_payload
+
+    product_list_payload(queryset, carrier)            # ProductListSerializer(many=True).data
+    product_detail_payload(base_queryset, carrier)     # ProductDetailSerializer.data (없으면 None)
+"""
+
+from collections import defaultdict
+
+from django.db.models import Q
+
+from phone.constants import CREDIT_CHECK_AGREE_LINK, CarrierChoices
+from phone.models import (
+    DecoratorTag,
+    DeviceColor,
+    DeviceSpecItem,
+    DevicesColorImage,
+    DeviceVariant,
+    Inventory,
+    Product,
+    ProductDetailImage,
+    ProductOption,
+    Review,
+)
+
+# 재고 수량이 이 값 이하면 low_stock
+LOW_STOCK_THRESHOLD = 5
+
+BEST_OPTION_CARRIERS = (CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG)
+
+# ProductOptionSimpleSerializer 에 필요한 컬럼
+_SIMPLE_OPTION_FIELDS = (
+    "id",
+    "final_price",
+    "contract_type",
+    "discount_type",
+    "device_price",
+    "plan_id",
+    "plan__carrier",
+    "plan__price",
+    "device_variant__storage_capacity",
+)
+
+
+def _carrier_filter(prev_carrier):
+    # 기존 통신사면 기기변경, 다른 통신사면 번호이동 옵션만
+    return Q(Q(contract_type="기기변경") & Q(plan__carrier=prev_carrier)) | Q(
+        Q(contract_type="번호이동") & ~Q(plan__carrier=prev_carrier)
+    )
+
+
+def list_options_queryset(prev_carrier=None):
+    """상품 목록의 옵션 (이전 통신사가 있으면 그 기준으로 거른다)."""
+    queryset = ProductOption.objects.order_by("id")
+    if prev_carrier in CarrierChoices.VALUES:
+        queryset = queryset.filter(_carrier_filter(prev_carrier))
+    return queryset
+
+
+def detail_options_queryset(prev_carrier=None):
+    """상품 상세의 옵션 (이전 통신사가 없으면 추가지원금 0 인 옵션 제외)."""
+    queryset = ProductOption.objects.order_by("id")
+    if prev_carrier in CarrierChoices.VALUES:
+        return queryset.filter(_carrier_filter(prev_carrier))
+    return queryset.exclude(additional_discount=0)
+
+
+def _image_url(model, name):
+    return model._meta.get_field("image").storage.url(name)
+
+
+def _group(rows):
+    """(key, value) rows -> {key: [value, ...]} (순서 유지)."""
+    grouped = defaultdict(list)
+    for key, value in rows:
+        grouped[key].append(value)
+    return grouped
+
+
+def _simple_option(option, device_name, is_best=False):
+    """ProductOptionSimpleSerializer(option).data 와 같은 dict."""
+    return {
+        "id": option["id"],
+        "final_price": option["final_price"],
+        "carrier": option["plan__carrier"],
+        "contract_type": option["contract_type"],
+        "discount_type": option["discount_type"],
+        "is_best": is_best,
+        "device_price": option["device_price"],
+        "device_name": device_name,
+        "monthly_payment": ProductOption.calculate_monthly_payment(
+            option["final_price"], option["discount_type"], option["plan__price"]
+        ),
+        "plan_id": option["plan_id"],
+        "storage_capacity": option["device_variant__storage_capacity"],
+    }
+
+
+def _best_list_options(options, in_stock_pairs, device_name):
+    """ProductListSerializer.get_options 와 같은 규칙."""
+    best_options = dict.fromkeys(BEST_OPTION_CARRIERS)
+    best_price = 99999999
+
+    for option in options:
+        carrier = option["plan__carrier"]
+        if carrier not in best_options:
+            continue
+        if (
+            in_stock_pairs
+            and (carrier, option["device_variant__storage_capacity"])
+            not in in_stock_pairs
+        ):
+            continue
+
+        current = best_options[carrier]
+        if (
+            current is None
+            or option["final_price"] < current["final_price"]
+            or (
+                option["final_price"] == current["final_price"]
+                and option["plan__price"] < current["plan__price"]
+            )
+        ):
+            best_options[carrier] = option
+            if option["final_price"] < best_price:
+                best_price = option["final_price"]
+
+    return [
+        _simple_option(option, device_name, option["final_price"] == best_price)
+        for option in best_options.values()
+        if option is not None
+    ]
+
+
+def product_list_payload(queryset, prev_carrier=None) -> list[dict]:
+    """product_list_querysets() 의 queryset 으로 ProductListSerializer 와 같은 list."""
+    products = list(
+        queryset.prefetch_related(None).values(
+            "id",
+            "name",
+            "is_featured",
+            "device_id",
+            "device__model_name",
+            "product_series_id",
+            "product_series__name",
+            "product_series__sort_order",
+        )
+    )
+    product_ids = [product["id"] for product in products]
+
+    options = _group(
+        (option["product_id"], option)
+        for option in list_options_queryset(prev_carrier)
+        .filter(product_id__in=product_ids)
+        .values("product_id", *_SIMPLE_OPTION_FIELDS)
+    )
+    images = _group(
+        ProductDetailImage.objects.filter(product_id__in=product_ids)
+        .order_by("id")
+        .values_list("product_id", "image")
+    )
+    # M2M 중간 테이블에서 바로 읽는다 (삭제된 태그 제외는 prefetch 와 같게)
+    tag_rows = (
+        DecoratorTag.product.through.objects.filter(
+            product_id__in=product_ids, decoratortag__deleted_at__isnull=True
+        )
+        .order_by("decoratortag_id")
+        .values_list(
+            "product_id",
+            "decoratortag__name",
+            "decoratortag__text_color",
+            "decoratortag__tag_color",
+        )
+    )
+    tags = _group(
+        (product_id, {"name": name, "text_color": text_color, "tag_color": tag_color})
+        for product_id, name, text_color, tag_color in tag_rows
+    )
+    in_stock_by_device = defaultdict(set)
+    for device_id, carrier, storage_capacity in Inventory.objects.filter(
+        device_variant__device_id__in={product["device_id"] for product in products},
+        count__gt=0,
+    ).values_list(
+        "device_variant__device_id",
+        "dealership__carrier",
+        "device_variant__storage_capacity",
+    ):
+        in_stock_by_device[device_id].add((carrier, storage_capacity))
+
+    return [
+        {
+            "id": product["id"],
+            "name": product["name"],
+            "series": (
+                {
+                    "name": product["product_series__name"],
+                    "id": product["product_series_id"],
+                    "sort_order": product["product_series__sort_order"],
+                }
+                if product["product_series_id"]
+                else None
+            ),
+            "is_featured": product["is_featured"],
+            "options": _best_list_options(
+                options[product["id"]],
+                in_stock_by_device.get(product["device_id"], set()),
+                product["device__model_name"],
+            ),
+            "images": [
+                _image_url(ProductDetailImage, name) for name in images[product["id"]]
+            ],
+            "tags": tags[product["id"]],
+        }
+        for product in products
+    ]
+
+
+def _detail_options(options, storage_by_variant, in_stock_pairs):
+    """ProductDetailSerializer.get_options 와 같은 용량/통신사/계약/할인/요금제 트리."""
+    result = {}
+    for option in options:
+        storage_capacity = storage_by_variant[option["device_variant_id"]]
+        carrier = option["plan__carrier"]
+        if in_stock_pairs and (carrier, storage_capacity) not in in_stock_pairs:
+            continue
+        plans = (
+            result.setdefault(storage_capacity, {})
+            .setdefault(carrier, {})
+            .setdefault(option["contract_type"], {})
+            .setdefault(option["discount_type"], {})
+        )
+        plans[option["plan_id"]] = {
+            "option_id": option["id"],
+            "device_price": option["device_price"],
+            "final_price": option["final_price"],
+            "additional_discount": option["additional_discount"],
+            "subsidy_amount": option["subsidy_amount"],
+            "subsidy_amount_mnp": option["subsidy_amount_mnp"],
+            "plan_id": option["plan_id"],
+            "name": option["plan__name"],
+            "price": option["plan__price"],
+            "data_allowance": option["plan__data_allowance"],
+            "call_allowance": option["plan__call_allowance"],
+            "sms_allowance": option["plan__sms_allowance"],
+            "description": option["plan__description"],
+            "official_contract_link": option["official_contract_link__link"],
+            "credit_check_agree_link": CREDIT_CHECK_AGREE_LINK[carrier],
+        }
+    return result
+
+
+def _detail_best_options(options, variants, in_stock_pairs, device_name):
+    """ProductDetailSerializer.get_best_options 와 같은 규칙."""
+    by_device_price = dict.fromkeys(BEST_OPTION_CARRIERS)
+    by_monthly_payment = dict.fromkeys(BEST_OPTION_CARRIERS)
+
+    # 통신사별 재고 있는 최저가 variant
+    variants_by_price = sorted(variants, key=lambda v: v["device_price"])
+    target_variant_ids = {}
+    if in_stock_pairs:
+        for carrier in BEST_OPTION_CARRIERS:
+            for variant in variants_by_price:
+                if (carrier, variant["storage_capacity"]) in in_stock_pairs:
+                    target_variant_ids[carrier] = variant["id"]
+                    break
+    else:
+        default_id = variants_by_price[0]["id"] if variants_by_price else None
+        target_variant_ids = dict.fromkeys(BEST_OPTION_CARRIERS, default_id)
+
+    for option in options:
+        carrier = option["plan__carrier"]
+        if target_variant_ids.get(carrier) != option["device_variant_id"]:
+            continue
+        gongsi = option["plan__price"] * 6 + option["final_price"]
+        monthly = ProductOption.calculate_monthly_payment(
+            option["final_price"], option["discount_type"], option["plan__price"]
+        )
+        entry = (gongsi, monthly, option)
+
+        current = by_device_price[carrier]
+        if (current is None or gongsi < current[0]) or (
+            gongsi == current[0] and monthly < current[1]
+        ):
+            by_device_price[carrier] = entry
+
+        current = by_monthly_payment[carrier]
+        if (current is None or monthly < current[1]) or (
+            monthly == current[1] and gongsi < current[0]
+        ):
+            by_monthly_payment[carrier] = entry
+
+    return {
+        "device_price": {
+            carrier: _simple_option(entry[2], device_name)
+            for carrier, entry in by_device_price.items()
+            if entry is not None
+        },
+        "monthly_payment": {
+            carrier: _simple_option(entry[2], device_name)
+            for carrier, entry in by_monthly_payment.items()
+            if entry is not None
+        },
+    }
+
+
+def _stock_status(count):
+    if count <= 0:
+        return "out_of_stock"
+    if count <= LOW_STOCK_THRESHOLD:
+        return "low_stock"
+    return "in_stock"
+
+
+def _related_products(product_series_id):
+    """같은 시리즈 판매 상품 [{id, name, image}] (첫 색상의 첫 이미지)."""
+    related = list(
+        Product.objects.filter(product_series_id=product_series_id, is_active=True)
+        .order_by("id")
+        .values_list("id", "device_id", "device__model_name")
+    )
+    first_color = {}
+    for device_id, color_id in (
+        DeviceColor.objects.filter(device_id__in={row[1] for row in related})
+        .order_by("sort_order", "id")
+        .values_list("device_id", "id")
+    ):
+        first_color.setdefault(device_id, color_id)
+    first_image = {}
+    for color_id, name in (
+        DevicesColorImage.objects.filter(device_color_id__in=first_color.values())
+        .order_by("id")
+        .values_list("device_color_id", "image")
+    ):
+        first_image.setdefault(color_id, name)
+
+    result = []
+    for product_id, device_id, model_name in related:
+        name = first_image.get(first_color.get(device_id))
+        result.append(
+            {
+                "id": product_id,
+                "name": model_name,
+                "image": None if name is None else _image_url(DevicesColorImage, name),
+            }
+        )
+    return result
+
+
+def product_detail_payload(base_queryset, prev_carrier=None) -> dict | None:
+    """ProductDetailSerializer 와 같은 dict. 상품이 없으면 None."""
+    product = base_queryset.values(
+        "id",
+        "description",
+        "device_id",
+        "device__model_name",
+        "device__brand",
+        "product_series_id",
+    ).first()
+    if product is None:
+        return None
+    product_id, device_id = product["id"], product["device_id"]
+    device_name = product["device__model_name"]
+
+    variants = list(
+        DeviceVariant.objects.filter(device_id=device_id)
+        .order_by("id")
+        .values(
+            "id",
+            "storage_capacity",
+            "device_price",
+            "self_buy_url_naver",
+            "self_buy_url_coupang",
+            "is_default",
+            "gtin",
+        )
+    )
+    colors = list(
+        DeviceColor.objects.filter(device_id=device_id)
+        .order_by("sort_order", "id")
+        .values("id", "color", "color_code")
+    )
+    color_images = _group(
+        DevicesColorImage.objects.filter(
+            device_color_id__in=[color["id"] for color in colors]
+        )
+        .order_by("id")
+        .values_list("device_color_id", "image")
+    )
+    options = list(
+        detail_options_queryset(prev_carrier)
+        .filter(product_id=product_id)
+        .values(
+            *_SIMPLE_OPTION_FIELDS,
+            "device_variant_id",
+            "additional_discount",
+            "subsidy_amount",
+            "subsidy_amount_mnp",
+            "plan__name",
+            "plan__data_allowance",
+            "plan__call_allowance",
+            "plan__sms_allowance",
+            "plan__description",
+            "official_contract_link__link",
+        )
+    )
+    inventories = list(
+        Inventory.objects.filter(
+            device_variant_id__in=[variant["id"] for variant in variants],
+            device_color_id__in=[color["id"] for color in colors],
+        )
+        .order_by("id")
+        .values_list(
+            "count",
+            "dealership__carrier",
+            "device_variant__storage_capacity",
+            "device_color__color_code",
+        )
+    )
+    in_stock_pairs = {
+        (carrier, storage_capacity)
+        for count, carrier, storage_capacity, _ in inventories
+        if count > 0
+    }
+    stock = {}
+    for count, carrier, storage_capacity, color_code in inventories:
+        stock.setdefault(carrier, {}).setdefault(storage_capacity, {})[color_code] = (
+            _stock_status(count)
+        )
+
+    images = sorted(
+        ProductDetailImage.objects.filter(product_id=product_id)
+        .order_by("id")
+        .values_list("image", "type", "sort_order"),
+        key=lambda image: image[2],
+    )
+    reviews = (
+        Review.objects.filter(product_id=product_id, is_public=True)
+        .order_by("-created_at", "-id")
+        .values("id", "customer_name", "rating", "comment", "created_at", "image")
+    )
+    specs = (
+        DeviceSpecItem.objects.filter(device_id=device_id)
+        .order_by("sort_order", "id")
+        .values_list("label", "value")
+    )
+
+    return {
+        "id": product_id,
+        "options": _detail_options(
+            options,
+            {variant["id"]: variant["storage_capacity"] for variant in variants},
+            in_stock_pairs,
+        ),
+        "device": {
+            "device_variants": [
+                {
+                    "id": variant["id"],
+                    "storage_capacity": variant["storage_capacity"],
+                    "price": variant["device_price"],
+                    "self_buy_url_naver": variant["self_buy_url_naver"],
+                    "self_buy_url_coupang": variant["self_buy_url_coupang"],
+                    "is_default": variant["is_default"],
+                    "gtin": variant["gtin"],
+                }
+                for variant in variants
+            ],
+            "device_colors": [
+                {
+                    "color": color["color"],
+                    "color_code": color["color_code"],
+                    "images": [
+                        _image_url(DevicesColorImage, name)
+                        for name in color_images[color["id"]]
+                    ],
+                }
+                for color in colors
+            ],
+            "model_name": device_name,
+            "brand": product["device__brand"],
+            "specs": [{"label": label, "value": value} for label, value in specs],
+        },
+        "reviews": [
+            {
+                **review,
+                "image": _image_url(Review, review["image"]) if review["image"] else "",
+            }
+            for review in reviews[:10]
+        ],
+        "images": [
+            {"url": _image_url(ProductDetailImage, name), "type": image_type}
+            for name, image_type, _ in images
+        ],
+        "description": product["description"],
+        "best_options": _detail_best_options(
+            options, variants, in_stock_pairs, device_name
+        ),
+        "stock": stock,
+        "related_products": (
+            _related_products(product["product_series_id"])
+            if product["product_series_id"]
+            else []
+        ),
+    }
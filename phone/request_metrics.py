@@ -0,0 +1,313 @@
+"""
+요청별 SQL / 구간 시간 측정 (RequestMetricsMiddleware)
+
+phone.views / internet.views 의 DRF view 요청을 REQUEST_METRICS_SAMPLE_RATE 비율로
+샘플링해 아래 값을 잰다.
+
+    - queries / db: 실행된 SQL 수와 합계 시간, 가장 느린 SQL 과 그 시간
+    - app: view 실행 시간에서 SQL 시간을 뺀 값 (serializer / 파이썬 처리)
+    - render: DRF Response 렌더링(JSON 직렬화) 시간
+    - total: 미들웨어 진입부터 응답까지
+
+결과 노출:
+    - DEBUG: 응답에 Server-Timing 헤더 (브라우저 개발자도구 Timing 탭에 표시)
+    - 항상: key=value 구조화 로그 1줄 + 느린 SQL 경고 로그
+    - RequestMetric 에 적재 → admin '엔드포인트 성능' 페이지에서 view 별 p50/p95/p99
+    - 적재할 때 DB 풀 / 연결 재사용 로그도 남긴다 (phoneinone_server.db_pool)
+
+RequestMetric INSERT 는 요청마다 하지 않고 프로세스별로 모았다가
+REQUEST_METRICS_FLUSH_SIZE 건 / REQUEST_METRICS_FLUSH_INTERVAL 초마다 bulk_create 한다.
+
+사용법:
+    # settings.MIDDLEWARE 맨 앞
+    "phone.request_metrics.RequestMetricsMiddleware",
+
+    from phone.request_metrics import endpoint_percentiles
+    endpoint_percentiles(hours=24)
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connection, connections
+from django.utils import timezone
+
+from phone.models import RequestMetric
+from phoneinone_server.db_pool import log_pool_stats
+
+logger = logging.getLogger(__name__)
+
+# 측정 대상 view 모듈
+COVERED_VIEW_MODULES = ("phone.views", "internet.views")
+
+# RequestMetric.slowest_sql 에 저장하는 SQL 최대 길이
+MAX_SQL_LENGTH = 2000
+
+_buffer: list[RequestMetric] = []
+_buffer_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+class QueryRecorder:
+    """connection.execute_wrapper 로 SQL 수 / 합계 시간 / 가장 느린 SQL 을 모은다."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.slowest = 0.0
+        self.slowest_sql = ""
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.count += 1
+            self.total += elapsed
+            if elapsed > self.slowest:
+                self.slowest = elapsed
+                self.slowest_sql = sql
+
+
+def resolve_view_name(view_func, method: str) -> str | None:
+    """측정 대상 view 면 'ViewSet.action' 형태 이름, 아니면 None."""
+    cls = getattr(view_func, "cls", None)
+    module = (cls or view_func).__module__
+    if not module.startswith(COVERED_VIEW_MODULES):
+        return None
+    if cls is None:
+        return view_func.__name__
+    # ViewSet 은 as_view(actions) 로 만든 view 에 actions 매핑이 붙는다
+    actions = getattr(view_func, "actions", None) or {}
+    action = actions.get(method.lower(), method.lower())
+    return f"{cls.__name__}.{action}"
+
+
+class RequestMetricsMiddleware:
+    # ASGI 에서는 async 로 동작한다 - sync 전용 미들웨어가 끼면 요청마다 sync/async 전환이
+    # 생겨 async view 의 이점이 줄어든다. 적재(_report)는 DB 를 쓰므로 sync_to_async.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._metrics = {"recorder": recorder}
+        start = time.perf_counter()
+        with _recording(recorder):
+            response = self.get_response(request)
+        self._finish(request, response, recorder, start, time.perf_counter())
+        return response
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        request._metrics = {"recorder": recorder}
+        start = time.perf_counter()
+        # DB 연결은 스레드별이라 SQL 이 실행되는 스레드(요청의 thread-sensitive 스레드,
+        # async ORM / sync view 가 쓰는 곳)에서 execute_wrapper 를 건다
+        recording = ExitStack()
+        await sync_to_async(recording.enter_context)(_recording(recorder))
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(recording.close)()
+        await sync_to_async(self._finish)(
+            request, response, recorder, start, time.perf_counter()
+        )
+        return response
+
+    @staticmethod
+    def _sampled():
+        return settings.REQUEST_METRICS_ENABLED and (
+            random.random() < settings.REQUEST_METRICS_SAMPLE_RATE
+        )
+
+    def _finish(self, request, response, recorder, start, end):
+        timings = request._metrics
+        if "view_name" not in timings:
+            return
+
+        view_end = timings.get("view_end", end)
+        render_end = timings.get("render_end", view_end)
+        metric = RequestMetric(
+            view_name=timings["view_name"],
+            method=request.method,
+            status=response.status_code,
+            query_count=recorder.count,
+            db_ms=recorder.total * 1000,
+            slowest_sql_ms=recorder.slowest * 1000,
+            slowest_sql=recorder.slowest_sql[:MAX_SQL_LENGTH],
+            app_ms=max(view_end - timings["view_start"] - recorder.total, 0) * 1000,
+            render_ms=(render_end - view_end) * 1000,
+            total_ms=(end - start) * 1000,
+        )
+        _report(metric, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = getattr(request, "_metrics", None)
+        if timings is None:
+            return None
+        view_name = resolve_view_name(view_func, request.method)
+        if view_name:
+            timings["view_name"] = view_name
+            timings["view_start"] = time.perf_counter()
+        return None
+
+    def process_template_response(self, request, response):
+        # DRF Response 는 view 반환 후 여기를 거쳐 렌더링된다 (가장 바깥 미들웨어라 마지막)
+        timings = getattr(request, "_metrics", None)
+        if timings is None or "view_name" not in timings:
+            return response
+        timings["view_end"] = time.perf_counter()
+
+        def mark_rendered(rendered):
+            timings["render_end"] = time.perf_counter()
+            return rendered
+
+        response.add_post_render_callback(mark_rendered)
+        return response
+
+
+@contextmanager
+def _recording(recorder):
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield
+
+
+def _report(metric: RequestMetric, response):
+    logger.info(
+        "request_metrics view=%s method=%s status=%s queries=%s db_ms=%.1f "
+        "slowest_sql_ms=%.1f app_ms=%.1f render_ms=%.1f total_ms=%.1f",
+        metric.view_name,
+        metric.method,
+        metric.status,
+        metric.query_count,
+        metric.db_ms,
+        metric.slowest_sql_ms,
+        metric.app_ms,
+        metric.render_ms,
+        metric.total_ms,
+    )
+    if metric.slowest_sql_ms >= settings.REQUEST_METRICS_SLOW_SQL_MS:
+        logger.warning(
+            "request_metrics.slow_sql view=%s sql_ms=%.1f sql=%s",
+            metric.view_name,
+            metric.slowest_sql_ms,
+            metric.slowest_sql,
+        )
+    if settings.DEBUG:
+        response["Server-Timing"] = server_timing(metric)
+    _buffer_metric(metric)
+
+
+def server_timing(metric: RequestMetric) -> str:
+    return ", ".join(
+        [
+            f'db;dur={metric.db_ms:.1f};desc="{metric.query_count} queries"',
+            f'sql-max;dur={metric.slowest_sql_ms:.1f};desc="slowest query"',
+            f'app;dur={metric.app_ms:.1f};desc="view (serializer)"',
+            f"render;dur={metric.render_ms:.1f}",
+            f"total;dur={metric.total_ms:.1f}",
+        ]
+    )
+
+
+def _buffer_metric(metric: RequestMetric):
+    global _last_flush
+    with _buffer_lock:
+        _buffer.append(metric)
+        due = (
+            len(_buffer) >= settings.REQUEST_METRICS_FLUSH_SIZE
+            or time.monotonic() - _last_flush >= settings.REQUEST_METRICS_FLUSH_INTERVAL
+        )
+        if not due:
+            return
+        pending = _buffer[:]
+        _buffer.clear()
+        _last_flush = time.monotonic()
+    try:
+        RequestMetric.objects.bulk_create(pending)
+    except Exception:  # noqa: BLE001 - 측정 적재 실패가 응답을 깨면 안 된다
+        logger.exception("request_metrics.flush_failed count=%s", len(pending))
+    log_pool_stats()
+
+
+_PERCENTILE_SQL = f"""
+    SELECT view_name,
+           count(*),
+           percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY total_ms),
+           percentile_cont(ARRAY[0.5, 0.95, 0.99]) WITHIN GROUP (ORDER BY db_ms),
+           percentile_cont(0.95) WITHIN GROUP (ORDER BY app_ms),
+           percentile_cont(0.95) WITHIN GROUP (ORDER BY render_ms),
+           avg(query_count),
+           max(query_count)
+    FROM {RequestMetric._meta.db_table}
+    WHERE created_at >= %s
+    GROUP BY view_name
+    ORDER BY 3 DESC
+"""
+
+
+def endpoint_percentiles(hours: int = 24) -> list[dict]:
+    """최근 hours 시간의 view 별 샘플 수 / 구간별 백분위 (total p95 내림차순)."""
+    since = timezone.now() - timedelta(hours=hours)
+    with connection.cursor() as cursor:
+        cursor.execute(_PERCENTILE_SQL, [since])
+        rows = cursor.fetchall()
+    return [
+        {
+            "view_name": view_name,
+            "samples": samples,
+            "total_p50": total[0],
+            "total_p95": total[1],
+            "total_p99": total[2],
+            "db_p50": db[0],
+            "db_p95": db[1],
+            "db_p99": db[2],
+            "app_p95": app_p95,
+            "render_p95": render_p95,
+            "queries_avg": float(queries_avg),
+            "queries_max": queries_max,
+        }
+        for (
+            view_name,
+            samples,
+            total,
+            db,
+            app_p95,
+            render_p95,
+            queries_avg,
+            queries_max,
+        ) in rows
+    ]
+
+
+def purge_request_metrics(retention_days: int | None = None) -> int:
+    """보관 기간이 지난 RequestMetric 을 지우고 지운 row 수를 반환."""
+    if retention_days is None:
+        retention_days = settings.REQUEST_METRICS_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deleted, _ = RequestMetric.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
@@ -1,17 +1,21 @@
 """
 Next.js ISR On-demand Revalidation 유틸리티
 
+revalidate 는 요청 경로에서 바로 보내지 않고 대기열(RevalidationRequest)에 적재한다.
+task_flush_revalidation 이 REVALIDATE_COALESCE_WINDOW 초 동안 모인 태그를 중복 제거해
+한 번만 보내고, 실패하면 태그를 다시 적재한 뒤 재시도한다.
+
 사용법:
-    from phone.revalidate import revalidate_cache, RevalidateTag
+    from phone.revalidate import enqueue_revalidation, RevalidateTag
 
-    # 특정 태그 revalidate
-    revalidate_cache(RevalidateTag.PRODUCTS)
+    # 특정 태그 revalidate 예약
+    enqueue_revalidation(RevalidateTag.PRODUCTS)
 
-    # 여러 태그 revalidate
-    revalidate_cache([RevalidateTag.PRODUCTS, RevalidateTag.BANNERS])
+    # 여러 태그 revalidate 예약
+    enqueue_revalidation([RevalidateTag.PRODUCTS, RevalidateTag.BANNERS])
 
-    # 모든 캐시 revalidate
-    revalidate_cache(RevalidateTag.ALL)
+    # 즉시 전송 (워커 내부용)
+    revalidate_cache(RevalidateTag.ALL, async_call=False)
 """
 
 import logging
@@ -20,6 +24,8 @@ from enum import Enum
 from typing import Union, List
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +42,20 @@ class RevalidateTag(str, Enum):
     ALL = "all"
 
 
+def normalize_tags(
+    tags: Union[RevalidateTag, List[RevalidateTag], str, List[str]],
+) -> List[str]:
+    if isinstance(tags, (RevalidateTag, str)):
+        return [str(tags.value if isinstance(tags, RevalidateTag) else tags)]
+    return [str(t.value if isinstance(t, RevalidateTag) else t) for t in tags]
+
+
+def _revalidate_token() -> str | None:
+    return getattr(
+        settings, "REVALIDATE_SECRET_TOKEN", os.environ.get("REVALIDATE_SECRET_TOKEN")
+    )
+
+
 def revalidate_cache(
     tags: Union[RevalidateTag, List[RevalidateTag], str, List[str]],
     async_call: bool = True,
@@ -55,9 +75,7 @@ def revalidate_cache(
         "FRONTEND_URL",
         os.environ.get("FRONTEND_URL", "https://www.phoneinone.com"),
     )
-    revalidate_token = getattr(
-        settings, "REVALIDATE_SECRET_TOKEN", os.environ.get("REVALIDATE_SECRET_TOKEN")
-    )
+    revalidate_token = _revalidate_token()
 
     if not revalidate_token:
         logger.warning(
@@ -65,11 +83,7 @@ def revalidate_cache(
         )
         return False
 
-    # 태그 정규화
-    if isinstance(tags, (RevalidateTag, str)):
-        tag_list = [str(tags.value if isinstance(tags, RevalidateTag) else tags)]
-    else:
-        tag_list = [str(t.value if isinstance(t, RevalidateTag) else t) for t in tags]
+    tag_list = normalize_tags(tags)
 
     url = f"{frontend_url}/api/revalidate"
     headers = {
@@ -102,26 +116,184 @@ def revalidate_cache(
         return False
 
 
-def revalidate_products():
-    """제품 관련 캐시 revalidate"""
-    return revalidate_cache([RevalidateTag.PRODUCTS, RevalidateTag.PRODUCT_DETAIL])
+# ---------------------------------------------------------------------------
+# 대기열 (coalescing)
+# ---------------------------------------------------------------------------
+
+FLUSH_SCHEDULED_KEY = "revalidate:flush_scheduled"
+# 재시도 체인이 진행 중이면 beat/enqueue 가 새 flush 체인을 시작하지 않도록 표시한다.
+RETRY_PENDING_KEY = "revalidate:retry_pending"
+# 장애 한 번에 알림 한 번: 전송이 다시 성공할 때까지 유지한다.
+OUTAGE_ALERTED_KEY = "revalidate:outage_alerted"
+
+
+class RevalidationFailed(Exception):
+    pass
+
+
+def _schedule_flush():
+    # 윈도우당 flush 예약은 한 번만 - 이후 enqueue 는 대기열에 쌓이기만 한다.
+    window = settings.REVALIDATE_COALESCE_WINDOW
+    if not cache.add(FLUSH_SCHEDULED_KEY, 1, timeout=window * 5):
+        return
+    from phone.tasks import task_flush_revalidation
+
+    try:
+        task_flush_revalidation.apply_async(countdown=window)
+    except Exception:
+        # broker 장애 시에도 대기열은 남아 있으므로 beat 주기 flush 가 처리한다.
+        cache.delete(FLUSH_SCHEDULED_KEY)
+        logger.exception("revalidate.schedule_failed")
+
+
+def enqueue_revalidation(
+    tags: Union[RevalidateTag, List[RevalidateTag], str, List[str]],
+) -> bool:
+    """revalidate 할 태그를 대기열에 적재하고 commit 후 flush 를 예약한다."""
+    from phone.models import RevalidationRequest
+
+    tag_list = normalize_tags(tags)
+    if not tag_list:
+        return False
+    RevalidationRequest.objects.create(tags=tag_list)
+    transaction.on_commit(_schedule_flush)
+    return True
+
+
+def flush_revalidation_queue() -> dict[str, int]:
+    """대기열의 태그를 중복 제거해 한 번에 revalidate 한다.
+
+    실패하면 태그를 대기열에 다시 넣고 RevalidationFailed 를 올린다 (호출 측이 재시도).
+    REVALIDATE_SECRET_TOKEN 이 없으면(로컬/스테이징) 보내지 않고 대기열만 비운다.
+    """
+    from phone.models import RevalidationRequest
+
+    cache.delete(FLUSH_SCHEDULED_KEY)
+    with transaction.atomic():
+        requests_ = list(
+            RevalidationRequest.objects.select_for_update(skip_locked=True).order_by(
+                "id"
+            )
+        )
+        RevalidationRequest.objects.filter(id__in=[r.id for r in requests_]).delete()
+
+    calls = len(requests_)
+    if not calls:
+        return {"calls": 0, "tags": 0, "coalesced": 0}
+
+    tag_list = sorted({tag for r in requests_ for tag in r.tags})
+    if RevalidateTag.ALL.value in tag_list:
+        tag_list = [RevalidateTag.ALL.value]
+
+    stats = {"calls": calls, "tags": len(tag_list), "coalesced": calls - 1}
+    if not _revalidate_token():
+        logger.info("revalidate.skipped reason=not_configured calls=%s", calls)
+        return stats
+    if not revalidate_cache(tag_list, async_call=False):
+        RevalidationRequest.objects.create(tags=tag_list)
+        raise RevalidationFailed(f"revalidate 실패: {tag_list}")
+
+    cache.delete(OUTAGE_ALERTED_KEY)
+
+    logger.info(
+        "revalidate.flushed calls=%s tags=%s coalesced=%s",
+        stats["calls"],
+        stats["tags"],
+        stats["coalesced"],
+    )
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# 제품 단위 태그
+# ---------------------------------------------------------------------------
+
+
+def product_detail_tag(product_id: int) -> str:
+    return f"{RevalidateTag.PRODUCT_DETAIL.value}-{product_id}"
+
+
+def products_brand_tag(brand: str) -> str:
+    return f"{RevalidateTag.PRODUCTS.value}-brand-{brand}"
+
+
+def product_tags(
+    product_ids=(), device_variant_ids=(), include_lists: bool = True
+) -> List[str]:
+    """변경된 Product / ProductOption(product_id) / Inventory(device_variant_id) 로부터
+    영향받는 제품 상세 태그와 (include_lists 면) 브랜드 목록 태그를 계산한다."""
+    from django.db.models import Q
+
+    from phone.models import Product
+
+    product_ids = set(product_ids or ())
+    device_variant_ids = set(device_variant_ids or ())
+    if not product_ids and not device_variant_ids:
+        return []
+
+    rows = (
+        Product.objects.filter(
+            Q(id__in=product_ids) | Q(device__variants__id__in=device_variant_ids)
+        )
+        .values_list("id", "device__brand")
+        .distinct()
+    )
+    tags = set()
+    for product_id, brand in rows:
+        tags.add(product_detail_tag(product_id))
+        if include_lists and brand:
+            tags.add(products_brand_tag(brand))
+    return sorted(tags)
+
+
+def revalidate_products(
+    product_ids=None, device_variant_ids=None, include_lists: bool = True
+):
+    """제품 관련 캐시 revalidate
+
+    - 인자 없이 호출: 구조 변경(제품 추가/삭제/노출·정렬 변경 등)으로 보고 전역
+      products / product-detail 태그를 무효화한다.
+    - product_ids / device_variant_ids 지정: 해당 제품의 product-detail-<id> 와
+      products-brand-<brand> 태그만 무효화한다. 재고처럼 목록에 영향이 없는 변경은
+      include_lists=False 로 상세 태그만 보낸다.
+    - REVALIDATE_PRODUCT_TAGS_ONLY=False(기본값)이면 프론트 호환을 위해 전역
+      product-detail (include_lists 면 products 도) 태그를 함께 보낸다.
+
+    카탈로그 정적 스냅샷(phone.catalog_snapshot) 발행도 함께 예약한다.
+    """
+    from phone.catalog_snapshot import schedule_catalog_snapshot
+
+    if product_ids is None and device_variant_ids is None:
+        schedule_catalog_snapshot()
+        return enqueue_revalidation(
+            [RevalidateTag.PRODUCTS, RevalidateTag.PRODUCT_DETAIL]
+        )
+    tags = product_tags(product_ids, device_variant_ids, include_lists)
+    if not tags:
+        return False
+    if not settings.REVALIDATE_PRODUCT_TAGS_ONLY:
+        tags.append(RevalidateTag.PRODUCT_DETAIL.value)
+        if include_lists:
+            tags.append(RevalidateTag.PRODUCTS.value)
+    schedule_catalog_snapshot()
+    return enqueue_revalidation(tags)
 
 
 def revalidate_banners():
     """배너 캐시 revalidate"""
-    return revalidate_cache(RevalidateTag.BANNERS)
+    return enqueue_revalidation(RevalidateTag.BANNERS)
 
 
 def revalidate_reviews():
     """리뷰 캐시 revalidate"""
-    return revalidate_cache(RevalidateTag.REVIEWS)
+    return enqueue_revalidation(RevalidateTag.REVIEWS)
 
 
 def revalidate_faqs():
     """FAQ 캐시 revalidate"""
-    return revalidate_cache(RevalidateTag.FAQS)
+    return enqueue_revalidation(RevalidateTag.FAQS)
 
 
 def revalidate_all():
     """모든 캐시 revalidate"""
-    return revalidate_cache(RevalidateTag.ALL)
+    return enqueue_revalidation(RevalidateTag.ALL)
@@ -0,0 +1,168 @@
+"""
+상품 목록 / 상세 직렬화 CPU 벤치마크
+
+같은 요청의 응답 본문을 두 경로로 번갈아 만들고 요청당 CPU 시간과 wall 시간을 비교한다.
+
+    - serializer: ProductListSerializer / ProductDetailSerializer + JSONRenderer
+    - fast: phone.product_payloads (values()) + ORJSONRenderer
+
+CPU 는 time.process_time (DB 결과 파싱 포함, DB 대기 제외), wall 은 time.perf_counter.
+둘 다 반복 측정의 중앙값이다. 요청당 쿼리 수는 측정 밖에서 한 번 센다. 두 경로의 응답
+바이트가 다르면 identical=False 로 표시한다. 조회수 증가 / 라우팅 등 view 의 나머지 비용은
+두 경로가 같아 빼고 잰다.
+
+사용법:
+    from phone.serialization_benchmark import run_serialization_benchmark
+
+    result = run_serialization_benchmark(iterations=20)
+    # {"targets": {"product_list": {"serializer": {"cpu_ms", "wall_ms", "queries"},
+    #                               "fast": {...}, "cpu_saving": 0.71, "identical": True,
+    #                               "bytes": 52311}, ...}, "meta": {...}}
+"""
+
+import statistics
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from phone.product_payloads import product_detail_payload, product_list_payload
+from phone.renderers import ORJSONRenderer
+from phone.serializers import ProductDetailSerializer, ProductListSerializer
+from phone.views.product_views import (
+    ProductViewSet,
+    detail_inventories,
+    group_in_stock_by_device,
+    in_stock_inventories,
+    product_detail_queryset,
+    product_list_querysets,
+    related_products_queryset,
+)
+
+# 이름 -> (엔드포인트, 이전 통신사)
+TARGETS = {
+    "product_list": ("list", None),
+    "product_list_carrier": ("list", "SK"),
+    "product_detail": ("detail", None),
+    "product_detail_carrier": ("detail", "SK"),
+}
+
+PATHS = ("serializer", "fast")
+
+
+def _serializer_list(carrier):
+    _, queryset = product_list_querysets(
+        ProductViewSet.queryset.all(), {"carrier": carrier} if carrier else {}
+    )
+    in_stock_by_device = group_in_stock_by_device(in_stock_inventories(queryset))
+    serializer = ProductListSerializer(
+        queryset, many=True, context={"in_stock_by_device": in_stock_by_device}
+    )
+    return JSONRenderer().render(serializer.data)
+
+
+def _fast_list(carrier):
+    _, queryset = product_list_querysets(
+        ProductViewSet.queryset.all(), {"carrier": carrier} if carrier else {}
+    )
+    return ORJSONRenderer().render(product_list_payload(queryset, carrier))
+
+
+def _serializer_detail(product_id, carrier):
+    instance = product_detail_queryset(
+        ProductViewSet.queryset.filter(id=product_id), carrier
+    ).first()
+    related_products = []
+    if instance.product_series_id:
+        related_products = list(related_products_queryset(instance))
+    serializer = ProductDetailSerializer(
+        instance,
+        context={
+            "inventories": detail_inventories(instance),
+            "related_products": related_products,
+        },
+    )
+    return JSONRenderer().render(serializer.data)
+
+
+def _fast_detail(product_id, carrier):
+    data = product_detail_payload(
+        ProductViewSet.queryset.filter(id=product_id), carrier
+    )
+    return ORJSONRenderer().render(data)
+
+
+_BUILDERS = {
+    ("list", "serializer"): _serializer_list,
+    ("list", "fast"): _fast_list,
+    ("detail", "serializer"): _serializer_detail,
+    ("detail", "fast"): _fast_detail,
+}
+
+
+def _args(endpoint, carrier, product_ids, i):
+    if endpoint == "list":
+        return (carrier,)
+    return (product_ids[i % len(product_ids)], carrier)
+
+
+def _queries(build, args):
+    with CaptureQueriesContext(connection) as ctx:
+        build(*args)
+    return len(ctx.captured_queries)
+
+
+def run_serialization_benchmark(iterations=20, targets=None, product_limit=20):
+    """targets(기본: TARGETS 전체)를 iterations 번씩 두 경로로 만들어 비교한다."""
+    product_ids = list(
+        ProductViewSet.queryset.filter(best_price_option_id__isnull=False)
+        .order_by("id")
+        .values_list("id", flat=True)[:product_limit]
+    )
+    if not product_ids:
+        raise ValueError("판매 중인 상품이 없습니다 (합성 카탈로그를 먼저 만드세요)")
+
+    result = {}
+    for name in targets or TARGETS:
+        endpoint, carrier = TARGETS[name]
+        samples = {path: {"cpu": [], "wall": []} for path in PATHS}
+        identical = True
+        size = 0
+        for i in range(iterations):
+            args = _args(endpoint, carrier, product_ids, i)
+            bodies = {}
+            # 경로 순서를 번갈아 바꿔 캐시 / 연결 상태가 한쪽에 유리하지 않게
+            for path in PATHS if i % 2 == 0 else reversed(PATHS):
+                build = _BUILDERS[(endpoint, path)]
+                cpu_start, wall_start = time.process_time(), time.perf_counter()
+                bodies[path] = build(*args)
+                samples[path]["cpu"].append(time.process_time() - cpu_start)
+                samples[path]["wall"].append(time.perf_counter() - wall_start)
+            identical = identical and bodies["serializer"] == bodies["fast"]
+            size = max(size, len(bodies["fast"]))
+
+        args = _args(endpoint, carrier, product_ids, 0)
+        stats = {
+            path: {
+                "cpu_ms": round(statistics.median(samples[path]["cpu"]) * 1000, 2),
+                "wall_ms": round(statistics.median(samples[path]["wall"]) * 1000, 2),
+                "queries": _queries(_BUILDERS[(endpoint, path)], args),
+            }
+            for path in PATHS
+        }
+        serializer_cpu = stats["serializer"]["cpu_ms"]
+        result[name] = {
+            **stats,
+            "cpu_saving": (
+                round(1 - stats["fast"]["cpu_ms"] / serializer_cpu, 3)
+                if serializer_cpu
+                else None
+            ),
+            "identical": identical,
+            "bytes": size,
+        }
+    return {
+        "targets": result,
+        "meta": {"iterations": iterations, "products": len(product_ids)},
+    }
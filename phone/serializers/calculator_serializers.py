@@ -7,7 +7,8 @@ from phone.constants import (
     ContactChannelChoices,
     WinnerChoices,
 )
-from phone.models import CalculatorSession, CustomerIdentity, PartnerCard
+from phone.models import CalculatorSession, CustomerIdentity
+from phone.partner_card_cache import get_partner_card_index
 
 SLOT_KEYS = {"slot", "card_id", "card_name", "spend_allocated", "amount_monthly"}
 
@@ -78,10 +79,8 @@ class CalculatorSessionCreateSerializer(serializers.Serializer):
                 card_ids.append(slot["card_id"])
 
         if card_ids:
-            existing = set(
-                PartnerCard.objects.filter(id__in=card_ids).values_list("id", flat=True)
-            )
-            missing_cards = set(card_ids) - existing
+            # 프로세스 내 캐시로 검증 - POST 마다 PartnerCard 조회를 하지 않는다.
+            missing_cards = set(card_ids) - get_partner_card_index().keys()
             if missing_cards:
                 raise serializers.ValidationError(
                     {
@@ -123,8 +122,12 @@ class CalculatorSessionCreateSerializer(serializers.Serializer):
                     )
         return result
 
-    @transaction.atomic
-    def create(self, validated_data):
+    def to_session_fields(self, validated_data) -> tuple[dict, list[int]]:
+        """validated_data 를 CalculatorSession 컬럼 dict 와 인터넷 통신사 id 목록으로 평탄화.
+
+        즉시 INSERT(create) 와 write-behind 버퍼(phone.calculator_buffer) 가 같은
+        결과를 쓰도록 공용으로 사용한다.
+        """
         answers = validated_data.get("answers", {}) or {}
         auto = validated_data.get("auto_selected", {}) or {}
         result = validated_data.get("result", {}) or {}
@@ -181,6 +184,11 @@ class CalculatorSessionCreateSerializer(serializers.Serializer):
             "benefit_amounts_snapshot": snapshot,
         }
 
+        return flat, internet_ids
+
+    @transaction.atomic
+    def create(self, validated_data):
+        flat, internet_ids = self.to_session_fields(validated_data)
         instance = CalculatorSession.objects.create(**flat)
 
         if internet_ids:
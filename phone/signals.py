@@ -1,7 +1,7 @@
 from django.db.models.signals import post_save, post_delete
 from django.db import models, transaction
 from django.dispatch import receiver
-from .models import ProductOption
+from .models import Inventory, PartnerCard, PriceHistory, ProductOption
 
 
 @receiver(post_save, sender=ProductOption)
@@ -16,3 +16,37 @@ def handle_product_option_delete(sender, instance, **kwargs):
     """ProductOption 삭제 후 제품을 업데이트 대기열에 추가"""
     ProductOption._add_pending_product(instance.product_id)
     transaction.on_commit(ProductOption._update_pending_products)
+
+
+@receiver(post_save, sender=Inventory)
+def handle_inventory_save(sender, instance, update_fields=None, **kwargs):
+    """재고표 별칭이 바뀌었을 수 있으면 InventoryAlias 를 재생성 (count 만 저장 시 생략)"""
+    if update_fields is not None and not (
+        {"name_in_sheet", "color_in_sheet", "dealership", "deleted_at"}
+        & set(update_fields)
+    ):
+        return
+    from phone.inventory.aliases import sync_inventory_aliases
+
+    sync_inventory_aliases(instance)
+
+
+@receiver(post_save, sender=PartnerCard)
+@receiver(post_delete, sender=PartnerCard)
+def handle_partner_card_change(sender, **kwargs):
+    """calculator 검증용 PartnerCard 캐시 무효화 (다른 프로세스는 TTL 로 갱신)
+
+    commit 전에 지우면 그 사이 다른 요청이 commit 전 데이터로 캐시를 다시 채우므로
+    commit 후에 무효화한다.
+    """
+    from phone.partner_card_cache import invalidate_partner_card_index
+
+    transaction.on_commit(invalidate_partner_card_index)
+
+
+@receiver(post_save, sender=PriceHistory)
+def handle_price_history_save(sender, instance, **kwargs):
+    """admin 등 단건 저장 시 일별 가격 시리즈를 price_at 부터 다시 채움 (bulk 저장은 호출 측에서)"""
+    from phone.price_series import refresh_daily_prices_for
+
+    transaction.on_commit(lambda: refresh_daily_prices_for([instance]))
@@ -0,0 +1,234 @@
+"""
+soft delete row 정리 (archive / purge)
+
+SoftDeleteModel 은 delete() 가 deleted_at 만 찍기 때문에 지운 row 가 hot 테이블과
+인덱스에 계속 남는다. deleted_at 이 보관 기간(SOFT_DELETE_RETENTION_DAYS)보다 오래된
+row 를 배치 단위로 원본 테이블에서 지운다.
+
+    - mode="archive": 지운 row 를 ArchivedRow 에 JSON 으로 옮긴다 (기본)
+    - mode="delete": 보관 없이 바로 지운다
+
+배치 1번 = 문장 1번: PK 순서 keyset 으로 최대 batch_size 개를 FOR UPDATE SKIP LOCKED 로
+잡고(다른 트랜잭션이 잡고 있는 row 는 다음 실행으로 미룸) DELETE ... RETURNING 결과를
+ArchivedRow 로 INSERT 한다. 배치 사이에는 sleep 으로 쉬어 복제 지연/IO 를 제한한다.
+
+안전장치:
+    - 다른 row 가 FK 로 아직 가리키는 row 는 건너뛴다 (자식이 먼저 정리된 뒤에 정리).
+      DO_NOTHING FK(simple_history 이력 등)는 원래 참조 무결성을 기대하지 않으므로 제외.
+    - 자동 생성 M2M 중간 테이블의 연결 row 는 같은 문장에서 함께 지운다.
+    - post_delete signal / 이미지 파일 삭제는 일어나지 않는다 (이미 soft delete 시점에 처리).
+    - 주문/신용조회 동의 기록은 대상에서 제외한다 (EXCLUDED_MODELS).
+
+사용법:
+    from phone.soft_delete_purge import purge_soft_deleted
+
+    purge_soft_deleted()                                 # settings 기본값
+    purge_soft_deleted(targets=[ProductOption], mode="delete", retention_days=30)
+"""
+
+import logging
+import time
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection, models, transaction
+from django.utils import timezone
+
+from phone.models import ArchivedRow, CreditCheckAgreement, Order, SoftDeleteModel
+
+logger = logging.getLogger(__name__)
+
+MODES = ("archive", "delete")
+
+# 법적 보관 의무가 있는 기록은 별도 정책으로 관리한다
+EXCLUDED_MODELS = (Order, CreditCheckAgreement)
+
+
+def purge_targets() -> list[type[models.Model]]:
+    """정리 대상 모델 목록. 자식(FK 를 가진 쪽) 모델이 부모보다 먼저 온다.
+
+    Product <-> ProductOption 처럼 서로 가리키는 경우는 순서가 임의로 정해지지만,
+    참조 중인 row 는 어차피 건너뛰므로 다음 실행에서 정리된다.
+    """
+    targets = sorted(
+        (
+            model
+            for model in apps.get_models()
+            if issubclass(model, SoftDeleteModel) and model not in EXCLUDED_MODELS
+        ),
+        key=lambda model: model._meta.label,
+    )
+    children = {model: set() for model in targets}
+    for model in targets:
+        for field, _ in _incoming_fks(model):
+            if field.model in children and field.model is not model:
+                children[model].add(field.model)
+
+    ordered = []
+    visited = set()
+
+    def visit(model):
+        if model in visited:
+            return
+        visited.add(model)
+        for child in sorted(children[model], key=lambda m: m._meta.label):
+            visit(child)
+        ordered.append(model)
+
+    for model in targets:
+        visit(model)
+    return ordered
+
+
+def _incoming_fks(model):
+    """model 을 가리키는 (FK 필드, 자동 생성 M2M 중간 테이블 여부) 목록."""
+    fks = []
+    for other in apps.get_models(include_auto_created=True):
+        for field in other._meta.local_fields:
+            if not field.is_relation or field.related_model is None:
+                continue
+            if field.related_model._meta.concrete_model is not model:
+                continue
+            if field.remote_field.on_delete is models.DO_NOTHING:
+                continue
+            fks.append((field, other._meta.auto_created is not False))
+    return fks
+
+
+def _batch_sql(model, mode: str) -> str:
+    table = model._meta.db_table
+    pk = model._meta.pk.column
+    guards = []
+    link_deletes = []
+    for field, is_m2m_link in _incoming_fks(model):
+        ref_table = field.model._meta.db_table
+        if is_m2m_link:
+            link_deletes.append(
+                f"link_{len(link_deletes)} AS ("
+                f"DELETE FROM {ref_table} "
+                f"WHERE {field.column} IN (SELECT {pk} FROM batch))"
+            )
+        else:
+            guards.append(
+                f"AND NOT EXISTS (SELECT 1 FROM {ref_table} r "
+                f"WHERE r.{field.column} = t.{field.target_field.column})"
+            )
+
+    ctes = [
+        f"""batch AS (
+            SELECT t.{pk} FROM {table} t
+            WHERE t.deleted_at < %(cutoff)s
+              AND (%(after)s::text IS NULL OR t.{pk} > %(after)s)
+              {' '.join(guards)}
+            ORDER BY t.{pk}
+            LIMIT %(limit)s
+            FOR UPDATE OF t SKIP LOCKED
+        )""",
+        *link_deletes,
+        f"""removed AS (
+            DELETE FROM {table} t USING batch b
+            WHERE t.{pk} = b.{pk}
+            RETURNING t.*
+        )""",
+    ]
+    if mode == "archive":
+        ctes.append(f"""archived AS (
+                INSERT INTO {ArchivedRow._meta.db_table}
+                    (table_name, row_id, deleted_at, archived_at, data)
+                SELECT '{table}', {pk}::text, deleted_at, %(now)s, to_jsonb(removed)
+                FROM removed
+            )""")
+    # uuid 에는 max() 가 없어 array_agg 로 마지막 PK 를 구한다
+    return (
+        f"WITH {', '.join(ctes)} "
+        f"SELECT count(*), (array_agg({pk} ORDER BY {pk} DESC))[1] FROM removed"
+    )
+
+
+def purge_model(
+    model,
+    cutoff,
+    mode: str = "archive",
+    batch_size: int = 1000,
+    sleep: float = 0,
+    deadline: float | None = None,
+    on_progress=None,
+) -> int:
+    """model 에서 deleted_at < cutoff 인 row 를 배치로 정리하고 정리한 row 수를 반환."""
+    sql = _batch_sql(model, mode)
+    label = model._meta.label
+    total = 0
+    after = None
+    while deadline is None or time.monotonic() < deadline:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                {
+                    "cutoff": cutoff,
+                    "after": after,
+                    "limit": batch_size,
+                    "now": timezone.now(),
+                },
+            )
+            count, after = cursor.fetchone()
+        if not count:
+            break
+        total += count
+        logger.info(
+            "soft_delete_purge.batch model=%s mode=%s count=%s total=%s",
+            label,
+            mode,
+            count,
+            total,
+        )
+        if on_progress:
+            on_progress(label, total)
+        if count < batch_size:
+            break
+        if sleep:
+            time.sleep(sleep)
+    return total
+
+
+def purge_soft_deleted(
+    targets=None,
+    mode: str | None = None,
+    retention_days: int | None = None,
+    batch_size: int | None = None,
+    sleep: float | None = None,
+    max_seconds: float | None = None,
+    on_progress=None,
+) -> dict[str, int]:
+    """보관 기간이 지난 soft delete row 를 정리한다. {모델 label: 정리 row 수} 반환.
+
+    max_seconds 가 지나면 진행 중인 배치까지만 처리하고 멈춘다 (다음 실행에서 이어감).
+    """
+    mode = mode or settings.SOFT_DELETE_PURGE_MODE
+    if mode not in MODES:
+        raise ValueError(f"mode 는 {MODES} 중 하나여야 합니다: {mode}")
+    if retention_days is None:
+        retention_days = settings.SOFT_DELETE_RETENTION_DAYS
+    cutoff = timezone.now() - timedelta(days=retention_days)
+    deadline = time.monotonic() + max_seconds if max_seconds else None
+
+    results = {}
+    for model in targets or purge_targets():
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        results[model._meta.label] = purge_model(
+            model,
+            cutoff,
+            mode=mode,
+            batch_size=batch_size or settings.SOFT_DELETE_PURGE_BATCH_SIZE,
+            sleep=settings.SOFT_DELETE_PURGE_SLEEP if sleep is None else sleep,
+            deadline=deadline,
+            on_progress=on_progress,
+        )
+    logger.info(
+        "soft_delete_purge.done mode=%s cutoff=%s total=%s",
+        mode,
+        cutoff.isoformat(),
+        sum(results.values()),
+    )
+    return results
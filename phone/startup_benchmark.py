@@ -0,0 +1,131 @@
+"""
+프로세스 역할별 기동 비용 측정 (web / worker / beat)
+
+역할마다 새 파이썬 프로세스를 띄워 그 역할이 기동 시 하는 import 를 그대로 재현하고,
+걸린 시간과 상주 메모리(RSS), 로드된 무거운 라이브러리 목록을 잰다.
+
+    - web: django.setup() + WSGI application + URLconf 전체 (views/serializers)
+    - worker / beat: django.setup() + Celery 기본 모듈(tasks autodiscover) import
+
+자식 프로세스에는 PROCESS_ROLE 을 넘겨 settings 의 역할별 분기(Sentry integration 등)도
+실제와 같게 탄다. DB 에는 연결하지 않는다.
+
+사용법:
+    from phone.startup_benchmark import measure_role
+
+    result = measure_role("web", repeat=3)
+    # {"role": "web", "import_s": 0.97, "wall_s": 1.1, "rss_mb": 91.0, "heavy_modules": []}
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROLES = ("web", "worker", "beat")
+
+# 웹 요청 대부분은 쓰지 않는 무거운 라이브러리 - web 역할에서는 로드되지 않아야 한다
+HEAVY_MODULES = (
+    "pandas",
+    "numpy",
+    "openpyxl",
+    "google.genai",
+    "google.shopping",
+    "boto3",
+    "botocore",
+    "lxml",
+)
+
+_PROBE = "from phone.startup_benchmark import probe; probe({role!r})"
+
+
+def _rss_mb():
+    """현재 RSS(MB). /proc 가 없으면(macOS 등) 최대 RSS 로 대신한다."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def _load_role(role):
+    import django
+
+    django.setup()
+    if role == "web":
+        from django.urls import get_resolver
+
+        import phoneinone_server.wsgi  # noqa: F401
+
+        get_resolver().url_patterns
+    else:
+        from phoneinone_server.celery import app
+
+        app.loader.import_default_modules()
+
+
+def probe(role):
+    """자식 프로세스에서 실행: 역할 기동 import 후 측정값을 JSON 한 줄로 출력."""
+    started = time.perf_counter()
+    _load_role(role)
+    elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "import_s": round(elapsed, 3),
+                "rss_mb": round(_rss_mb(), 1),
+                "heavy_modules": [m for m in HEAVY_MODULES if m in sys.modules],
+            }
+        )
+    )
+
+
+def _run_probe(role, env, cwd):
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(role=role)],
+        env=env,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    wall = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"{role} 기동 실패 (exit {completed.returncode}): {completed.stderr[-2000:]}"
+        )
+    # settings 가 stdout 에 무언가 찍을 수 있으므로 마지막 줄만 결과로 읽는다
+    sample = json.loads(completed.stdout.strip().splitlines()[-1])
+    sample["wall_s"] = round(wall, 3)
+    return sample
+
+
+def measure_role(role, repeat=3, settings_module=None):
+    """role 을 repeat 번 새 프로세스로 기동해 중앙값을 반환."""
+    from django.conf import settings
+
+    if role not in ROLES:
+        raise ValueError(f"알 수 없는 역할: {role} (가능: {', '.join(ROLES)})")
+    env = {
+        **os.environ,
+        "PROCESS_ROLE": role,
+        "DJANGO_SETTINGS_MODULE": settings_module or settings.SETTINGS_MODULE,
+    }
+    samples = [_run_probe(role, env, settings.BASE_DIR) for _ in range(repeat)]
+    return {
+        "role": role,
+        "repeat": repeat,
+        "import_s": round(statistics.median(s["import_s"] for s in samples), 3),
+        "wall_s": round(statistics.median(s["wall_s"] for s in samples), 3),
+        "rss_mb": round(statistics.median(s["rss_mb"] for s in samples), 1),
+        "heavy_modules": samples[-1]["heavy_modules"],
+    }
@@ -0,0 +1,670 @@
+"""
+합성(synthetic) 카탈로그 생성기
+
+성능 측정 / 쿼리 수 회귀 테스트용으로 상품 카탈로그를 scale 에 맞춰 만든다.
+같은 scale + seed 면 항상 같은 데이터가 만들어지고, INSERT 는 bulk_create 라
+save() / signal(리밸리데이트, 마켓 동기화 등)은 일어나지 않는다. 기존 데이터는 건드리지
+않고 추가만 한다 (오픈마켓은 source 별로 있으면 재사용).
+
+PriceHistory.price_at 은 auto_now_add 라 bulk_create 로는 과거 날짜를 넣을 수 없어
+unnest INSERT 한 문장으로 넣는다. 파티션이 없는 지난 달 row 는 default 파티션으로 간다.
+
+    - 단말기 / 용량 / 색상 / 색상 이미지, 요금제, 시리즈, 태그
+    - 상품 / 상세 이미지 / 옵션 (용량 x 요금제 x 계약·할인유형), best_price_option
+    - 대리점 / 재고
+    - 오픈마켓 상품 / 옵션 (마켓 x 용량 x 통신사 x 번호이동·기기변경)
+    - PriceHistory (가격이 바뀐 날만) + 일별 가격 시리즈(PriceHistoryDaily)
+    - CalculatorSession
+    - 카드사 / 제휴카드 / 카드 혜택 / 추가 프로모션
+    - 인터넷 통신사 / 인터넷·TV 요금제 / 와이파이·셋톱 / 결합 조건·할인·프로모션 / 설치비
+
+사용법:
+    from phone.synthetic_catalog import CatalogScale, build_catalog
+
+    build_catalog(CatalogScale(products=1000), seed=0)   # {모델 이름: 생성 row 수}
+"""
+
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from internet.models import (
+    BundleCondition,
+    BundleDiscount,
+    BundlePromotion,
+    InstallationOption,
+    InternetCarrier,
+    InternetPlan,
+    SettopBoxOption,
+    TVPlan,
+    WifiOption,
+)
+from phone.constants import (
+    CardSlotChoices,
+    CarrierChoices,
+    ContractTypeChoices,
+    ContactChannelChoices,
+    DiscountTypeChoices,
+    FunnelVariantChoices,
+    OpenMarketChoices,
+    WinnerChoices,
+)
+from phone.models import (
+    CalculatorSession,
+    CardAdditionalPromotion,
+    CardBenefit,
+    CardIssuer,
+    Dealership,
+    DecoratorTag,
+    Device,
+    DeviceColor,
+    DevicesColorImage,
+    DeviceVariant,
+    Inventory,
+    OpenMarket,
+    OpenMarketProduct,
+    OpenMarketProductOption,
+    PartnerCard,
+    Plan,
+    PriceHistory,
+    PriceHistoryDaily,
+    Product,
+    ProductDetailImage,
+    ProductOption,
+    ProductSeries,
+)
+from phone.price_series import refresh_daily_prices
+
+CARRIERS = (CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG)
+BRANDS = ("Samsung", "Apple", "Google")
+STORAGES = ("128GB", "256GB", "512GB", "1TB")
+COLORS = (
+    ("블랙", "#000000"),
+    ("화이트", "#FFFFFF"),
+    ("실버", "#C0C0C0"),
+    ("블루", "#1E3A8A"),
+    ("핑크", "#F9A8D4"),
+)
+# 옵션 1세트 = (계약유형, 할인유형) 조합
+CONTRACT_DISCOUNTS = (
+    (ContractTypeChoices.CHANGE, DiscountTypeChoices.SUBSIDY),
+    (ContractTypeChoices.CHANGE, DiscountTypeChoices.SELECTION),
+    (ContractTypeChoices.MNP, DiscountTypeChoices.SUBSIDY),
+    (ContractTypeChoices.MNP, DiscountTypeChoices.SELECTION),
+)
+INTERNET_CARRIERS = ("SK브로드밴드", "KT", "LG U+")
+OPEN_MARKETS = tuple(source for source, _ in OpenMarketChoices.Choices)
+BATCH_SIZE = 2000
+# PriceHistory: 하루에 가격이 바뀔 확률 / CalculatorSession: 상담 신청(lead) 비율
+PRICE_CHANGE_RATE = 0.15
+LEAD_RATE = 0.1
+
+
+@dataclass(frozen=True)
+class CatalogScale:
+    products: int = 10
+    carriers: int = 3
+    variants_per_device: int = 2
+    colors_per_device: int = 2
+    plans_per_carrier: int = 2
+    series: int = 5
+    tags: int = 3
+    detail_images_per_product: int = 2
+    partner_cards: int = 5
+    internet_plans_per_carrier: int = 3
+    open_markets: int = 0
+    price_history_days: int = 0
+    calculator_sessions: int = 0
+
+    @property
+    def carrier_codes(self):
+        return CARRIERS[: self.carriers]
+
+
+def build_catalog(scale: CatalogScale = CatalogScale(), seed: int = 0) -> dict:
+    """scale 만큼 카탈로그를 만들고 {모델 이름: 생성 row 수} 를 반환."""
+    rng = random.Random(seed)
+    counts = {}
+    tables = {PriceHistory._meta.db_table, PriceHistoryDaily._meta.db_table}
+
+    def create(model, objs):
+        created = model.objects.bulk_create(objs, batch_size=BATCH_SIZE)
+        tables.add(model._meta.db_table)
+        counts[model.__name__] = counts.get(model.__name__, 0) + len(created)
+        return created
+
+    plans = _build_plans(create, scale, rng)
+    series = create(
+        ProductSeries,
+        [
+            ProductSeries(name=f"시리즈 {i:03d}", sort_order=i)
+            for i in range(scale.series)
+        ],
+    )
+    devices, variants, colors = _build_devices(create, scale, rng)
+    products, options = _build_products(
+        create, scale, rng, devices, variants, series, plans
+    )
+    _build_inventory(create, scale, rng, variants, colors)
+    _build_partner_cards(create, scale, rng, series)
+    _build_internet(create, scale, rng)
+    _build_open_market(create, scale, variants, options, plans)
+    counts.update(_build_price_history(scale, rng, options, plans))
+    _build_calculator_sessions(create, scale, rng, products)
+
+    # 통계가 비어 있으면 planner 가 row 0개로 보고 나쁜 plan 을 고른다.
+    # 트랜잭션 안(테스트 / 롤백하는 벤치마크)이어도 ANALYZE 는 자기 INSERT 를 표본에 넣는다.
+    with connection.cursor() as cursor:
+        for table in sorted(tables):
+            cursor.execute(f'ANALYZE "{table}"')
+    return counts
+
+
+def _build_plans(create, scale, rng):
+    return create(
+        Plan,
+        [
+            Plan(
+                name=f"{carrier} 5G {i:02d}",
+                carrier=carrier,
+                category_1="5G",
+                category_2="5G",
+                price=rng.randrange(35000, 130001, 500),
+                data_allowance="무제한" if i == 0 else f"{(i + 1) * 10}GB",
+                call_allowance="무제한",
+                sms_allowance="기본제공",
+                sort_order=i,
+            )
+            for carrier in scale.carrier_codes
+            for i in range(scale.plans_per_carrier)
+        ],
+    )
+
+
+def _build_devices(create, scale, rng):
+    devices = create(
+        Device,
+        [
+            Device(
+                model_name=f"Synthetic {i:05d}",
+                brand=BRANDS[i % len(BRANDS)],
+                series=f"{BRANDS[i % len(BRANDS)]} 시리즈",
+            )
+            for i in range(scale.products)
+        ],
+    )
+    variants = create(
+        DeviceVariant,
+        [
+            DeviceVariant(
+                device=device,
+                storage_capacity=STORAGES[v % len(STORAGES)],
+                device_price=rng.randrange(500000, 2500001, 1000),
+                is_default=v == 0,
+            )
+            for device in devices
+            for v in range(scale.variants_per_device)
+        ],
+    )
+    colors = create(
+        DeviceColor,
+        [
+            DeviceColor(
+                device=device,
+                color=COLORS[c % len(COLORS)][0],
+                color_code=COLORS[c % len(COLORS)][1],
+                sort_order=c,
+            )
+            for device in devices
+            for c in range(scale.colors_per_device)
+        ],
+    )
+    create(
+        DevicesColorImage,
+        [
+            DevicesColorImage(
+                device_color=color,
+                image=f"device_color_images/synthetic/{color.device_id}_{color.sort_order}.png",
+                description=color.color,
+            )
+            for color in colors
+        ],
+    )
+    return devices, variants, colors
+
+
+def _build_products(create, scale, rng, devices, variants, series, plans):
+    products = create(
+        Product,
+        [
+            Product(
+                name=device.model_name,
+                device=device,
+                is_active=True,
+                is_featured=i % 10 == 0,
+                sort_order=scale.products - i,
+                product_series=series[i % len(series)] if series else None,
+            )
+            for i, device in enumerate(devices)
+        ],
+    )
+    create(
+        ProductDetailImage,
+        [
+            ProductDetailImage(
+                product=product,
+                image=f"product_images/synthetic/{product.id}_{i}.png",
+                description=f"{product.name} 상세 {i}",
+                sort_order=i,
+            )
+            for product in products
+            for i in range(scale.detail_images_per_product)
+        ],
+    )
+    tags = create(
+        DecoratorTag,
+        [
+            DecoratorTag(name=f"태그 {i}", text_color="#FFFFFF", tag_color="#FF0000")
+            for i in range(scale.tags)
+        ],
+    )
+    if tags:
+        create(
+            DecoratorTag.product.through,
+            [
+                DecoratorTag.product.through(
+                    decoratortag_id=tags[i % len(tags)].id, product_id=product.id
+                )
+                for i, product in enumerate(products)
+            ],
+        )
+
+    variants_by_device = {}
+    for variant in variants:
+        variants_by_device.setdefault(variant.device_id, []).append(variant)
+    options = []
+    for product in products:
+        for variant in variants_by_device.get(product.device_id, []):
+            for plan in plans:
+                subsidy = rng.randrange(100000, 600001, 10000)
+                for contract_type, discount_type in CONTRACT_DISCOUNTS:
+                    option = ProductOption(
+                        product=product,
+                        device_variant=variant,
+                        plan=plan,
+                        device_price=variant.device_price,
+                        contract_type=contract_type,
+                        discount_type=discount_type,
+                        subsidy_amount=subsidy,
+                        subsidy_amount_mnp=rng.choice((0, 50000, 100000)),
+                        additional_discount=rng.randrange(0, 200001, 10000),
+                    )
+                    option.final_price = option._get_final_price()
+                    options.append(option)
+    options = create(ProductOption, options)
+
+    # Product._update_product_best_option 과 같은 기준 (final_price, plan.price)
+    plan_prices = {plan.id: plan.price for plan in plans}
+    best = {}
+    for option in options:
+        key = (option.final_price, plan_prices[option.plan_id])
+        current = best.get(option.product_id)
+        if current is None or key < current[0]:
+            best[option.product_id] = (key, option)
+    for product in products:
+        if product.id in best:
+            product.best_price_option = best[product.id][1]
+    Product.objects.bulk_update(products, ["best_price_option"], batch_size=BATCH_SIZE)
+    return products, options
+
+
+def _build_inventory(create, scale, rng, variants, colors):
+    dealers = create(
+        Dealership,
+        [
+            Dealership(
+                name=f"{carrier} 대리점",
+                carrier=carrier,
+                contact_number="02-0000-0000",
+                manager="합성",
+            )
+            for carrier in scale.carrier_codes
+        ],
+    )
+    colors_by_device = {}
+    for color in colors:
+        colors_by_device.setdefault(color.device_id, []).append(color)
+    create(
+        Inventory,
+        [
+            Inventory(
+                device_variant=variant,
+                device_color=color,
+                dealership=dealer,
+                name_in_sheet=f"SM-{variant.device_id:05d}",
+                color_in_sheet=color.color,
+                count=rng.randrange(0, 6),
+            )
+            for variant in variants
+            for color in colors_by_device.get(variant.device_id, [])
+            for dealer in dealers
+        ],
+    )
+
+
+def _build_partner_cards(create, scale, rng, series):
+    issuers = create(CardIssuer, [CardIssuer(name=f"카드사 {i}") for i in range(3)])
+    cards = create(
+        PartnerCard,
+        [
+            PartnerCard(
+                issuer=issuers[i % len(issuers)],
+                name=f"제휴카드 {i:03d}",
+                carriers=[CARRIERS[i % len(CARRIERS)]],
+                discount_types=[
+                    CardSlotChoices.VALUES[i % len(CardSlotChoices.VALUES)]
+                ],
+                annual_fee=rng.randrange(0, 30001, 5000),
+                sort_order=i,
+            )
+            for i in range(scale.partner_cards)
+        ],
+    )
+    create(
+        CardBenefit,
+        [
+            CardBenefit(
+                card=card,
+                kind=kind,
+                threshold_amount=threshold,
+                amount=threshold // 20,
+            )
+            for card in cards
+            for kind, threshold in (("basic", 300000), ("additional", 700000))
+        ],
+    )
+    promotions = create(
+        CardAdditionalPromotion,
+        [
+            CardAdditionalPromotion(
+                card=card,
+                title=f"{card.name} 캐시백",
+                cashback_amount=rng.randrange(50000, 200001, 10000),
+            )
+            for card in cards
+        ],
+    )
+    if series:
+        create(
+            CardAdditionalPromotion.target_series.through,
+            [
+                CardAdditionalPromotion.target_series.through(
+                    cardadditionalpromotion_id=promotion.id,
+                    productseries_id=series[i % len(series)].id,
+                )
+                for i, promotion in enumerate(promotions)
+            ],
+        )
+
+
+def _build_internet(create, scale, rng):
+    carriers = create(
+        InternetCarrier,
+        [
+            InternetCarrier(name=name, logo=f"carrier_logos/synthetic_{i}.png")
+            for i, name in enumerate(INTERNET_CARRIERS)
+        ],
+    )
+    tv_plans = create(
+        TVPlan,
+        [
+            TVPlan(
+                carrier=carrier,
+                name=f"{carrier.name} TV {i}",
+                channel_count=100 + i * 50,
+                tv_price_per_month=rng.randrange(10000, 25001, 100),
+            )
+            for carrier in carriers
+            for i in range(2)
+        ],
+    )
+    create(
+        WifiOption,
+        [
+            WifiOption(carrier=carrier, name=f"{carrier.name} 와이파이")
+            for carrier in carriers
+        ],
+    )
+    create(
+        SettopBoxOption,
+        [
+            SettopBoxOption(carrier=carrier, name=f"{carrier.name} 셋톱")
+            for carrier in carriers
+        ],
+    )
+    create(
+        InstallationOption,
+        [
+            InstallationOption(
+                carrier=carrier, installation_type=kind, installation_fee=fee
+            )
+            for carrier in carriers
+            for kind, fee in (("I", 36000), ("T", 22000))
+        ],
+    )
+    plans = create(
+        InternetPlan,
+        [
+            InternetPlan(
+                carrier=carrier,
+                name=f"{carrier.name} 인터넷 {i:03d}",
+                speed=("100M", "500M", "1G")[i % 3],
+                internet_price_per_month=rng.randrange(20000, 50001, 100),
+            )
+            for carrier in carriers
+            for i in range(scale.internet_plans_per_carrier)
+        ],
+    )
+    tv_by_carrier = {}
+    for tv_plan in tv_plans:
+        tv_by_carrier.setdefault(tv_plan.carrier_id, []).append(tv_plan)
+    conditions = create(
+        BundleCondition,
+        [
+            BundleCondition(
+                carrier_id=plan.carrier_id,
+                internet_plan=plan,
+                tv_plan=tv_plan,
+                mobile_type="MNO",
+            )
+            for plan in plans
+            for tv_plan in [None, *tv_by_carrier[plan.carrier_id]]
+        ],
+    )
+    create(
+        BundleDiscount,
+        [
+            BundleDiscount(
+                bundle_condition=condition,
+                bundle_name="결합할인",
+                discount_type=discount_type,
+                discount_amount=rng.randrange(1000, 11001, 500),
+            )
+            for condition in conditions
+            for discount_type in ("Internet", "Mobile")
+        ],
+    )
+    create(
+        BundlePromotion,
+        [
+            BundlePromotion(
+                bundle_condition=condition,
+                cash_amount=rng.randrange(0, 400001, 10000),
+            )
+            for condition in conditions
+        ],
+    )
+
+
+def _build_open_market(create, scale, variants, options, plans):
+    if not scale.open_markets:
+        return
+    sources = OPEN_MARKETS[: scale.open_markets]
+    markets = {}
+    for market in OpenMarket.objects.filter(source__in=sources).order_by("id"):
+        markets.setdefault(market.source, market)
+    missing = [source for source in sources if source not in markets]
+    for market in create(OpenMarket, [OpenMarket(source=s) for s in missing]):
+        markets[market.source] = market
+
+    # 판매자 코드 규칙(get_capacity / get_carrier / get_contract_type)을 따른다
+    products = create(
+        OpenMarketProduct,
+        [
+            OpenMarketProduct(
+                open_market=markets[source],
+                device_variant=variant,
+                seller_code=(
+                    f"SYN{variant.device_id}_{_capacity(variant.storage_capacity)}"
+                    f"_{carrier}_{'DEVICE' if contract == ContractTypeChoices.CHANGE else 'MNP'}"
+                ),
+                name=f"Synthetic {variant.device_id:05d} {variant.storage_capacity}",
+                om_product_id=f"{source}-{variant.id}-{carrier}-{contract}",
+            )
+            for source in sources
+            for variant in variants
+            for carrier in scale.carrier_codes
+            for contract in (ContractTypeChoices.MNP, ContractTypeChoices.CHANGE)
+        ],
+    )
+    plan_carrier = {plan.id: plan.carrier for plan in plans}
+    subsidy_options = {}
+    for option in options:
+        if option.discount_type == DiscountTypeChoices.SUBSIDY:
+            key = (option.device_variant_id, plan_carrier[option.plan_id])
+            subsidy_options.setdefault((*key, option.contract_type), []).append(option)
+    create(
+        OpenMarketProductOption,
+        [
+            OpenMarketProductOption(
+                open_market_product=om_product,
+                pio_product_option=option,
+                option_name=f"{om_product.get_carrier()} {option.plan_id}",
+                price=option.final_price,
+            )
+            for om_product in products
+            for option in subsidy_options.get(
+                (
+                    om_product.device_variant_id,
+                    om_product.get_carrier(),
+                    om_product.get_contract_type(),
+                ),
+                [],
+            )
+        ],
+    )
+
+
+def _capacity(storage_capacity: str) -> str:
+    if storage_capacity.endswith("TB"):
+        return str(int(storage_capacity[:-2]) * 1024)
+    return storage_capacity.removesuffix("GB")
+
+
+_PRICE_HISTORY_SQL = f"""
+    INSERT INTO {PriceHistory._meta.db_table}
+        (product_id, carrier, final_price, plan_id, price_at, created_at, updated_at)
+    SELECT r.product_id, r.carrier, r.final_price, r.plan_id, r.price_at,
+           %(now)s, %(now)s
+    FROM unnest(
+        %(product_ids)s::integer[], %(carriers)s::varchar[],
+        %(final_prices)s::integer[], %(plan_ids)s::integer[], %(days)s::date[]
+    ) AS r(product_id, carrier, final_price, plan_id, price_at)
+    ON CONFLICT DO NOTHING
+"""
+
+
+def _build_price_history(scale, rng, options, plans) -> dict:
+    if not scale.price_history_days:
+        return {}
+    today = timezone.now().date()
+    start = today - timedelta(days=scale.price_history_days - 1)
+
+    # (product, carrier) 별 오늘 최저가 공시지원금 옵션 (price_snapshot 과 같은 대상)
+    plan_carrier = {plan.id: plan.carrier for plan in plans}
+    cheapest = {}
+    for option in options:
+        if option.discount_type != DiscountTypeChoices.SUBSIDY:
+            continue
+        key = (option.product_id, plan_carrier[option.plan_id])
+        if key not in cheapest or option.final_price < cheapest[key].final_price:
+            cheapest[key] = option
+
+    # 오늘 가격에서 과거로 거슬러 가며 가격이 바뀐 날만 기록 (첫날은 항상 기록)
+    rows = {
+        "product_ids": [],
+        "carriers": [],
+        "final_prices": [],
+        "plan_ids": [],
+        "days": [],
+    }
+    for (product_id, carrier), option in cheapest.items():
+        price = option.final_price
+        for offset in range(scale.price_history_days):
+            day = today - timedelta(days=offset)
+            if offset and day != start and rng.random() >= PRICE_CHANGE_RATE:
+                continue
+            rows["product_ids"].append(product_id)
+            rows["carriers"].append(carrier)
+            rows["final_prices"].append(price)
+            rows["plan_ids"].append(option.plan_id)
+            rows["days"].append(day)
+            price += rng.randrange(-2, 6) * 10000
+
+    with connection.cursor() as cursor:
+        cursor.execute(_PRICE_HISTORY_SQL, {**rows, "now": timezone.now()})
+        inserted = cursor.rowcount
+    daily = refresh_daily_prices(cheapest.keys(), start, today)
+    return {"PriceHistory": inserted, "PriceHistoryDaily": daily}
+
+
+def _build_calculator_sessions(create, scale, rng, products):
+    if not scale.calculator_sessions or not products:
+        return
+    sessions = []
+    for _ in range(scale.calculator_sessions):
+        product = rng.choice(products)
+        option = product.best_price_option or ProductOption()
+        pio_total = rng.randrange(1500000, 4000001, 1000)
+        selfbuy_total = pio_total + rng.randrange(-300000, 500001, 1000)
+        official_total = pio_total + rng.randrange(0, 800001, 1000)
+        sessions.append(
+            CalculatorSession(
+                id=uuid.UUID(int=rng.getrandbits(128), version=4),
+                funnel_variant=rng.choice(FunnelVariantChoices.VALUES),
+                carrier=rng.choice(scale.carrier_codes),
+                keep_carrier=rng.random() < 0.5,
+                device=product,
+                device_name=product.name,
+                device_price=option.device_price or 0,
+                public_subsidy=option.subsidy_amount or 0,
+                additional_discount=option.additional_discount or 0,
+                card=rng.random() < 0.3,
+                pio_total=pio_total,
+                selfbuy_total=selfbuy_total,
+                official_total=official_total,
+                official_vs_pio=official_total - pio_total,
+                total_saving=max(selfbuy_total, official_total) - pio_total,
+                winner=rng.choice(WinnerChoices.VALUES),
+                contact_channel=(
+                    rng.choice(ContactChannelChoices.VALUES)
+                    if rng.random() < LEAD_RATE
+                    else None
+                ),
+            )
+        )
+    create(CalculatorSession, sessions)
@@ -15,6 +15,7 @@ from phone.external_services.channel_talk import (
     send_open_market_update_failure_alert,
     send_open_market_order_alert,
     send_open_market_settlement_alert,
+    send_ops_failure_alert,
 )
 from phone.external_services.st_11.check_order.get_order_list import (
     get_unhandled_order_list_today,
@@ -382,3 +383,156 @@ def task_push_google_merchant():
             "푸시", 0, str(e), market="Google Merchant"
         )
         raise
+
+
+@shared_task
+def task_flush_calculator_sessions():
+    """write-behind 버퍼에 쌓인 CalculatorSession 을 배치로 bulk_create 한다.
+
+    CALCULATOR_WRITE_BEHIND 가 꺼져 있으면 아무것도 하지 않는다. beat 주기가 짧아
+    실패 시 채널톡 알림 대신 예외만 남기고, ack 되지 않은 entry 는 이후 주기에
+    회수되어 재시도된다.
+    """
+    from django.conf import settings
+
+    from phone.calculator_buffer import flush_session_buffer
+
+    if not settings.CALCULATOR_WRITE_BEHIND:
+        return 0
+    return flush_session_buffer()
+
+
+@shared_task
+def task_deliver_channel_talk_outbox():
+    """채널톡 알림 outbox 를 한 배치 발송한다.
+
+    개별 메시지 실패는 outbox row 의 재시도(백오프)로 처리되므로 여기서는 알림을
+    보내지 않는다 - 채널톡 자체 장애일 때 실패 알림도 채널톡이라 의미가 없다.
+    """
+    from phone.external_services.channel_talk_outbox import deliver_outbox
+
+    return deliver_outbox()
+
+
+@shared_task(bind=True, max_retries=5)
+def task_flush_revalidation(self):
+    """ISR revalidate 대기열을 중복 제거해 한 번에 전송한다.
+
+    실패하면 태그는 대기열로 돌아가고 지수 백오프로 재시도한다. 재시도 체인이 진행
+    중인 동안 beat/enqueue 로 들어온 실행은 건너뛰어 체인이 하나만 돌게 한다.
+    재시도를 모두 소진하면 채널톡으로 알리되, 장애 한 번에 한 번만 보낸다 (전송이
+    다시 성공하면 알림 상태가 풀린다). 태그는 대기열에 남아 다음 flush 때 다시 시도된다.
+    """
+    from django.core.cache import cache
+    from phone.revalidate import (
+        OUTAGE_ALERTED_KEY,
+        RETRY_PENDING_KEY,
+        RevalidationFailed,
+        flush_revalidation_queue,
+    )
+
+    if not self.request.retries and cache.get(RETRY_PENDING_KEY):
+        return {"calls": 0, "tags": 0, "coalesced": 0}
+
+    try:
+        stats = flush_revalidation_queue()
+    except RevalidationFailed as e:
+        if self.request.retries >= self.max_retries:
+            cache.delete(RETRY_PENDING_KEY)
+            if cache.add(OUTAGE_ALERTED_KEY, 1, timeout=None):
+                send_ops_failure_alert("ISR revalidate", str(e))
+            raise
+        countdown = 5 * 2**self.request.retries
+        cache.set(RETRY_PENDING_KEY, 1, timeout=countdown + 60)
+        raise self.retry(exc=e, countdown=countdown)
+    cache.delete(RETRY_PENDING_KEY)
+    return stats
+
+
+@shared_task
+def task_publish_catalog_snapshot():
+    """상품 목록(통신사별) / 상세 / 시리즈 응답을 S3 정적 JSON 으로 발행한다 (CloudFront).
+
+    가격/재고 변경 시 schedule_catalog_snapshot 으로 예약되고 beat 에서도 매시간 돈다.
+    바뀐 응답만 올리고, 바뀐 게 없으면 manifest 도 그대로 둔다.
+    """
+    from django.conf import settings
+
+    from phone.catalog_snapshot import publish_catalog_snapshot
+
+    if not settings.CATALOG_SNAPSHOT_ENABLED:
+        return None
+    return publish_catalog_snapshot()
+
+
+@shared_task
+def task_match_price_alerts(product_ids=None):
+    """목표가에 도달한 가격 알림 요청을 매칭해 채널톡 outbox 에 적재한다.
+
+    엑셀 가격 업로드 직후 큐잉되고, beat 에서도 주기적으로 실행된다.
+    매칭된 요청은 선점 시점에 notified_at 이 찍히고 같은 트랜잭션에서 outbox 에 들어간다.
+    실제 발송과 재시도는 task_deliver_channel_talk_outbox 가 맡는다. outbox row 가
+    재시도를 소진해 FAILED 로 남으면 그 알림은 다시 매칭되지 않는다 (notified_at 유지).
+    """
+    from phone.price_alerts import match_price_alerts
+
+    return match_price_alerts(product_ids=product_ids)
+
+
+@shared_task
+def task_extend_daily_prices():
+    """가격 변동이 없는 날에도 차트용 일별 가격 시리즈를 오늘까지 이어 붙인다."""
+    from phone.price_series import extend_daily_prices
+
+    return extend_daily_prices()
+
+
+@shared_task
+def task_snapshot_price_history(backfill_days=0):
+    """활성 상품의 (product, carrier) 최저가를 오늘 날짜 PriceHistory 로 기록한다.
+
+    backfill_days 를 주면 그 기간 중 스냅샷이 빠진 날을 직전 기록 가격으로 먼저 채운다.
+    """
+    from datetime import timedelta
+
+    from phone.price_snapshot import backfill_price_history, snapshot_price_history
+
+    try:
+        if backfill_days:
+            backfill_price_history(timezone.now().date() - timedelta(days=backfill_days))
+        return snapshot_price_history()
+    except Exception as e:
+        send_ops_failure_alert("PriceHistory 스냅샷", str(e))
+        raise
+
+
+@shared_task
+def task_ensure_partitions():
+    """월별 파티션 테이블의 다음 달 파티션을 미리 만든다 (오래된 파티션 정리는 커맨드로만)."""
+    from phone.partitioning import ensure_partitions
+
+    try:
+        return ensure_partitions()
+    except Exception as e:
+        send_ops_failure_alert("파티션 생성", str(e))
+        raise
+
+
+@shared_task
+def task_purge_soft_deleted(max_seconds=600):
+    """보관 기간이 지난 soft delete row 를 배치로 archive / 삭제한다 (실행당 시간 제한)."""
+    from phone.soft_delete_purge import purge_soft_deleted
+
+    try:
+        return purge_soft_deleted(max_seconds=max_seconds)
+    except Exception as e:
+        send_ops_failure_alert("soft delete 정리", str(e))
+        raise
+
+
+@shared_task
+def task_purge_request_metrics():
+    """보관 기간이 지난 RequestMetric 을 지운다."""
+    from phone.request_metrics import purge_request_metrics
+
+    return purge_request_metrics()
@@ -0,0 +1,66 @@
+from django.test import TestCase, override_settings
+
+from phone.api_benchmark import (
+    TRAFFIC_MIX,
+    BenchmarkTargets,
+    InProcessTransport,
+    compare_to_baseline,
+    run_benchmark,
+)
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+
+@override_settings(
+    DEBUG=False,
+    REQUEST_METRICS_ENABLED=False,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+)
+class RunBenchmarkTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        build_catalog(CatalogScale(products=3, price_history_days=30))
+
+    def test_replays_every_endpoint_in_mix(self):
+        result = run_benchmark(
+            InProcessTransport(), BenchmarkTargets.from_db(), requests=80, warmup=0
+        )
+
+        self.assertEqual(set(result["endpoints"]), set(TRAFFIC_MIX))
+        for name, stats in result["endpoints"].items():
+            self.assertEqual(stats["errors"], 0, name)
+            self.assertGreater(stats["queries"], 0, name)
+            self.assertLessEqual(stats["p50_ms"], stats["p95_ms"])
+        self.assertGreater(result["throughput_rps"], 0)
+
+    def test_unknown_endpoint_in_mix(self):
+        with self.assertRaises(ValueError):
+            run_benchmark(
+                InProcessTransport(), BenchmarkTargets.from_db(), mix={"nope": 1}
+            )
+
+
+class CompareToBaselineTest(TestCase):
+    def stats(self, p95_ms, queries):
+        return {"endpoints": {"product_detail": {"p95_ms": p95_ms, "queries": queries}}}
+
+    def test_flags_slower_p95_beyond_threshold(self):
+        regressions = compare_to_baseline(
+            self.stats(130, 15), self.stats(100, 15), threshold=0.2
+        )
+
+        self.assertEqual([name for name, _ in regressions], ["product_detail"])
+
+    def test_flags_any_extra_query(self):
+        regressions = compare_to_baseline(self.stats(100, 16), self.stats(100, 15))
+
+        self.assertIn("쿼리 15 → 16", regressions[0][1])
+
+    def test_within_threshold_is_not_regression(self):
+        self.assertEqual(
+            compare_to_baseline(self.stats(110, 15), self.stats(100, 15), 0.2), []
+        )
@@ -0,0 +1,21 @@
+from django.test import SimpleTestCase
+
+from phone.async_benchmark import capacity, serve
+
+
+class CapacityTest(SimpleTestCase):
+    def test_highest_concurrency_within_budget(self):
+        rows = [
+            {"concurrency": 1, "worst_p95_ms": 50, "errors": 0},
+            {"concurrency": 16, "worst_p95_ms": 300, "errors": 0},
+            {"concurrency": 32, "worst_p95_ms": 450, "errors": 2},
+            {"concurrency": 64, "worst_p95_ms": 900, "errors": 0},
+        ]
+
+        self.assertEqual(capacity(rows, p95_budget_ms=500), 16)
+        self.assertEqual(capacity(rows, p95_budget_ms=10), 0)
+
+    def test_unknown_deployment(self):
+        with self.assertRaises(ValueError):
+            with serve("daphne"):
+                pass
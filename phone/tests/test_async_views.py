@@ -0,0 +1,107 @@
+from asgiref.sync import sync_to_async
+from django.test import AsyncRequestFactory, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from phone.models import Product
+from phone.synthetic_catalog import CatalogScale, build_catalog
+from phone.views import async_views
+
+
+# 이미지 URL 생성에 S3/CloudFront 설정이 필요 없도록 메모리 storage 사용
+@override_settings(
+    REQUEST_METRICS_ENABLED=False,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+)
+class AsyncReadViewTest(TestCase):
+    """async view 응답이 같은 경로의 sync(DRF) view 응답과 바이트 단위로 같은지 확인."""
+
+    @classmethod
+    def setUpTestData(cls):
+        build_catalog(CatalogScale(products=5, price_history_days=40))
+        cls.product = Product.objects.order_by("id").first()
+
+    def setUp(self):
+        self.client = APIClient()
+        self.factory = AsyncRequestFactory()
+
+    async def assertSameResponse(self, view, path, *args):
+        sync_response = await self.get_sync(path)
+        async_response = await view(self.factory.get(path), *args)
+
+        self.assertEqual(async_response.status_code, sync_response.status_code, path)
+        self.assertEqual(async_response.content, sync_response.content, path)
+        return async_response
+
+    async def get_sync(self, path):
+        return await sync_to_async(self.client.get)(path)
+
+    async def test_product_list(self):
+        for query in ("", "?carrier=SK", "?carrier=KT&is_featured=false"):
+            response = await self.assertSameResponse(
+                async_views.product_list, f"/phone/products{query}"
+            )
+            self.assertEqual(response.status_code, 200)
+
+    async def test_product_list_not_found(self):
+        response = await self.assertSameResponse(
+            async_views.product_list, "/phone/products?brand=없는제조사"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_product_detail(self):
+        for query in ("", "?carrier=LG"):
+            response = await self.assertSameResponse(
+                async_views.product_detail,
+                f"/phone/products/{self.product.id}{query}",
+                self.product.id,
+            )
+            self.assertEqual(response.status_code, 200)
+
+    async def test_product_detail_increments_views(self):
+        before = self.product.views
+
+        await async_views.product_detail(
+            self.factory.get(f"/phone/products/{self.product.id}"), self.product.id
+        )
+
+        await self.product.arefresh_from_db()
+        self.assertEqual(self.product.views, before + 1)
+
+    async def test_product_detail_not_found(self):
+        response = await self.assertSameResponse(
+            async_views.product_detail, "/phone/products/0", 0
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_price_history_chart(self):
+        for query in (
+            f"product_id={self.product.id}&period=1month",
+            f"product_id={self.product.id}&period=1year",
+            "product_id=0",
+            "product_id=abc",
+            f"product_id={self.product.id}&period=2days",
+        ):
+            await self.assertSameResponse(
+                async_views.price_history_chart, f"/phone/price-history-chart?{query}"
+            )
+
+    async def test_price_history_chart_batch(self):
+        for query in (
+            f"product_ids={self.product.id},0&periods=1week,3months",
+            "product_ids=",
+            "product_ids=1,x",
+        ):
+            await self.assertSameResponse(
+                async_views.price_history_chart_batch,
+                f"/phone/price-history-chart/batch?{query}",
+            )
+
+    async def test_rejects_post(self):
+        response = await async_views.product_list(self.factory.post("/phone/products"))
+
+        self.assertEqual(response.status_code, 405)
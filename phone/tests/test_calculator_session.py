@@ -3,14 +3,14 @@ from concurrent.futures import ThreadPoolExecutor
 from unittest import mock, skipUnless
 
 from django.db import connection
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 from rest_framework.test import APIClient
 
-CHANNELTALK_PATCH_TARGET = "phone.views.calculator_views.send_calculator_lead_alert"
+CHANNELTALK_PATCH_TARGET = "phone.views.calculator_views.queue_calculator_lead_alert"
 
 
 class _MockChannelTalkMixin:
-    """모든 PATCH 흐름이 외부 ChannelTalk 호출을 하지 않도록 차단."""
+    """모든 PATCH 흐름의 ChannelTalk 알림 적재(outbox)를 mock 으로 대체."""
 
     def setUp(self):  # noqa: D401
         super().setUp()
@@ -404,24 +404,39 @@ class IntegrationTests(_MockChannelTalkMixin, TestCase):
         self.assertEqual(self.mock_send_alert.call_count, 0)
 
     def test_patch_alert_failure_does_not_break_response(self):
-        # 알림 실패가 사용자 응답을 막지 않아야 한다.
-        self.mock_send_alert.side_effect = RuntimeError("ChannelTalk 5xx")
+        # 알림은 outbox 에 적재만 하므로 채널톡 장애가 사용자 응답을 막지 않는다.
+        from phone.external_services.channel_talk_outbox import deliver_outbox
+        from phone.models import ChannelTalkOutbox
 
+        self._channel_talk_patcher.stop()
         post = self.client.post(CALC_URL, _payload(), format="json")
         sid = post.json()["id"]
 
-        response = self.client.patch(
-            _detail_url(sid),
-            {
-                "contact_channel": ContactChannelChoices.PHONE,
-                "submitted_name": "홍길동",
-                "submitted_contact": "010-1234-5678",
-            },
-            format="json",
-        )
+        with mock.patch(
+            "phone.external_services.channel_talk_outbox.ChannelTalkAPI.post",
+            side_effect=RuntimeError("ChannelTalk 5xx"),
+        ) as mock_post:
+            response = self.client.patch(
+                _detail_url(sid),
+                {
+                    "contact_channel": ContactChannelChoices.PHONE,
+                    "submitted_name": "홍길동",
+                    "submitted_contact": "010-1234-5678",
+                },
+                format="json",
+            )
+            mock_post.assert_not_called()
 
-        self.assertEqual(response.status_code, 200)
-        self.assertTrue(response.json().get("applied"))
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.json().get("applied"))
+
+            outbox = ChannelTalkOutbox.objects.get(kind="calculator_lead")
+            self.assertIn(sid, outbox.body["blocks"][0]["value"])
+            self.assertEqual(deliver_outbox()["failed"], 1)
+
+        outbox.refresh_from_db()
+        self.assertEqual(outbox.attempts, 1)
+        self.assertEqual(outbox.status, "pending")
 
 
 class IdentityTests(_MockChannelTalkMixin, TestCase):
@@ -573,3 +588,199 @@ class ConcurrentPatchTests(_MockChannelTalkMixin, TransactionTestCase):
             instance.contact_channel,
             (ContactChannelChoices.PHONE, ContactChannelChoices.KAKAO),
         )
+
+
+@override_settings(
+    CALCULATOR_WRITE_BEHIND=True,
+    CALCULATOR_SESSION_BUFFER="phone.calculator_buffer.InMemorySessionBuffer",
+)
+class WriteBehindTests(_MockChannelTalkMixin, TestCase):
+    """CALCULATOR_WRITE_BEHIND=True — POST 는 버퍼에만 쓰고 워커가 bulk_create."""
+
+    def setUp(self):
+        super().setUp()
+        from phone.calculator_buffer import get_session_buffer
+
+        get_session_buffer.cache_clear()
+        self.addCleanup(get_session_buffer.cache_clear)
+        self.client = APIClient()
+        self.sk_carrier = InternetCarrier.objects.create(name="SK 인터넷")
+
+    def test_post_returns_201_without_insert(self):
+        with self.assertNumQueries(0):
+            response = self.client.post(CALC_URL, _payload(), format="json")
+        self.assertEqual(response.status_code, 201)
+        uuid.UUID(response.json()["id"])
+        self.assertFalse(CalculatorSession.objects.exists())
+
+    def test_flush_bulk_creates_buffered_sessions(self):
+        from phone.calculator_buffer import flush_session_buffer
+
+        payload = _payload()
+        payload["answers"]["internet"] = [self.sk_carrier.id, 99999]
+        ids = [
+            self.client.post(CALC_URL, payload, format="json").json()["id"]
+            for _ in range(3)
+        ]
+
+        self.assertEqual(flush_session_buffer(batch_size=2), 3)
+        self.assertEqual(flush_session_buffer(), 0)
+
+        self.assertEqual(CalculatorSession.objects.filter(id__in=ids).count(), 3)
+        instance = CalculatorSession.objects.get(id=ids[0])
+        self.assertEqual(instance.device_name, "갤럭시 S26 Ultra")
+        self.assertEqual(
+            list(instance.internet_carriers.values_list("id", flat=True)),
+            [self.sk_carrier.id],
+        )
+
+    def test_flush_dead_letters_invalid_rows_and_acks_batch(self):
+        from phone.calculator_buffer import flush_session_buffer, get_session_buffer
+
+        ids = [
+            self.client.post(CALC_URL, _payload(), format="json").json()["id"]
+            for _ in range(3)
+        ]
+        buffer = get_session_buffer()
+        buffer.pending[ids[0]]["fields"]["device_id"] = 999999
+        buffer.pending[ids[1]]["fields"]["device_name"] = "x" * 200
+
+        with self.assertLogs("phone.calculator_buffer", "ERROR") as logs:
+            self.assertEqual(flush_session_buffer(), 3)
+
+        self.assertEqual(
+            list(CalculatorSession.objects.values_list("id", flat=True)),
+            [uuid.UUID(ids[2])],
+        )
+        self.assertEqual(buffer.stream, [])
+        self.assertEqual([dead["payload"]["id"] for dead in buffer.dead], ids[:2])
+        self.assertIn(ids[0], logs.output[0])
+        self.assertEqual(flush_session_buffer(), 0)
+
+    def test_get_dead_letters_unpersistable_session(self):
+        from phone.calculator_buffer import flush_session_buffer, get_session_buffer
+
+        sid = self.client.post(CALC_URL, _payload(), format="json").json()["id"]
+        buffer = get_session_buffer()
+        buffer.pending[sid]["fields"]["device_id"] = 999999
+
+        with self.assertLogs("phone.calculator_buffer", "ERROR"):
+            response = self.client.get(_detail_url(sid))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual([dead["payload"]["id"] for dead in buffer.dead], [sid])
+        self.assertIsNone(buffer.get(sid))
+        self.assertEqual(flush_session_buffer(), 1)
+        self.assertEqual(buffer.stream, [])
+        self.assertEqual(len(buffer.dead), 1)
+
+    def test_patch_before_flush_keeps_first_write_wins(self):
+        from phone.calculator_buffer import flush_session_buffer
+
+        sid = self.client.post(CALC_URL, _payload(), format="json").json()["id"]
+
+        first = self.client.patch(
+            _detail_url(sid),
+            {
+                "contact_channel": ContactChannelChoices.PHONE,
+                "submitted_name": "홍길동",
+                "submitted_contact": "010-1234-5678",
+            },
+            format="json",
+        )
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(first.json()["applied"])
+
+        # 워커가 뒤늦게 같은 row 를 flush 해도 lead 정보를 덮어쓰지 않는다.
+        flush_session_buffer()
+        second = self.client.patch(
+            _detail_url(sid),
+            {"contact_channel": ContactChannelChoices.KAKAO},
+            format="json",
+        )
+        self.assertFalse(second.json()["applied"])
+
+        instance = CalculatorSession.objects.get(id=sid)
+        self.assertEqual(instance.contact_channel, ContactChannelChoices.PHONE)
+        self.assertEqual(instance.submitted_name, "홍길동")
+        self.mock_send_alert.assert_called_once()
+
+    def test_get_before_flush(self):
+        sid = self.client.post(CALC_URL, _payload(), format="json").json()["id"]
+        response = self.client.get(_detail_url(sid))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["id"], sid)
+
+
+class PartnerCardCacheTests(TestCase):
+    """calculator POST 검증이 PartnerCard 프로세스 캐시를 쓰는지."""
+
+    def setUp(self):
+        from phone.models import PartnerCard
+        from phone.partner_card_cache import invalidate_partner_card_index
+        from phone.serializers import CalculatorSessionCreateSerializer
+
+        invalidate_partner_card_index()
+        self.addCleanup(invalidate_partner_card_index)
+        self.CreateSerializer = CalculatorSessionCreateSerializer
+        self.card = PartnerCard.objects.create(
+            name="Deep Dream", carriers=[CarrierChoices.SK]
+        )
+
+    def _payload_with_card(self, card_id):
+        payload = _payload()
+        payload["auto_selected"]["partner_card_slots"] = [
+            {
+                "slot": CardSlotChoices.INSTALLMENT,
+                "card_id": card_id,
+                "card_name": "Deep Dream",
+                "spend_allocated": 300000,
+                "amount_monthly": 10000,
+            }
+        ]
+        return payload
+
+    def test_validation_makes_no_queries_when_warm(self):
+        self.assertTrue(
+            self.CreateSerializer(data=self._payload_with_card(self.card.id)).is_valid()
+        )
+        with self.assertNumQueries(0):
+            ser = self.CreateSerializer(data=self._payload_with_card(self.card.id))
+            self.assertTrue(ser.is_valid(), msg=str(ser.errors))
+
+    def test_soft_delete_invalidates_cache(self):
+        self.assertTrue(
+            self.CreateSerializer(data=self._payload_with_card(self.card.id)).is_valid()
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.card.delete()
+        ser = self.CreateSerializer(data=self._payload_with_card(self.card.id))
+        self.assertFalse(ser.is_valid())
+        self.assertIn("auto_selected", ser.errors)
+
+    def test_new_card_visible_after_save(self):
+        from phone.models import PartnerCard
+        from phone.partner_card_cache import get_partner_card_index
+
+        get_partner_card_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            card = PartnerCard.objects.create(name="신규", carriers=[CarrierChoices.KT])
+        self.assertEqual(
+            get_partner_card_index()[card.id].carriers, (CarrierChoices.KT,)
+        )
+
+    def test_invalidation_waits_for_commit(self):
+        from phone.partner_card_cache import get_partner_card_index
+
+        get_partner_card_index()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.card.delete()
+            # commit 전에는 캐시가 그대로 (다른 요청이 commit 전 데이터로 채우지 않도록)
+            self.assertIn(self.card.id, get_partner_card_index())
+        self.assertEqual(len(callbacks), 1)
+
+    @override_settings(PARTNER_CARD_CACHE_TTL=0)
+    def test_ttl_zero_disables_cache(self):
+        self.CreateSerializer(data=self._payload_with_card(self.card.id)).is_valid()
+        with self.assertNumQueries(1):
+            self.CreateSerializer(data=self._payload_with_card(self.card.id)).is_valid()
@@ -0,0 +1,125 @@
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from phone.catalog_snapshot import (
+    MANIFEST,
+    InMemorySnapshotStore,
+    build_snapshot,
+    publish_catalog_snapshot,
+    schedule_catalog_snapshot,
+)
+from phone.models import Product
+from phone.revalidate import revalidate_products
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+
+@override_settings(
+    REQUEST_METRICS_ENABLED=False,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+)
+class PublishCatalogSnapshotTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        build_catalog(CatalogScale(products=3))
+        cls.product = Product.objects.order_by("id").first()
+
+    def setUp(self):
+        self.store = InMemorySnapshotStore()
+        self.client = APIClient()
+
+    def manifest(self):
+        return json.loads(self.store.get(MANIFEST))
+
+    def test_objects_match_api_responses(self):
+        publish_catalog_snapshot(self.store)
+        objects = self.manifest()["objects"]
+
+        for path in (
+            "products",
+            "products?carrier=SK",
+            f"products/{self.product.id}",
+            f"products/{self.product.id}?carrier=KT",
+            "product-series",
+        ):
+            response = self.client.get(f"/phone/{path}")
+            self.assertEqual(response.status_code, 200, path)
+            self.assertEqual(self.store.get(objects[path]), response.content, path)
+
+    def test_not_found_responses_are_left_to_api(self):
+        Product.objects.update(is_active=False)
+
+        publish_catalog_snapshot(self.store)
+
+        self.assertEqual(list(self.manifest()["objects"]), ["product-series"])
+
+    def test_republish_uploads_only_changes(self):
+        first = publish_catalog_snapshot(self.store)
+        self.assertTrue(first["changed"])
+        self.assertEqual(first["uploaded"], first["objects"])
+        self.assertEqual(self.store.objects[MANIFEST][1], "public, max-age=30")
+
+        again = publish_catalog_snapshot(self.store)
+        self.assertEqual(again, {**first, "uploaded": 0, "changed": False})
+
+        self.product.is_active = False
+        self.product.save(update_fields=["is_active"])
+        changed = publish_catalog_snapshot(self.store)
+
+        self.assertTrue(changed["changed"])
+        self.assertLess(changed["uploaded"], changed["objects"])
+        self.assertNotIn(f"products/{self.product.id}", self.manifest()["objects"])
+        self.assertIn(f"manifests/{first['version']}.json", self.store.objects)
+
+    def test_publish_holds_advisory_lock(self):
+        def advisory_locks():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT count(*) FROM pg_locks "
+                    "WHERE locktype = 'advisory' AND pid = pg_backend_pid()"
+                )
+                return cursor.fetchone()[0]
+
+        held = []
+
+        def build():
+            held.append(advisory_locks())
+            return build_snapshot()
+
+        with mock.patch("phone.catalog_snapshot.build_snapshot", side_effect=build):
+            publish_catalog_snapshot(self.store)
+
+        self.assertEqual(held, [1])
+        self.assertEqual(advisory_locks(), 0)
+
+
+class ScheduleCatalogSnapshotTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @override_settings(CATALOG_SNAPSHOT_ENABLED=True)
+    def test_changes_are_coalesced_into_one_publish(self):
+        with mock.patch(
+            "phone.tasks.task_publish_catalog_snapshot.apply_async"
+        ) as apply_async, self.captureOnCommitCallbacks(execute=True):
+            revalidate_products()
+            schedule_catalog_snapshot()
+
+        apply_async.assert_called_once_with(countdown=30)
+
+    def test_disabled_does_not_schedule(self):
+        with mock.patch(
+            "phone.tasks.task_publish_catalog_snapshot.apply_async"
+        ) as apply_async, self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(schedule_catalog_snapshot())
+
+        apply_async.assert_not_called()
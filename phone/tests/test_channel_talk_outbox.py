@@ -0,0 +1,172 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from phone.constants import OutboxStatusChoices
+from phone.external_services.channel_talk_outbox import (
+    DELIVER_LOCK_KEY,
+    batch_lease,
+    deliver_outbox,
+    enqueue_group_message,
+    queue_order_alert,
+    queue_price_alert_event,
+)
+from phone.models import ChannelTalkOutbox
+
+POST_TARGET = "phone.external_services.channel_talk_outbox.ChannelTalkAPI.post"
+OK = {"message": {"id": "1"}}
+
+
+class EnqueueTest(TestCase):
+    def test_queue_order_alert_builds_group_message(self):
+        row = queue_order_alert(12, "홍길동", "01012345678")
+        self.assertEqual(row.kind, "order")
+        self.assertEqual(row.status, OutboxStatusChoices.PENDING)
+        self.assertEqual(
+            row.body,
+            {
+                "blocks": [
+                    {"type": "text", "value": "주문 알림: 12, 홍길동, 01012345678"}
+                ]
+            },
+        )
+
+
+class DeliverOutboxTest(TestCase):
+    def test_sends_pending_rows_in_order(self):
+        first = enqueue_group_message("order", "100", "a")
+        second = enqueue_group_message("inquiry", "200", "b")
+
+        with mock.patch(POST_TARGET, return_value=OK) as mock_post:
+            counts = deliver_outbox()
+
+        self.assertEqual(counts, {"sent": 2, "failed": 0, "deferred": 0})
+        self.assertEqual(
+            [c.kwargs["path"] for c in mock_post.call_args_list],
+            ["/open/v5/groups/100/messages", "/open/v5/groups/200/messages"],
+        )
+        for row in (first, second):
+            row.refresh_from_db()
+            self.assertEqual(row.status, OutboxStatusChoices.SENT)
+            self.assertEqual(row.attempts, 1)
+            self.assertIsNotNone(row.sent_at)
+
+        with mock.patch(POST_TARGET) as mock_post:
+            deliver_outbox()
+        mock_post.assert_not_called()
+
+    @override_settings(CHANNEL_TALK_GROUP_MIN_INTERVAL=0.5)
+    def test_lease_outlasts_worst_case_batch(self):
+        rows = [enqueue_group_message("order", str(i), "a") for i in range(50)]
+        leased_for = []
+
+        def post(**kwargs):
+            last = ChannelTalkOutbox.objects.get(id=rows[-1].id)
+            leased_for.append((last.next_attempt_at - timezone.now()).total_seconds())
+            return OK
+
+        with mock.patch(POST_TARGET, side_effect=post):
+            deliver_outbox(batch_size=50)
+
+        # 건당 0.5초 간격 + (3, 10)초 타임아웃을 모두 써도 마지막 row 의 lease 가 남는다.
+        self.assertGreaterEqual(leased_for[0], 50 * 13.5)
+        self.assertEqual(batch_lease(1).total_seconds(), 13.5 + 60)
+
+    def test_failure_backs_off_and_defers_same_group(self):
+        failing = enqueue_group_message("order", "100", "a")
+        same_group = enqueue_group_message("order", "100", "b")
+        other_group = enqueue_group_message("order", "200", "c")
+
+        with mock.patch(POST_TARGET, side_effect=[{"type": "error"}, OK]):
+            counts = deliver_outbox()
+
+        self.assertEqual(counts, {"sent": 1, "failed": 1, "deferred": 1})
+        failing.refresh_from_db()
+        same_group.refresh_from_db()
+        other_group.refresh_from_db()
+        self.assertEqual(failing.attempts, 1)
+        self.assertGreater(failing.next_attempt_at, timezone.now())
+        self.assertEqual(same_group.attempts, 0)
+        self.assertLessEqual(same_group.next_attempt_at, timezone.now())
+        self.assertEqual(other_group.status, OutboxStatusChoices.SENT)
+
+    @override_settings(CHANNEL_TALK_OUTBOX_MAX_ATTEMPTS=1)
+    def test_gives_up_after_max_attempts(self):
+        row = enqueue_group_message("order", "100", "a")
+        with mock.patch(POST_TARGET, side_effect=TimeoutError("read timeout")):
+            deliver_outbox()
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboxStatusChoices.FAILED)
+        self.assertIn("read timeout", row.last_error)
+
+    @override_settings(CHANNEL_TALK_GROUP_MIN_INTERVAL=1.0)
+    def test_paces_messages_per_group(self):
+        enqueue_group_message("order", "100", "a")
+        enqueue_group_message("order", "200", "b")
+        enqueue_group_message("order", "100", "c")
+
+        sleep = mock.Mock()
+        with mock.patch(POST_TARGET, return_value=OK):
+            deliver_outbox(sleep=sleep)
+
+        # 그룹 100 의 두 번째 메시지 앞에서만 대기
+        self.assertEqual(sleep.call_count, 1)
+        self.assertLessEqual(sleep.call_args.args[0], 1.0)
+
+    def test_user_events_post_to_user_and_pace_per_user(self):
+        queue_price_alert_event("u1", {"currentPrice": 850000})
+        enqueue_group_message("order", "100", "a")
+        queue_price_alert_event("u2", {"currentPrice": 900000})
+
+        sleep = mock.Mock()
+        with mock.patch(
+            POST_TARGET, side_effect=[{"event": {}}, OK, {"event": {}}]
+        ) as mock_post:
+            counts = deliver_outbox(sleep=sleep)
+
+        self.assertEqual(counts, {"sent": 3, "failed": 0, "deferred": 0})
+        self.assertEqual(
+            [c.kwargs["path"] for c in mock_post.call_args_list],
+            [
+                "/open/v5/users/u1/events",
+                "/open/v5/groups/100/messages",
+                "/open/v5/users/u2/events",
+            ],
+        )
+        self.assertEqual(
+            mock_post.call_args_list[0].kwargs["json"],
+            {"name": "price_alert", "property": {"currentPrice": 850000}},
+        )
+        sleep.assert_not_called()
+
+    @override_settings(CHANNEL_TALK_GROUP_MIN_INTERVAL=1.0)
+    def test_paces_against_previous_run(self):
+        previous = enqueue_group_message("order", "100", "a")
+        ChannelTalkOutbox.objects.filter(id=previous.id).update(
+            status=OutboxStatusChoices.SENT, sent_at=timezone.now()
+        )
+        enqueue_group_message("order", "100", "b")
+
+        sleep = mock.Mock()
+        with mock.patch(POST_TARGET, return_value=OK):
+            deliver_outbox(sleep=sleep)
+
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args.args[0], 1.0)
+
+    def test_skips_while_another_worker_delivers(self):
+        row = enqueue_group_message("order", "100", "a")
+        other = connection.get_new_connection(connection.get_connection_params())
+        self.addCleanup(other.close)
+        with other.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [DELIVER_LOCK_KEY])
+
+        with mock.patch(POST_TARGET) as mock_post:
+            counts = deliver_outbox()
+
+        mock_post.assert_not_called()
+        self.assertEqual(counts, {"sent": 0, "failed": 0, "deferred": 0})
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboxStatusChoices.PENDING)
@@ -0,0 +1,62 @@
+from unittest import mock, skipIf
+
+from django.conf import settings
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+from psycopg_pool import ConnectionPool
+
+from phoneinone_server import db_pool
+
+
+class PoolStatsTest(TransactionTestCase):
+    # TestCase 의 atomic 안에서는 연결이 실제로 닫히지 않는다
+    databases = {"default", "replica"}
+
+    def setUp(self):
+        db_pool.pool_stats(reset=True)
+
+    @skipIf(settings.DB_POOL, "지속 연결 모드 전용")
+    def test_counts_new_connections_per_alias(self):
+        replica = connections["replica"]
+        replica.close()
+        replica.ensure_connection()
+
+        self.assertEqual(db_pool.pool_stats()["replica"]["connects"], 1)
+        db_pool.pool_stats(reset=True)
+        self.assertNotIn("replica", db_pool.pool_stats())
+
+    def test_maps_psycopg_pool_counters(self):
+        params = connections["default"].get_connection_params()
+        pool = ConnectionPool(kwargs=params, min_size=1, max_size=2, open=True)
+        self.addCleanup(pool.close)
+        pool.wait()
+        for _ in range(3):
+            with pool.connection():
+                pass
+
+        with mock.patch.object(
+            db_pool, "_pool", lambda alias: pool if alias == "default" else None
+        ):
+            stats = db_pool.pool_stats(reset=True)["default"]
+            after_reset = db_pool.pool_stats()["default"]
+
+        self.assertEqual(stats["mode"], "pool")
+        self.assertEqual((stats["min_size"], stats["max_size"]), (1, 2))
+        self.assertEqual(stats["checkouts"], 3)
+        self.assertEqual(stats["waits"], 0)
+        self.assertEqual(stats["timeouts"], 0)
+        self.assertEqual(after_reset["checkouts"], 0)
+        self.assertEqual(after_reset["size"], stats["size"])
+
+    @skipIf(settings.DB_POOL, "지속 연결 모드 전용")
+    @override_settings(DB_POOL_STATS_INTERVAL=3600)
+    def test_log_is_throttled_per_interval(self):
+        db_pool.log_pool_stats(force=True)
+        connections["replica"].close()
+        connections["replica"].ensure_connection()
+
+        self.assertFalse(db_pool.log_pool_stats())
+        with self.assertLogs("phoneinone_server.db_pool", "INFO") as logs:
+            self.assertTrue(db_pool.log_pool_stats(force=True))
+        self.assertIn("db_pool role=", logs.output[0])
+        self.assertIn("alias=replica mode=persistent connects=1", logs.output[0])
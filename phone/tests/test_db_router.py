@@ -0,0 +1,109 @@
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from phone.models import FAQ
+from phoneinone_server import db_router
+from phoneinone_server.db_router import (
+    PIN_COOKIE,
+    REPLICA,
+    ReplicaRoutingMiddleware,
+    read_replica,
+    untracked_writes,
+)
+
+
+class _RoutingTestMixin:
+    # 테스트 DB 에서 replica 는 default 의 미러(TEST.MIRROR) - 같은 DB 를 다른 커넥션으로
+    # 연다. TestCase 는 테스트를 atomic 으로 감싸 라우터가 항상 default 를 고르므로
+    # TransactionTestCase 로 어떤 커넥션이 쿼리를 실행했는지 본다.
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    def assertReadsFrom(self, alias, func):
+        with CaptureQueriesContext(
+            connections[REPLICA]
+        ) as replica, CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as default:
+            result = func()
+        used = {REPLICA: replica, DEFAULT_DB_ALIAS: default}
+        self.assertGreaterEqual(len(used.pop(alias)), 1)
+        self.assertEqual(len(used.popitem()[1]), 0)
+        return result
+
+
+@override_settings(DB_REPLICA_ENABLED=True, REQUEST_METRICS_ENABLED=False)
+class ReplicaRouterTest(_RoutingTestMixin, TransactionTestCase):
+    def setUp(self):
+        FAQ.objects.create(category="개통", question="Q", answer="A")
+
+    def test_reads_outside_block_go_to_default(self):
+        self.assertReadsFrom(DEFAULT_DB_ALIAS, FAQ.objects.count)
+
+    def test_reads_in_block_go_to_replica(self):
+        with read_replica():
+            self.assertEqual(self.assertReadsFrom(REPLICA, FAQ.objects.count), 1)
+
+    def test_write_switches_later_reads_to_default(self):
+        with read_replica():
+            FAQ.objects.create(category="개통", question="Q2", answer="A2")
+            self.assertReadsFrom(DEFAULT_DB_ALIAS, FAQ.objects.count)
+
+    def test_write_in_outer_scope_pins_nested_block(self):
+        with read_replica():
+            FAQ.objects.update(sort_order=1)
+            with read_replica():
+                self.assertReadsFrom(DEFAULT_DB_ALIAS, FAQ.objects.count)
+
+    def test_untracked_write_keeps_replica(self):
+        with read_replica():
+            with untracked_writes():
+                FAQ.objects.update(sort_order=1)
+            self.assertReadsFrom(REPLICA, FAQ.objects.count)
+
+    def test_atomic_block_reads_default(self):
+        with read_replica(), transaction.atomic():
+            self.assertReadsFrom(DEFAULT_DB_ALIAS, FAQ.objects.count)
+
+    @override_settings(DB_REPLICA_ENABLED=False)
+    def test_disabled_replica_reads_default(self):
+        with read_replica():
+            self.assertReadsFrom(DEFAULT_DB_ALIAS, FAQ.objects.count)
+
+
+@override_settings(DB_REPLICA_ENABLED=True, REQUEST_METRICS_ENABLED=False)
+class ReplicaRoutingMiddlewareTest(_RoutingTestMixin, TransactionTestCase):
+    def setUp(self):
+        FAQ.objects.create(category="개통", question="Q", answer="A")
+        self.client = APIClient()
+
+    def test_opted_in_get_reads_replica(self):
+        response = self.assertReadsFrom(REPLICA, lambda: self.client.get("/phone/faqs"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_pinned_client_reads_default(self):
+        self.client.cookies[PIN_COOKIE] = "1"
+
+        self.assertReadsFrom(DEFAULT_DB_ALIAS, lambda: self.client.get("/phone/faqs"))
+
+    def test_successful_write_sets_pin_cookie(self):
+        factory = RequestFactory()
+        middleware = ReplicaRoutingMiddleware(lambda r: HttpResponse(status=201))
+
+        response = middleware(factory.post("/phone/orders"))
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        failed = ReplicaRoutingMiddleware(lambda r: HttpResponse(status=400))
+        self.assertNotIn(PIN_COOKIE, failed(factory.post("/phone/orders")).cookies)
+
+    def test_view_without_opt_in_stays_on_default(self):
+        request = RequestFactory().get("/phone/orders")
+        middleware = ReplicaRoutingMiddleware(lambda r: HttpResponse())
+        token = middleware._enter(request)
+        self.addCleanup(db_router._scope.reset, token)
+
+        middleware.process_view(request, lambda r: HttpResponse(), (), {})
+
+        self.assertFalse(request._db_scope.replica)
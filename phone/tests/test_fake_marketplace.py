@@ -0,0 +1,88 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from phone.external_services.ssg.put_product.update_options import _get_current_option
+from phone.external_services.st_11.put_product.get_product_info import (
+    get_display_status_code,
+)
+from phone.external_services.st_11.put_product.set_display_status import (
+    stop_display,
+)
+from phone.external_services.st_11.put_product.set_price import set_product_price
+from phone.fake_marketplace import FakeMarketplace, FaultConfig
+from phone.marketplace_benchmark import STAGES, run_marketplace_benchmark
+from phone.synthetic_catalog import OPEN_MARKETS, CatalogScale, build_catalog
+
+
+class FakeMarketplaceTest(SimpleTestCase):
+    def test_11st_display_round_trip(self):
+        with FakeMarketplace() as fake, fake.settings():
+            stop_display("한글-상품-1")
+
+            self.assertEqual(get_display_status_code("한글-상품-1"), "105")
+            self.assertEqual(fake.st11.stats()["calls"], {"display": 1, "product": 1})
+
+    def test_11st_price_drop_is_stepped(self):
+        with FakeMarketplace() as fake, fake.settings():
+            fake.st11.prices["p1"] = 1_000_000
+
+            set_product_price("p1", 100_000)
+
+            # 80% 넘게 한 번에 못 내리므로 200,000 을 거쳐 목표가에 도달
+            self.assertEqual(fake.st11.prices["p1"], 100_000)
+            self.assertEqual(fake.st11.stats()["calls"], {"set_price": 3})
+
+    def test_injected_errors_and_rate_limit(self):
+        with FakeMarketplace(
+            st11=FaultConfig(error_rate=1.0), ssg=FaultConfig(rate_limit=1)
+        ) as fake, fake.settings():
+            with self.assertRaisesMessage(Exception, "status: 500"):
+                stop_display("p1")
+            _get_current_option("i1")
+            with self.assertRaisesMessage(Exception, "HTTP 429"):
+                _get_current_option("i1")
+
+            self.assertEqual(fake.stats()["11st"]["errors"], 1)
+            self.assertEqual(fake.stats()["ssg"]["throttled"], 1)
+
+
+class MarketplaceBenchmarkTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        build_catalog(CatalogScale(products=2, open_markets=len(OPEN_MARKETS)))
+
+    def test_every_stage_calls_fake_apis(self):
+        with FakeMarketplace() as fake:
+            result = run_marketplace_benchmark(fake)
+
+        self.assertEqual(list(result["stages"]), list(STAGES))
+        for stage, stats in result["stages"].items():
+            self.assertGreater(stats["api_calls"], 0, stage)
+            self.assertEqual(stats["alerts"], 0, stats["alert_samples"])
+        display = result["stages"]["sync_11st_display_status"]
+        self.assertEqual(display["result"]["failed"], 0)
+        self.assertEqual(display["api_calls"], display["result"]["updated"])
+
+    def test_failures_are_alerted_to_channel_talk(self):
+        with FakeMarketplace(st11=FaultConfig(error_rate=1.0)) as fake:
+            result = run_marketplace_benchmark(
+                fake, stages=["sync_11st_display_status"]
+            )
+
+        stats = result["stages"]["sync_11st_display_status"]
+        self.assertEqual(stats["errors"], stats["api_calls"])
+        self.assertEqual(stats["result"]["updated"], 0)
+        self.assertEqual(stats["alerts"], 1)
+
+    def test_unknown_stage(self):
+        with self.assertRaises(ValueError):
+            run_marketplace_benchmark(FakeMarketplace(), stages=["nope"])
+
+
+class BenchMarketplaceCommandTest(SimpleTestCase):
+    @override_settings(DEBUG=False)
+    def test_refuses_without_debug(self):
+        with self.assertRaisesMessage(Exception, "--force"):
+            call_command("bench_marketplace", stdout=StringIO())
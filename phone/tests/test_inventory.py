@@ -0,0 +1,279 @@
+import os
+import tempfile
+
+import openpyxl
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from phone.constants import CarrierChoices
+from phone.inventory.aliases import match_feed_rows
+from phone.inventory.inventory_initial_data import load_initial_inventory_data
+from phone.inventory.kt_first.excel_kt_first import update_inventory
+from phone.inventory.lg_hunet.image_lg_hunet import (
+    StubStockImageProvider,
+    extract_json_from_image,
+)
+from phone.inventory.writer import write_inventory_counts
+from phone.models import (
+    Dealership,
+    Device,
+    DeviceColor,
+    DeviceVariant,
+    Inventory,
+    InventoryAlias,
+    InventoryChangeLog,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def make_dealer(name="퍼스트", carrier=CarrierChoices.KT):
+    return Dealership.objects.create(
+        name=name, carrier=carrier, contact_number="010", manager="담당자"
+    )
+
+
+def make_inventory(dealer, name_in_sheet, color_in_sheet, count=0, color="블랙"):
+    device = Device.objects.create(model_name=name_in_sheet, brand="Apple")
+    variant = DeviceVariant.objects.create(device=device, storage_capacity="256GB")
+    device_color = DeviceColor.objects.create(
+        device=device, color=color, color_code="#000000"
+    )
+    return Inventory.objects.create(
+        device_variant=variant,
+        device_color=device_color,
+        dealership=dealer,
+        name_in_sheet=name_in_sheet,
+        color_in_sheet=color_in_sheet,
+        count=count,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Diff-only writer
+# ---------------------------------------------------------------------------
+
+
+class WriteInventoryCountsTest(TestCase):
+    def setUp(self):
+        self.dealer = make_dealer()
+        self.same = make_inventory(self.dealer, "AIP16-128", "블랙", count=3)
+        self.changed = make_inventory(self.dealer, "AIP16-256", "화이트", count=1)
+        self.missing = make_inventory(self.dealer, "AIP16-512", "블루", count=2)
+
+    def test_only_changed_rows_are_logged(self):
+        logs = write_inventory_counts(
+            list(Inventory.objects.filter(dealership=self.dealer)),
+            {self.same.id: 3, self.changed.id: 5},
+        )
+
+        self.assertEqual(len(logs), 2)
+        self.assertEqual(InventoryChangeLog.objects.count(), 2)
+        by_variant = {
+            log.device_variant_id: (log.old_count, log.new_count)
+            for log in InventoryChangeLog.objects.all()
+        }
+        self.assertEqual(by_variant[self.changed.device_variant_id], (1, 5))
+        self.assertEqual(by_variant[self.missing.device_variant_id], (2, 0))
+        self.assertNotIn(self.same.device_variant_id, by_variant)
+
+    def test_counts_persisted(self):
+        write_inventory_counts(
+            list(Inventory.objects.filter(dealership=self.dealer)),
+            {self.same.id: 3, self.changed.id: 5},
+        )
+        self.changed.refresh_from_db()
+        self.missing.refresh_from_db()
+        self.assertEqual(self.changed.count, 5)
+        self.assertEqual(self.missing.count, 0)
+
+    def test_no_change_makes_no_writes(self):
+        inventories = list(Inventory.objects.filter(dealership=self.dealer))
+        counts = {inv.id: inv.count for inv in inventories}
+        with self.assertNumQueries(0):
+            logs = write_inventory_counts(inventories, counts)
+        self.assertEqual(logs, [])
+
+
+class KTFirstImporterTest(TestCase):
+    def setUp(self):
+        self.dealer = make_dealer()
+        self.inventory = make_inventory(
+            self.dealer, "AIP16-128BK,AIP16-128BKN", "블랙", count=0
+        )
+
+    def test_aliases_accumulate_and_log_once(self):
+        not_matched = update_inventory(
+            [
+                {"name_in_sheet": "AIP16-128BK", "color_in_sheet": "블랙", "count": 2},
+                {"name_in_sheet": "AIP16-128BKN", "color_in_sheet": "블랙", "count": 1},
+                {"name_in_sheet": "UNKNOWN", "color_in_sheet": "레드", "count": 4},
+            ]
+        )
+
+        self.inventory.refresh_from_db()
+        self.assertEqual(self.inventory.count, 3)
+        self.assertEqual(not_matched, ["UNKNOWN - 레드 : 4"])
+        self.assertEqual(InventoryChangeLog.objects.count(), 1)
+
+
+# ---------------------------------------------------------------------------
+# Alias index
+# ---------------------------------------------------------------------------
+
+
+class InventoryAliasSyncTest(TestCase):
+    def setUp(self):
+        self.dealer = make_dealer()
+        self.inventory = make_inventory(
+            self.dealer, "UIPA 512(아이폰 에어), uipa512n", "스카이 블루"
+        )
+
+    def test_aliases_created_on_save(self):
+        keys = set(
+            InventoryAlias.objects.filter(inventory=self.inventory).values_list(
+                "model_key", "color_key"
+            )
+        )
+        self.assertEqual(
+            keys,
+            {("UIPA512(아이폰에어)", "스카이블루"), ("UIPA512N", "스카이블루")},
+        )
+
+    def test_aliases_follow_admin_edit(self):
+        self.inventory.color_in_sheet = "스카이블루,하늘색"
+        self.inventory.save()
+        self.assertEqual(
+            InventoryAlias.objects.filter(inventory=self.inventory).count(), 4
+        )
+
+    def test_count_only_save_keeps_aliases(self):
+        alias_ids = set(
+            InventoryAlias.objects.filter(inventory=self.inventory).values_list(
+                "id", flat=True
+            )
+        )
+        self.inventory.count = 7
+        self.inventory.save(update_fields=["count"])
+        self.assertEqual(
+            alias_ids,
+            set(
+                InventoryAlias.objects.filter(inventory=self.inventory).values_list(
+                    "id", flat=True
+                )
+            ),
+        )
+
+    def test_soft_delete_removes_aliases(self):
+        self.inventory.delete()
+        self.assertFalse(
+            InventoryAlias.objects.filter(inventory_id=self.inventory.id).exists()
+        )
+
+    def alias_keys(self):
+        return set(
+            InventoryAlias.objects.filter(inventory=self.inventory).values_list(
+                "model_key", flat=True
+            )
+        )
+
+    def test_rebuild_command_syncs_bulk_updates(self):
+        # queryset update 는 post_save 를 타지 않는다
+        Inventory.objects.filter(id=self.inventory.id).update(name_in_sheet="UIPA256")
+
+        call_command("rebuild_inventory_aliases", "--dealership", self.dealer.name)
+
+        self.assertEqual(self.alias_keys(), {"UIPA256"})
+
+    def test_initial_data_upsert_rebuilds_aliases(self):
+        make_dealer("디아이", CarrierChoices.SK)
+        make_dealer("엘비휴넷", CarrierChoices.LG)
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["header"] * 11)
+        sheet.append(
+            [
+                self.inventory.device_variant_id,
+                "iPhone Air",
+                "256GB",
+                None,
+                None,
+                "UIPA 256",
+                "스카이 블루",
+                None,
+                None,
+                "스카이 블루",
+                self.inventory.device_color_id,
+            ]
+        )
+        with tempfile.NamedTemporaryFile(suffix=".xlsx") as f:
+            workbook.save(f.name)
+            load_initial_inventory_data(f.name)
+
+        self.assertEqual(self.alias_keys(), {"UIPA256"})
+
+
+class MatchFeedRowsTest(TestCase):
+    def setUp(self):
+        self.dealer = make_dealer()
+        self.inventory = make_inventory(self.dealer, "SM-S942N,SM-S942NSO", "블랙")
+
+    def test_single_lookup_accumulates_and_reports_unmatched(self):
+        with self.assertNumQueries(1):
+            result = match_feed_rows(
+                self.dealer,
+                [
+                    ("SM-S942N", "블 랙", 2),
+                    ("sm-s942nso", "블랙", 3),
+                    ("SM-X000", "블랙", 1),
+                ],
+            )
+
+        self.assertEqual(result.new_counts, {self.inventory.id: 5})
+        self.assertEqual(result.unmatched, [("SM-X000", "블랙", 1)])
+        self.assertAlmostEqual(result.match_rate, 2 / 3)
+
+
+# ---------------------------------------------------------------------------
+# LG Hunet image extraction cache
+# ---------------------------------------------------------------------------
+
+
+class LGHunetImageCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.provider = StubStockImageProvider(
+            {"UIPA 512(아이폰 에어)": [["스카이 블루", 3], ["스카이 블루", 1]]}
+        )
+
+    def _write_image(self, content: bytes) -> str:
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+        tmp.write(content)
+        tmp.close()
+        self.addCleanup(os.unlink, tmp.name)
+        return tmp.name
+
+    def test_same_content_served_from_cache(self):
+        first = self._write_image(b"capture-1")
+        second = self._write_image(b"capture-1")
+
+        data = extract_json_from_image(first, provider=self.provider)
+        cached = extract_json_from_image(second, provider=self.provider)
+
+        self.assertEqual(self.provider.calls, 1)
+        self.assertEqual(data, cached)
+        self.assertEqual(data, {("UIPA 512(아이폰 에어)", "스카이 블루"): 4})
+
+    def test_different_content_calls_provider(self):
+        extract_json_from_image(self._write_image(b"a"), provider=self.provider)
+        extract_json_from_image(self._write_image(b"b"), provider=self.provider)
+        self.assertEqual(self.provider.calls, 2)
+
+    @override_settings(
+        LG_HUNET_IMAGE_PROVIDER="phone.inventory.lg_hunet.image_lg_hunet.StubStockImageProvider"
+    )
+    def test_provider_configurable_by_setting(self):
+        self.assertEqual(extract_json_from_image(self._write_image(b"c")), {})
@@ -0,0 +1,180 @@
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import Q, Sum
+from django.test import TestCase
+from django.utils import timezone
+
+from phone.constants import (
+    CarrierChoices,
+    ContractTypeChoices,
+    DiscountTypeChoices,
+    OpenMarketChoices,
+)
+from phone.models import (
+    Dealership,
+    Device,
+    DeviceColor,
+    DeviceVariant,
+    Inventory,
+    OpenMarket,
+    OpenMarketProduct,
+    Plan,
+    Product,
+    ProductOption,
+)
+
+# soft delete 된 row 가 alive row 보다 훨씬 많은 상황을 만든다 (운영 테이블과 비슷하게)
+DELETED_ROWS = 200
+# 다른 상품/단말/마켓의 alive row - 조회 조건이 인덱스 선두 컬럼으로 걸러지는지 확인용
+OTHER_ALIVE_ROWS = 50
+
+
+@skipUnless(
+    connection.vendor == "postgresql", "partial index EXPLAIN 은 PostgreSQL 전용"
+)
+class AlivePartialIndexTest(TestCase):
+    """hot 쿼리가 deleted_at IS NULL partial index 를 타는지 EXPLAIN 으로 확인."""
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        devices = Device.objects.bulk_create(
+            Device(model_name=f"Galaxy S{i}", brand="Samsung")
+            for i in range(OTHER_ALIVE_ROWS + 1)
+        )
+        variants = DeviceVariant.objects.bulk_create(
+            DeviceVariant(device=device, storage_capacity="256GB") for device in devices
+        )
+        products = Product.objects.bulk_create(
+            Product(name=device.model_name, device=device, is_active=True)
+            for device in devices
+        )
+        cls.device, cls.variant, cls.product = devices[0], variants[0], products[0]
+        plan = Plan.objects.create(
+            name="5G 프리미엄",
+            carrier=CarrierChoices.SK,
+            category_1="5G",
+            category_2="5G",
+            price=89000,
+            data_allowance="무제한",
+            call_allowance="무제한",
+            sms_allowance="무제한",
+        )
+        dealer = Dealership.objects.create(
+            name="디아이", carrier=CarrierChoices.SK, contact_number="010", manager="-"
+        )
+        cls.st11 = OpenMarket.objects.create(source=OpenMarketChoices.ST11)
+        ssg = OpenMarket.objects.create(source=OpenMarketChoices.SSG)
+
+        # 상품/단말마다 alive 옵션 1건 + 고르게 퍼진 soft delete 옵션
+        pairs = list(zip(products, variants))
+        targets = [(*pair, None) for pair in pairs] + [
+            (*pairs[i % len(pairs)], now) for i in range(DELETED_ROWS)
+        ]
+        ProductOption.objects.bulk_create(
+            ProductOption(
+                product=product,
+                device_variant=variant,
+                plan=plan,
+                contract_type=ContractTypeChoices.CHANGE,
+                deleted_at=deleted_at,
+            )
+            for product, variant, deleted_at in targets
+        )
+        colors = DeviceColor.objects.bulk_create(
+            DeviceColor(device=cls.device, color=f"색상 {i}", color_code="#000000")
+            for i in range(DELETED_ROWS + 1)
+        )
+        Inventory.objects.bulk_create(
+            [
+                Inventory(
+                    device_variant=cls.variant,
+                    device_color=color,
+                    dealership=dealer,
+                    name_in_sheet="SM-S931",
+                    color_in_sheet=color.color,
+                    count=3,
+                    deleted_at=None if i == 0 else now,
+                )
+                for i, color in enumerate(colors)
+            ]
+            + [
+                Inventory(
+                    device_variant=variant,
+                    device_color=colors[0],
+                    dealership=dealer,
+                    name_in_sheet="SM-S931",
+                    color_in_sheet=colors[0].color,
+                    count=3,
+                )
+                for variant in variants[1:]
+            ]
+        )
+        OpenMarketProduct.objects.bulk_create(
+            [
+                OpenMarketProduct(
+                    open_market=cls.st11,
+                    device_variant=cls.variant,
+                    om_product_id=str(i),
+                    seller_code="S25_256_SK_MNP_11ST",
+                    deleted_at=None if i == 0 else now,
+                )
+                for i in range(DELETED_ROWS + 1)
+            ]
+            + [
+                OpenMarketProduct(open_market=ssg, device_variant=variant)
+                for variant in variants[1:]
+            ]
+        )
+        with connection.cursor() as cursor:
+            for model in (ProductOption, Inventory, OpenMarketProduct):
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+    def assertUsesIndex(self, queryset, index_name):
+        # fixture 가 작아 seq scan 이 항상 싸게 나오므로 끄고 인덱스 선택만 비교한다
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+
+    def test_product_options_prefetch(self):
+        # ProductViewSet.list / retrieve 의 carrier 필터 options prefetch
+        queryset = ProductOption.objects.filter(
+            product_id__in=[self.product.id]
+        ).filter(
+            Q(contract_type="기기변경", plan__carrier=CarrierChoices.SK)
+            | Q(Q(contract_type="번호이동") & ~Q(plan__carrier=CarrierChoices.SK))
+        )
+        self.assertUsesIndex(queryset, "po_alive_product")
+
+    def test_marketplace_sync_options_by_variant(self):
+        # trigger_marketplace_sync / 네이버 EP 의 device_variant 별 공시지원금 옵션
+        queryset = ProductOption.objects.filter(
+            device_variant_id__in=[self.variant.id],
+            discount_type=DiscountTypeChoices.SUBSIDY,
+        )
+        self.assertUsesIndex(queryset, "po_alive_variant")
+
+    def test_display_status_stock_map(self):
+        # sync_11st_display_status._build_stock_map
+        queryset = (
+            Inventory.objects.filter(device_variant_id__in=[self.variant.id])
+            .values("device_variant_id", "dealership__carrier")
+            .annotate(total=Sum("count"))
+        )
+        self.assertUsesIndex(queryset, "inv_alive_variant")
+
+    def test_product_in_stock_lookup(self):
+        # ProductViewSet.list 의 재고 있는 (통신사, 용량) 조회
+        queryset = Inventory.objects.filter(
+            device_variant_id__in=[self.variant.id], count__gt=0
+        )
+        self.assertUsesIndex(queryset, "inv_alive_variant")
+
+    def test_open_market_products_by_market(self):
+        # 11번가 전시상태 동기화 / 마켓플레이스 동기화 / 네이버 EP
+        queryset = OpenMarketProduct.objects.filter(
+            open_market_id=self.st11.id, device_variant__isnull=False
+        )
+        self.assertUsesIndex(queryset, "omp_alive_market")
@@ -0,0 +1,70 @@
+import uuid
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from phone.calculator_buffer import persist_sessions
+from phone.models import CalculatorSession, PriceHistory
+from phone.partitioning import (
+    PARTITIONED_TABLES,
+    add_months,
+    detach_old_partitions,
+    ensure_partitions,
+    list_partitions,
+    partition_name,
+)
+
+FUTURE = date(2099, 1, 15)
+
+
+class PartitionManagementTest(TestCase):
+    def test_ensure_partitions_creates_missing_months_once(self):
+        created = ensure_partitions(months_ahead=1, today=FUTURE)
+
+        self.assertEqual(
+            sorted(created),
+            sorted(
+                partition_name(table, month)
+                for table in PARTITIONED_TABLES
+                for month in (date(2099, 1, 1), date(2099, 2, 1))
+            ),
+        )
+        self.assertEqual(ensure_partitions(months_ahead=1, today=FUTURE), [])
+
+    def test_detach_old_partitions_keeps_retained_months(self):
+        ensure_partitions(months_ahead=0, today=FUTURE)
+        table = PriceHistory._meta.db_table
+
+        detached = detach_old_partitions(retain_months=0, drop=True, today=FUTURE)
+
+        self.assertNotIn(partition_name(table, date(2099, 1, 1)), detached)
+        self.assertEqual(list(list_partitions(table)), [date(2099, 1, 1)])
+
+    def test_range_query_scans_only_matching_partition(self):
+        ensure_partitions(months_ahead=1)
+        this_month = timezone.now().date().replace(day=1)
+        table = PriceHistory._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"EXPLAIN SELECT * FROM {table} WHERE price_at >= %s AND price_at < %s",
+                [this_month, add_months(this_month, 1)],
+            )
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        self.assertIn(partition_name(table, this_month), plan)
+        self.assertNotIn(partition_name(table, add_months(this_month, 1)), plan)
+        self.assertNotIn(f"{table}_default", plan)
+
+
+class PartitionedSessionPersistTest(TestCase):
+    def test_persist_skips_existing_session_id(self):
+        # PK 가 (id, created_at) 라 id 중복은 DB 가 막지 못한다
+        payload = {"id": str(uuid.uuid4()), "fields": {}, "internet_ids": []}
+
+        persist_sessions([payload])
+        persist_sessions([payload])
+
+        self.assertEqual(CalculatorSession.objects.filter(id=payload["id"]).count(), 1)
@@ -0,0 +1,145 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from phone.constants import CarrierChoices, ContractTypeChoices
+from phone.models import (
+    ChannelTalkOutbox,
+    Device,
+    DeviceVariant,
+    Plan,
+    PriceNotificationRequest,
+    Product,
+    ProductOption,
+)
+from phone.price_alerts import find_matches, match_price_alerts
+
+POST_TARGET = "phone.external_services.channel_talk.ChannelTalkAPI.post"
+
+
+def make_plan(carrier):
+    return Plan.objects.create(
+        name=f"{carrier} 5G",
+        carrier=carrier,
+        category_1="5G",
+        category_2="5G",
+        price=69000,
+        data_allowance="무제한",
+        call_allowance="무제한",
+        sms_allowance="무제한",
+    )
+
+
+class PriceAlertTestBase(TestCase):
+    def setUp(self):
+        cache.clear()
+        device = Device.objects.create(model_name="Galaxy S25", brand="Samsung")
+        variant = DeviceVariant.objects.create(
+            device=device, storage_capacity="256GB", device_price=1200000
+        )
+        self.product = Product.objects.create(
+            name="갤럭시 S25", device=device, is_active=True
+        )
+        # SK 기기변경 950,000 / KT 번호이동 850,000
+        for carrier, contract_type, discount in (
+            (CarrierChoices.SK, ContractTypeChoices.CHANGE, 250000),
+            (CarrierChoices.KT, ContractTypeChoices.MNP, 350000),
+        ):
+            ProductOption.objects.create(
+                product=self.product,
+                device_variant=variant,
+                device_price=1200000,
+                plan=make_plan(carrier),
+                discount_type="공시지원금",
+                contract_type=contract_type,
+                additional_discount=discount,
+            )
+
+    def make_request(self, prev_carrier, target_price, channel_talk_user_id="u1"):
+        return PriceNotificationRequest.objects.create(
+            product=self.product,
+            customer_phone="01012345678",
+            target_price=target_price,
+            prev_carrier=prev_carrier,
+            channel_talk_user_id=channel_talk_user_id,
+        )
+
+
+class FindMatchesTest(PriceAlertTestBase):
+    def test_uses_change_for_same_carrier_and_mnp_for_others(self):
+        sk_customer = self.make_request(CarrierChoices.SK, 900000)
+        self.make_request(CarrierChoices.KT, 900000)  # KT 기기변경/타사 번호이동 없음
+        self.make_request(CarrierChoices.SK, 800000)  # 목표가 미달
+
+        matches = find_matches()
+
+        self.assertEqual([m.request_id for m in matches], [sk_customer.id])
+        self.assertEqual(
+            (matches[0].carrier, matches[0].contract_type, matches[0].price),
+            (CarrierChoices.KT, ContractTypeChoices.MNP, 850000),
+        )
+
+    def test_picks_cheapest_option_per_request(self):
+        request = self.make_request(CarrierChoices.MVNO, 1000000)
+        matches = find_matches()
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].request_id, request.id)
+        self.assertEqual(matches[0].price, 850000)
+
+    def test_skips_notified_and_deleted_requests(self):
+        self.make_request(CarrierChoices.MVNO, 1000000).delete()
+        notified = self.make_request(CarrierChoices.MVNO, 1000000)
+        PriceNotificationRequest.objects.filter(id=notified.id).update(
+            notified_at="2026-01-01T00:00:00Z"
+        )
+        self.assertEqual(find_matches(), [])
+
+
+class MatchPriceAlertsTest(PriceAlertTestBase):
+    @override_settings(PRICE_ALERT_BATCH_SIZE=2)
+    def test_queues_user_events_and_marks_notified_in_batches(self):
+        requests = [self.make_request(CarrierChoices.MVNO, 900000) for _ in range(3)]
+
+        with mock.patch(POST_TARGET) as post:
+            counts = match_price_alerts()
+
+        post.assert_not_called()
+        self.assertEqual(counts, {"matched": 3, "notified": 3})
+        events = ChannelTalkOutbox.objects.filter(kind="price_alert_event")
+        self.assertEqual(events.count(), 3)
+        event = events.first()
+        self.assertEqual(event.user_id, "u1")
+        self.assertEqual(event.body["name"], "price_alert")
+        self.assertEqual(event.body["property"]["currentPrice"], 850000)
+        for request in requests:
+            request.refresh_from_db()
+            self.assertIsNotNone(request.notified_at)
+
+        self.assertEqual(match_price_alerts(), {"matched": 0, "notified": 0})
+        self.assertEqual(events.count(), 3)
+
+    def test_requests_without_user_go_to_group_digest(self):
+        self.make_request(CarrierChoices.MVNO, 900000, channel_talk_user_id="")
+        self.make_request(CarrierChoices.MVNO, 900000, channel_talk_user_id="")
+
+        counts = match_price_alerts()
+
+        self.assertEqual(counts["notified"], 2)
+        outbox = ChannelTalkOutbox.objects.get()
+        self.assertEqual(outbox.kind, "price_alert")
+        self.assertIn("가격 알림 대상 2건", outbox.body["blocks"][0]["value"])
+
+    def test_skips_requests_claimed_by_another_run(self):
+        request = self.make_request(CarrierChoices.MVNO, 900000)
+        matches = find_matches()
+        # 다른 실행이 매칭 이후 먼저 선점(notified_at)한 경우
+        PriceNotificationRequest.objects.filter(id=request.id).update(
+            notified_at="2026-01-01T00:00:00Z"
+        )
+
+        with mock.patch("phone.price_alerts.find_matches", side_effect=[matches, []]):
+            counts = match_price_alerts()
+
+        self.assertEqual(counts, {"matched": 1, "notified": 0})
+        self.assertFalse(ChannelTalkOutbox.objects.exists())
@@ -0,0 +1,155 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from phone.constants import CarrierChoices
+from phone.models import (
+    Device,
+    DeviceVariant,
+    Plan,
+    PriceHistory,
+    PriceHistoryDaily,
+    Product,
+)
+from phone.price_series import (
+    build_price_charts,
+    extend_daily_prices,
+    refresh_daily_prices,
+)
+
+CHART_URL = "/phone/price-history-chart"
+
+
+def make_plan(carrier, price=69000):
+    return Plan.objects.create(
+        name=f"{carrier} 5G",
+        carrier=carrier,
+        category_1="5G",
+        category_2="5G",
+        price=price,
+        data_allowance="무제한",
+        call_allowance="무제한",
+        sms_allowance="무제한",
+    )
+
+
+class PriceSeriesTestBase(TestCase):
+    def setUp(self):
+        self.today = timezone.now().date()
+        device = Device.objects.create(model_name="Galaxy S25", brand="Samsung")
+        DeviceVariant.objects.create(
+            device=device, storage_capacity="512GB", device_price=1500000
+        )
+        DeviceVariant.objects.create(
+            device=device, storage_capacity="256GB", device_price=1200000
+        )
+        self.product = Product.objects.create(name="갤럭시 S25", device=device)
+        self.sk_plan = make_plan(CarrierChoices.SK)
+        self.kt_plan = make_plan(CarrierChoices.KT, price=59000)
+
+        # SK: D-10 900,000 → D-3 850,000 / KT: D-5 700,000
+        self.add_history(CarrierChoices.SK, self.sk_plan, 900000, 10)
+        self.add_history(CarrierChoices.SK, self.sk_plan, 850000, 3)
+        self.add_history(CarrierChoices.KT, self.kt_plan, 700000, 5)
+
+    def add_history(self, carrier, plan, price, days_ago):
+        history = PriceHistory.objects.create(
+            product=self.product, carrier=carrier, final_price=price, plan=plan
+        )
+        # price_at 은 auto_now_add 라 생성 후 과거 날짜로 옮긴다
+        PriceHistory.objects.filter(id=history.id).update(
+            price_at=self.today - timedelta(days=days_ago)
+        )
+
+    def refresh(self, end=None):
+        refresh_daily_prices(
+            [
+                (self.product.id, CarrierChoices.SK),
+                (self.product.id, CarrierChoices.KT),
+            ],
+            self.today - timedelta(days=30),
+            end,
+        )
+
+    def daily_price(self, carrier, days_ago):
+        return PriceHistoryDaily.objects.get(
+            product=self.product,
+            carrier=carrier,
+            day=self.today - timedelta(days=days_ago),
+        ).final_price
+
+
+class RefreshDailyPricesTest(PriceSeriesTestBase):
+    def test_forward_fills_from_first_history(self):
+        self.refresh()
+
+        self.assertEqual(
+            PriceHistoryDaily.objects.filter(carrier=CarrierChoices.SK).count(), 11
+        )
+        self.assertEqual(
+            PriceHistoryDaily.objects.filter(carrier=CarrierChoices.KT).count(), 6
+        )
+        self.assertEqual(self.daily_price(CarrierChoices.SK, 4), 900000)
+        self.assertEqual(self.daily_price(CarrierChoices.SK, 3), 850000)
+        self.assertEqual(self.daily_price(CarrierChoices.SK, 0), 850000)
+
+    def test_refresh_reflects_deleted_history(self):
+        self.refresh()
+        PriceHistory.objects.get(final_price=850000).delete()
+        self.refresh()
+        self.assertEqual(self.daily_price(CarrierChoices.SK, 0), 900000)
+
+    def test_extend_carries_last_value_to_today(self):
+        self.refresh(end=self.today - timedelta(days=2))
+        self.assertFalse(PriceHistoryDaily.objects.filter(day=self.today).exists())
+
+        extend_daily_prices()
+
+        self.assertEqual(self.daily_price(CarrierChoices.SK, 0), 850000)
+        self.assertEqual(self.daily_price(CarrierChoices.KT, 1), 700000)
+        # 다시 돌려도 이미 있는 날은 그대로
+        self.assertEqual(extend_daily_prices(), 0)
+
+
+class BuildPriceChartsTest(PriceSeriesTestBase):
+    def setUp(self):
+        super().setUp()
+        self.refresh()
+
+    def test_chart_matches_forward_filled_history(self):
+        with self.assertNumQueries(3):
+            charts = build_price_charts([self.product.id], ["1week"])
+
+        chart = charts[(self.product.id, "1week")]
+        self.assertEqual(chart["storage"], "256GB")
+        self.assertEqual(len(chart["chart_data"]), 8)
+        first, last = chart["chart_data"][0], chart["chart_data"][-1]
+        self.assertEqual((first["SK"], first["KT"], first["LG"]), (900000, None, None))
+        self.assertEqual((last["SK"], last["KT"]), (850000, 700000))
+        self.assertEqual(
+            chart["latest_prices"][CarrierChoices.KT],
+            {"price": 700000, "plan_name": "KT 5G", "plan_price": 59000},
+        )
+        self.assertIsNone(chart["latest_prices"][CarrierChoices.LG])
+
+    def test_batch_endpoint_returns_all_product_period_pairs(self):
+        response = APIClient().get(
+            f"{CHART_URL}/batch",
+            {"product_ids": f"{self.product.id},999999", "periods": "1week,1year"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()["results"]
+        self.assertEqual(
+            [(r["product_id"], r["period"]) for r in results],
+            [(self.product.id, "1week"), (self.product.id, "1year")],
+        )
+        self.assertEqual(len(results[1]["chart_data"]), 366)
+
+    def test_batch_endpoint_rejects_unknown_period(self):
+        response = APIClient().get(
+            f"{CHART_URL}/batch", {"product_ids": self.product.id, "periods": "2y"}
+        )
+        self.assertEqual(response.status_code, 400)
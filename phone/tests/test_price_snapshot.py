@@ -0,0 +1,146 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from phone.constants import CarrierChoices, DiscountTypeChoices
+from phone.models import (
+    Device,
+    DeviceVariant,
+    Plan,
+    PriceHistory,
+    PriceHistoryDaily,
+    Product,
+    ProductOption,
+)
+from phone.price_snapshot import backfill_price_history, snapshot_price_history
+from phone.tasks import task_snapshot_price_history
+
+
+def make_plan(carrier, price):
+    return Plan.objects.create(
+        name=f"{carrier} {price}",
+        carrier=carrier,
+        category_1="5G",
+        category_2="5G",
+        price=price,
+        data_allowance="무제한",
+        call_allowance="무제한",
+        sms_allowance="무제한",
+    )
+
+
+class SnapshotPriceHistoryTest(TestCase):
+    def setUp(self):
+        self.today = timezone.now().date()
+        device = Device.objects.create(model_name="Galaxy S25", brand="Samsung")
+        self.variant = DeviceVariant.objects.create(
+            device=device, storage_capacity="256GB", device_price=1200000
+        )
+        self.product = Product.objects.create(
+            name="갤럭시 S25", device=device, is_active=True
+        )
+        self.inactive = Product.objects.create(
+            name="비활성", device=device, is_active=False
+        )
+        self.sk_cheap_plan = make_plan(CarrierChoices.SK, 89000)
+        sk_expensive_plan = make_plan(CarrierChoices.SK, 69000)
+        kt_plan = make_plan(CarrierChoices.KT, 69000)
+
+        # SK: 900,000 + 69,000*6 = 1,314,000 vs 700,000 + 89,000*6 = 1,234,000
+        self.add_option(self.product, sk_expensive_plan, 300000)
+        self.sk_best = self.add_option(self.product, self.sk_cheap_plan, 500000)
+        self.add_option(self.product, kt_plan, 400000)
+        # 선택약정 / 비활성 상품은 스냅샷 대상이 아니다
+        self.add_option(
+            self.product,
+            kt_plan,
+            1100000,
+            discount_type=DiscountTypeChoices.SELECTION,
+        )
+        self.add_option(self.inactive, kt_plan, 1000000)
+
+    def add_option(self, product, plan, discount, **kwargs):
+        return ProductOption.objects.create(
+            product=product,
+            device_variant=self.variant,
+            device_price=1200000,
+            plan=plan,
+            discount_type=kwargs.get("discount_type", DiscountTypeChoices.SUBSIDY),
+            contract_type="기기변경",
+            additional_discount=discount,
+        )
+
+    def test_records_cheapest_six_month_total_per_carrier(self):
+        counts = snapshot_price_history()
+
+        self.assertEqual(counts, {"created": 2, "updated": 0})
+        history = {
+            h.carrier: (h.final_price, h.plan_id)
+            for h in PriceHistory.objects.filter(price_at=self.today)
+        }
+        self.assertEqual(
+            history,
+            {
+                CarrierChoices.SK: (700000, self.sk_cheap_plan.id),
+                CarrierChoices.KT: (800000, history[CarrierChoices.KT][1]),
+            },
+        )
+        self.assertEqual(PriceHistoryDaily.objects.filter(day=self.today).count(), 2)
+
+    def test_rerun_updates_only_changed_prices(self):
+        snapshot_price_history()
+        self.assertEqual(snapshot_price_history(), {"created": 0, "updated": 0})
+
+        self.sk_best.additional_discount = 600000
+        self.sk_best.save()
+        self.assertEqual(snapshot_price_history(), {"created": 0, "updated": 1})
+        self.assertEqual(
+            PriceHistory.objects.get(
+                price_at=self.today, carrier=CarrierChoices.SK
+            ).final_price,
+            600000,
+        )
+        self.assertEqual(
+            PriceHistoryDaily.objects.get(
+                day=self.today, carrier=CarrierChoices.SK
+            ).final_price,
+            600000,
+        )
+
+    def test_backfill_carries_last_price_into_missed_days(self):
+        snapshot_price_history()
+        PriceHistory.objects.update(price_at=self.today - timedelta(days=3))
+
+        filled = backfill_price_history(self.today - timedelta(days=5))
+
+        # D-2, D-1 × (SK, KT). D-5, D-4 는 이전 기록이 없어 비워 둔다.
+        self.assertEqual(filled, 4)
+        self.assertEqual(
+            sorted(
+                PriceHistory.objects.filter(carrier=CarrierChoices.SK).values_list(
+                    "price_at", "final_price"
+                )
+            ),
+            [
+                (self.today - timedelta(days=3), 700000),
+                (self.today - timedelta(days=2), 700000),
+                (self.today - timedelta(days=1), 700000),
+            ],
+        )
+
+
+class SnapshotPriceHistoryTaskTest(TestCase):
+    def test_failure_sends_ops_alert(self):
+        with mock.patch(
+            "phone.price_snapshot.snapshot_price_history",
+            side_effect=RuntimeError("boom"),
+        ), mock.patch(
+            "phone.external_services.channel_talk.ChannelTalkAPI.post"
+        ) as post:
+            with self.assertRaises(RuntimeError):
+                task_snapshot_price_history()
+
+        value = post.call_args.kwargs["json"]["blocks"][0]["value"]
+        self.assertEqual(value, "[운영 작업 PriceHistory 스냅샷 실패]\n상세: boom")
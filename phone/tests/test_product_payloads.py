@@ -0,0 +1,232 @@
+from datetime import datetime, timezone as dt_timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from phone.constants import CarrierChoices
+from phone.models import (
+    DecoratorTag,
+    Dealership,
+    Inventory,
+    OfficialContractLink,
+    Product,
+    ProductOption,
+    Review,
+)
+from phone.product_payloads import product_detail_payload, product_list_payload
+from phone.renderers import ORJSONRenderer
+from phone.serialization_benchmark import TARGETS, run_serialization_benchmark
+from phone.serializers import ProductDetailSerializer, ProductListSerializer
+from phone.synthetic_catalog import CatalogScale, build_catalog
+from phone.views.product_views import (
+    ProductViewSet,
+    detail_inventories,
+    group_in_stock_by_device,
+    in_stock_inventories,
+    product_detail_queryset,
+    product_list_querysets,
+    related_products_queryset,
+)
+
+CARRIERS = [None, *CarrierChoices.VALUES]
+
+
+def serializer_list(query_params):
+    _, queryset = product_list_querysets(ProductViewSet.queryset.all(), query_params)
+    in_stock_by_device = group_in_stock_by_device(in_stock_inventories(queryset))
+    serializer = ProductListSerializer(
+        queryset, many=True, context={"in_stock_by_device": in_stock_by_device}
+    )
+    return JSONRenderer().render(serializer.data)
+
+
+def payload_list(query_params):
+    _, queryset = product_list_querysets(ProductViewSet.queryset.all(), query_params)
+    return ORJSONRenderer().render(
+        product_list_payload(queryset, query_params.get("carrier"))
+    )
+
+
+def serializer_detail(product_id, carrier):
+    instance = product_detail_queryset(
+        ProductViewSet.queryset.filter(id=product_id), carrier
+    ).first()
+    related_products = []
+    if instance.product_series_id:
+        related_products = list(related_products_queryset(instance))
+    serializer = ProductDetailSerializer(
+        instance,
+        context={
+            "inventories": detail_inventories(instance),
+            "related_products": related_products,
+        },
+    )
+    return JSONRenderer().render(serializer.data)
+
+
+def payload_detail(product_id, carrier):
+    data = product_detail_payload(
+        ProductViewSet.queryset.filter(id=product_id), carrier
+    )
+    return ORJSONRenderer().render(data)
+
+
+@override_settings(
+    REQUEST_METRICS_ENABLED=False,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+)
+class ProductPayloadGoldenTest(TestCase):
+    """values() 경로 + ORJSONRenderer 응답이 serializer + JSONRenderer 와 바이트 단위로 같은지."""
+
+    @classmethod
+    def setUpTestData(cls):
+        build_catalog(CatalogScale(products=6))
+        products = list(Product.objects.order_by("id"))
+        cls.product_ids = [product.id for product in products]
+        first, second, third = products[:3]
+
+        # 이스케이프가 필요한 문자 / 시리즈 없는 상품 / 삭제된 태그
+        Product.objects.filter(id=first.id).update(
+            description='줄\u2028바꿈\u2029 "따옴표" \\ \t 😀'
+        )
+        Product.objects.filter(id=second.id).update(product_series=None)
+        DecoratorTag.objects.order_by("id").first().delete()
+
+        # 공개/비공개, 이미지 유무, created_at 이 같은 리뷰
+        Review.objects.bulk_create(
+            Review(
+                product=first,
+                customer_name=f"고객 {i}",
+                rating=i % 5 + 1,
+                comment=None if i % 4 == 0 else f"후기 {i}",
+                image="review_images/synthetic.png" if i % 3 == 0 else None,
+                is_public=i != 2,
+            )
+            for i in range(14)
+        )
+        Review.objects.filter(customer_name__in=["고객 5", "고객 6", "고객 7"]).update(
+            created_at=datetime(2025, 1, 1, 12, 0, 0, 123456, tzinfo=dt_timezone.utc)
+        )
+
+        # 공식신청서 링크가 있는 옵션
+        option = ProductOption.objects.filter(product=first).order_by("id").first()
+        link = OfficialContractLink.objects.create(
+            dealer=Dealership.objects.order_by("id").first(),
+            device_variant=option.device_variant,
+            contract_type=option.contract_type,
+            link="https://example.com/contract?a=1&b=2",
+        )
+        ProductOption.objects.filter(
+            product=first, device_variant=option.device_variant
+        ).update(official_contract_link=link)
+
+        # 저재고 / 품절, 재고가 전혀 없는 단말기
+        inventories = Inventory.objects.filter(
+            device_variant__device=first.device
+        ).order_by("id")
+        for inventory, count in zip(inventories, (0, 3, 20)):
+            Inventory.objects.filter(id=inventory.id).update(count=count)
+        Inventory.objects.filter(device_variant__device=third.device).delete()
+
+    def test_product_list_is_byte_identical(self):
+        for carrier in CARRIERS:
+            with self.subTest(carrier=carrier):
+                query_params = {"carrier": carrier} if carrier else {}
+                self.assertEqual(
+                    payload_list(query_params), serializer_list(query_params)
+                )
+        self.assertEqual(
+            payload_list({"is_featured": "false"}),
+            serializer_list({"is_featured": "false"}),
+        )
+
+    def test_product_detail_is_byte_identical(self):
+        for product_id in self.product_ids:
+            for carrier in CARRIERS:
+                with self.subTest(product_id=product_id, carrier=carrier):
+                    self.assertEqual(
+                        payload_detail(product_id, carrier),
+                        serializer_detail(product_id, carrier),
+                    )
+
+    def test_edge_cases_reach_the_payload(self):
+        detail = product_detail_payload(
+            ProductViewSet.queryset.filter(id=self.product_ids[0])
+        )
+
+        self.assertEqual(len(detail["reviews"]), 10)
+        self.assertIn("\u2028", detail["description"])
+        self.assertIn(
+            "https://example.com/contract?a=1&b=2",
+            ORJSONRenderer().render(detail["options"]).decode(),
+        )
+        statuses = {
+            status
+            for by_storage in detail["stock"].values()
+            for by_color in by_storage.values()
+            for status in by_color.values()
+        }
+        self.assertEqual(statuses, {"out_of_stock", "low_stock", "in_stock"})
+
+    def test_missing_product_returns_none(self):
+        self.assertIsNone(product_detail_payload(ProductViewSet.queryset.filter(id=0)))
+
+    def test_api_responses_match_serializer_path(self):
+        client = APIClient()
+        paths = [
+            "/phone/products",
+            "/phone/products?carrier=KT",
+            f"/phone/products/{self.product_ids[0]}",
+            f"/phone/products/{self.product_ids[0]}?carrier=SK",
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                with override_settings(FAST_PRODUCT_SERIALIZATION=False):
+                    expected = client.get(path)
+                with override_settings(FAST_PRODUCT_SERIALIZATION=True):
+                    actual = client.get(path)
+                self.assertEqual(actual.status_code, 200)
+                self.assertEqual(actual.content, expected.content)
+
+    def test_benchmark_compares_both_paths(self):
+        result = run_serialization_benchmark(iterations=2)
+
+        self.assertEqual(set(result["targets"]), set(TARGETS))
+        for name, stats in result["targets"].items():
+            self.assertTrue(stats["identical"], name)
+            self.assertGreater(stats["serializer"]["queries"], 0)
+            self.assertGreater(stats["fast"]["cpu_ms"], 0)
+
+
+class ORJSONRendererTest(SimpleTestCase):
+    def assertSameAsJSONRenderer(self, data, *args):
+        self.assertEqual(
+            ORJSONRenderer().render(data, *args), JSONRenderer().render(data, *args)
+        )
+
+    def test_matches_json_renderer(self):
+        now = timezone.now()
+        self.assertSameAsJSONRenderer(
+            {
+                "text": '한글 "quote" \\ \n \x01 \u2028 \u2029 😀',
+                1: {2: None},
+                "datetime": now,
+                "datetime_no_micro": now.replace(microsecond=0),
+                "date": now.date(),
+                "decimal": Decimal("1.50"),
+                "flags": [True, False],
+            }
+        )
+
+    def test_falls_back_for_indent_and_unsupported_values(self):
+        self.assertSameAsJSONRenderer({"a": [1, 2]}, "application/json; indent=4")
+        self.assertSameAsJSONRenderer({"big": 2**70})
+        self.assertEqual(ORJSONRenderer().render(None), b"")
@@ -0,0 +1,135 @@
+import logging
+import os
+import time
+
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from phone.models import Product
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+logger = logging.getLogger(__name__)
+
+# 카탈로그 크기 - 상품 수만 바뀌고 나머지(용량/요금제/카드 등)는 같은 비율로 늘린다
+SMALL_PRODUCTS = 10
+LARGE_PRODUCTS = int(os.environ.get("QUERY_BUDGET_PRODUCTS", 1000))
+
+
+def scale_for(products: int) -> CatalogScale:
+    ratio = products // SMALL_PRODUCTS
+    return CatalogScale(
+        products=products,
+        variants_per_device=1,
+        plans_per_carrier=1,
+        series=ratio,
+        partner_cards=ratio,
+        internet_plans_per_carrier=ratio,
+    )
+
+
+def first_product_path():
+    return f"/phone/products/{Product.objects.order_by('id').first().id}"
+
+
+# 엔드포인트별 (경로, 최대 쿼리 수). 상품 수와 상관없이 쿼리 수가 같아야 한다 (N+1 금지)
+ENDPOINTS = {
+    "product_list": ("/phone/products", 6),
+    "product_list_carrier": ("/phone/products?carrier=SK", 6),
+    "product_list_brand": ("/phone/products?brand=Samsung", 6),
+    "product_detail": (first_product_path, 15),
+    "product_detail_carrier": (lambda: f"{first_product_path()}?carrier=KT", 15),
+    "product_series": ("/phone/product-series", 4),
+    "devices": ("/phone/devices", 3),
+    "partner_cards": ("/phone/partner-cards", 5),
+    "internet_plans": ("/internet/plans", 9),
+}
+
+
+# 이미지 URL 생성에 S3/CloudFront 설정이 필요 없도록 메모리 storage 사용.
+# RequestMetric 적재(bulk_create)가 측정 쿼리 수에 섞이지 않도록 미들웨어는 끈다.
+@override_settings(
+    REQUEST_METRICS_ENABLED=False,
+    STORAGES={
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+        "staticfiles": {
+            "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"
+        },
+    },
+)
+class QueryBudgetTest(TestCase):
+    """공개 API 쿼리 수가 카탈로그 크기(10 → 1,000 상품)에 따라 늘지 않는지 확인.
+
+    같은 트랜잭션 안에서 작은/큰 카탈로그를 savepoint 로 번갈아 만들어 잰다.
+    응답 시간은 비교하지 않고 로그(query_budget ...)로만 남긴다.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.small = cls.measure(SMALL_PRODUCTS)
+        cls.large = cls.measure(LARGE_PRODUCTS)
+
+    @classmethod
+    def measure(cls, products):
+        client = APIClient()
+        results = {}
+        savepoint = transaction.savepoint()
+        build_catalog(scale_for(products))
+        for name, (path, _) in ENDPOINTS.items():
+            path = path() if callable(path) else path
+            with CaptureQueriesContext(connection) as ctx:
+                start = time.perf_counter()
+                response = client.get(path)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            results[name] = (response.status_code, len(ctx.captured_queries))
+            logger.info(
+                "query_budget endpoint=%s products=%s status=%s queries=%s ms=%.1f",
+                name,
+                products,
+                response.status_code,
+                len(ctx.captured_queries),
+                elapsed_ms,
+            )
+        transaction.savepoint_rollback(savepoint)
+        return results
+
+    def assertFlatQueryCount(self, name):
+        budget = ENDPOINTS[name][1]
+        small_status, small_queries = self.small[name]
+        large_status, large_queries = self.large[name]
+        self.assertEqual((small_status, large_status), (200, 200))
+        self.assertEqual(
+            large_queries,
+            small_queries,
+            f"{name}: 상품 {SMALL_PRODUCTS}개 {small_queries}쿼리 → "
+            f"{LARGE_PRODUCTS}개 {large_queries}쿼리 (N+1)",
+        )
+        self.assertLessEqual(large_queries, budget, f"{name}: 쿼리 예산 {budget} 초과")
+
+    def test_product_list(self):
+        self.assertFlatQueryCount("product_list")
+
+    def test_product_list_by_carrier(self):
+        self.assertFlatQueryCount("product_list_carrier")
+
+    def test_product_list_by_brand(self):
+        self.assertFlatQueryCount("product_list_brand")
+
+    def test_product_detail(self):
+        self.assertFlatQueryCount("product_detail")
+
+    def test_product_detail_by_carrier(self):
+        self.assertFlatQueryCount("product_detail_carrier")
+
+    def test_product_series(self):
+        self.assertFlatQueryCount("product_series")
+
+    def test_devices(self):
+        self.assertFlatQueryCount("devices")
+
+    def test_partner_cards(self):
+        self.assertFlatQueryCount("partner_cards")
+
+    def test_internet_plans(self):
+        self.assertFlatQueryCount("internet_plans")
@@ -0,0 +1,96 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from internet.models import InternetCarrier
+from phone import request_metrics
+from phone.models import FAQ, RequestMetric
+from phone.request_metrics import endpoint_percentiles
+
+
+@override_settings(
+    REQUEST_METRICS_ENABLED=True,
+    REQUEST_METRICS_SAMPLE_RATE=1.0,
+    REQUEST_METRICS_FLUSH_SIZE=1,
+)
+class RequestMetricsMiddlewareTest(TestCase):
+    def setUp(self):
+        # 다른 테스트에서 샘플링돼 남은 측정값이 섞이지 않게 비운다
+        request_metrics._buffer.clear()
+        self.client = APIClient()
+        FAQ.objects.create(
+            category="개통", question="개통은 언제 되나요?", answer="당일 개통됩니다."
+        )
+
+    def test_records_viewset_action_with_query_count(self):
+        response = self.client.get("/phone/faqs")
+
+        self.assertEqual(response.status_code, 200)
+        metric = RequestMetric.objects.get()
+        self.assertEqual(metric.view_name, "FAQViewSet.list")
+        self.assertEqual(metric.method, "GET")
+        self.assertEqual(metric.status, 200)
+        self.assertGreaterEqual(metric.query_count, 1)
+        self.assertIn("phone_faq", metric.slowest_sql)
+        self.assertGreater(metric.total_ms, 0)
+
+    async def test_records_under_asgi(self):
+        # AsyncClient 는 미들웨어 체인을 async 로 구성한다 (uvicorn 워커와 같음)
+        response = await self.async_client.get("/phone/faqs")
+
+        self.assertEqual(response.status_code, 200)
+        metric = await RequestMetric.objects.aget()
+        self.assertEqual(metric.view_name, "FAQViewSet.list")
+        self.assertGreaterEqual(metric.query_count, 1)
+
+    def test_covers_internet_views(self):
+        InternetCarrier.objects.create(name="SK브로드밴드")
+
+        self.client.get("/internet/carriers")
+
+        self.assertEqual(
+            RequestMetric.objects.get().view_name, "InternetCarrierViewSet.list"
+        )
+
+    @override_settings(DEBUG=True)
+    def test_server_timing_header_in_debug(self):
+        response = self.client.get("/phone/faqs")
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    def test_no_server_timing_header_in_prod(self):
+        response = self.client.get("/phone/faqs")
+
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(REQUEST_METRICS_SAMPLE_RATE=0.0)
+    def test_unsampled_request_is_not_recorded(self):
+        self.client.get("/phone/faqs")
+
+        self.assertFalse(RequestMetric.objects.exists())
+
+    def test_admin_views_are_not_recorded(self):
+        admin_user = get_user_model().objects.create_superuser("admin", "", "pw")
+        self.client.force_login(admin_user)
+
+        self.client.get("/admin/")
+
+        self.assertFalse(RequestMetric.objects.exists())
+
+    def test_endpoint_percentiles(self):
+        for total_ms in (10, 20, 30, 40, 100):
+            RequestMetric.objects.create(
+                view_name="FAQViewSet.list",
+                method="GET",
+                status=200,
+                query_count=2,
+                total_ms=total_ms,
+            )
+
+        (row,) = endpoint_percentiles(hours=1)
+
+        self.assertEqual(row["view_name"], "FAQViewSet.list")
+        self.assertEqual(row["samples"], 5)
+        self.assertEqual(row["total_p50"], 30)
+        self.assertEqual(row["queries_avg"], 2)
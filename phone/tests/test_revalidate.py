@@ -0,0 +1,249 @@
+from unittest import mock
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from phone.models import (
+    Device,
+    DeviceVariant,
+    Product,
+    ProductDetailImage,
+    ProductOption,
+    RevalidationRequest,
+)
+from phone.revalidate import (
+    OUTAGE_ALERTED_KEY,
+    RETRY_PENDING_KEY,
+    RevalidateTag,
+    RevalidationFailed,
+    enqueue_revalidation,
+    flush_revalidation_queue,
+    product_tags,
+    revalidate_products,
+)
+from phone.tasks import task_flush_revalidation
+
+SEND_TARGET = "phone.revalidate.revalidate_cache"
+SCHEDULE_TARGET = "phone.tasks.task_flush_revalidation.apply_async"
+ALERT_TARGET = "phone.tasks.send_ops_failure_alert"
+
+
+class EnqueueRevalidationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_burst_schedules_one_flush_after_commit(self):
+        with mock.patch(SCHEDULE_TARGET) as schedule:
+            with self.captureOnCommitCallbacks(execute=True):
+                enqueue_revalidation(RevalidateTag.PRODUCTS)
+                enqueue_revalidation([RevalidateTag.PRODUCTS, "product-detail"])
+                enqueue_revalidation(RevalidateTag.BANNERS)
+                schedule.assert_not_called()
+
+        schedule.assert_called_once_with(countdown=2)
+        self.assertEqual(RevalidationRequest.objects.count(), 3)
+
+
+@override_settings(REVALIDATE_SECRET_TOKEN="token")
+class FlushRevalidationQueueTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        for tags in (["products"], ["products", "product-detail"], ["banners"]):
+            RevalidationRequest.objects.create(tags=tags)
+
+    def test_dedupes_into_single_call(self):
+        with mock.patch(SEND_TARGET, return_value=True) as send:
+            stats = flush_revalidation_queue()
+
+        send.assert_called_once_with(
+            ["banners", "product-detail", "products"], async_call=False
+        )
+        self.assertEqual(stats, {"calls": 3, "tags": 3, "coalesced": 2})
+        self.assertFalse(RevalidationRequest.objects.exists())
+
+    def test_all_tag_supersedes_others(self):
+        RevalidationRequest.objects.create(tags=["all"])
+        with mock.patch(SEND_TARGET, return_value=True) as send:
+            flush_revalidation_queue()
+        send.assert_called_once_with(["all"], async_call=False)
+
+    def test_failure_requeues_tags(self):
+        with mock.patch(SEND_TARGET, return_value=False):
+            with self.assertRaises(RevalidationFailed):
+                flush_revalidation_queue()
+
+        self.assertEqual(
+            list(RevalidationRequest.objects.values_list("tags", flat=True)),
+            [["banners", "product-detail", "products"]],
+        )
+
+    @override_settings(REVALIDATE_SECRET_TOKEN="")
+    def test_not_configured_drains_without_sending(self):
+        with mock.patch(SEND_TARGET) as send:
+            stats = flush_revalidation_queue()
+
+        send.assert_not_called()
+        self.assertEqual(stats["calls"], 3)
+        self.assertFalse(RevalidationRequest.objects.exists())
+
+    def test_empty_queue_sends_nothing(self):
+        RevalidationRequest.objects.all().delete()
+        with mock.patch(SEND_TARGET) as send:
+            self.assertEqual(flush_revalidation_queue()["calls"], 0)
+        send.assert_not_called()
+
+
+@override_settings(REVALIDATE_SECRET_TOKEN="token")
+class FlushRevalidationTaskTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        RevalidationRequest.objects.create(tags=["products"])
+
+    def run_task(self):
+        # eager 실행에서는 self.retry 가 재시도 체인 전체를 동기로 돌린다.
+        return task_flush_revalidation.apply()
+
+    def test_alerts_once_per_outage(self):
+        with mock.patch(SEND_TARGET, return_value=False), mock.patch(
+            ALERT_TARGET
+        ) as alert:
+            self.assertTrue(self.run_task().failed())
+            self.assertTrue(self.run_task().failed())
+
+        alert.assert_called_once()
+        self.assertFalse(cache.get(RETRY_PENDING_KEY))
+        self.assertTrue(RevalidationRequest.objects.exists())
+
+    def test_recovery_rearms_alert(self):
+        cache.set(OUTAGE_ALERTED_KEY, 1)
+        with mock.patch(SEND_TARGET, return_value=True):
+            self.assertEqual(self.run_task().get()["calls"], 1)
+        self.assertIsNone(cache.get(OUTAGE_ALERTED_KEY))
+
+        RevalidationRequest.objects.create(tags=["products"])
+        with mock.patch(SEND_TARGET, return_value=False), mock.patch(
+            ALERT_TARGET
+        ) as alert:
+            self.run_task()
+        alert.assert_called_once()
+
+    def test_skips_while_retry_chain_pending(self):
+        cache.set(RETRY_PENDING_KEY, 1)
+        with mock.patch(SEND_TARGET) as send:
+            self.assertEqual(self.run_task().get()["calls"], 0)
+
+        send.assert_not_called()
+        self.assertTrue(RevalidationRequest.objects.exists())
+
+
+class ProductTagsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.device = Device.objects.create(model_name="iPhone 16", brand="Apple")
+        self.variant = DeviceVariant.objects.create(
+            device=self.device, storage_capacity="256GB", device_price=1400000
+        )
+        self.product = Product.objects.create(name="iPhone 16", device=self.device)
+
+    def test_product_ids_map_to_detail_and_brand_tags(self):
+        self.assertEqual(
+            product_tags(product_ids=[self.product.id]),
+            [f"product-detail-{self.product.id}", "products-brand-Apple"],
+        )
+
+    def test_inventory_change_maps_to_detail_tag_only(self):
+        self.assertEqual(
+            product_tags(device_variant_ids=[self.variant.id], include_lists=False),
+            [f"product-detail-{self.product.id}"],
+        )
+
+    @override_settings(REVALIDATE_PRODUCT_TAGS_ONLY=True)
+    def test_structural_change_uses_global_tags(self):
+        with mock.patch(SCHEDULE_TARGET):
+            revalidate_products()
+            revalidate_products(product_ids=[self.product.id])
+
+        self.assertEqual(
+            list(
+                RevalidationRequest.objects.order_by("id").values_list(
+                    "tags", flat=True
+                )
+            ),
+            [
+                ["products", "product-detail"],
+                [f"product-detail-{self.product.id}", "products-brand-Apple"],
+            ],
+        )
+
+    def test_global_tags_sent_alongside_by_default(self):
+        with mock.patch(SCHEDULE_TARGET):
+            revalidate_products(product_ids=[self.product.id])
+            revalidate_products(
+                device_variant_ids=[self.variant.id], include_lists=False
+            )
+
+        self.assertEqual(
+            list(
+                RevalidationRequest.objects.order_by("id").values_list(
+                    "tags", flat=True
+                )
+            ),
+            [
+                [
+                    f"product-detail-{self.product.id}",
+                    "products-brand-Apple",
+                    "product-detail",
+                    "products",
+                ],
+                [f"product-detail-{self.product.id}", "product-detail"],
+            ],
+        )
+
+    def test_unknown_ids_enqueue_nothing(self):
+        self.assertFalse(revalidate_products(product_ids=[0]))
+        self.assertFalse(RevalidationRequest.objects.exists())
+
+
+@override_settings(REVALIDATE_PRODUCT_TAGS_ONLY=True)
+class ProductAdminRevalidateTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        device = Device.objects.create(model_name="Galaxy S25", brand="Samsung")
+        self.product = Product.objects.create(name="Galaxy S25", device=device)
+        self.model_admin = admin.site._registry[Product]
+        self.request = RequestFactory().post("/")
+
+    def save_related(self, changed_data=(), model=None, **formset_objects):
+        form = mock.Mock(instance=self.product, changed_data=list(changed_data))
+        formset = mock.Mock(
+            **{
+                "model": model or ProductDetailImage,
+                "new_objects": [],
+                "changed_objects": [],
+                "deleted_objects": [],
+                **formset_objects,
+            }
+        )
+        with mock.patch(SCHEDULE_TARGET):
+            self.model_admin.save_related(self.request, form, [formset], True)
+        return list(RevalidationRequest.objects.values_list("tags", flat=True))
+
+    def test_inline_change_revalidates_product(self):
+        self.assertEqual(
+            self.save_related(new_objects=[mock.Mock()]),
+            [[f"product-detail-{self.product.id}", "products-brand-Samsung"]],
+        )
+
+    def test_unchanged_form_and_inlines_send_nothing(self):
+        self.assertEqual(self.save_related(), [])
+        # 옵션 inline 은 저장하지 않으므로 태그도 만들지 않는다.
+        self.assertEqual(
+            self.save_related(model=ProductOption, new_objects=[mock.Mock()]), []
+        )
+
+    def test_structural_field_uses_global_tags(self):
+        self.assertEqual(
+            self.save_related(changed_data=["is_active"]),
+            [["products", "product-detail"]],
+        )
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from phone.models import ArchivedRow, Device, DeviceVariant
+from phone.soft_delete_purge import purge_soft_deleted, purge_targets
+
+
+class PurgeSoftDeletedTest(TestCase):
+    def setUp(self):
+        self.old = timezone.now() - timedelta(days=100)
+
+    def make_device(self, name, deleted_at=None):
+        device = Device.objects.create(model_name=name, brand="Samsung")
+        Device.objects.filter(id=device.id).update(deleted_at=deleted_at)
+        return device
+
+    def remaining_ids(self):
+        return set(QuerySet(Device).values_list("id", flat=True))
+
+    def test_archives_rows_past_retention_in_batches(self):
+        expired = [self.make_device(f"old {i}", self.old) for i in range(3)]
+        recent = self.make_device("recent", timezone.now() - timedelta(days=1))
+        alive = self.make_device("alive")
+
+        results = purge_soft_deleted(
+            [Device], mode="archive", retention_days=90, batch_size=2, sleep=0
+        )
+
+        self.assertEqual(results, {"phone.Device": 3})
+        self.assertEqual(self.remaining_ids(), {recent.id, alive.id})
+        archived = ArchivedRow.objects.filter(table_name=Device._meta.db_table)
+        self.assertEqual(
+            sorted(archived.values_list("row_id", flat=True)),
+            sorted(str(d.id) for d in expired),
+        )
+        self.assertEqual(
+            archived.get(row_id=str(expired[0].id)).data["model_name"], "old 0"
+        )
+
+    def test_delete_mode_skips_archive(self):
+        self.make_device("old", self.old)
+
+        purge_soft_deleted([Device], mode="delete", retention_days=90, sleep=0)
+
+        self.assertEqual(self.remaining_ids(), set())
+        self.assertFalse(ArchivedRow.objects.exists())
+
+    def test_keeps_rows_still_referenced(self):
+        device = self.make_device("old", self.old)
+        DeviceVariant.objects.create(
+            device=device, storage_capacity="256GB", device_price=1000000
+        )
+
+        purge_soft_deleted([Device], retention_days=90, sleep=0)
+
+        self.assertEqual(self.remaining_ids(), {device.id})
+
+    def test_children_are_purged_before_parents(self):
+        targets = purge_targets()
+        self.assertLess(targets.index(DeviceVariant), targets.index(Device))
@@ -0,0 +1,32 @@
+from django.test import SimpleTestCase
+
+from phone.startup_benchmark import measure_role
+from phoneinone_server.process_role import detect_process_role
+
+
+class DetectProcessRoleTest(SimpleTestCase):
+    def test_procfile_commands(self):
+        cases = {
+            ("/venv/bin/gunicorn", "phoneinone_server.wsgi:application"): "web",
+            ("manage.py", "runserver"): "web",
+            ("/venv/bin/celery", "-A", "phoneinone_server", "worker"): "worker",
+            ("/venv/bin/celery", "-A", "phoneinone_server", "beat", "-l", "info"): (
+                "beat"
+            ),
+            ("manage.py", "migrate"): "command",
+            (): "command",
+        }
+        for argv, role in cases.items():
+            self.assertEqual(detect_process_role(list(argv)), role, argv)
+
+
+class StartupBenchmarkTest(SimpleTestCase):
+    def test_web_role_does_not_load_heavy_modules(self):
+        result = measure_role("web", repeat=1)
+
+        self.assertEqual(result["heavy_modules"], [])
+        self.assertGreater(result["rss_mb"], 0)
+
+    def test_unknown_role(self):
+        with self.assertRaises(ValueError):
+            measure_role("cron", repeat=1)
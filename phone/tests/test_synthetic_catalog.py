@@ -0,0 +1,86 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+
+from phone.models import (
+    CalculatorSession,
+    OpenMarketProduct,
+    PriceHistory,
+    PriceHistoryDaily,
+    Product,
+    ProductOption,
+)
+from phone.synthetic_catalog import CatalogScale, build_catalog
+
+
+class SyntheticCatalogTest(TestCase):
+    def test_counts_follow_scale(self):
+        scale = CatalogScale(
+            products=4,
+            carriers=2,
+            variants_per_device=2,
+            plans_per_carrier=3,
+            open_markets=2,
+            price_history_days=10,
+            calculator_sessions=20,
+        )
+
+        counts = build_catalog(scale)
+
+        # 상품 x 용량 x (통신사 x 요금제) x 계약/할인 4조합
+        self.assertEqual(counts["ProductOption"], 4 * 2 * (2 * 3) * 4)
+        self.assertEqual(ProductOption.objects.count(), 4 * 2 * 2 * 3 * 4)
+        self.assertFalse(Product.objects.filter(best_price_option=None).exists())
+        # 마켓 x 용량 x 통신사 x 번호이동/기기변경, 옵션은 요금제별 공시지원금 옵션
+        self.assertEqual(counts["OpenMarketProduct"], 2 * (4 * 2) * 2 * 2)
+        self.assertEqual(counts["OpenMarketProductOption"], 2 * (4 * 2) * 2 * 2 * 3)
+        om_product = OpenMarketProduct.objects.order_by("id").first()
+        self.assertEqual(om_product.get_capacity(), "128")
+        self.assertEqual(om_product.get_carrier(), "SK")
+        # (상품 x 통신사) 시리즈마다 10일치 일별 가격
+        self.assertEqual(PriceHistoryDaily.objects.count(), 4 * 2 * 10)
+        self.assertEqual(counts["PriceHistory"], PriceHistory.objects.count())
+        self.assertEqual(CalculatorSession.objects.count(), 20)
+
+    def test_same_seed_builds_same_data(self):
+        def snapshot(seed):
+            savepoint = transaction.savepoint()
+            build_catalog(CatalogScale(products=3, calculator_sessions=5), seed=seed)
+            data = (
+                list(
+                    ProductOption.objects.order_by("id").values_list(
+                        "final_price", "additional_discount"
+                    )
+                ),
+                sorted(CalculatorSession.objects.values_list("id", "pio_total")),
+            )
+            transaction.savepoint_rollback(savepoint)
+            return data
+
+        self.assertEqual(snapshot(1), snapshot(1))
+        self.assertNotEqual(snapshot(1), snapshot(2))
+
+
+class GenerateSyntheticCatalogCommandTest(TestCase):
+    @override_settings(DEBUG=False)
+    def test_refuses_without_debug(self):
+        with self.assertRaisesMessage(Exception, "--force"):
+            call_command("generate_synthetic_catalog", stdout=StringIO())
+
+    @override_settings(DEBUG=True)
+    def test_generates_catalog(self):
+        out = StringIO()
+
+        call_command(
+            "generate_synthetic_catalog",
+            "--products",
+            "5",
+            "--carriers",
+            "1",
+            stdout=out,
+        )
+
+        self.assertEqual(Product.objects.count(), 5)
+        self.assertIn("ProductOption: 80", out.getvalue())
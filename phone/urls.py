@@ -1,13 +1,27 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework import routers
 
 from .views import *
+from .views import async_views
 
 router = routers.DefaultRouter()
 
+# ASGI 배포에서는 읽기 API 를 async view 로 서빙한다 (settings.ASYNC_READ_API)
+if settings.ASYNC_READ_API:
+    product_list = async_views.product_list
+    product_detail = async_views.product_detail
+    price_history_chart = async_views.price_history_chart
+    price_history_chart_batch = async_views.price_history_chart_batch
+else:
+    product_list = ProductViewSet.as_view({"get": "list"})
+    product_detail = ProductViewSet.as_view({"get": "retrieve"})
+    price_history_chart = PriceHistoryChartViewSet.as_view({"get": "list"})
+    price_history_chart_batch = PriceHistoryChartViewSet.as_view({"get": "batch"})
+
 urlpatterns = [
-    path("products", ProductViewSet.as_view({"get": "list"})),
-    path("products/<int:pk>", ProductViewSet.as_view({"get": "retrieve"})),
+    path("products", product_list),
+    path("products/<int:pk>", product_detail),
     path("product-series", ProductSeriesViewSet.as_view({"get": "list"})),
     path("orders", OrderViewSet.as_view({"get": "list", "post": "create"})),
     path("orders/<int:pk>", OrderViewSet.as_view({"get": "retrieve"})),
@@ -35,10 +49,8 @@ urlpatterns = [
         "price-notification-requests",
         PriceNotificationRequestViewSet.as_view({"get": "list", "post": "create"}),
     ),
-    path(
-        "price-history-chart",
-        PriceHistoryChartViewSet.as_view({"get": "list"}),
-    ),
+    path("price-history-chart", price_history_chart),
+    path("price-history-chart/batch", price_history_chart_batch),
     path(
         "diagnosis-logs",
         DiagnosisLogViewSet.as_view({"post": "create"}),
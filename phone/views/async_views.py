@@ -0,0 +1,162 @@
+"""
+읽기 API 의 async view (상품 목록 / 상세, 가격 차트)
+
+ProductViewSet.list / retrieve, PriceHistoryChartViewSet.list / batch 와 같은 쿼리를
+async ORM(aexists / aupdate / afirst / async for)으로 실행한다. ASGI 워커(uvicorn)에서는
+쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 받으므로, 워커 프로세스당 동시에 처리할
+수 있는 요청 수가 gunicorn sync 워커(프로세스당 1개)보다 훨씬 많다.
+
+    - queryset 구성과 파라미터 검증은 sync view 의 함수를 그대로 쓴다 (응답이 같아야 함)
+    - 목록은 aiterator() 대신 async for 로 한 번에 읽는다. aiterator() 는 서버 사이드
+      커서를 써서 정렬 없는 queryset(재고 등)의 순서가 sync 와 달라질 수 있고,
+      values_list 에서는 첫 SQL 을 이벤트 루프에서 실행해 에러가 난다 (Django 5.2)
+    - serializer 는 lazy 관계 접근(예: device.specs.order_by)이 남아 있어
+      sync_to_async 로 실행한다
+    - settings.FAST_PRODUCT_SERIALIZATION 이면 상품 목록 / 상세는 serializer 대신
+      phone.product_payloads 로 만든다 (sync view 와 같은 분기)
+    - 응답은 ORJSONRenderer 로 렌더링해 sync view 와 바이트 단위로 같다
+      (브라우저블 API / format 협상은 지원하지 않는다)
+
+settings.ASYNC_READ_API 가 True 면 phone/urls.py 가 기존 경로를 이 view 로 연결한다.
+phoneinone_server/asgi.py 로 띄우면 기본으로 켜진다.
+
+사용법:
+    gunicorn phoneinone_server.asgi:application -k uvicorn_worker.UvicornWorker
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework import status
+
+from phone.price_series import abuild_price_charts
+from phone.product_payloads import product_detail_payload, product_list_payload
+from phone.renderers import ORJSONRenderer
+from phone.serializers import ProductDetailSerializer, ProductListSerializer
+from phone.views.price_views import parse_chart_batch_params, parse_chart_params
+from phone.views.product_views import (
+    ProductViewSet,
+    detail_inventories,
+    group_in_stock_by_device,
+    in_stock_inventories,
+    product_detail_queryset,
+    product_list_querysets,
+    related_products_queryset,
+)
+from phoneinone_server.db_router import replica_reads, untracked_writes
+
+
+def _json_response(data=None, status=status.HTTP_200_OK):
+    content = b"" if data is None else ORJSONRenderer().render(data)
+    return HttpResponse(content, status=status, content_type="application/json")
+
+
+async def _alist(queryset):
+    # QuerySet.__aiter__: _fetch_all(prefetch 포함)을 스레드에서 한 번에 실행
+    return [obj async for obj in queryset]
+
+
+@replica_reads
+@require_GET
+async def product_list(request):
+    """ProductViewSet.list 의 async 버전."""
+    base_queryset, queryset = product_list_querysets(
+        ProductViewSet.queryset.all(), request.GET
+    )
+    if not await base_queryset.aexists():
+        return _json_response(status=status.HTTP_404_NOT_FOUND)
+
+    if settings.FAST_PRODUCT_SERIALIZATION:
+        data = await sync_to_async(product_list_payload)(
+            queryset, request.GET.get("carrier")
+        )
+        return _json_response(data)
+
+    products = await _alist(queryset)
+    in_stock_by_device = group_in_stock_by_device(
+        await _alist(in_stock_inventories(queryset))
+    )
+
+    serializer = ProductListSerializer(
+        products, many=True, context={"in_stock_by_device": in_stock_by_device}
+    )
+    return _json_response(await sync_to_async(lambda: serializer.data)())
+
+
+@replica_reads
+@require_GET
+async def product_detail(request, pk):
+    """ProductViewSet.retrieve 의 async 버전 (조회수 +1 포함)."""
+    base_queryset = ProductViewSet.queryset.filter(id=pk)
+    if not await base_queryset.aexists():
+        return _json_response(status=status.HTTP_404_NOT_FOUND)
+
+    with untracked_writes():
+        await base_queryset.all().aupdate(views=F("views") + 1)
+
+    if settings.FAST_PRODUCT_SERIALIZATION:
+        data = await sync_to_async(product_detail_payload)(
+            base_queryset, request.GET.get("carrier", None)
+        )
+        if data is None:
+            return _json_response(status=status.HTTP_404_NOT_FOUND)
+        return _json_response(data)
+
+    instance = await product_detail_queryset(
+        base_queryset, request.GET.get("carrier", None)
+    ).afirst()
+    if instance is None:
+        return _json_response(status=status.HTTP_404_NOT_FOUND)
+
+    inventories = await _alist(detail_inventories(instance))
+    related_products = []
+    if instance.product_series_id:
+        related_products = await _alist(related_products_queryset(instance))
+
+    serializer = ProductDetailSerializer(
+        instance,
+        context={
+            "inventories": inventories,
+            "related_products": related_products,
+        },
+    )
+    return _json_response(await sync_to_async(lambda: serializer.data)())
+
+
+@replica_reads
+@require_GET
+async def price_history_chart(request):
+    """PriceHistoryChartViewSet.list 의 async 버전."""
+    try:
+        product_id, period = parse_chart_params(request.GET)
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    charts = await abuild_price_charts([product_id], [period])
+    if not charts:
+        return _json_response(
+            {"error": "상품을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND
+        )
+    return _json_response(charts[(product_id, period)])
+
+
+@replica_reads
+@require_GET
+async def price_history_chart_batch(request):
+    """PriceHistoryChartViewSet.batch 의 async 버전."""
+    try:
+        product_ids, periods = parse_chart_batch_params(request.GET)
+    except ValueError as e:
+        return _json_response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    charts = await abuild_price_charts(product_ids, periods)
+    return _json_response(
+        {
+            "results": [
+                {"product_id": product_id, **chart}
+                for (product_id, _), chart in charts.items()
+            ]
+        }
+    )
@@ -1,6 +1,7 @@
 import logging
 
 from django.conf import settings
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from drf_yasg.utils import swagger_auto_schema
@@ -11,7 +12,8 @@ from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
-from phone.external_services.channel_talk import send_calculator_lead_alert
+from phone.calculator_buffer import buffer_session, ensure_session_persisted
+from phone.external_services.channel_talk_outbox import queue_calculator_lead_alert
 from phone.models import CalculatorSession
 from phone.serializers import (
     CalculatorSessionCreateSerializer,
@@ -52,6 +54,11 @@ class CalculatorSessionViewSet(
             return CalculatorSessionPatchSerializer
         return CalculatorSessionDetailSerializer
 
+    def get_object(self):
+        # write-behind 버퍼에만 있는 세션도 조회되도록 먼저 INSERT
+        ensure_session_persisted(self.kwargs[self.lookup_field])
+        return super().get_object()
+
     @swagger_auto_schema(
         operation_summary="Calculator 세션 생성 (result_view 시점)",
         tags=["Calculator"],
@@ -64,6 +71,11 @@ class CalculatorSessionViewSet(
                 {"id": None, "debug_skipped": True},
                 status=status.HTTP_200_OK,
             )
+        if settings.CALCULATOR_WRITE_BEHIND:
+            session_id = buffer_session(
+                *serializer.to_session_fields(serializer.validated_data)
+            )
+            return Response({"id": str(session_id)}, status=status.HTTP_201_CREATED)
         instance = serializer.save()
         return Response({"id": str(instance.id)}, status=status.HTTP_201_CREATED)
 
@@ -92,24 +104,21 @@ class CalculatorSessionViewSet(
         }
         fields["updated_at"] = timezone.now()
 
-        affected = CalculatorSession.objects.filter(
-            id=pk,
-            contact_channel__isnull=True,
-            deleted_at__isnull=True,
-        ).update(**fields)
-
-        instance = get_object_or_404(CalculatorSession, id=pk)
-        applied = affected == 1
-        if not applied:
-            logger.warning(
-                "first_write_wins.ignored session_id=%s attempted=%s",
-                pk,
-                fields.get("contact_channel"),
-            )
-        else:
-            # 첫 lead 결정 시에만 운영팀 채널 알림. 실패해도 응답은 정상.
-            try:
-                send_calculator_lead_alert(
+        # 버퍼에만 있는 세션이면 먼저 INSERT → 아래 조건부 UPDATE 로 first-write-wins 유지
+        ensure_session_persisted(pk)
+        with transaction.atomic():
+            affected = CalculatorSession.objects.filter(
+                id=pk,
+                contact_channel__isnull=True,
+                deleted_at__isnull=True,
+            ).update(**fields)
+
+            instance = get_object_or_404(CalculatorSession, id=pk)
+            applied = affected == 1
+            if applied:
+                # 첫 lead 결정 시에만 운영팀 채널 알림 - UPDATE 와 같은 트랜잭션으로
+                # outbox 에 적재하고 발송은 워커가 한다 (응답이 채널톡을 기다리지 않음).
+                queue_calculator_lead_alert(
                     session_id=str(instance.id),
                     contact_channel=instance.contact_channel,
                     customer_name=instance.submitted_name,
@@ -119,10 +128,13 @@ class CalculatorSessionViewSet(
                     total_saving=instance.total_saving,
                     funnel_variant=instance.funnel_variant,
                 )
-            except Exception:
-                logger.exception(
-                    "calculator_lead_alert.failed session_id=%s", instance.id
-                )
+
+        if not applied:
+            logger.warning(
+                "first_write_wins.ignored session_id=%s attempted=%s",
+                pk,
+                fields.get("contact_channel"),
+            )
 
         data = CalculatorSessionDetailSerializer(
             instance, context={"applied": applied}
@@ -150,6 +162,7 @@ class CustomerIdentityCreateView(APIView):
                 {**serializer.validated_data, "debug_skipped": True},
                 status=status.HTTP_200_OK,
             )
+        ensure_session_persisted(id)
         session = get_object_or_404(CalculatorSession, id=id)
         if hasattr(session, "identity"):
             return Response(
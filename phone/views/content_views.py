@@ -8,6 +8,7 @@ from rest_framework import mixins, status
 from django.db.models import Prefetch, QuerySet
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from phoneinone_server.db_router import replica_reads
 
 from phone.serializers import (
     FAQSerializer,
@@ -33,6 +34,7 @@ from phone.models import (
 )
 
 
+@replica_reads
 class FAQViewSet(ReadOnlyModelViewSet):
     """FAQ 목록 조회 API"""
 
@@ -48,6 +50,7 @@ class FAQViewSet(ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
 
+@replica_reads
 class NoticeViewSet(ReadOnlyModelViewSet):
     serializer_class = NoticeSerializer
     queryset = Notice.objects.all().order_by("-created_at")
@@ -92,6 +95,7 @@ class NoticeViewSet(ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
+@replica_reads
 class BannerViewSet(ReadOnlyModelViewSet):
     """배너 목록 API"""
 
@@ -109,6 +113,7 @@ class BannerViewSet(ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
 
+@replica_reads
 class ReviewViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, GenericViewSet):
     """상품 리뷰 API"""
 
@@ -182,6 +187,7 @@ class ReviewViewSet(mixins.ListModelMixin, mixins.CreateModelMixin, GenericViewS
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+@replica_reads
 class PolicyDocumentViewSet(ReadOnlyModelViewSet):
     """약관/개인정보처리방침 API"""
 
@@ -205,6 +211,7 @@ class PolicyDocumentViewSet(ReadOnlyModelViewSet):
         return super().retrieve(request, *args, **kwargs)
 
 
+@replica_reads
 class PartnerCardViewSet(ReadOnlyModelViewSet):
     """제휴 카드 API"""
 
@@ -236,6 +243,7 @@ class PartnerCardViewSet(ReadOnlyModelViewSet):
         return super().list(request, *args, **kwargs)
 
 
+@replica_reads
 class EventViewSet(ReadOnlyModelViewSet):
     """이벤트 API"""
 
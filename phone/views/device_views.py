@@ -7,6 +7,7 @@ from django.utils import timezone
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.permissions import AllowAny
 from rest_framework import status
+from phoneinone_server.db_router import replica_reads
 
 from phone.serializers import (
     DeviceSerializer,
@@ -21,6 +22,7 @@ from phone.models import (
 )
 
 
+@replica_reads
 class DeviceViewSet(ReadOnlyModelViewSet):
     """단말기 목록 API"""
 
@@ -54,6 +56,7 @@ class DeviceViewSet(ReadOnlyModelViewSet):
     )
 
 
+@replica_reads
 class PhonePlanViewSet(ReadOnlyModelViewSet):
     """요금제 목록 API"""
 
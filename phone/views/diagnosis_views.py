@@ -1,3 +1,4 @@
+from django.db import transaction
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -6,7 +7,7 @@ from rest_framework import mixins, status
 from drf_yasg.utils import swagger_auto_schema
 
 from phone.serializers import DiagnosisLogSerializer, DiagnosisInquirySerializer
-from phone.external_services.channel_talk import send_inquiry_alert
+from phone.external_services.channel_talk_outbox import queue_inquiry_alert
 
 
 class DiagnosisLogViewSet(mixins.CreateModelMixin, GenericViewSet):
@@ -43,22 +44,24 @@ class DiagnosisInquiryViewSet(mixins.CreateModelMixin, GenericViewSet):
     def create(self, request: Request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
 
         body = request.data
-
         if not isinstance(body, dict):
             return Response(
-                {"error": "Invalid data format"}, status=status.HTTP_400_BAD_REQUEST
+                {"error": "Invalid data format"},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-        send_inquiry_alert(
-            customer_name=body.get("name", ""),
-            customer_phone=body.get("contact", ""),
-            device_name=body.get("device_name", ""),
-            internet_new=body.get("internet_new", "true") == "true",
-            card=body.get("card", "true") == "true",
-            gift=body.get("gift", "true") == "true",
-        )
+        # 문의 row 와 채널톡 알림 outbox 를 같은 트랜잭션으로 적재 (발송은 워커)
+        with transaction.atomic():
+            serializer.save()
+            queue_inquiry_alert(
+                customer_name=body.get("name", ""),
+                customer_phone=body.get("contact", ""),
+                device_name=body.get("device_name", ""),
+                internet_new=body.get("internet_new", "true") == "true",
+                card=body.get("card", "true") == "true",
+                gift=body.get("gift", "true") == "true",
+            )
 
         return Response(serializer.data, status=status.HTTP_201_CREATED)
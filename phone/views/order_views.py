@@ -1,5 +1,6 @@
 import uuid
 
+from django.db import transaction
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -15,10 +16,8 @@ from phone.serializers import (
     OrderDetailSerializer,
 )
 from phone.models import Order, CreditCheckAgreement
-from phone.external_services.channel_talk import (
-    send_credit_check_alert,
-    send_order_alert,
-)
+from phone.external_services.channel_talk import send_credit_check_alert
+from phone.external_services.channel_talk_outbox import queue_order_alert
 
 from .helpers import clean_phone_num
 
@@ -119,7 +118,7 @@ WHERE
 
     @swagger_auto_schema(
         operation_summary="주문 생성",
-        operation_description="새 주문을 생성합니다. 생성 시 Channel Talk 알림 발송.",
+        operation_description="새 주문을 생성합니다. 생성 시 Channel Talk 알림을 outbox 에 적재(비동기 발송).",
         request_body=OrderCreateSerializer,
         responses={
             201: openapi.Response(
@@ -133,40 +132,42 @@ WHERE
         customer_phone = clean_phone_num(body.get("customer_phone"))
         customer_phone2 = clean_phone_num(body.get("customer_phone2"))
 
-        new_order = Order.objects.create(
-            customer_name=body.get("customer_name"),
-            customer_phone=customer_phone,
-            customer_phone2=customer_phone2,
-            customer_email=body.get("customer_email"),
-            customer_birth=body.get("customer_birth"),
-            product_id=body.get("product_id"),
-            plan_id=body.get("plan_id"),
-            contract_type=body.get("contract_type"),
-            device_price=body.get("device_price"),
-            plan_monthly_fee=body.get("plan_monthly_fee"),
-            subsidy_standard=body.get("subsidy_standard"),
-            subsidy_mnp=body.get("subsidy_mnp"),
-            payment_period=body.get("payment_period"),
-            final_price=body.get("final_price"),
-            discount_type=body.get("discount_type"),
-            monthly_discount=body.get("monthly_discount"),
-            additional_discount=body.get("additional_discount"),
-            storage_capacity=body.get("storage_capacity"),
-            color=body.get("color"),
-            customer_memo=body.get("customer_memo"),
-            shipping_address=body.get("shipping_address"),
-            shipping_address_detail=body.get("shipping_address_detail"),
-            zipcode=body.get("zipcode"),
-            ga4_id=body.get("ga4_id", ""),
-            prev_carrier=body.get("prev_carrier", ""),
-            channeltalk_user_id=body.get("channeltalk_user_id", ""),
-        )
-        new_order.save()
-        send_order_alert(
-            order_id=new_order.id,
-            customer_name=new_order.customer_name,
-            customer_phone=new_order.customer_phone,
-        )
+        # 주문 row 와 채널톡 알림 outbox 를 같은 트랜잭션으로 적재 (발송은 워커)
+        with transaction.atomic():
+            new_order = Order.objects.create(
+                customer_name=body.get("customer_name"),
+                customer_phone=customer_phone,
+                customer_phone2=customer_phone2,
+                customer_email=body.get("customer_email"),
+                customer_birth=body.get("customer_birth"),
+                product_id=body.get("product_id"),
+                plan_id=body.get("plan_id"),
+                contract_type=body.get("contract_type"),
+                device_price=body.get("device_price"),
+                plan_monthly_fee=body.get("plan_monthly_fee"),
+                subsidy_standard=body.get("subsidy_standard"),
+                subsidy_mnp=body.get("subsidy_mnp"),
+                payment_period=body.get("payment_period"),
+                final_price=body.get("final_price"),
+                discount_type=body.get("discount_type"),
+                monthly_discount=body.get("monthly_discount"),
+                additional_discount=body.get("additional_discount"),
+                storage_capacity=body.get("storage_capacity"),
+                color=body.get("color"),
+                customer_memo=body.get("customer_memo"),
+                shipping_address=body.get("shipping_address"),
+                shipping_address_detail=body.get("shipping_address_detail"),
+                zipcode=body.get("zipcode"),
+                ga4_id=body.get("ga4_id", ""),
+                prev_carrier=body.get("prev_carrier", ""),
+                channeltalk_user_id=body.get("channeltalk_user_id", ""),
+            )
+            new_order.save()
+            queue_order_alert(
+                order_id=new_order.id,
+                customer_name=new_order.customer_name,
+                customer_phone=new_order.customer_phone,
+            )
         return Response({"id": new_order.id}, status=201)
 
     @swagger_auto_schema(
@@ -3,22 +3,61 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.utils import timezone
-from datetime import timedelta
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from phoneinone_server.db_router import replica_reads
 
 from phone.serializers import (
     PriceNotificationRequestSerializer,
     PriceNotificationRequestCreateSerializer,
 )
-from phone.models import (
-    PriceNotificationRequest,
-    PriceHistory,
-    Product,
-    DeviceVariant,
-)
-from phone.constants import CarrierChoices
+from phone.models import PriceNotificationRequest
+from phone.price_series import PERIOD_DAYS, build_price_charts
+
+MAX_BATCH_PRODUCTS = 50
+
+
+def _invalid_period_message():
+    return f"유효하지 않은 period입니다. 가능한 값: {list(PERIOD_DAYS.keys())}"
+
+
+def parse_chart_params(query_params) -> tuple[int, str]:
+    """가격 차트 조회 파라미터 (product_id, period). 잘못되면 ValueError(응답 메시지)."""
+    product_id = query_params.get("product_id")
+    if not product_id:
+        raise ValueError("product_id 파라미터가 필요합니다.")
+    try:
+        product_id = int(product_id)
+    except ValueError:
+        raise ValueError("product_id는 정수여야 합니다.") from None
+
+    period = query_params.get("period", "1month")
+    if period not in PERIOD_DAYS:
+        raise ValueError(_invalid_period_message())
+    return product_id, period
+
+
+def parse_chart_batch_params(query_params) -> tuple[list[int], list[str]]:
+    """가격 차트 일괄 조회 파라미터 (product_ids, periods). 잘못되면 ValueError."""
+    try:
+        product_ids = [
+            int(value)
+            for value in query_params.get("product_ids", "").split(",")
+            if value.strip()
+        ]
+    except ValueError:
+        raise ValueError("product_ids는 쉼표로 구분된 정수여야 합니다.") from None
+    if not product_ids or len(product_ids) > MAX_BATCH_PRODUCTS:
+        raise ValueError(f"product_ids는 1~{MAX_BATCH_PRODUCTS}개여야 합니다.")
+
+    periods = [
+        value.strip()
+        for value in query_params.get("periods", "1month").split(",")
+        if value.strip()
+    ]
+    if not periods or any(p not in PERIOD_DAYS for p in periods):
+        raise ValueError(_invalid_period_message())
+    return product_ids, periods
 
 
 class PriceNotificationRequestViewSet(ModelViewSet):
@@ -126,18 +165,16 @@ class PriceNotificationRequestViewSet(ModelViewSet):
         return super().destroy(request, *args, **kwargs)
 
 
+@replica_reads
 class PriceHistoryChartViewSet(GenericViewSet):
-    """가격 변동 차트 데이터를 제공하는 ViewSet"""
+    """가격 변동 차트 데이터를 제공하는 ViewSet
+
+    PriceHistoryDaily(쓰기 시점에 forward-fill 된 일별 시리즈)를 범위 조회해서 만든다.
+    """
 
     permission_classes = [AllowAny]
 
-    PERIOD_DAYS = {
-        "1week": 7,
-        "1month": 30,
-        "3months": 90,
-        "6months": 180,
-        "1year": 365,
-    }
+    PERIOD_DAYS = PERIOD_DAYS
 
     @swagger_auto_schema(
         operation_summary="가격 변동 차트 데이터 조회",
@@ -163,133 +200,53 @@ class PriceHistoryChartViewSet(GenericViewSet):
         tags=["가격차트"],
     )
     def list(self, request, *args, **kwargs):
-        product_id = request.query_params.get("product_id")
-        if not product_id:
-            return Response(
-                {"error": "product_id 파라미터가 필요합니다."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         try:
-            product_id = int(product_id)
-        except ValueError:
-            return Response(
-                {"error": "product_id는 정수여야 합니다."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-        period = request.query_params.get("period", "1month")
-        if period not in self.PERIOD_DAYS:
-            return Response(
-                {
-                    "error": f"유효하지 않은 period입니다. 가능한 값: {list(self.PERIOD_DAYS.keys())}"
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            product_id, period = parse_chart_params(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            product = Product.objects.select_related("device").get(id=product_id)
-        except Product.DoesNotExist:
+        charts = build_price_charts([product_id], [period])
+        if not charts:
             return Response(
                 {"error": "상품을 찾을 수 없습니다."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        smallest_variant = (
-            DeviceVariant.objects.filter(device=product.device)
-            .order_by("device_price")
-            .first()
-        )
-
-        storage = smallest_variant.storage_capacity if smallest_variant else "N/A"
-
-        days = self.PERIOD_DAYS[period]
-        end_date = timezone.now().date()
-        start_date = end_date - timedelta(days=days)
-
-        carriers = [CarrierChoices.SK, CarrierChoices.KT, CarrierChoices.LG]
-        last_known_prices = {}
-        last_known_plans = {}
-
-        for carrier in carriers:
-            initial_price = (
-                PriceHistory.objects.filter(
-                    product=product,
-                    carrier=carrier,
-                    price_at__lt=start_date,
-                )
-                .select_related("plan")
-                .order_by("-price_at")
-                .first()
-            )
-            if initial_price:
-                last_known_prices[carrier] = initial_price.final_price
-                last_known_plans[carrier] = initial_price.plan
-            else:
-                last_known_prices[carrier] = None
-                last_known_plans[carrier] = None
-
-        price_histories = (
-            PriceHistory.objects.filter(
-                product=product,
-                price_at__gte=start_date,
-                price_at__lte=end_date,
-            )
-            .select_related("plan")
-            .order_by("price_at")
-        )
+        return Response(charts[(product_id, period)])
 
-        price_changes = {}
-        for ph in price_histories:
-            date_str = ph.price_at.strftime("%Y-%m-%d")
-            if date_str not in price_changes:
-                price_changes[date_str] = {}
-            price_changes[date_str][ph.carrier] = {
-                "price": ph.final_price,
-                "plan": ph.plan,
-            }
-
-        chart_data = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-
-            if date_str in price_changes:
-                for carrier, data in price_changes[date_str].items():
-                    last_known_prices[carrier] = data["price"]
-                    last_known_plans[carrier] = data["plan"]
-
-            chart_data.append(
-                {
-                    "date": date_str,
-                    "SK": last_known_prices.get(CarrierChoices.SK),
-                    "KT": last_known_prices.get(CarrierChoices.KT),
-                    "LG": last_known_prices.get(CarrierChoices.LG),
-                }
-            )
-
-            current_date += timedelta(days=1)
-
-        latest_prices = {}
-        for carrier in carriers:
-            if last_known_prices.get(carrier) is not None and last_known_plans.get(
-                carrier
-            ):
-                latest_prices[carrier] = {
-                    "price": last_known_prices[carrier],
-                    "plan_name": last_known_plans[carrier].name,
-                    "plan_price": last_known_plans[carrier].price,
-                }
-            else:
-                latest_prices[carrier] = None
+    @swagger_auto_schema(
+        operation_summary="가격 변동 차트 일괄 조회",
+        manual_parameters=[
+            openapi.Parameter(
+                "product_ids",
+                openapi.IN_QUERY,
+                description=f"상품 ID 목록, 쉼표 구분 (필수, 최대 {MAX_BATCH_PRODUCTS}개)",
+                type=openapi.TYPE_STRING,
+                required=True,
+            ),
+            openapi.Parameter(
+                "periods",
+                openapi.IN_QUERY,
+                description="조회 기간 목록, 쉼표 구분 (기본: 1month)",
+                type=openapi.TYPE_STRING,
+                required=False,
+            ),
+        ],
+        responses={200: "성공", 400: "파라미터 오류"},
+        tags=["가격차트"],
+    )
+    def batch(self, request, *args, **kwargs):
+        try:
+            product_ids, periods = parse_chart_batch_params(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+        charts = build_price_charts(product_ids, periods)
         return Response(
             {
-                "product_name": product.name,
-                "storage": storage,
-                "period": period,
-                "chart_data": chart_data,
-                "latest_prices": latest_prices,
+                "results": [
+                    {"product_id": product_id, **chart}
+                    for (product_id, _), chart in charts.items()
+                ]
             }
         )
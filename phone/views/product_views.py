@@ -3,9 +3,12 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
-from django.db.models import Prefetch, Q, F, Subquery, OuterRef
+from rest_framework.renderers import BrowsableAPIRenderer
+from django.conf import settings
+from django.db.models import Prefetch, F, Subquery, OuterRef
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
+from phoneinone_server.db_router import replica_reads, untracked_writes
 
 from phone.serializers import (
     ProductListSerializer,
@@ -15,6 +18,7 @@ from phone.serializers import (
     ProductSeriesSerializer,
 )
 from phone.models import (
+    DecoratorTag,
     Product,
     ProductOption,
     DeviceVariant,
@@ -25,9 +29,139 @@ from phone.models import (
     Inventory,
     ProductSeries,
 )
-from phone.constants import CarrierChoices
+from phone.product_payloads import (
+    detail_options_queryset,
+    list_options_queryset,
+    product_detail_payload,
+    product_list_payload,
+)
+from phone.renderers import ORJSONRenderer
+
+
+def product_list_querysets(queryset, query_params):
+    """상품 목록 (존재 확인용 base, 응답용 queryset). sync / async view 가 같이 쓴다."""
+    base_queryset = (
+        queryset.filter(best_price_option_id__isnull=False)
+        .select_related("product_series")
+        .prefetch_related(
+            Prefetch("tags", queryset=DecoratorTag.objects.order_by("id"))
+        )
+    )
+    if brand_query := query_params.get("brand", None):
+        base_queryset = base_queryset.filter(device__brand=brand_query)
+    if series_query := query_params.get("series", None):
+        base_queryset = base_queryset.filter(product_series__name=series_query)
+    prev_carrier = query_params.get("carrier", None)
+    if is_featured := query_params.get("is_featured", None):
+        if is_featured.lower() == "true":
+            base_queryset = base_queryset.filter(is_featured=True)
+        elif is_featured.lower() == "false":
+            base_queryset = base_queryset.filter(is_featured=False)
+
+    # 하위 목록 정렬은 phone.product_payloads 와 같아야 한다 (응답 바이트 비교)
+    queryset = (
+        base_queryset.select_related("device")
+        .prefetch_related(
+            Prefetch("images", queryset=ProductDetailImage.objects.order_by("id")),
+            Prefetch(
+                "options",
+                queryset=list_options_queryset(prev_carrier).select_related(
+                    "plan", "device_variant"
+                ),
+            ),
+        )
+        .order_by("-sort_order", "id")
+    )
+    return base_queryset, queryset
+
+
+def in_stock_inventories(queryset):
+    """목록 queryset 의 단말기 중 재고가 있는 Inventory (dealership, variant 포함)."""
+    device_ids = queryset.values_list("device_id", flat=True)
+    return Inventory.objects.filter(
+        device_variant__device_id__in=device_ids, count__gt=0
+    ).select_related("dealership", "device_variant")
 
 
+def group_in_stock_by_device(inventories) -> dict:
+    """device_id -> {(carrier, storage_capacity)} (ProductListSerializer context)."""
+    in_stock_by_device = {}
+    for inv in inventories:
+        did = inv.device_variant.device_id
+        if did not in in_stock_by_device:
+            in_stock_by_device[did] = set()
+        in_stock_by_device[did].add(
+            (inv.dealership.carrier, inv.device_variant.storage_capacity)
+        )
+    return in_stock_by_device
+
+
+def product_detail_queryset(base_queryset, prev_carrier):
+    """상품 상세 응답에 필요한 관계를 모두 prefetch 한 queryset."""
+    # 하위 목록 정렬은 phone.product_payloads 와 같아야 한다 (응답 바이트 비교)
+    return base_queryset.select_related("device").prefetch_related(
+        Prefetch(
+            "options",
+            queryset=detail_options_queryset(prev_carrier).select_related(
+                "plan", "device_variant", "official_contract_link"
+            ),
+        ),
+        Prefetch("device__variants", queryset=DeviceVariant.objects.order_by("id")),
+        Prefetch(
+            "device__colors",
+            queryset=DeviceColor.objects.order_by("sort_order", "id"),
+        ),
+        Prefetch(
+            "device__colors__images", queryset=DevicesColorImage.objects.order_by("id")
+        ),
+        Prefetch("images", queryset=ProductDetailImage.objects.order_by("id")),
+        Prefetch(
+            "reviews",
+            queryset=Review.objects.filter(is_public=True).order_by(
+                "-created_at", "-id"
+            )[:10],
+            to_attr="limited_reviews",
+        ),
+    )
+
+
+def detail_inventories(instance):
+    """상세 상품의 (용량, 색상) Inventory. ProductDetailSerializer context 용."""
+    variant_ids = [v.id for v in instance.device.variants.all()]
+    color_ids = [c.id for c in instance.device.colors.all()]
+    return (
+        Inventory.objects.filter(
+            device_variant_id__in=variant_ids,
+            device_color_id__in=color_ids,
+        )
+        .select_related("dealership", "device_variant", "device_color")
+        .order_by("id")
+    )
+
+
+def related_products_queryset(instance):
+    """같은 시리즈의 판매 중인 상품 (색상 이미지 포함)."""
+    return (
+        Product.objects.filter(
+            product_series_id=instance.product_series_id,
+            is_active=True,
+        )
+        .select_related("device")
+        .prefetch_related(
+            Prefetch(
+                "device__colors",
+                queryset=DeviceColor.objects.order_by("sort_order", "id"),
+            ),
+            Prefetch(
+                "device__colors__images",
+                queryset=DevicesColorImage.objects.order_by("id"),
+            ),
+        )
+        .order_by("id")
+    )
+
+
+@replica_reads
 class ProductViewSet(ReadOnlyModelViewSet):
     """
     Viewset for listing products with their best price options.
@@ -35,6 +169,7 @@ class ProductViewSet(ReadOnlyModelViewSet):
 
     serializer_class = ProductListSerializer
     queryset = Product.objects.filter(is_active=True).all()
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
 
     def get_queryset(self):
         return self.queryset
@@ -172,70 +307,18 @@ class ProductViewSet(ReadOnlyModelViewSet):
         tags=["상품"],
     )
     def list(self, request: Request, *args, **kwargs):
-        base_queryset = (
-            self.get_queryset()
-            .filter(best_price_option_id__isnull=False)
-            .select_related("product_series")
-            .prefetch_related("tags")
+        base_queryset, queryset = product_list_querysets(
+            self.get_queryset(), request.query_params
         )
-        if brand_query := request.query_params.get("brand", None):
-            base_queryset = base_queryset.filter(device__brand=brand_query)
-        if series_query := request.query_params.get("series", None):
-            base_queryset = base_queryset.filter(product_series__name=series_query)
-        if (
-            prev_carrier := request.query_params.get("carrier", None)
-        ) in CarrierChoices.VALUES:
-            pass
-        if is_featured := request.query_params.get("is_featured", None):
-            if is_featured.lower() == "true":
-                base_queryset = base_queryset.filter(is_featured=True)
-            elif is_featured.lower() == "false":
-                base_queryset = base_queryset.filter(is_featured=False)
-
         if not base_queryset.exists():
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        queryset = (
-            base_queryset.select_related("device")
-            .prefetch_related("images")
-            .order_by("-sort_order")
-        )
-
-        if prev_carrier in CarrierChoices.VALUES:
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    "options",
-                    queryset=ProductOption.objects.all()
-                    .select_related("plan", "device_variant")
-                    .filter(
-                        Q(Q(contract_type="기기변경") & Q(plan__carrier=prev_carrier))
-                        | Q(
-                            Q(contract_type="번호이동") & ~Q(plan__carrier=prev_carrier)
-                        )
-                    ),
-                )
-            )
-        else:
-            queryset = queryset.prefetch_related(
-                Prefetch(
-                    "options",
-                    queryset=ProductOption.objects.all().select_related(
-                        "plan", "device_variant"
-                    ),
-                )
+        if settings.FAST_PRODUCT_SERIALIZATION:
+            return Response(
+                product_list_payload(queryset, request.query_params.get("carrier"))
             )
 
-        device_ids = queryset.values_list("device_id", flat=True)
-        in_stock_by_device = {}
-        for inv in Inventory.objects.filter(
-            device_variant__device_id__in=device_ids, count__gt=0
-        ).select_related("dealership", "device_variant"):
-            did = inv.device_variant.device_id
-            if did not in in_stock_by_device:
-                in_stock_by_device[did] = set()
-            in_stock_by_device[did].add(
-                (inv.dealership.carrier, inv.device_variant.storage_capacity)
-            )
+        in_stock_by_device = group_in_stock_by_device(in_stock_inventories(queryset))
 
         serializer = ProductListSerializer(
             queryset, many=True, context={"in_stock_by_device": in_stock_by_device}
@@ -264,83 +347,30 @@ class ProductViewSet(ReadOnlyModelViewSet):
         if not base_queryset.exists():
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        base_queryset.update(views=F("views") + 1)
-
-        prev_carrier = request.query_params.get("carrier", None)
-        if prev_carrier in CarrierChoices.VALUES:
-            base_queryset = base_queryset.prefetch_related(
-                Prefetch(
-                    "options",
-                    queryset=ProductOption.objects.all()
-                    .select_related("plan", "device_variant", "official_contract_link")
-                    .filter(
-                        Q(Q(contract_type="기기변경") & Q(plan__carrier=prev_carrier))
-                        | Q(
-                            Q(contract_type="번호이동") & ~Q(plan__carrier=prev_carrier)
-                        )
-                    ),
-                )
-            )
-        else:
-            base_queryset = base_queryset.prefetch_related(
-                Prefetch(
-                    "options",
-                    queryset=ProductOption.objects.all()
-                    .exclude(additional_discount=0)
-                    .select_related("plan", "device_variant", "official_contract_link"),
-                )
-            )
+        # 조회수는 응답에 쓰지 않으므로 이후 읽기는 replica 그대로.
+        # update() 는 queryset 을 쓰기용으로 표시하므로 복제본에서 실행한다
+        with untracked_writes():
+            base_queryset.all().update(views=F("views") + 1)
 
-        instance = (
-            base_queryset.select_related("device").prefetch_related(
-                Prefetch("device__variants", queryset=DeviceVariant.objects.all()),
-                Prefetch(
-                    "device__colors",
-                    queryset=DeviceColor.objects.all().order_by("sort_order"),
-                ),
-                Prefetch(
-                    "device__colors__images", queryset=DevicesColorImage.objects.all()
-                ),
-                Prefetch("images", queryset=ProductDetailImage.objects.all()),
-                Prefetch(
-                    "reviews",
-                    queryset=Review.objects.filter(is_public=True).order_by(
-                        "-created_at"
-                    )[:10],
-                    to_attr="limited_reviews",
-                ),
+        if settings.FAST_PRODUCT_SERIALIZATION:
+            data = product_detail_payload(
+                base_queryset, request.query_params.get("carrier", None)
             )
+            if data is None:
+                return Response(status=status.HTTP_404_NOT_FOUND)
+            return Response(data)
+
+        instance = product_detail_queryset(
+            base_queryset, request.query_params.get("carrier", None)
         ).first()
 
         if instance is None:
             return Response(status=status.HTTP_404_NOT_FOUND)
 
-        variant_ids = [v.id for v in instance.device.variants.all()]
-        color_ids = [c.id for c in instance.device.colors.all()]
-        inventories = Inventory.objects.filter(
-            device_variant_id__in=variant_ids,
-            device_color_id__in=color_ids,
-        ).select_related("dealership", "device_variant", "device_color")
-
+        inventories = detail_inventories(instance)
         related_products = []
-        if instance.product_series:
-            related_products = list(
-                Product.objects.filter(
-                    product_series=instance.product_series,
-                    is_active=True,
-                )
-                .select_related("device")
-                .prefetch_related(
-                    Prefetch(
-                        "device__colors",
-                        queryset=DeviceColor.objects.all().order_by("sort_order"),
-                    ),
-                    Prefetch(
-                        "device__colors__images",
-                        queryset=DevicesColorImage.objects.all(),
-                    ),
-                )
-            )
+        if instance.product_series_id:
+            related_products = list(related_products_queryset(instance))
 
         serializer = ProductDetailSerializer(
             instance,
@@ -352,6 +382,7 @@ class ProductViewSet(ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
+@replica_reads
 class ProductSeriesViewSet(ReadOnlyModelViewSet):
     """제품 시리즈 목록 API"""
 
@@ -371,6 +402,7 @@ class ProductSeriesViewSet(ReadOnlyModelViewSet):
         return Response(serializer.data)
 
 
+@replica_reads
 class ProductOptionViewSet(ReadOnlyModelViewSet):
     """상품옵션 목록 API"""
 
@@ -3,6 +3,13 @@ ASGI config for phoneinone_server project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+ASGI 로 띄우면 읽기 API(상품 목록/상세, 가격 차트)는 async view 로 서빙된다
+(settings.ASYNC_READ_API, phone.views.async_views). 나머지 DRF view 는 Django 가
+스레드에서 실행한다. 요청마다 스레드가 달라 스레드별 지속 연결 대신 DB 풀을 쓴다
+(settings.DB_POOL).
+
+    gunicorn phoneinone_server.asgi:application -k uvicorn_worker.UvicornWorker
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -12,5 +19,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'phoneinone_server.settings')
+os.environ.setdefault('ASYNC_READ_API', 'True')
+os.environ.setdefault('DB_POOL', 'True')
 
 application = get_asgi_application()
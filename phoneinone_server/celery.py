@@ -1,8 +1,31 @@
 import os
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "phoneinone_server.settings")
 
 app = Celery("phoneinone_server")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+# 웹 요청의 request_started / request_finished 와 같다 - CONN_MAX_AGE 가 지났거나 끊긴
+# 연결만 닫고 나머지는 다음 태스크가 재사용한다. eager(호출한 쪽에서 바로 실행)는 호출자의
+# 연결/트랜잭션을 쓰므로 건드리지 않는다.
+@task_prerun.connect
+def _before_task(task=None, **kwargs):
+    from django.db import close_old_connections
+
+    if not getattr(task.request, "is_eager", False):
+        close_old_connections()
+
+
+@task_postrun.connect
+def _after_task(task=None, **kwargs):
+    from django.db import close_old_connections
+
+    from phoneinone_server.db_pool import log_pool_stats
+
+    if not getattr(task.request, "is_eager", False):
+        close_old_connections()
+        log_pool_stats()
@@ -0,0 +1,102 @@
+"""DB 연결 재사용 상태 (psycopg 풀 / 지속 연결) 측정.
+
+settings 의 DB_POOL 에 따라 프로세스마다 둘 중 하나로 연결을 재사용한다.
+
+    - 풀(DB_POOL=True): Django 5 psycopg 풀. 프로세스 역할(web / worker / beat / command)
+      별로 DB_POOL_MIN_SIZE_<ROLE> / DB_POOL_MAX_SIZE_<ROLE> 크기
+    - 지속 연결: 스레드별 연결을 DB_CONN_MAX_AGE 초 동안 유지, 재사용 전 health check
+
+측정값 (프로세스별, 마지막 기록 이후 누적):
+    - size / available / waiting: 풀에 열린 연결 수 / 놀고 있는 연결 수 / 지금 기다리는 요청 수
+    - checkouts: 풀에서 연결을 꺼낸 횟수
+    - waits / wait_ms: 빈 연결이 없어 기다린 횟수 / 합계 시간
+    - timeouts: DB_POOL_TIMEOUT 안에 연결을 못 받은 횟수
+    - connects: 새로 연 DB 연결 수 (지속 연결에서는 이것만 본다 - 요청 수보다 훨씬 작아야 함)
+
+web 은 RequestMetricsMiddleware 의 적재 주기에, worker 는 태스크가 끝날 때
+DB_POOL_STATS_INTERVAL 초마다 'db_pool ...' 로그 1줄(alias 별)로 남긴다.
+
+사용법:
+    from phoneinone_server.db_pool import log_pool_stats, pool_stats
+
+    pool_stats()        # {"default": {"mode": "pool", "size": 2, ...}}
+    log_pool_stats()    # 주기가 지났으면 로그를 남기고 누적값을 0 으로
+"""
+
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_connects = Counter()
+_lock = threading.Lock()
+_last_logged = time.monotonic()
+
+
+def _count_connect(sender, connection, **kwargs):
+    _connects[connection.alias] += 1
+
+
+connection_created.connect(_count_connect, dispatch_uid="db_pool_count_connect")
+
+
+def _pool(alias):
+    """alias 가 풀을 쓰고 이 프로세스에서 열렸으면 ConnectionPool, 아니면 None."""
+    if not settings.DATABASES[alias].get("OPTIONS", {}).get("pool"):
+        return None
+    pool = connections[alias].pool
+    return None if pool is None or pool.closed else pool
+
+
+def pool_stats(reset: bool = False) -> dict[str, dict]:
+    """alias 별 연결 재사용 측정값. reset=True 면 누적값(checkouts 등)을 0 으로 되돌린다."""
+    stats = {}
+    for alias in settings.DATABASES:
+        with _lock:
+            connects = _connects.pop(alias, 0) if reset else _connects[alias]
+        pool = _pool(alias)
+        if pool is None:
+            if connects:
+                stats[alias] = {"mode": "persistent", "connects": connects}
+            continue
+        raw = pool.pop_stats() if reset else pool.get_stats()
+        # psycopg_pool 은 한 번도 늘지 않은 카운터를 생략한다
+        stats[alias] = {
+            "mode": "pool",
+            "min_size": raw["pool_min"],
+            "max_size": raw["pool_max"],
+            "size": raw["pool_size"],
+            "available": raw["pool_available"],
+            "waiting": raw["requests_waiting"],
+            "checkouts": raw.get("requests_num", 0),
+            "waits": raw.get("requests_queued", 0),
+            "wait_ms": raw.get("requests_wait_ms", 0),
+            "timeouts": raw.get("requests_errors", 0),
+            "connects": raw.get("connections_num", 0),
+        }
+    return stats
+
+
+def log_pool_stats(force: bool = False) -> bool:
+    """DB_POOL_STATS_INTERVAL 초가 지났으면 alias 별 로그 1줄을 남긴다. 남겼으면 True."""
+    global _last_logged
+    with _lock:
+        if not force and (
+            time.monotonic() - _last_logged < settings.DB_POOL_STATS_INTERVAL
+        ):
+            return False
+        _last_logged = time.monotonic()
+    for alias, row in pool_stats(reset=True).items():
+        logger.info(
+            "db_pool role=%s alias=%s %s",
+            settings.PROCESS_ROLE,
+            alias,
+            " ".join(f"{key}={value}" for key, value in row.items()),
+        )
+    return True
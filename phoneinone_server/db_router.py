@@ -0,0 +1,198 @@
+"""읽기 전용 복제본(replica) 라우팅.
+
+기본은 모든 쿼리가 default 로 간다. 아래 범위 안의 읽기만 replica 로 보낸다.
+
+    - 공개 API 의 GET/HEAD 요청 중 view 에 @replica_reads 가 붙은 것 (카탈로그 조회 등)
+      - ReplicaRoutingMiddleware
+    - 리포트 코드를 감싼 read_replica() 블록 (EP 생성, Google Merchant 빌드,
+      InventorySummary 피벗)
+
+read-your-writes:
+    - 같은 요청/블록 안에서 쓰기가 한 번이라도 있으면 이후 읽기는 default
+      (untracked_writes() 안의 쓰기는 제외)
+    - 쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 응답에 쿠키를 심어
+      DB_REPLICA_STICKY_SECONDS 동안 그 클라이언트의 요청은 replica 를 쓰지 않는다
+    - transaction.atomic() 안의 읽기는 항상 default
+
+settings.DB_REPLICA_ENABLED(DB_REPLICA_HOST 설정)가 False 면 아무것도 바꾸지 않는다.
+
+사용법:
+    from phoneinone_server.db_router import read_replica, replica_reads
+
+    with read_replica():
+        rows = list(Inventory.objects.values(...))
+
+    @replica_reads
+    class FAQViewSet(ReadOnlyModelViewSet): ...
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA = "replica"
+# 쓰기 요청 후 replica 를 쓰지 않을 클라이언트를 표시하는 쿠키
+PIN_COOKIE = "db_primary_pin"
+
+_SAFE_METHODS = ("GET", "HEAD")
+_WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+class _Scope:
+    """요청 / read_replica() 블록 하나의 라우팅 상태.
+
+    sync_to_async 스레드에서도 같은 객체를 보므로 값은 바꿔 쓰고 ContextVar 는 다시
+    set 하지 않는다.
+    """
+
+    __slots__ = ("replica", "written", "parent")
+
+    def __init__(self, replica, parent=None):
+        self.replica = replica
+        self.written = False
+        self.parent = parent
+
+    def mark_written(self):
+        scope = self
+        while scope is not None:
+            scope.written = True
+            scope = scope.parent
+
+
+_scope: ContextVar[_Scope | None] = ContextVar("db_read_scope", default=None)
+_untracked: ContextVar[bool] = ContextVar("db_untracked_writes", default=False)
+
+
+@contextmanager
+def read_replica():
+    """블록 안의 읽기를 replica 로 보낸다. 데코레이터로도 쓸 수 있다.
+
+    쿠키로 default 에 고정된 요청 안이거나, 바깥 범위에서 이미 쓰기가 있었다면
+    default 를 그대로 쓴다.
+    """
+    parent = _scope.get()
+    pinned = parent is not None and parent.written
+    token = _scope.set(_Scope(replica=not pinned, parent=parent))
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+@contextmanager
+def untracked_writes():
+    """블록 안의 쓰기는 이후 읽기를 default 로 돌리지 않는다.
+
+    조회수 증가처럼 같은 요청에서 다시 읽지 않는 쓰기에만 쓴다.
+    """
+    token = _untracked.set(True)
+    try:
+        yield
+    finally:
+        _untracked.reset(token)
+
+
+def replica_reads(view):
+    """view(클래스 또는 함수)의 GET 요청 읽기를 replica 로 보낸다 (ReplicaRoutingMiddleware)."""
+    view.replica_reads = True
+    return view
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        scope = _scope.get()
+        if (
+            scope is None
+            or not scope.replica
+            or scope.written
+            or not settings.DB_REPLICA_ENABLED
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return REPLICA
+
+    def db_for_write(self, model, **hints):
+        scope = _scope.get()
+        if scope is not None and not _untracked.get():
+            scope.mark_written()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 default 의 복제본이라 같은 DB 로 본다
+        return {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA}
+
+    def allow_migrate(self, db, app_label, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """요청 단위 라우팅 범위를 연다.
+
+    GET/HEAD 이고 @replica_reads view 이며 고정 쿠키가 없는 요청만 replica 를 읽는다.
+    process_view 는 ASGI 에서 스레드로 실행될 수 있어 ContextVar 대신 범위 객체를 바꾼다.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = self._enter(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _scope.reset(token)
+        return self._pin(request, response)
+
+    async def __acall__(self, request):
+        token = self._enter(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _scope.reset(token)
+        return self._pin(request, response)
+
+    def _enter(self, request):
+        scope = _Scope(replica=False)
+        if PIN_COOKIE in request.COOKIES:
+            # 직전 쓰기 이후 - read_replica() 블록도 default 를 쓰게 한다
+            scope.written = True
+        request._db_scope = scope
+        return _scope.set(scope)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        scope = getattr(request, "_db_scope", None)
+        if (
+            scope is not None
+            and not scope.written
+            and request.method in _SAFE_METHODS
+            and getattr(getattr(view_func, "cls", view_func), "replica_reads", False)
+        ):
+            scope.replica = True
+        return None
+
+    def _pin(self, request, response):
+        if (
+            settings.DB_REPLICA_ENABLED
+            and request.method in _WRITE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.DB_REPLICA_STICKY_SECONDS,
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
@@ -0,0 +1,36 @@
+"""프로세스 역할(web / worker / beat / command) 판별.
+
+Procfile 의 세 프로세스(gunicorn, celery worker, celery beat)는 같은 settings 를
+읽지만 필요한 것이 다르다. 역할에 따라 무거운 계측(Sentry boto3/google-genai
+integration 등)을 켜고 끄는 데 쓴다. 환경변수 PROCESS_ROLE 이 있으면 그 값을 쓴다.
+
+사용법:
+    from django.conf import settings
+
+    if settings.PROCESS_ROLE == "worker":
+        ...
+"""
+
+import os
+
+WEB = "web"
+WORKER = "worker"
+BEAT = "beat"
+COMMAND = "command"
+ROLES = (WEB, WORKER, BEAT, COMMAND)
+
+_WEB_PROGRAMS = ("gunicorn", "uvicorn", "daphne")
+
+
+def detect_process_role(argv: list[str]) -> str:
+    """실행 인자로 역할을 추정한다. 알 수 없으면 command (manage.py 커맨드, 셸 등)."""
+    program = os.path.basename(argv[0]) if argv else ""
+    args = argv[1:]
+    if program in _WEB_PROGRAMS or "runserver" in args:
+        return WEB
+    if program == "celery" or (args and args[0] == "celery"):
+        if "beat" in args:
+            return BEAT
+        if "worker" in args:
+            return WORKER
+    return COMMAND
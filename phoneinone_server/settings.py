@@ -1,9 +1,15 @@
 import os
+import sys
 from pathlib import Path
 
 import environ
 import sentry_sdk
 import logging
+from sentry_sdk.integrations.celery import CeleryIntegration
+from sentry_sdk.integrations.django import DjangoIntegration
+from sentry_sdk.integrations.redis import RedisIntegration
+
+from phoneinone_server.process_role import ROLES, detect_process_role
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 env = environ.Env(DEBUG=(bool, False))
@@ -26,7 +32,13 @@ DB_USER = env("DB_USER", default="postgres")
 DB_PASSWORD = env("DB_PASSWORD", default="1234")
 DB_HOST = env("DB_HOST", default="localhost")
 DB_PORT = env("DB_PORT", default="5432")
+# 공유 캐시(Redis). 비어 있으면 프로세스 로컬 메모리 캐시로 동작한다.
+CACHE_URL = env("CACHE_URL", default="")
 DEBUG = env.bool("DEBUG", default=False)
+# web(gunicorn) / worker / beat / command. 미지정 시 sys.argv 로 추정 (process_role.py)
+PROCESS_ROLE = env("PROCESS_ROLE", default=detect_process_role(sys.argv))
+if PROCESS_ROLE not in ROLES:
+    raise ValueError(f"PROCESS_ROLE must be one of {ROLES}: {PROCESS_ROLE}")
 CHANENLTALK_ACCESS_KEY = env("CHANENLTALK_ACCESS_KEY")
 CHANENLTALK_ACCESS_SECRET = env("CHANENLTALK_ACCESS_SECRET")
 SMARTEL_INVENTORY_API_KEY = env("SMARTEL_INVENTORY_API_KEY")
@@ -36,10 +48,104 @@ CELERY_RESULT_BACKEND = env("celery_broker")
 API_KEY_11st = env("API_KEY_11st")
 # SSG(신세계) 오픈API 벤더 인증키 — 빈 값이면 SSG 연동 코드가 런타임에 명확히 에러를 낸다.
 SSG_API_KEY = env("SSG_API_KEY", default="")
+# 외부 API base URL. 로컬 벤치마크(bench_marketplace --serve)에서는 가짜 서버로 돌린다.
+API_HOST_11st = env("API_HOST_11st", default="https://api.11st.co.kr/rest")
+SSG_API_HOST = env("SSG_API_HOST", default="https://eapi.ssgadm.com")
+CHANNELTALK_API_HOST = env("CHANNELTALK_API_HOST", default="https://api.channel.io")
+
+# LG 엘비휴넷 재고 이미지 추출기 (dotted path). 테스트/벤치마크는
+# phone.inventory.lg_hunet.image_lg_hunet.StubStockImageProvider 로 교체 가능.
+LG_HUNET_IMAGE_PROVIDER = env(
+    "LG_HUNET_IMAGE_PROVIDER",
+    default="phone.inventory.lg_hunet.image_lg_hunet.GeminiStockImageProvider",
+)
+# 같은 캡쳐 이미지(내용 해시 동일) 재업로드 시 Gemini 재호출 없이 재사용하는 시간(초)
+LG_HUNET_IMAGE_CACHE_TTL = env.int("LG_HUNET_IMAGE_CACHE_TTL", default=60 * 60 * 6)
+
+# Calculator 세션 write-behind — True 면 POST 는 버퍼(Redis stream)에만 넣고 201 을 반환,
+# task_flush_calculator_sessions 가 배치로 bulk_create 한다. 끌 때는 버퍼가 비워진 뒤 끈다.
+CALCULATOR_WRITE_BEHIND = env.bool("CALCULATOR_WRITE_BEHIND", default=False)
+CALCULATOR_SESSION_BUFFER = env(
+    "CALCULATOR_SESSION_BUFFER",
+    default="phone.calculator_buffer.RedisSessionBuffer",
+)
+CALCULATOR_BUFFER_REDIS_URL = env(
+    "CALCULATOR_BUFFER_REDIS_URL", default=CACHE_URL or CELERY_BROKER_URL
+)
+CALCULATOR_BUFFER_KEY_PREFIX = "calculator_session"
+CALCULATOR_BUFFER_BATCH_SIZE = env.int("CALCULATOR_BUFFER_BATCH_SIZE", default=500)
+# flush 가 멈춰도 payload 가 사라지지 않도록 넉넉히 보관 (초)
+CALCULATOR_BUFFER_TTL = env.int("CALCULATOR_BUFFER_TTL", default=60 * 60 * 24)
+
+# calculator POST 검증용 PartnerCard 프로세스 캐시 TTL(초). 0 이면 매 요청 DB 조회.
+PARTNER_CARD_CACHE_TTL = env.int("PARTNER_CARD_CACHE_TTL", default=60)
+
+# 채널톡 알림 outbox 발송 (task_deliver_channel_talk_outbox)
+CHANNEL_TALK_OUTBOX_BATCH_SIZE = env.int("CHANNEL_TALK_OUTBOX_BATCH_SIZE", default=50)
+CHANNEL_TALK_OUTBOX_MAX_ATTEMPTS = env.int("CHANNEL_TALK_OUTBOX_MAX_ATTEMPTS", default=8)
+# 같은 채널톡 그룹으로 연속 발송할 때 최소 간격(초)
+CHANNEL_TALK_GROUP_MIN_INTERVAL = env.float(
+    "CHANNEL_TALK_GROUP_MIN_INTERVAL", default=0.5
+)
+
+# 가격 알림 매칭 (task_match_price_alerts) - 한 번에 매칭/발송하는 알림 건수
+PRICE_ALERT_BATCH_SIZE = env.int("PRICE_ALERT_BATCH_SIZE", default=500)
+
+# soft delete row 정리 (task_purge_soft_deleted)
+# deleted_at 이 이 일수보다 오래된 row 를 원본 테이블에서 지운다
+SOFT_DELETE_RETENTION_DAYS = env.int("SOFT_DELETE_RETENTION_DAYS", default=90)
+# "archive": ArchivedRow 로 옮김 / "delete": 보관 없이 삭제
+SOFT_DELETE_PURGE_MODE = env("SOFT_DELETE_PURGE_MODE", default="archive")
+SOFT_DELETE_PURGE_BATCH_SIZE = env.int("SOFT_DELETE_PURGE_BATCH_SIZE", default=1000)
+# 배치 사이 쉬는 시간(초) - 복제 지연/IO 폭주 방지
+SOFT_DELETE_PURGE_SLEEP = env.float("SOFT_DELETE_PURGE_SLEEP", default=0.2)
+
+# 요청별 SQL / 구간 시간 측정 (phone.request_metrics.RequestMetricsMiddleware)
+REQUEST_METRICS_ENABLED = env.bool("REQUEST_METRICS_ENABLED", default=True)
+# 측정할 요청 비율 (0~1). DEBUG 에서는 전부 측정
+REQUEST_METRICS_SAMPLE_RATE = env.float(
+    "REQUEST_METRICS_SAMPLE_RATE", default=1.0 if DEBUG else 0.05
+)
+# 이 시간(ms) 이상 걸린 SQL 은 경고 로그로 남긴다
+REQUEST_METRICS_SLOW_SQL_MS = env.int("REQUEST_METRICS_SLOW_SQL_MS", default=200)
+# 측정값을 프로세스별로 모았다가 N건 / N초마다 bulk_create
+REQUEST_METRICS_FLUSH_SIZE = env.int("REQUEST_METRICS_FLUSH_SIZE", default=50)
+REQUEST_METRICS_FLUSH_INTERVAL = env.int("REQUEST_METRICS_FLUSH_INTERVAL", default=30)
+REQUEST_METRICS_RETENTION_DAYS = env.int("REQUEST_METRICS_RETENTION_DAYS", default=14)
+
+# 읽기 API(상품 목록/상세, 가격 차트)를 async view(phone.views.async_views)로 서빙한다.
+# phoneinone_server/asgi.py 가 기본값을 True 로 둔다 - WSGI(gunicorn sync)에서는 끈다.
+ASYNC_READ_API = env.bool("ASYNC_READ_API", default=False)
+
+# 상품 목록/상세 응답을 serializer 대신 values() 기반 dict(phone.product_payloads)로 만든다.
+# 응답 바이트는 같다 - 문제가 생기면 False 로 serializer 경로로 되돌린다.
+FAST_PRODUCT_SERIALIZATION = env.bool("FAST_PRODUCT_SERIALIZATION", default=True)
 
 # Next.js ISR Revalidation
 FRONTEND_URL = env("FRONTEND_URL", default="https://www.phoneinone.com")
 REVALIDATE_SECRET_TOKEN = env("REVALIDATE_SECRET_TOKEN", default="")
+# revalidate 요청을 모아서 보내는 윈도우(초) - 윈도우 내 중복 태그는 한 번만 전송
+REVALIDATE_COALESCE_WINDOW = env.int("REVALIDATE_COALESCE_WINDOW", default=2)
+# True 면 가격/재고 변경 시 제품 단위 태그(product-detail-<id>, products-brand-<brand>)만
+# 보낸다. 프론트가 제품 단위 태그로 fetch 하기 전까지는 False(전역 products /
+# product-detail 태그를 함께 전송)로 둔다.
+REVALIDATE_PRODUCT_TAGS_ONLY = env.bool("REVALIDATE_PRODUCT_TAGS_ONLY", default=False)
+
+# 카탈로그 정적 스냅샷 (phone.catalog_snapshot) - 상품 목록/상세/시리즈 응답을 S3 JSON 으로
+# 발행한다. 프론트는 CloudFront 의 {PREFIX}/manifest.json 을 읽고, 없으면 API 로 fallback.
+CATALOG_SNAPSHOT_ENABLED = env.bool("CATALOG_SNAPSHOT_ENABLED", default=False)
+CATALOG_SNAPSHOT_STORE = env(
+    "CATALOG_SNAPSHOT_STORE", default="phone.catalog_snapshot.S3SnapshotStore"
+)
+CATALOG_SNAPSHOT_PREFIX = env("CATALOG_SNAPSHOT_PREFIX", default="catalog")
+# 가격/재고 변경을 이 시간(초) 동안 모아 한 번 발행한다
+CATALOG_SNAPSHOT_COALESCE_WINDOW = env.int(
+    "CATALOG_SNAPSHOT_COALESCE_WINDOW", default=30
+)
+# manifest.json 캐시 시간(초) - 발행 후 프론트에 반영되기까지의 최대 지연
+CATALOG_SNAPSHOT_MANIFEST_MAX_AGE = env.int(
+    "CATALOG_SNAPSHOT_MANIFEST_MAX_AGE", default=30
+)
 
 # Google Merchant API (Shopping) — 상품 피드 직접 푸시
 # 값이 비어 있으면 push 커맨드/태스크가 런타임에 명확히 에러를 낸다(부팅에는 영향 없음).
@@ -151,6 +257,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 가장 바깥에서 전체 시간 / SQL 을 잰다
+    "phone.request_metrics.RequestMetricsMiddleware",
+    # 공개 GET API 읽기를 replica 로 (DB_REPLICA_HOST 설정 시)
+    "phoneinone_server.db_router.ReplicaRoutingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -198,6 +308,77 @@ DATABASES = {
         "PORT": DB_PORT,
     }
 }
+# 연결 재사용 - 요청/태스크마다 RDS 에 새로 붙으면 TLS + 인증으로 수 ms 가 든다
+# (측정: phoneinone_server.db_pool, 'db_pool ...' 로그).
+#   - DB_POOL=True: psycopg 풀 (psycopg-pool 필요). 프로세스별 풀이며 크기는 역할별.
+#     ASGI(uvicorn) 웹은 요청마다 스레드가 달라 지속 연결 대신 풀을 쓴다 (asgi.py 에서 켬)
+#   - 아니면 스레드별 연결을 DB_CONN_MAX_AGE 초 동안 유지 (gunicorn sync 워커 / celery)
+# 어느 쪽이든 재사용 전에 연결이 살아 있는지 확인한다.
+DB_POOL = env.bool("DB_POOL", default=False)
+# 역할별 (min_size, max_size). web 은 ASGI 동시 요청, worker 는 prefork 자식당 태스크 1개
+# (+ replica), beat 는 스케줄러 1개 기준. 환경변수 DB_POOL_MIN_SIZE_WEB 등으로 바꾼다.
+_DB_POOL_SIZE_DEFAULTS = {
+    "web": (2, 10),
+    "worker": (1, 2),
+    "beat": (1, 1),
+    "command": (1, 4),
+}
+DB_POOL_MIN_SIZE = env.int(
+    f"DB_POOL_MIN_SIZE_{PROCESS_ROLE.upper()}",
+    default=_DB_POOL_SIZE_DEFAULTS[PROCESS_ROLE][0],
+)
+DB_POOL_MAX_SIZE = env.int(
+    f"DB_POOL_MAX_SIZE_{PROCESS_ROLE.upper()}",
+    default=_DB_POOL_SIZE_DEFAULTS[PROCESS_ROLE][1],
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            # 빈 연결을 기다리는 최대 시간(초). 넘으면 요청이 에러 - timeouts 로 집계
+            "timeout": env.float("DB_POOL_TIMEOUT", default=10),
+            "max_lifetime": env.float("DB_POOL_MAX_LIFETIME", default=1800),
+        }
+    }
+else:
+    DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)
+# celery 는 기본으로 태스크마다 연결을 닫는다. 이 횟수마다만 닫고 그 사이에는 위 설정대로
+# 재사용한다 (phoneinone_server/celery.py 가 태스크 전에 만료/끊긴 연결을 정리)
+CELERY_DB_REUSE_MAX = env.int("CELERY_DB_REUSE_MAX", default=100)
+DB_POOL_STATS_INTERVAL = env.int("DB_POOL_STATS_INTERVAL", default=60)
+# 읽기 전용 복제본. DB_REPLICA_HOST 가 있을 때만 공개 GET API / 리포트 읽기를 보낸다
+# (phoneinone_server.db_router). 없으면 alias 만 있고(연결은 열리지 않음) 전부 default.
+# 로컬에서는 DB_REPLICA_HOST=localhost 로 같은 서버에 두 번째 연결을 붙여 확인할 수 있다.
+DB_REPLICA_HOST = env("DB_REPLICA_HOST", default="")
+DB_REPLICA_ENABLED = bool(DB_REPLICA_HOST)
+DATABASES["replica"] = {
+    **DATABASES["default"],
+    "NAME": env("DB_REPLICA_NAME", default=DB_NAME),
+    "HOST": DB_REPLICA_HOST or DB_HOST,
+    "PORT": env("DB_REPLICA_PORT", default=DB_PORT),
+    # 테스트에서는 default 테스트 DB 를 별도 연결로 읽는다 (phone/tests/test_db_router.py)
+    "TEST": {"MIRROR": "default"},
+}
+DATABASE_ROUTERS = ["phoneinone_server.db_router.ReplicaRouter"]
+# 쓰기 요청 후 이 시간(초) 동안 같은 클라이언트(쿠키)의 읽기는 default 로 보낸다
+DB_REPLICA_STICKY_SECONDS = env.int("DB_REPLICA_STICKY_SECONDS", default=10)
+
+
+if CACHE_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
 
 
 # Password validation
@@ -350,9 +531,77 @@ CELERY_BEAT_SCHEDULE = {
         "task": "phone.tasks.task_push_google_merchant",
         "schedule": 60 * 60,  # 1시간
     },
+    # ISR revalidate 대기열 안전망 — 평소엔 enqueue 시 예약된 flush 가 처리하고,
+    # broker 장애 등으로 예약이 유실된 태그만 여기서 정리된다.
+    "flush-revalidation-every-1min": {
+        "task": "phone.tasks.task_flush_revalidation",
+        "schedule": 60,  # 1분
+    },
+    # 카탈로그 정적 스냅샷 안전망 — 평소엔 가격/재고 변경 시 예약된 발행이 처리한다.
+    # 내용이 같으면 아무것도 올리지 않는다. CATALOG_SNAPSHOT_ENABLED=False 면 즉시 반환.
+    "publish-catalog-snapshot-every-1h": {
+        "task": "phone.tasks.task_publish_catalog_snapshot",
+        "schedule": 60 * 60,  # 1시간
+    },
+    # 채널톡 알림 outbox 발송 — 주문/문의/calculator lead 알림은 요청에서 적재만 한다.
+    "deliver-channel-talk-outbox-every-5s": {
+        "task": "phone.tasks.task_deliver_channel_talk_outbox",
+        "schedule": 5,  # 5초
+    },
+    # 가격 알림 매칭 — 엑셀 업로드 직후에도 큐잉되며, admin 수정분은 여기서 잡는다.
+    "match-price-alerts-every-30min": {
+        "task": "phone.tasks.task_match_price_alerts",
+        "schedule": 60 * 30,  # 30분
+    },
+    # PriceHistory 스냅샷 — 오늘 row 는 가격이 바뀐 경우에만 갱신되므로 매시간 돌려도 안전
+    "snapshot-price-history-every-1h": {
+        "task": "phone.tasks.task_snapshot_price_history",
+        "schedule": 60 * 60,  # 1시간
+    },
+    # 일별 가격 시리즈 연장 (가격 차트) — 이미 있는 날은 건드리지 않아 자주 돌려도 안전
+    "extend-daily-prices-every-1h": {
+        "task": "phone.tasks.task_extend_daily_prices",
+        "schedule": 60 * 60,  # 1시간
+    },
+    # 월별 파티션 미리 생성 (PriceHistory / PriceHistoryDaily / calculator_session)
+    "ensure-partitions-every-1d": {
+        "task": "phone.tasks.task_ensure_partitions",
+        "schedule": 60 * 60 * 24,  # 1일
+    },
+    # 보관 기간이 지난 soft delete row 정리 (archive / delete)
+    "purge-soft-deleted-every-1d": {
+        "task": "phone.tasks.task_purge_soft_deleted",
+        "schedule": 60 * 60 * 24,  # 1일
+    },
+    # 보관 기간이 지난 요청 측정값(RequestMetric) 삭제
+    "purge-request-metrics-every-1d": {
+        "task": "phone.tasks.task_purge_request_metrics",
+        "schedule": 60 * 60 * 24,  # 1일
+    },
+    # Calculator 세션 write-behind 버퍼 flush — CALCULATOR_WRITE_BEHIND=False 면 즉시 반환.
+    "flush-calculator-sessions-every-5s": {
+        "task": "phone.tasks.task_flush_calculator_sessions",
+        "schedule": 5,  # 5초
+    },
 }
 
+# 자동 integration 은 설치된 라이브러리(boto3, google-genai 등)를 전부 import 해서
+# 웹 워커마다 기동 ~1.5초, 메모리 ~100MB 가 늘어난다. 필요한 것만 명시하고, S3 업로드
+# (EP/이미지) 가 도는 worker 에서만 boto3 계측을 켠다. Gemini 호출(LG 재고 캡쳐)은
+# admin 업로드에서만 일어나 google-genai 계측은 켜지 않는다 - 예외는 Django 로 잡힌다.
+SENTRY_INTEGRATIONS = [
+    DjangoIntegration(),
+    CeleryIntegration(),
+    RedisIntegration(),
+]
+if PROCESS_ROLE == "worker":
+    from sentry_sdk.integrations.boto3 import Boto3Integration
+
+    SENTRY_INTEGRATIONS.append(Boto3Integration())
+
 sentry_sdk.init(
+    auto_enabling_integrations=False,
+    integrations=SENTRY_INTEGRATIONS,
     dsn="https://c56b025211e2e9b775c47a34f254b5ca@o4511307313774592.ingest.us.sentry.io/4511307316723712",
     # Add data like request headers and IP for users,
     # see https://docs.sentry.io/platforms/python/data-management/data-collected/ for more info